@@ -0,0 +1,444 @@
+"""Lists every color combination a flavor can produce, and audits its contrast.
+
+`use()` is walked symbolically: each context flag is left undecided until the
+code reads it, and then both of its values are explored. After every
+statement, the paths that hold the same colors and agree on the flags that
+are still to be read are merged, so flags that cannot change the result from
+there on never multiply the number of paths. Flags that ranger never sets
+together (see EXCLUSIVE_FLAGS) are not combined. The result is every distinct
+`(fg, bg, attr)` the scheme can return, each with one context producing it.
+
+Each outcome is then rendered as a terminal would draw it (xterm RGB of the
+quantized codes, `reverse` applied, the terminal's default colors taken to be
+the flavor's TEXT on BASE), and its WCAG contrast ratio is checked:
+
+    python3 audit.py mocha --threshold 4.5
+"""
+
+import argparse
+import ast
+import builtins
+import json
+import operator
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import build
+import ranger_stub
+from colors import COLORS
+from hex2xterm import short2rgb
+from specialize import specialize_method
+
+WCAG_AA = 4.5
+
+# Groups of context flags of which ranger sets at most one: every widget
+# draws with its own `in_*` flag, and a file has one type and one VCS status.
+# fmt: off
+EXCLUSIVE_FLAGS = (
+    ("in_browser", "in_statusbar", "in_titlebar", "in_console", "in_pager",
+     "in_taskview"),
+    ("directory", "file"),
+    ("good", "bad"),
+    ("video", "audio", "image"),
+    ("vcsfile", "vcsremote"),
+    ("vcsconflict", "vcschanged", "vcsunknown", "vcsignored", "vcsuntracked",
+     "vcsstaged", "vcssync", "vcsnone", "vcsbehind", "vcsahead", "vcsdiverged"),
+)
+# fmt: on
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.BitOr: operator.or_,
+    ast.BitAnd: operator.and_,
+    ast.BitXor: operator.xor,
+    ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift,
+    ast.Invert: operator.invert,
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+
+class _State(NamedTuple):
+    """One set of paths through `use()`."""
+
+    variables: tuple[tuple[str, object], ...]
+    flags: tuple[tuple[str, bool], ...]
+    result: tuple[int, int, int] | None = None
+
+    def assign(self, name: str, value: object) -> "_State":
+        variables = dict(self.variables)
+        variables[name] = value
+        return self._replace(variables=tuple(sorted(variables.items())))
+
+    def decide(self, flag: str, value: bool) -> "_State":
+        return self._replace(flags=tuple(sorted(self.flags + ((flag, value),))))
+
+
+def _read_flags(nodes: list[ast.AST]) -> frozenset[str]:
+    return frozenset(
+        node.attr
+        for root in nodes
+        for node in ast.walk(root)
+        if isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "context"
+    )
+
+
+class ContextSpace:
+    """Symbolic walk of a colorscheme's `use()` over all context flags.
+
+    Attributes:
+        scheme: An instance of the colorscheme, for `self.<attribute>` reads.
+        paths: The number of states explored.
+    """
+
+    def __init__(self, function: ast.FunctionDef, namespace: dict, scheme) -> None:
+        self.function = function
+        self.namespace = namespace
+        self.scheme = scheme
+        self.paths = 0
+        self._exclusive = {
+            flag: set(group) - {flag} for group in EXCLUSIVE_FLAGS for flag in group
+        }
+
+    def outcomes(self) -> dict[tuple[int, int, int], frozenset[str]]:
+        """Maps each possible `(fg, bg, attr)` to the flags of the smallest
+        context found that produces it."""
+        states = self._run(self.function.body, [_State((), ())], frozenset())
+        outcomes = {}
+        for state in states:
+            if state.result is None:
+                raise ValueError(f"{self.function.name}() can return None")
+            witness = frozenset(flag for flag, value in state.flags if value)
+            if len(witness) < len(outcomes.get(state.result, witness | {None})):
+                outcomes[state.result] = witness
+        return outcomes
+
+    def _merge(self, states: list[_State], later: frozenset[str]) -> list[_State]:
+        merged = {}
+        for state in states:
+            if state.result is not None:
+                key = (state.result,)
+            else:
+                flags = tuple(item for item in state.flags if item[0] in later)
+                key = (state.variables, flags)
+            merged.setdefault(key, state)
+        self.paths += len(merged)
+        return list(merged.values())
+
+    def _run(
+        self, body: list[ast.stmt], states: list[_State], later: frozenset[str]
+    ) -> list[_State]:
+        for i, statement in enumerate(body):
+            future = later | _read_flags(body[i + 1 :])
+            done = [state for state in states if state.result is not None]
+            for state in states:
+                if state.result is None:
+                    done.extend(self._execute(statement, state, future))
+            states = self._merge(done, future)
+        return states
+
+    def _execute(
+        self, statement: ast.stmt, state: _State, later: frozenset[str]
+    ) -> list[_State]:
+        if isinstance(statement, ast.If):
+            states = []
+            for value, branch in self._evaluate(statement.test, state):
+                body = statement.body if value else statement.orelse
+                states.extend(self._run(body, [branch], later))
+            return states
+
+        if isinstance(statement, ast.Return):
+            return [
+                state._replace(result=tuple(value))
+                for value, state in self._evaluate(statement.value, state)
+            ]
+
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1:
+            target = statement.targets[0]
+            if isinstance(target, ast.Name):
+                names, unpack = [target.id], False
+            else:
+                names, unpack = [element.id for element in target.elts], True
+            states = []
+            for value, state in self._evaluate(statement.value, state):
+                values = value if unpack else [value]
+                for name, item in zip(names, values, strict=True):
+                    state = state.assign(name, item)
+                states.append(state)
+            return states
+
+        if isinstance(statement, ast.AugAssign) and isinstance(
+            statement.target, ast.Name
+        ):
+            current = dict(state.variables)[statement.target.id]
+            apply = _OPERATORS[type(statement.op)]
+            return [
+                state.assign(statement.target.id, apply(current, value))
+                for value, state in self._evaluate(statement.value, state)
+            ]
+
+        if isinstance(statement, (ast.Pass, ast.Expr)):
+            return [state]
+
+        raise ValueError(f"Unsupported statement: {ast.unparse(statement)}")
+
+    def _evaluate_all(
+        self, nodes: list[ast.expr], state: _State
+    ) -> list[tuple[list, _State]]:
+        results = [([], state)]
+        for node in nodes:
+            results = [
+                (values + [value], branch)
+                for values, state in results
+                for value, branch in self._evaluate(node, state)
+            ]
+        return results
+
+    def _evaluate(self, node: ast.expr, state: _State) -> list[tuple[object, _State]]:
+        if isinstance(node, ast.Constant):
+            return [(node.value, state)]
+
+        if isinstance(node, ast.Name):
+            variables = dict(state.variables)
+            if node.id in variables:
+                return [(variables[node.id], state)]
+            if node.id in self.namespace:
+                return [(self.namespace[node.id], state)]
+            return [(getattr(builtins, node.id), state)]
+
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == "context":
+                flags = dict(state.flags)
+                if node.attr in flags:
+                    return [(flags[node.attr], state)]
+                values = [False]
+                if not any(flags.get(f) for f in self._exclusive.get(node.attr, ())):
+                    values.append(True)
+                return [(value, state.decide(node.attr, value)) for value in values]
+            if node.value.id == "self":
+                return [(getattr(self.scheme, node.attr), state)]
+
+        if isinstance(node, ast.Tuple):
+            return [
+                (tuple(values), s) for values, s in self._evaluate_all(node.elts, state)
+            ]
+
+        if isinstance(node, ast.BoolOp):
+            results = []
+            pending = [(None, state)]
+            for i, operand in enumerate(node.values):
+                following = []
+                for _, current in pending:
+                    for value, branch in self._evaluate(operand, current):
+                        last = i == len(node.values) - 1
+                        if last or bool(value) == isinstance(node.op, ast.Or):
+                            results.append((value, branch))
+                        else:
+                            following.append((value, branch))
+                pending = following
+            return results
+
+        if isinstance(node, ast.IfExp):
+            return [
+                result
+                for value, branch in self._evaluate(node.test, state)
+                for result in self._evaluate(
+                    node.body if value else node.orelse, branch
+                )
+            ]
+
+        if isinstance(node, ast.UnaryOp):
+            apply = _OPERATORS[type(node.op)]
+            return [
+                (apply(value), s) for value, s in self._evaluate(node.operand, state)
+            ]
+
+        if isinstance(node, ast.BinOp):
+            apply = _OPERATORS[type(node.op)]
+            return [
+                (apply(left, right), s)
+                for (left, right), s in self._evaluate_all(
+                    [node.left, node.right], state
+                )
+            ]
+
+        if isinstance(node, ast.Compare):
+            results = []
+            for values, s in self._evaluate_all([node.left, *node.comparators], state):
+                pairs = zip(node.ops, values, values[1:])
+                value = all(_OPERATORS[type(op)](a, b) for op, a, b in pairs)
+                results.append((value, s))
+            return results
+
+        if isinstance(node, ast.Call) and not node.keywords:
+            return [
+                (func(*args), s)
+                for (func, *args), s in self._evaluate_all(
+                    [node.func, *node.args], state
+                )
+            ]
+
+        raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
+def enumerate_outcomes(
+    flavor: dict[str, str],
+    flavor_name: str,
+    template: build.Template | None = None,
+) -> tuple[dict[tuple[int, int, int], frozenset[str]], int]:
+    """Finds every `(fg, bg, attr)` the colorscheme of a flavor can return.
+
+    Args:
+        flavor: The flavor's colors as xterm codes, as from `flavor_to_xterm`.
+        flavor_name: The name of the flavor.
+        template: The compiled base configuration; read from BASE_FILE if not
+            given.
+
+    Returns:
+        A mapping from each outcome to the flags of a context producing it,
+        and the number of symbolic states that were explored.
+    """
+    if template is None:
+        template = build.compile_template(build.get_base_config())
+    class_name = build.get_class_name(flavor_name)
+    config = specialize_method(template.render(flavor, flavor_name), class_name, "use")
+    scheme_cls = build.load_scheme(config, class_name)
+
+    tree = ast.parse(config)
+    (function,) = [
+        node
+        for cls in tree.body
+        if isinstance(cls, ast.ClassDef) and cls.name == class_name
+        for node in cls.body
+        if isinstance(node, ast.FunctionDef) and node.name == "use"
+    ]
+
+    space = ContextSpace(function, scheme_cls.use.__globals__, scheme_cls())
+    return space.outcomes(), space.paths
+
+
+def _luminance(code: int) -> float:
+    channels = [c / 255 for c in bytes.fromhex(short2rgb(code))]
+    r, g, b = [
+        c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in channels
+    ]
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(fg: int, bg: int) -> float:
+    """Returns the WCAG contrast ratio of two xterm color codes.
+
+    Args:
+        fg: The foreground xterm code.
+        bg: The background xterm code.
+
+    Returns:
+        A ratio between 1 (no contrast) and 21 (black on white).
+    """
+    light, dark = sorted((_luminance(fg), _luminance(bg)), reverse=True)
+    return (light + 0.05) / (dark + 0.05)
+
+
+def audit_flavor(flavor_name: str, threshold: float = WCAG_AA) -> dict:
+    """Audits every outcome of a flavor's colorscheme.
+
+    Args:
+        flavor_name: A key of COLORS.
+        threshold: The lowest acceptable contrast ratio.
+
+    Returns:
+        The number of outcomes and explored states, and each foreground and
+        background pair below the threshold with its ratio and the smallest
+        context drawing it (and that context's attributes), from the lowest
+        ratio up.
+    """
+    flavor = build.flavor_to_xterm(COLORS[flavor_name])
+    outcomes, paths = enumerate_outcomes(flavor, flavor_name)
+
+    names: dict[int, list[str]] = {}
+    for name, code in flavor.items():
+        names.setdefault(int(code), []).append(name.upper())
+
+    failures = {}
+    for (fg, bg, attr), witness in outcomes.items():
+        shown_fg = int(flavor["text"]) if fg == ranger_stub.default else fg
+        shown_bg = int(flavor["base"]) if bg == ranger_stub.default else bg
+        if attr & ranger_stub.reverse:
+            shown_fg, shown_bg = shown_bg, shown_fg
+
+        ratio = contrast_ratio(shown_fg, shown_bg)
+        previous = failures.get((shown_fg, shown_bg))
+        if ratio < threshold and (
+            previous is None or len(witness) < len(previous["context"])
+        ):
+            failures[shown_fg, shown_bg] = {
+                "fg": names.get(shown_fg, [str(shown_fg)]),
+                "bg": names.get(shown_bg, [str(shown_bg)]),
+                "attr": build._attr_names(attr),
+                "ratio": round(ratio, 2),
+                "context": sorted(witness, key=ranger_stub.CONTEXT_KEYS.index),
+            }
+
+    failures = sorted(failures.values(), key=lambda failure: failure["ratio"])
+    return {"outcomes": len(outcomes), "paths": paths, "failures": failures}
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "flavors", nargs="*", default=list(COLORS), help="flavors to audit"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=WCAG_AA,
+        help=f"lowest acceptable contrast ratio (default: {WCAG_AA}, WCAG AA)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error if any combination is below the threshold",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write a JSON report here")
+    args = parser.parse_args()
+
+    report = {name: audit_flavor(name, args.threshold) for name in args.flavors}
+
+    for name, result in report.items():
+        print(
+            f"{name}: {result['outcomes']} outcomes ({result['paths']} states),"
+            f" {len(result['failures'])} below {args.threshold}"
+        )
+        for failure in result["failures"]:
+            print(
+                f"  {failure['ratio']:5.2f}  {'/'.join(failure['fg'])}"
+                f" on {'/'.join(failure['bg'])}"
+                f"{' [' + ', '.join(failure['attr']) + ']' if failure['attr'] else ''}"
+                f"  e.g. {' '.join(failure['context']) or '(empty context)'}"
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.check and any(result["failures"] for result in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
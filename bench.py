@@ -0,0 +1,374 @@
+"""Benchmarks for the colorscheme hot path and the build pipeline.
+
+Runs without ranger installed: schemes are evaluated against `ranger_stub`.
+Results are written as JSON and compared against a stored baseline; the run
+fails if the generated schemes changed, if a benchmark got slower than the
+baseline by more than the allowed tolerance, or if there is no baseline to
+compare against (record one with `--save-baseline`).
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+import build
+import ranger_stub
+from colors import COLORS
+from hex2xterm import rgb2short, rgb2short_batch
+
+BASELINE_FILE = Path("bench_baseline.json")
+BUILD_SIZES = (4, 100, 10_000)
+CONTEXTS = 100_000
+COLORS_COUNT = 100_000
+REPEAT = 3
+SEED = 0
+
+# Context key sets ranger produces, with rough relative frequencies.
+WORKLOADS: dict[str, list[tuple[tuple[str, ...], int]]] = {
+    "browser": [
+        (("in_browser", "file", "main_column"), 40),
+        (("in_browser", "directory", "main_column"), 20),
+        (("in_browser", "file"), 30),
+        (("in_browser", "directory"), 15),
+        (("in_browser", "file", "selected", "main_column"), 4),
+        (("in_browser", "directory", "selected", "main_column"), 4),
+        (("in_browser", "file", "media", "image", "main_column"), 6),
+        (("in_browser", "file", "media", "video"), 2),
+        (("in_browser", "file", "document", "main_column"), 5),
+        (("in_browser", "file", "container"), 2),
+        (("in_browser", "file", "executable", "main_column"), 3),
+        (("in_browser", "file", "link", "good"), 2),
+        (("in_browser", "file", "link", "bad"), 1),
+        (("in_browser", "file", "marked", "main_column"), 2),
+        (("in_browser", "file", "tag_marker", "main_column"), 1),
+        (("in_browser", "file", "cut", "main_column"), 1),
+        (("in_browser", "directory", "inactive_pane"), 3),
+        (("in_browser", "empty"), 1),
+    ],
+    "statusbar": [
+        (("in_statusbar", "permissions", "good"), 5),
+        (("in_statusbar", "permissions", "bad"), 1),
+        (("in_statusbar", "owner"), 3),
+        (("in_statusbar", "mtime"), 3),
+        (("in_statusbar", "message", "bad"), 1),
+        (("in_statusbar", "marked"), 1),
+        (("in_statusbar", "vcsinfo"), 2),
+        (("in_statusbar", "vcscommit"), 1),
+        (("in_statusbar", "vcsdate"), 1),
+        (("in_statusbar", "loaded"), 1),
+    ],
+    "titlebar": [
+        (("in_titlebar", "hostname", "good"), 3),
+        (("in_titlebar", "directory"), 6),
+        (("in_titlebar", "file"), 4),
+        (("in_titlebar", "tab", "good"), 1),
+        (("in_titlebar", "link"), 1),
+    ],
+    "vcs": [
+        (("in_browser", "vcsfile", "vcschanged"), 4),
+        (("in_browser", "vcsfile", "vcsstaged"), 2),
+        (("in_browser", "vcsfile", "vcsunknown"), 3),
+        (("in_browser", "vcsfile", "vcssync"), 6),
+        (("in_browser", "vcsfile", "vcsignored"), 1),
+        (("in_browser", "vcsremote", "vcsahead"), 1),
+        (("in_browser", "vcsremote", "vcssync"), 2),
+    ],
+}
+
+
+def make_contexts(workload: str, count: int, seed: int = SEED) -> list:
+    """Draws ranger contexts from one of the WORKLOADS distributions.
+
+    Args:
+        workload: The name of the distribution.
+        count: How many contexts to draw.
+        seed: Seed for the random number generator.
+
+    Returns:
+        A list of `ranger_stub.Context` objects.
+    """
+    keys, weights = zip(*WORKLOADS[workload])
+    rng = random.Random(seed)
+    return [ranger_stub.Context(k) for k in rng.choices(keys, weights, k=count)]
+
+
+def synthetic_palettes(
+    count: int, seed: int = SEED
+) -> Iterator[tuple[str, dict[str, str]]]:
+    """Generates synthetic palettes with the same color names as COLORS.
+
+    Args:
+        count: How many palettes to generate.
+        seed: Seed for the random number generator.
+
+    Yields:
+        The name of each palette and its colors, one at a time.
+    """
+    rng = random.Random(seed)
+    names = list(COLORS["mocha"])
+    for i in range(count):
+        colors = {name: f"#{rng.randrange(1 << 24):06x}" for name in names}
+        yield f"synthetic{i}", colors
+
+
+def make_palettes(count: int, seed: int = SEED) -> dict[str, dict[str, str]]:
+    """Generates synthetic palettes with the same color names as COLORS.
+
+    Args:
+        count: How many palettes to generate.
+        seed: Seed for the random number generator.
+
+    Returns:
+        A mapping from palette name to its colors, as `synthetic_palettes`.
+    """
+    return dict(synthetic_palettes(count, seed))
+
+
+def timeit(func: Callable[[], object], repeat: int = REPEAT) -> float:
+    """Returns the best wall time of `repeat` calls to `func`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def render_scheme(template: build.Template, flavor_name: str) -> str:
+    """Renders a flavor's scheme as `build.build_palette` ships it.
+
+    Args:
+        template: The compiled base configuration.
+        flavor_name: A key of COLORS.
+
+    Returns:
+        The scheme's source, with its tables for every color depth.
+    """
+    depths = build.flavor_depths(COLORS[flavor_name])
+    flavor = depths.pop(build.DEFAULT_DEPTH)
+    return build.render_config(template, flavor, flavor_name, depths=depths)
+
+
+def load_schemes(flavor_name: str) -> dict[str, object]:
+    """Builds the branchy and the generated scheme of a flavor, in memory.
+
+    Args:
+        flavor_name: A key of COLORS.
+
+    Returns:
+        Instances of the template with the DEFAULT_DEPTH colors substituted
+        ("branchy") and of the scheme shipped in output/, set to that depth
+        whatever the terminal's ("generated").
+    """
+    template = build.compile_template(build.get_base_config())
+    flavor = build.flavor_depths(COLORS[flavor_name])[build.DEFAULT_DEPTH]
+    class_name = build.get_class_name(flavor_name)
+    generated = build.load_scheme(render_scheme(template, flavor_name), class_name)
+    generated.use.__globals__["_use_depth"](build.DEFAULT_DEPTH)
+    return {
+        "branchy": build.load_scheme(
+            template.render(flavor, flavor_name), class_name
+        )(),
+        "generated": generated(),
+    }
+
+
+def bench_use(results: dict[str, dict], flavor_name: str = "mocha") -> None:
+    """Times `use()` on every workload, for the branchy and generated schemes."""
+    schemes = load_schemes(flavor_name)
+    for workload in WORKLOADS:
+        contexts = make_contexts(workload, CONTEXTS)
+        for kind, scheme in schemes.items():
+            use = scheme.use
+
+            def run() -> None:
+                for context in contexts:
+                    use(context)
+
+            seconds = timeit(run)
+            results[f"use/{workload}/{kind}"] = {
+                "seconds": seconds,
+                "ops_per_sec": len(contexts) / seconds,
+            }
+
+
+def count_opcodes(func: Callable[[object], object], contexts: list) -> float:
+    """Returns the mean number of bytecodes executed per call of `func`."""
+    executed = 0
+
+    def tracer(frame, event, arg):
+        nonlocal executed
+        frame.f_trace_opcodes = True
+        if event == "opcode":
+            executed += 1
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        for context in contexts:
+            func(context)
+    finally:
+        sys.settrace(None)
+
+    return executed / len(contexts)
+
+
+def bench_opcodes(opcodes: dict[str, float], flavor_name: str = "mocha") -> None:
+    """Counts bytecodes per call of the branchy and the specialized code.
+
+    Both are measured without the decision table in front of them: the
+    original `use()` against the generated scheme's `_evaluate()`, which
+    resolves table misses.
+    """
+    schemes = load_schemes(flavor_name)
+    functions = {
+        "branchy": schemes["branchy"].use,
+        "specialized": schemes["generated"]._evaluate,
+    }
+    for workload in WORKLOADS:
+        contexts = make_contexts(workload, 1000)
+        for kind, func in functions.items():
+            opcodes[f"{workload}/{kind}"] = count_opcodes(func, contexts)
+
+
+def bench_rgb2short(results: dict[str, dict]) -> None:
+    """Times single and batch hex to xterm conversion."""
+    rng = random.Random(SEED)
+    colors = [f"{rng.randrange(1 << 24):06x}" for _ in range(COLORS_COUNT)]
+    packed = bytes.fromhex("".join(colors))
+
+    for method in ("cube", "nearest"):
+        benches = {
+            f"rgb2short/{method}/single": lambda: [
+                rgb2short(c, method) for c in colors
+            ],
+            f"rgb2short/{method}/batch-hex": lambda: rgb2short_batch(colors, method),
+            f"rgb2short/{method}/batch-packed": lambda: rgb2short_batch(packed, method),
+        }
+        for name, func in benches.items():
+            seconds = timeit(func)
+            results[name] = {"seconds": seconds, "ops_per_sec": COLORS_COUNT / seconds}
+
+
+def bench_build(
+    results: dict[str, dict], sizes: tuple[int, ...], jobs: int | None
+) -> None:
+    """Times `create_palettes` end to end, from scratch, at several sizes."""
+    for size in sizes:
+        palettes = make_palettes(size)
+        with tempfile.TemporaryDirectory() as output:
+            seconds = timeit(
+                lambda: build.create_palettes(
+                    force=True, jobs=jobs, palettes=palettes, output_path=Path(output)
+                ),
+                repeat=1,
+            )
+        results[f"build/{size}"] = {"seconds": seconds, "ops_per_sec": size / seconds}
+
+
+def scheme_digests() -> dict[str, str]:
+    """Hashes the generated scheme of every flavor in COLORS."""
+    template = build.compile_template(build.get_base_config())
+    return {
+        name: hashlib.sha256(render_scheme(template, name).encode("utf-8")).hexdigest()
+        for name in COLORS
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Lists the regressions of a report against a baseline.
+
+    Args:
+        report: The results of this run.
+        baseline: The results of a previous run.
+        tolerance: Allowed slowdown, as a fraction of the baseline time.
+
+    Returns:
+        A description of each regression; empty if there is none.
+    """
+    failures = []
+
+    for name, digest in baseline.get("schemes", {}).items():
+        if report["schemes"].get(name) != digest:
+            failures.append(f"generated scheme for {name} changed")
+
+    for name, count in report["opcodes"].items():
+        previous = baseline.get("opcodes", {}).get(name)
+        if previous is not None and count > previous:
+            failures.append(f"{name}: {count:.1f} bytecodes/call vs {previous:.1f}")
+
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous and result["seconds"] > previous["seconds"] * (1 + tolerance):
+            failures.append(
+                f"{name}: {result['seconds']:.4f}s vs {previous['seconds']:.4f}s"
+            )
+
+    return failures
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="*",
+        default=BUILD_SIZES,
+        help="palette counts to run the build benchmark at",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes for builds"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_FILE, help="baseline JSON file"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        "--record",
+        action="store_true",
+        help="store this run as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed slowdown as a fraction of the baseline (default: 0.5)",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the report here")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    opcodes: dict[str, float] = {}
+    bench_use(results)
+    bench_opcodes(opcodes)
+    bench_rgb2short(results)
+    bench_build(results, tuple(args.sizes), args.jobs or None)
+    report = {"results": results, "opcodes": opcodes, "schemes": scheme_digests()}
+
+    text = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+
+    if args.save_baseline:
+        args.baseline.write_text(text, encoding="utf-8")
+        return
+
+    if not args.baseline.exists():
+        parser.exit(1, f"{args.baseline} is missing; record one with --save-baseline\n")
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    failures = compare(report, baseline, args.tolerance)
+    if failures:
+        parser.exit(1, "Regressions:\n  " + "\n  ".join(failures) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,113 @@
+import argparse
+import ast
+import collections
+import ctypes
+import ctypes.util
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import py_compile
+import random
 import re
+import runpy
+import select
+import socket
+import struct
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, Mapping, NamedTuple
 
+import ranger_stub
 from colors import COLORS
-from hex2xterm import rgb2short
+from guard import guard_method, load_profile
+from hex2xterm import rgb2short, rgb2short_batch, rgb2short_distinct, short2rgb
+from instrument import (
+    STATS_VARIABLE,
+    count_branches,
+    instrument_branches,
+    instrument_use,
+)
+from palettes import iter_palettes
+from specialize import drop_inlined_helpers, specialize_method
 
 BASE_FILE = Path("base_config.py")
+COLORS_FILE = Path("colors.py")
 OUTPUT_DIR = Path("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 PLACEHOLDER_PATTERN = r'^([A-Z0-9_]+)\s*=\s*".*?"'
+BASE_CLASS_NAME = "BaseConfig"
+CLASS_SLOT = "<class>"
+USE_PATTERN = r"^    def use\(self, context\):$"
+TABLE_DEPTH = 2
+CHECK_SAMPLES = 2000
+# How many of the most frequent contexts of a profile go into the table.
+PROFILE_TABLE_SIZE = 1024
+# At runtime: how many context keys are interned, shared by all loaded schemes,
+# and how many contexts missing from each table are memoized.
+CONTEXT_KEY_CACHE = 4096
+MISS_CACHE = 1024
+# Color depths every scheme has a table for, each with the least number of
+# colors a terminal must show to use it, and the one used when the terminal's
+# is unknown. Truecolor codes are 0xRRGGBB, as ncurses takes them for
+# direct-color terminals (such as TERM=xterm-direct).
+COLOR_DEPTHS = {"truecolor": 1 << 24, "256": 256, "16": 16}
+DEFAULT_DEPTH = "256"
+# Terminals with fewer than 16 colors get the 16-color codes converted, by the
+# code each of 0-15 becomes: 8-color terminals lack the bright variants (8-15)
+# of their colors, and monochrome ones (any fewer) only have their defaults.
+FEWER_COLORS = {"8": (8, (*range(8), *range(8))), "monochrome": (0, (-1,) * 16)}
+# Sets the color depth of the schemes instead of the terminal's.
+DEPTH_VARIABLE = "CATPPUCCIN_RANGER_DEPTH"
+# `--distinct-colors`: the 256-color codes are assigned jointly, out of all
+# but the system colors (which terminal themes redefine), by CIEDE2000.
+DISTINCT_METHOD = "nearest"
+DISTINCT_METRIC = "ciede2000"
+# Stand-in xterm codes for a flavor's colors while its color pairs are found:
+# above 255, so they cannot be mistaken for codes written in the template.
+PAIR_PROBE = 1000
+# ranger runs under `python -O`, so ship bytecode for that level as well.
+BYTECODE_LEVELS = (0, 1)
+IMPORT_REPEAT = 20
+CACHE_FILE = ".build-cache.json"
+CONVERTER_MODULES = (
+    "build",
+    "hex2xterm",
+    "ranger_stub",
+    "specialize",
+    "audit",
+    "instrument",
+    "guard",
+)
+BUILD_WINDOW = 4
+# Watch mode: polling interval without inotify, and how long to wait for the
+# rest of a burst of events (editors often save in several steps).
+WATCH_POLL = 0.05
+WATCH_SETTLE = 0.01
+IN_CLOSE_WRITE = 0x08
+IN_MOVED_TO = 0x80
+INOTIFY_EVENT = struct.Struct("iIII")
+
+# Template shared with pool workers, set once per process by `_init_worker`.
+_worker_template = None
+_worker_profile = None
+
+
+class BuildError(Exception):
+    """Raised when one or more palettes failed to build.
+
+    Attributes:
+        errors: A mapping from palette name to the error it raised.
+    """
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        self.errors = errors
+        details = "\n".join(f"  {name}: {error}" for name, error in errors.items())
+        super().__init__(f"{len(errors)} palette(s) failed to build:\n{details}")
 
 
 def hex_to_xterm(value: str) -> str:
@@ -23,23 +123,109 @@ def hex_to_xterm(value: str) -> str:
         ValueError: If the hex color code is invalid.
     """
 
+    _validate_hex(value)
+    return rgb2short(value)[0]
+
+
+def _validate_hex(value: str) -> None:
     if not re.match(r"^#?[0-9A-Fa-f]{6}$", value):
         raise ValueError(f"Invalid hex color code: {value}")
 
-    return rgb2short(value)[0]
-
 
-def flavor_to_xterm(flavor: dict[str, str]) -> dict[str, str]:
+def flavor_to_xterm(
+    flavor: dict[str, str], metric: str | None = None, distinct: bool = False
+) -> dict[str, str]:
     """Converts each hex color in a flavor to xterm color codes.
 
     Args:
         flavor: A dictionary mapping color names to hex color codes.
+        metric: The color distance to minimize, one of `hex2xterm.METRICS`;
+            by default DISTINCT_METRIC with `distinct`, as for `--distinct-colors`,
+            and sRGB distance without it.
+        distinct: Assign the codes jointly, so that different colors get
+            different codes with the least total distance (see
+            `hex2xterm.rgb2short_distinct`), out of DISTINCT_METHOD's.
 
     Returns:
         A dictionary mapping color names to xterm color codes.
+
+    Raises:
+        ValueError: If any hex color code or the metric is invalid.
+    """
+
+    for value in flavor.values():
+        _validate_hex(value)
+
+    if distinct:
+        metric = metric or DISTINCT_METRIC
+        codes = rgb2short_distinct(list(flavor.values()), DISTINCT_METHOD, metric)
+    else:
+        codes = rgb2short_batch(list(flavor.values()), metric=metric or "srgb")
+    return {key.lower(): str(code) for key, code in zip(flavor, codes)}
+
+
+def flavor_depths(
+    flavor: dict[str, str], distinct: bool = False
+) -> dict[str, dict[str, str]]:
+    """Converts each hex color in a flavor to codes for every color depth.
+
+    The colors are validated and parsed once for all depths.
+
+    Args:
+        flavor: A dictionary mapping color names to hex color codes.
+        distinct: Assign the 256-color codes jointly, as `flavor_to_xterm`
+            does, by DISTINCT_METRIC. The 16-color codes cannot all be
+            distinct, and are found as without it.
+
+    Returns:
+        For each of COLOR_DEPTHS, a dictionary mapping color names to codes:
+        the 24-bit color itself for truecolor, the xterm color of
+        `flavor_to_xterm` for 256 colors, and the nearest of the 16 system
+        colors for 16 (by CIEDE2000, which keeps more of the palette's hues
+        apart than sRGB distance does).
+
+    Raises:
+        ValueError: If any hex color code is invalid.
     """
 
-    return {key.lower(): hex_to_xterm(value) for key, value in flavor.items()}
+    for value in flavor.values():
+        _validate_hex(value)
+
+    packed = bytes.fromhex("".join(value.lstrip("#") for value in flavor.values()))
+    names = [key.lower() for key in flavor]
+    depths = {}
+    for depth in COLOR_DEPTHS:
+        if distinct and depth == "256":
+            codes = rgb2short_distinct(packed, DISTINCT_METHOD, DISTINCT_METRIC)
+        else:
+            codes = _depth_codes(packed, depth)
+        depths[depth] = {name: str(code) for name, code in zip(names, codes)}
+    return depths
+
+
+def _depth_codes(packed: bytes, depth: str) -> list[int]:
+    # The code at `depth` of each color of a packed RGB buffer.
+    if depth == "truecolor":
+        colors = (packed[i : i + 3] for i in range(0, len(packed), 3))
+        return [int.from_bytes(color, "big") for color in colors]
+    if depth == "16":
+        codes = rgb2short_batch(packed, method="system16", metric="ciede2000")
+    else:
+        codes = rgb2short_batch(packed)
+    return [int(code) for code in codes]
+
+
+def _literal_codes(codes: Iterable[int], depth: str) -> dict[int, int]:
+    # The code at `depth` of the xterm codes written in the template itself,
+    # for those that differ. Codes 0-7 are the terminal's own colors at every
+    # depth (ncurses sends them as such in direct color too), and -1 is its
+    # default color.
+    least = 8 if depth == "truecolor" else COLOR_DEPTHS[depth]
+    codes = sorted(code for code in set(codes) if code >= least)
+    if not codes:
+        return {}
+    packed = bytes.fromhex("".join(short2rgb(code) for code in codes))
+    return dict(zip(codes, _depth_codes(packed, depth)))
 
 
 def get_base_config(input_path: Path = BASE_FILE) -> str:
@@ -66,19 +252,82 @@ def get_base_config(input_path: Path = BASE_FILE) -> str:
         raise IOError(f"Error reading {input_path}: {e}")
 
 
-def save_new_config(
-    contents: str, flavor_name: str, output_path: Path = OUTPUT_DIR
-) -> None:
-    """Writes a new configuration file for a given flavor.
+def _bytecode_is_current(cfile: str, source_hash: bytes) -> bool:
+    # A checked-hash .pyc starts with the magic number, flags 0b11 and the
+    # hash of its source (PEP 552).
+    try:
+        with open(cfile, "rb") as f:
+            header = f.read(16)
+    except OSError:
+        return False
+    return header == importlib.util.MAGIC_NUMBER + b"\x03\0\0\0" + source_hash
+
+
+def compile_bytecode(output: Path) -> None:
+    """Precompiles a generated module for the running Python version.
+
+    The `.pyc` files go to the module's `__pycache__`, one per level in
+    BYTECODE_LEVELS. They are validated against a hash of the source rather
+    than its mtime, so they stay valid when the scheme is copied. Files that
+    already match the source are left alone; the others are replaced
+    atomically by `py_compile`.
+
+    Args:
+        output: The generated configuration file.
+
+    Raises:
+        py_compile.PyCompileError: If the module does not compile.
+    """
+    source_hash = importlib.util.source_hash(output.read_bytes())
+    for level in BYTECODE_LEVELS:
+        cfile = importlib.util.cache_from_source(output, optimization=level or "")
+        if _bytecode_is_current(cfile, source_hash):
+            continue
+        py_compile.compile(
+            str(output),
+            cfile=cfile,
+            doraise=True,
+            optimize=level,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+
+
+def measure_import_time(output: Path, repeat: int = IMPORT_REPEAT) -> float:
+    """Measures how long importing a generated module takes.
+
+    The module is imported against the ranger stub, from its precompiled
+    bytecode when present, like ranger does at startup.
+
+    Args:
+        output: The generated configuration file.
+        repeat: How many imports to time; the fastest is kept.
+
+    Returns:
+        The import time, in seconds.
+    """
+    best = float("inf")
+    with ranger_stub.installed():
+        for _ in range(repeat):
+            spec = importlib.util.spec_from_file_location(output.stem, output)
+            module = importlib.util.module_from_spec(spec)
+            start = time.perf_counter()
+            spec.loader.exec_module(module)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def get_output_file(flavor_name: str, output_path: Path = OUTPUT_DIR) -> Path:
+    """Returns the path of the configuration file for a given flavor.
 
     Args:
-        contents: The configuration file contents.
         flavor_name: The name of the flavor (e.g., 'latte').
-        output_path: The directory to save the output file.
+        output_path: The directory the output file is saved in.
+
+    Returns:
+        The path of the output file.
 
     Raises:
         ValueError: If the flavor name is invalid.
-        IOError: If there is an error writing the file.
     """
 
     try:
@@ -87,54 +336,1154 @@ def save_new_config(
         raise ValueError(f"Invalid flavor name: {flavor_name}")
 
     flavor_key = re.sub(r"[^a-z0-9_]", "", flavor_key)
-    output = output_path / f"catppuccin_{flavor_key}.py"
+    return output_path / f"catppuccin_{flavor_key}.py"
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically replaces a file's contents, unless they are already `data`.
+
+    The data goes to a temporary file in the same directory, which is
+    flushed to disk and then renamed over `path`, so readers see either the
+    old or the new contents and never a partial file, even after a crash.
+    The directory is synced after the rename where the platform allows it
+    (see `sync_directories`).
+
+    Args:
+        path: The file to write.
+        data: Its new contents.
+
+    Returns:
+        False if the file already held `data` and was left untouched.
+
+    Raises:
+        OSError: If there is an error writing the file.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+    sync_directories(path.parent)
+    return True
+
+
+def sync_directories(*paths: Path) -> None:
+    """Flushes the entries of directories (e.g. renamed files) to disk.
+
+    Args:
+        paths: The directories to sync; missing ones are skipped, as are all
+            of them on platforms that cannot open directories.
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def save_new_config(
+    contents: str, flavor_name: str, output_path: Path = OUTPUT_DIR
+) -> bool:
+    """Writes a new configuration file for a given flavor.
+
+    The file is replaced atomically, and only if its contents change (see
+    `write_if_changed`).
+
+    Args:
+        contents: The configuration file contents.
+        flavor_name: The name of the flavor (e.g., 'latte').
+        output_path: The directory to save the output file.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+
+    Raises:
+        ValueError: If the flavor name is invalid.
+        IOError: If there is an error writing the file.
+    """
+
+    output = get_output_file(flavor_name, output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        _ = output.write_text(contents, encoding="utf-8")
+        return write_if_changed(output, contents.encode("utf-8"))
     except IOError as e:
         raise IOError(f"Error writing to {output}: {e}")
 
 
-def update_config_colors(config: str, flavor: dict[str, str]) -> str:
-    """Replaces placeholder color values in the config with xterm values.
+class Template(NamedTuple):
+    """A base configuration compiled into literal segments and slots.
+
+    Attributes:
+        source: The base configuration string it was compiled from.
+        segments: The literal text around the slots; one more than `slots`.
+        slots: For each slot, the lowercase color name it takes the xterm
+            code of, or CLASS_SLOT for the colorscheme class name.
+        keys: The color names a flavor must provide.
+    """
+
+    source: str
+    segments: tuple[str, ...]
+    slots: tuple[str, ...]
+    keys: frozenset[str]
+
+    def render(
+        self, flavor: dict[str, str], flavor_name: str, class_name: str | None = None
+    ) -> str:
+        """Fills the slots with a flavor's colors and class name.
+
+        Args:
+            flavor: A dictionary mapping color names to xterm color codes.
+            flavor_name: The name of the flavor (e.g., 'latte').
+            class_name: The class name, instead of the flavor's (see
+                `get_class_name`).
+
+        Returns:
+            The configuration string for the flavor.
+
+        Raises:
+            ValueError: If the flavor is missing colors.
+        """
+        missing_keys = self.keys - flavor.keys()
+
+        if missing_keys:
+            raise ValueError(
+                f"Flavor {flavor_name} missing required colors: {missing_keys}"
+            )
+
+        class_name = class_name or get_class_name(flavor_name)
+        values = dict(flavor, **{CLASS_SLOT: class_name})
+        parts = [""] * (2 * len(self.slots) + 1)
+        parts[0::2] = self.segments
+        parts[1::2] = [values[slot] for slot in self.slots]
+        return "".join(parts)
+
+
+def compile_template(config: str) -> Template:
+    """Splits the base configuration around its placeholders.
+
+    Every `NAME = "..."` color placeholder becomes a slot for the xterm code
+    of `name`, and every occurrence of BASE_CLASS_NAME a slot for the class
+    name.
 
     Args:
         config: The base configuration string.
-        flavor: A dictionary mapping color names to xterm color codes.
 
     Returns:
-        The updated configuration string with replaced color values.
+        The compiled template.
+
+    Raises:
+        ValueError: If the config has no color placeholders or no class.
     """
-    pattern = re.compile(PLACEHOLDER_PATTERN, re.MULTILINE)
+    slots = [
+        (match.start(), match.end(), f"{match.group(1)} = ", match.group(1).lower())
+        for match in re.finditer(PLACEHOLDER_PATTERN, config, re.MULTILINE)
+    ]
+
+    if not slots:
+        raise ValueError("Base config has no color placeholders")
 
-    def replacer(match: re.Match[str]) -> str:
-        key = match.group(1)
-        lower_key = key.lower()
-        return f"{key} = {flavor.get(lower_key, match.group(0))}"
+    start = config.find(BASE_CLASS_NAME)
+    if start < 0:
+        raise ValueError(f"Base config does not define {BASE_CLASS_NAME}")
 
-    return pattern.sub(replacer, config)
+    while start >= 0:
+        end = start + len(BASE_CLASS_NAME)
+        slots.append((start, end, "", CLASS_SLOT))
+        start = config.find(BASE_CLASS_NAME, end)
 
+    segments = []
+    position = 0
+    for start, end, prefix, _ in sorted(slots):
+        segments.append(config[position:start] + prefix)
+        position = end
+    segments.append(config[position:])
 
-def update_config_classname(config: str, flavor_name: str) -> str:
-    """Updates the class name in the config based on the flavor name.
+    return Template(
+        source=config,
+        segments=tuple(segments),
+        slots=tuple(slot for _, _, _, slot in sorted(slots)),
+        keys=frozenset(slot for *_, slot in slots if slot != CLASS_SLOT),
+    )
+
+
+def get_class_name(flavor_name: str) -> str:
+    """Returns the colorscheme class name for a flavor.
 
     Args:
-        config: The configuration string.
         flavor_name: The name of the flavor (e.g., 'latte').
 
     Returns:
-        The configuration string with the updated class name.
+        The class name (e.g., 'CatppuccinLatte').
+
+    Raises:
+        ValueError: If the flavor name is invalid.
     """
     try:
         name = flavor_name.split()[0].lower().capitalize()
     except IndexError:
         raise ValueError(f"Invalid flavor name: {flavor_name}")
-    return config.replace("BaseConfig", f"Catppuccin{name}")
+    return f"Catppuccin{name}"
+
+
+def load_scheme(config: str, class_name: str) -> type:
+    """Executes a colorscheme against the ranger stub and returns its class.
+
+    Args:
+        config: The colorscheme source, with all colors substituted.
+        class_name: The name of the colorscheme class defined by the source.
+
+    Returns:
+        The colorscheme class.
+    """
+    namespace = {"__name__": class_name}
+    with ranger_stub.installed():
+        exec(compile(config, f"<{class_name}>", "exec"), namespace)
+    return namespace[class_name]
+
+
+def get_context_flags(config: str) -> list[str]:
+    """Finds every context flag the colorscheme reads, in source order.
+
+    Args:
+        config: The colorscheme source.
+
+    Returns:
+        The names of all `context.<flag>` attributes used in the source.
+    """
+    flags = {}
+    for node in ast.walk(ast.parse(config)):
+        if (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "context"
+        ):
+            flags.setdefault((node.lineno, node.col_offset), node.attr)
+
+    return list(dict.fromkeys(flags[pos] for pos in sorted(flags)))
+
+
+class _TracingContext:
+    """Context that records every flag the colorscheme asks for."""
+
+    def __init__(self, keys: frozenset[str]) -> None:
+        self.keys = keys
+        self.read: set[str] = set()
+
+    def __getattr__(self, name: str) -> bool:
+        self.read.add(name)
+        return name in self.keys
+
+
+def _trace(scheme, keys: frozenset[str]) -> tuple[tuple[int, int, int], set[str]]:
+    context = _TracingContext(keys)
+    return scheme._evaluate(context), context.read
+
+
+def _reachable_flags(scheme, keys: frozenset[str], anchors: frozenset[str]) -> set[str]:
+    _, reachable = _trace(scheme, keys)
+    pending = list(reachable - anchors)
+
+    while pending:
+        _, read = _trace(scheme, keys | {pending.pop()})
+        pending.extend(read - reachable - anchors)
+        reachable |= read
+
+    return reachable - anchors - keys
+
+
+def compile_decision_table(
+    scheme, flags: list[str], depth: int = TABLE_DEPTH
+) -> dict[int, tuple[int, int, int]]:
+    """Evaluates a colorscheme over the context combinations it can see.
+
+    Each flag read by `use()` with an empty context (the `in_*` sections, text
+    highlighting, vcs files, ...) anchors an enumeration of every combination
+    of up to `depth` further flags reachable from it without going through
+    another anchor. Contexts outside of that set are still resolved by the
+    branchy code at lookup time.
+
+    Args:
+        scheme: An instance of the colorscheme, with `use` renamed to
+            `_evaluate`.
+        flags: The context flags read by the colorscheme; their position is
+            the bit they take in the table key.
+        depth: How many flags to combine with each anchor.
+
+    Returns:
+        A mapping from context-flag bitmask to `(fg, bg, attr)`.
+    """
+    bits = {flag: 1 << i for i, flag in enumerate(flags)}
+    table = {}
+
+    _, anchors = _trace(scheme, frozenset())
+    anchors = frozenset(anchors)
+    for anchor in [None, *sorted(anchors, key=flags.index)]:
+        if anchor is None:
+            keys, reachable = frozenset(), anchors
+        else:
+            keys = frozenset([anchor])
+            reachable = _reachable_flags(scheme, keys, anchors)
+        reachable = sorted(reachable, key=flags.index)
+
+        for size in range(depth + 1):
+            for extra in itertools.combinations(reachable, size):
+                context = keys.union(extra)
+                key = sum(bits[flag] for flag in context)
+                if key not in table:
+                    table[key], _ = _trace(scheme, context)
+
+    return table
+
+
+def _attr_names(attr: int) -> list[str]:
+    names = []
+    for name in ranger_stub.ATTRIBUTE_NAMES:
+        value = getattr(ranger_stub, name)
+        if attr & value:
+            names.append(name)
+            attr &= ~value
+
+    if attr:
+        raise ValueError(f"Unknown attribute bits in colorscheme: {attr}")
+
+    return names
+
+
+def render_decision_table(
+    table: dict[int, tuple[int, int, int]],
+    flags: list[str],
+    pairs: list[tuple[int, int]] = (),
+) -> str:
+    """Renders the table-driven `use()` and its table as source.
+
+    Args:
+        table: A mapping from context-flag bitmask to `(fg, bg, attr)`.
+        flags: The context flags in bit order.
+        pairs: The `(fg, bg)` pairs to allocate when the scheme is loaded, as
+            from `color_pairs`; none if empty.
+
+    Returns:
+        Source for a `use()` method, to be placed at the end of the class body,
+        followed by the module-level tables it reads.
+
+    The table holds literals only, so importing it costs no computation.
+    Attributes are stored with the ncurses values of ranger's `bold`,
+    `reverse`, ...; on a curses build where they differ, the table is
+    dropped and every context goes through `_evaluate()`.
+
+    A context's key is computed once per distinct tuple of its flags and
+    interned in a table shared, through `sys.modules`, by every loaded scheme
+    with the same `flags`, so that all flavors, tabs and panes reuse it.
+    Both that table and the memo of contexts missing from `table` are
+    bounded (`CONTEXT_KEY_CACHE`, `MISS_CACHE`); past that, keys and colors
+    are computed on every call rather than stored.
+
+    With `pairs`, the scheme also allocates their curses color pairs as soon
+    as curses is started (from ranger's `hook_ready` when the scheme is
+    created while reading rc.conf), so that drawing never has to. If the
+    terminal has fewer pairs, the first ones are allocated and ranger
+    allocates the others when they are drawn, as without the list.
+    """
+    rows = ",\n".join(
+        f"    {key:#x}: ({fg}, {bg}, {attr})"
+        for key, (fg, bg, attr) in sorted(table.items())
+    )
+    guard = _attrs_guard(table)
+    if guard:
+        guard = f"if {guard}:\n    _COLORS = {{}}\n"
+    # Two blank lines after the color pair functions, one after `_KEYS`.
+    separator = "\n" if pairs else ""
+
+    return f"""{_render_lookup(flags, pairs)}{separator}
+# Generated by build.py: (fg, bg, attr) for each context-flag bitmask.
+_COLORS = {{
+{rows},
+}}
+{guard}_COLORS_LIMIT = len(_COLORS) + {MISS_CACHE}
+"""
+
+
+def _attrs_guard(table: dict[int, tuple[int, int, int]]) -> str:
+    # The condition under which the curses build's attributes differ from the
+    # values stored in `table`.
+    attrs = sorted(
+        {name for _, _, attr in table.values() for name in _attr_names(attr)},
+        key=ranger_stub.ATTRIBUTE_NAMES.index,
+    )
+    return " or ".join(f"{name} != {getattr(ranger_stub, name)}" for name in attrs)
+
+
+def _render_lookup(
+    flags: list[str], pairs: list[tuple[int, int]], by_depth: bool = False
+) -> str:
+    # Returns the table-driven `use()` and the module-level code it calls, but
+    # not the tables it reads. With `by_depth`, the colors of `_evaluate()`
+    # are translated through `_CODES`, and `_COLOR_PAIRS` is set along with
+    # it (see `_render_depths`).
+    bits = ",\n".join(f"        {flag!r}: 1 << {i}" for i, flag in enumerate(flags))
+    layout = hashlib.sha256(json.dumps(list(flags)).encode()).hexdigest()[:16]
+    if pairs:
+        init, allocate = _render_color_pairs(None if by_depth else pairs)
+    else:
+        init = allocate = ""
+    if by_depth:
+        miss = (
+            "if _DEPTH is None:\n"
+            "                _use_depth(_color_depth())\n"
+            "                if key in _COLORS:\n"
+            "                    return _COLORS[key]\n"
+            "            fg, bg, attr = self._evaluate(context)\n"
+            "            colors = (_CODES.get(fg, fg), _CODES.get(bg, bg), attr)"
+        )
+    else:
+        miss = "colors = self._evaluate(context)"
+
+    return f"""{init}
+    def use(self, context):
+        flags = tuple(context.__dict__)
+        key = _KEYS.get(flags)
+        if key is None:
+            key = _intern_key(flags)
+        try:
+            return _COLORS[key]
+        except KeyError:
+            {miss}
+            if len(_COLORS) < _COLORS_LIMIT:
+                _COLORS[key] = colors
+            return colors
+
+
+def _shared_keys(name, flag_bits):
+    # One table of context keys for every loaded scheme with the same flags.
+    import sys
+    import types
+
+    shared = sys.modules.get(name)
+    if shared is None:
+        shared = sys.modules[name] = types.ModuleType(name)
+        shared.FLAG_BITS = flag_bits
+        shared.KEYS = {{}}
+    return shared.FLAG_BITS, shared.KEYS
+
+
+def _intern_key(flags):
+    key = 0
+    for flag in flags:
+        key |= _FLAG_BITS.get(flag, 0)
+    if len(_KEYS) < {CONTEXT_KEY_CACHE}:
+        _KEYS[flags] = key
+    return key
+
+
+# Generated by build.py: bit of each context flag read by the scheme, and the
+# bitmask of each tuple of flags seen.
+_FLAG_BITS, _KEYS = _shared_keys(
+    "_catppuccin_ranger_keys_{layout}",
+    {{
+{bits},
+    }},
+)
+{allocate}"""
+
+
+def _render_depths(
+    table: dict[int, tuple[int, int, int]],
+    depths: Mapping[str, dict[int, int]],
+    pairs: list[tuple[int, int]],
+    guard: str,
+    constants: Mapping[str, int],
+    class_name: str,
+    class_attrs: Iterable[tuple[str, str]],
+) -> str:
+    # Returns the tables of a scheme that chooses its colors when it is loaded,
+    # and the code that chooses them. Along with the tables, it sets the color
+    # constants (`constants`, by name, with the code `depths` maps) and the
+    # attributes of `class_name` assigned from them (`class_attrs`, as
+    # (attribute, constant) pairs) to the depth's codes.
+    functions = []
+    codes = []
+    values = []
+    pair_rows = []
+    for depth, mapping in depths.items():
+        colors = {
+            key: (mapping.get(fg, fg), mapping.get(bg, bg), attr)
+            for key, (fg, bg, attr) in table.items()
+        }
+        rows = "".join(f"        {key:#x}: {colors[key]},\n" for key in sorted(colors))
+        functions.append(f"\n\ndef _colors_{depth}():\n    return {{\n{rows}    }}\n")
+        codes.append(f"    {depth!r}: {dict(sorted(mapping.items()))!r},\n")
+        depth_values = {name: mapping[code] for name, code in constants.items()}
+        values.append(f"    {depth!r}: {depth_values!r},\n")
+        translated = dict.fromkeys(
+            (mapping.get(fg, fg), mapping.get(bg, bg)) for fg, bg in pairs
+        )
+        rows = "".join(f"        ({fg}, {bg}),\n" for fg, bg in translated)
+        pair_rows.append(f"    {depth!r}: (\n{rows}    ),\n")
+
+    least = sorted([(COLOR_DEPTHS[depth], depth) for depth in depths])[::-1]
+    fewer = {}
+    if "16" in depths:
+        fewer = {depth: ("16", codes) for depth, (_, codes) in FEWER_COLORS.items()}
+        least += [(colors, depth) for depth, (colors, _) in FEWER_COLORS.items()]
+    select = [
+        "    _DEPTH = depth",
+        "    depth, fewer = _FEWER_COLORS.get(depth, (depth, None))",
+        "    _CODES = _DEPTH_CODES[depth]",
+        "    _COLORS = _TABLES[depth]()",
+        "    constants = _DEPTH_CONSTANTS[depth]",
+    ]
+    convert = [
+        "    if fewer:",
+        "",
+        "        def convert(code):",
+        "            return fewer[code] if 0 <= code < 16 else code",
+        "",
+        "        _CODES = {code: convert(value) for code, value in _CODES.items()}",
+        "        _CODES.update((code, convert(code)) for code in range(16))",
+        "        _COLORS = {",
+        "            key: (convert(fg), convert(bg), attr)",
+        "            for key, (fg, bg, attr) in _COLORS.items()",
+        "        }",
+        "        constants = {name: convert(code) for name, code in constants.items()}",
+    ]
+    names = "_DEPTH, _CODES, _COLORS, _COLORS_LIMIT"
+    pairs_table = ""
+    if pairs:
+        select.append("    _COLOR_PAIRS = _DEPTH_PAIRS[depth]")
+        convert += [
+            "        _COLOR_PAIRS = tuple(",
+            "            dict.fromkeys((convert(fg), convert(bg)) for fg, bg in _COLOR_PAIRS)",
+            "        )",
+        ]
+        names += ", _COLOR_PAIRS"
+        pairs_table = f"""
+# Generated by build.py: every (fg, bg) use() can return, most common first,
+# at each color depth.
+_DEPTH_PAIRS = {{
+{"".join(pair_rows)}}}
+"""
+    select += convert
+    if guard:
+        select += [f"    if {guard}:", "        _COLORS = {}"]
+    select.append(f"    _COLORS_LIMIT = len(_COLORS) + {MISS_CACHE}")
+    select.append("    globals().update(constants)")
+    select += [f"    {class_name}.{attr} = {name}" for attr, name in class_attrs]
+    select = "\n".join(select)
+    tables = "\n".join(f"    {depth!r}: _colors_{depth}," for depth in depths)
+
+    return f"""
+
+# Generated by build.py: (fg, bg, attr) for each context-flag bitmask, at each
+# color depth; only the terminal's is built.{"".join(functions)}
+
+_TABLES = {{
+{tables}
+}}
+
+# Generated by build.py: the code at each color depth of the colors
+# _evaluate() returns.
+_DEPTH_CODES = {{
+{"".join(codes)}}}
+
+# Generated by build.py: the value of each color constant at each color depth.
+_DEPTH_CONSTANTS = {{
+{"".join(values)}}}
+{pairs_table}
+# Generated by build.py: for terminals with fewer colors than any table, the
+# table they use and the code each of its codes 0-15 becomes.
+_FEWER_COLORS = {fewer!r}
+
+# Generated by build.py: the least number of colors of each depth's terminals.
+_DEPTH_COLORS = {tuple(least)!r}
+
+
+def _color_depth():
+    # The terminal's, from its terminfo entry, unless set in the environment.
+    import os
+
+    depth = os.environ.get("{DEPTH_VARIABLE}")
+    if depth in _TABLES or depth in _FEWER_COLORS:
+        return depth
+    try:
+        import curses
+
+        try:
+            colors = curses.COLORS  # Only once curses is started.
+        except AttributeError:
+            curses.setupterm()
+            colors = curses.tigetnum("colors")  # -1 if it has none.
+    except Exception:  # No curses, no terminal, unknown $TERM, ...
+        return "{DEFAULT_DEPTH}"
+    for least, depth in _DEPTH_COLORS:
+        if colors >= least:
+            break
+    return depth
+
+
+def _use_depth(depth):
+    global {names}
+{select}
+
+
+# Chosen by the first use() or color pair allocation, which ranger only does
+# once curses is started, so that importing the scheme leaves the terminal
+# alone.
+_DEPTH = None
+_COLORS = {{}}
+"""
+
+
+def _render_color_pairs(pairs: list[tuple[int, int]] | None) -> tuple[str, str]:
+    # Returns the scheme's `__init__` and the module-level code it calls, which
+    # allocates `pairs`, or `_COLOR_PAIRS` as set by `_use_depth` if None.
+    init = """
+    def __init__(self):
+        super().__init__()
+        if not _allocate_color_pairs():
+            _allocate_when_ready()
+"""
+    allocate = ""
+    if pairs is not None:
+        rows = "".join(f"    ({fg}, {bg}),\n" for fg, bg in pairs)
+        allocate = f"""
+
+# Generated by build.py: every (fg, bg) use() can return, most common first.
+_COLOR_PAIRS = (
+{rows})
+"""
+    # With a table per depth, curses is started by now: choose the terminal's.
+    choose = (
+        ""
+        if pairs is not None
+        else "\n    if _DEPTH is None:\n        _use_depth(_color_depth())"
+    )
+    allocate += f"""
+
+def _allocate_color_pairs():
+    try:
+        import curses
+        from ranger.gui.color import COLOR_PAIRS, get_color
+
+        limit = curses.COLOR_PAIRS
+    except (ImportError, AttributeError):
+        return False
+{choose}
+    for pair in _COLOR_PAIRS:
+        if pair not in COLOR_PAIRS:
+            if len(COLOR_PAIRS) >= limit:
+                break
+            get_color(*pair)
+    return True
+
+
+def _allocate_when_ready():
+    # ranger creates the scheme while reading rc.conf, before it starts curses.
+    try:
+        import ranger.api
+    except ImportError:
+        return
+    hook_ready = ranger.api.hook_ready
+
+    def allocate_then_hook_ready(fm):
+        _allocate_color_pairs()
+        return hook_ready(fm)
+
+    ranger.api.hook_ready = allocate_then_hook_ready
+"""
+    return init, allocate
+
+
+def prune_imports(config: str, keep: Iterable[str] = ()) -> str:
+    """Drops imported names the module never uses.
+
+    Args:
+        config: The colorscheme source.
+        keep: Names to keep even if the source does not use them, e.g. those
+            read by code that is appended to it afterwards.
+
+    Returns:
+        The source with unused names removed from its `from ... import`
+        statements, and statements left empty removed altogether.
+    """
+    tree = ast.parse(config)
+    used = {
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+    }
+    used.update(keep)
+    lines = config.splitlines(keepends=True)
+
+    for node in reversed(tree.body):
+        if not isinstance(node, ast.ImportFrom) or node.module == "__future__":
+            continue
+
+        names = [alias for alias in node.names if (alias.asname or alias.name) in used]
+        if len(names) == len(node.names):
+            continue
+
+        statement = ast.unparse(ast.ImportFrom(node.module, names, node.level))
+        lines[node.lineno - 1 : node.end_lineno] = [f"{statement}\n"] if names else []
+
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_keys(flags: tuple[str, ...]) -> list[int]:
+    rng = random.Random(0)
+    return [
+        sum(1 << i for i in rng.sample(range(len(flags)), rng.randint(1, 6)))
+        for _ in range(CHECK_SAMPLES)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _check_context(flags: tuple[str, ...], key: int) -> ranger_stub.Context:
+    # Contexts are never modified, so every flavor's check shares them.
+    keys = []
+    while key:
+        keys.append(flags[(key & -key).bit_length() - 1])
+        key &= key - 1
+    return ranger_stub.Context(keys)
+
+
+def _probe_codes(keys: Iterable[str]) -> dict[int, str]:
+    # A distinct PAIR_PROBE code for each color name.
+    return dict(enumerate(sorted(keys), PAIR_PROBE))
+
+
+@functools.lru_cache(maxsize=8)
+def _color_pair_slots(source: str) -> tuple[tuple[int | str, int | str], ...]:
+    # The (fg, bg) pairs use() can return, as color names or literal codes,
+    # the ones returned for the smallest contexts first. Which colors use()
+    # returns does not depend on their values, so this is done once per
+    # template, with every color replaced by a distinct PAIR_PROBE code.
+    import audit  # audit imports build
+
+    template = compile_template(source)
+    names = _probe_codes(template.keys)
+    probe = {name: str(code) for code, name in names.items()}
+    outcomes, _ = audit.enumerate_outcomes(probe, "probe", template)
+
+    sizes = {}
+    for (fg, bg, _), flags in outcomes.items():
+        sizes[fg, bg] = min(len(flags), sizes.get((fg, bg), len(flags)))
+    return tuple(
+        (names.get(fg, fg), names.get(bg, bg))
+        for fg, bg in sorted(sizes, key=lambda pair: (sizes[pair], pair))
+    )
+
+
+def color_pairs(template: Template, flavor: dict[str, str]) -> list[tuple[int, int]]:
+    """Lists every `(fg, bg)` a flavor's `use()` can return.
+
+    Args:
+        template: The compiled base configuration.
+        flavor: A dictionary mapping color names to xterm color codes.
+
+    Returns:
+        The distinct pairs, those of the simplest contexts (and so, as a
+        rule, the most common ones) first.
+    """
+    codes = {name: int(code) for name, code in flavor.items()}
+    pairs = (
+        (codes.get(fg, fg), codes.get(bg, bg))
+        for fg, bg in _color_pair_slots(template.source)
+    )
+    return list(dict.fromkeys(pairs))
+
+
+def update_config_table(
+    config: str,
+    class_name: str,
+    pairs: list[tuple[int, int]] = (),
+    profile: Counter[frozenset[str]] | None = None,
+) -> str:
+    """Replaces the branchy `use()` with a precomputed decision table.
+
+    The original `use()` is renamed to `_evaluate()` and used to build the
+    table. In the generated scheme, `_evaluate()` resolves the contexts the
+    table does not cover, specialized for the flavor's palette (see
+    `specialize`). The generated scheme is checked against the original for
+    every table entry and for a random sample of other contexts.
+
+    With a `profile`, its most frequent contexts are added to the table, and
+    `_evaluate()` guards its rarely taken branches (see `guard`); the guarded
+    `_evaluate()` is also checked against the original, on the profile's
+    contexts and on the sample.
+
+    Args:
+        config: The colorscheme source, with all colors substituted.
+        class_name: The name of the colorscheme class.
+        pairs: The `(fg, bg)` pairs to allocate when the scheme is loaded
+            (see `render_decision_table`).
+        profile: How often each context was seen, as from
+            `guard.load_profile`.
+
+    Returns:
+        The colorscheme source with the table-driven `use()`.
+
+    Raises:
+        ValueError: If the config does not define exactly one `use()` at the
+            end of the class, if the generated table disagrees with it, or if
+            it returns a pair missing from `pairs`.
+    """
+    config, scheme, table, flags = _compile_table(config, class_name, profile)
+    config += render_decision_table(table, flags, pairs)
+    _check_table(config, class_name, scheme, table, flags, pairs, profile)
+    return config
+
+
+def _compile_table(
+    config: str,
+    class_name: str,
+    profile: Counter[frozenset[str]] | None,
+    instrument: bool = False,
+) -> tuple[str, object, dict[int, tuple[int, int, int]], list[str]]:
+    # Renames use() to _evaluate() and builds the decision table from it.
+    # Returns the config with _evaluate() specialized (and guarded, with a
+    # profile) but no use(), an instance of the original scheme, the table
+    # and the flags in bit order. The helpers _evaluate() inlines are only
+    # kept when `instrument`ed, as the labels of their counters.
+    config, count = re.subn(
+        USE_PATTERN, "    def _evaluate(self, context):", config, flags=re.MULTILINE
+    )
+    if count != 1:
+        raise ValueError(f"Expected one use() method in {class_name}, got {count}")
+
+    flags = get_context_flags(config)
+    scheme = load_scheme(config, class_name)()
+    table = compile_decision_table(scheme, flags)
+    contexts = [keys for keys, _ in profile.most_common()] if profile else []
+    bits = {flag: 1 << i for i, flag in enumerate(flags)}
+    for keys in contexts[:PROFILE_TABLE_SIZE]:
+        key = sum(bits.get(flag, 0) for flag in keys)
+        if key not in table:
+            table[key] = scheme._evaluate(ranger_stub.Context(keys))
+    config = specialize_method(config, class_name, "_evaluate")
+    if profile:
+        config = guard_method(config, class_name, "_evaluate", profile)
+    if not instrument:
+        config = drop_inlined_helpers(config, class_name)
+    # Pruned before the table is appended, which is large to parse and only
+    # reads the attributes of its curses guard.
+    guarded = {name for _, _, attr in table.values() for name in _attr_names(attr)}
+    config = prune_imports(config, guarded)
+    return config.rstrip("\n") + "\n", scheme, table, flags
+
+
+def _check_table(
+    config: str,
+    class_name: str,
+    scheme,
+    table: dict[int, tuple[int, int, int]],
+    flags: list[str],
+    pairs: list[tuple[int, int]],
+    profile: Counter[frozenset[str]] | None,
+    depths: Mapping[str, dict[int, int]] | None = None,
+    constants: Mapping[str, int] | None = None,
+    class_attrs: Iterable[tuple[str, str]] = (),
+) -> None:
+    # Checks a generated scheme against the original `scheme` (see
+    # `update_config_table`); with `depths`, at each color depth, along with
+    # the values of its color constants and of the class attributes assigned
+    # from them (see `_render_depths`).
+    contexts = [keys for keys, _ in profile.most_common()] if profile else []
+    flags = tuple(flags)
+    generated = load_scheme(config, class_name)()
+    namespace = generated.use.__globals__
+    keys = [*table, *_sample_keys(flags)]
+    expected = {key: scheme._evaluate(_check_context(flags, key)) for key in keys}
+    for depth, codes in (depths or {None: {}}).items():
+        if depth is not None:
+            namespace["_use_depth"](depth)
+        for name, code in (constants or {}).items():
+            if namespace[name] != codes[code]:
+                raise ValueError(f"{class_name} sets {name} to {namespace[name]}")
+        for attr, name in class_attrs:
+            if getattr(generated, attr) != namespace[name]:
+                raise ValueError(f"{class_name}.{attr} is not {name}")
+        allocated = {(codes.get(fg, fg), codes.get(bg, bg)) for fg, bg in pairs}
+        for key in keys:
+            fg, bg, attr = expected[key]
+            colors = generated.use(_check_context(flags, key))
+            if colors != (codes.get(fg, fg), codes.get(bg, bg), attr):
+                raise ValueError(f"Generated {class_name} disagrees at {key:#x}")
+            if allocated and colors[:2] not in allocated:
+                raise ValueError(f"{class_name} returns {colors[:2]} at {key:#x}")
+
+    for key in keys if profile else ():
+        if generated._evaluate(_check_context(flags, key)) != expected[key]:
+            raise ValueError(f"Guarded {class_name} disagrees at {key:#x}")
+
+    for keys in contexts:
+        context = ranger_stub.Context(keys)
+        if generated._evaluate(context) != scheme._evaluate(context):
+            raise ValueError(f"Guarded {class_name} disagrees at {sorted(keys)}")
+
+
+def _table_branches(
+    scheme, table: dict[int, tuple[int, int, int]], flags: list[str]
+) -> dict[int, tuple[int, ...]]:
+    # The counters each table entry stands for, in an instrumented `scheme`
+    # (see `instrument.count_branches`).
+    flags = tuple(flags)
+    contexts = {key: _check_context(flags, key) for key in table}
+    return count_branches(scheme._evaluate, contexts)
+
+
+class _ProbeScheme(NamedTuple):
+    # What a template's schemes with a table per color depth have in common,
+    # as found by `_probe_scheme`.
+    template: Template  # The scheme, less its depth tables, as a template.
+    names: dict[int, str]  # The color name of each PAIR_PROBE code.
+    literals: dict[str, dict[int, int]]  # `_literal_codes` at each depth.
+    table: dict[int, tuple[int, int, int]]
+    pairs: list[tuple[int, int]]
+    guard: str  # See `_attrs_guard`.
+    class_attrs: tuple[tuple[str, str], ...]  # See `_render_depths`.
+
+
+def _profile_key(
+    profile: Counter[frozenset[str]] | None,
+) -> frozenset[tuple[frozenset[str], int]] | None:
+    # A profile in a form `_probe_scheme` can cache on.
+    return frozenset(profile.items()) if profile else None
+
+
+def _inline_class_attrs(
+    config: str, class_name: str, constants: set[str]
+) -> tuple[str, tuple[tuple[str, str], ...]]:
+    # Finds the attributes the body of `class_name` assigns one of `constants`
+    # to, as (attribute, constant) pairs, and has its methods read the
+    # constant instead, so that `specialize` folds it in like the others.
+    cls = next(
+        node
+        for node in ast.parse(config).body
+        if isinstance(node, ast.ClassDef) and node.name == class_name
+    )
+    class_attrs = dict(
+        (node.targets[0].id, node.value.id)
+        for node in cls.body
+        if isinstance(node, ast.Assign)
+        and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+        and isinstance(node.value, ast.Name)
+        and node.value.id in constants
+    )
+    reads = sorted(
+        (
+            (node.lineno, node.col_offset, node.end_col_offset, class_attrs[node.attr])
+            for node in ast.walk(cls)
+            if isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "self"
+            and node.attr in class_attrs
+            and isinstance(node.ctx, ast.Load)
+        ),
+        reverse=True,
+    )
+    lines = config.splitlines(keepends=True)
+    for lineno, start, end, name in reads:
+        line = lines[lineno - 1].encode()  # Offsets are in UTF-8 bytes.
+        lines[lineno - 1] = (line[:start] + name.encode() + line[end:]).decode()
+    return "".join(lines), tuple(class_attrs.items())
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_scheme(
+    source: str,
+    instrument: bool,
+    profile: frozenset[tuple[frozenset[str], int]] | None,
+) -> _ProbeScheme:
+    # Builds and checks, once per template, everything of a scheme with a
+    # table per color depth that does not depend on the flavor's colors. The
+    # scheme is evaluated with a distinct PAIR_PROBE code standing for each
+    # color, which only `_evaluate()` and the depth tables keep: its color
+    # constants are turned back into placeholders, so that each flavor's
+    # scheme is rendered like the base config, then given its depth tables.
+    template = compile_template(source)
+    names = _probe_codes(template.keys)
+    probe = {name: str(code) for code, name in names.items()}
+    config = template.render(probe, "probe", BASE_CLASS_NAME)
+    pairs = color_pairs(template, probe)
+    literals = {code for pair in pairs for code in pair if code < PAIR_PROBE}
+    profile = Counter(dict(profile)) if profile else None
+    config, class_attrs = _inline_class_attrs(
+        config, BASE_CLASS_NAME, {name.upper() for name in template.keys}
+    )
+
+    if instrument:
+        config, labels = instrument_branches(config, BASE_CLASS_NAME)
+    config, scheme, table, flags = _compile_table(
+        config, BASE_CLASS_NAME, profile, instrument
+    )
+    config += _render_lookup(flags, pairs, by_depth=True)
+    if instrument:
+        branches = _table_branches(scheme, table, flags)
+        config = instrument_use(config, BASE_CLASS_NAME, labels, branches)
+
+    constants = {}
+    for code, name in names.items():
+        constant = name.upper()
+        config, count = re.subn(
+            rf"^{constant} = {code}\b", f'{constant} = "..."', config, 1, re.MULTILINE
+        )
+        if not count:
+            raise ValueError(f"Color {constant} was rewritten in the scheme")
+        constants[constant] = code
+
+    probe_scheme = _ProbeScheme(
+        template=compile_template(config),
+        names=names,
+        literals={depth: _literal_codes(literals, depth) for depth in COLOR_DEPTHS},
+        table=table,
+        pairs=pairs,
+        guard=_attrs_guard(table),
+        class_attrs=class_attrs,
+    )
+
+    # Checked with made-up colors: the rest only substitutes codes.
+    sample = {
+        name: hashlib.sha256(name.encode()).hexdigest()[:6] for name in template.keys
+    }
+    config, codes = _render_probe_scheme(probe_scheme, flavor_depths(sample), "probe")
+    _check_table(
+        config,
+        get_class_name("probe"),
+        scheme,
+        table,
+        flags,
+        pairs,
+        profile,
+        codes,
+        constants,
+        class_attrs,
+    )
+    return probe_scheme
+
+
+def _render_probe_scheme(
+    probe: _ProbeScheme, depths: Mapping[str, dict[str, str]], flavor_name: str
+) -> tuple[str, dict[str, dict[int, int]]]:
+    # Renders a flavor's scheme from `_probe_scheme`, given its colors at each
+    # depth. Returns it, with the code of each probe and literal code at each
+    # depth, including the `FEWER_COLORS` ones.
+    codes = {}
+    for depth in sorted(depths, key=list(COLOR_DEPTHS).index):
+        depth_flavor = depths[depth]
+        missing_keys = probe.template.keys - depth_flavor.keys()
+        if missing_keys:
+            raise ValueError(
+                f"Flavor {flavor_name} missing required colors: {missing_keys}"
+            )
+        codes[depth] = {
+            code: int(depth_flavor[name]) for code, name in probe.names.items()
+        }
+        codes[depth].update(probe.literals[depth])
+
+    constants = {name.upper(): code for code, name in probe.names.items()}
+    config = probe.template.render(depths[DEFAULT_DEPTH], flavor_name)
+    config += _render_depths(
+        probe.table,
+        codes,
+        probe.pairs,
+        probe.guard,
+        constants,
+        get_class_name(flavor_name),
+        probe.class_attrs,
+    )
+    for depth, (_, fewer) in FEWER_COLORS.items() if "16" in codes else ():
+        convert = dict(enumerate(fewer))
+        codes[depth] = {code: convert.get(v, v) for code, v in codes["16"].items()}
+        codes[depth].update(convert)
+    return config, codes
+
+
+def render_config(
+    template: Template,
+    flavor: dict[str, str],
+    flavor_name: str,
+    instrument: bool = False,
+    profile: Counter[frozenset[str]] | None = None,
+    depths: Mapping[str, dict[str, str]] | None = None,
+) -> str:
+    """Renders a flavor's config, with its decision table, from a template.
+
+    Args:
+        template: The compiled base configuration.
+        flavor: A dictionary mapping color names to xterm color codes.
+        flavor_name: The name of the flavor (e.g., 'latte').
+        instrument: Count and time the scheme's evaluations (see
+            `instrument`). Without it, the config has no trace of them.
+        profile: A context profile to optimize the scheme for (see
+            `update_config_table`).
+        depths: The flavor's codes at other color depths than DEFAULT_DEPTH,
+            as from `flavor_depths`. The scheme then chooses its colors when
+            it is loaded, from the terminal's number of colors, and `flavor`
+            gives those of DEFAULT_DEPTH. The decision table is built once
+            for all depths, with a distinct PAIR_PROBE code standing for each
+            color, so the template's tests compare colors by name: `fg in
+            (RED, PINK)` holds for those two only, even at a depth where
+            another color has the same code. Codes written in the template
+            are converted to each depth as well. As it does not depend on
+            the colors, the table and `_evaluate()` are built and checked
+            once per template (and `instrument` and `profile`); each flavor
+            only fills in its codes.
+
+    Returns:
+        The configuration string for the flavor.
+
+    Raises:
+        ValueError: If the flavor is missing colors, or a depth is unknown.
+    """
+    if depths:
+        depths = {DEFAULT_DEPTH: flavor, **depths}
+        unknown = depths.keys() - COLOR_DEPTHS.keys()
+        if unknown:
+            raise ValueError(f"Unknown color depths: {sorted(unknown)}")
+        probe = _probe_scheme(template.source, instrument, _profile_key(profile))
+        config, _ = _render_probe_scheme(probe, depths, flavor_name)
+        return config
+
+    class_name = get_class_name(flavor_name)
+    config = template.render(flavor, flavor_name)
+    pairs = color_pairs(template, flavor)
+    if not instrument:
+        return update_config_table(config, class_name, pairs, profile)
+
+    # As update_config_table does, keeping the original scheme to count its
+    # branches.
+    config, labels = instrument_branches(config, class_name)
+    config, scheme, table, flags = _compile_table(
+        config, class_name, profile, instrument=True
+    )
+    config += render_decision_table(table, flags, pairs)
+    _check_table(config, class_name, scheme, table, flags, pairs, profile)
+    branches = _table_branches(scheme, table, flags)
+    return instrument_use(config, class_name, labels, branches)
 
 
 def update_config(config: str, flavor: dict[str, str], flavor_name: str) -> str:
-    """Updates the config with xterm colors and a new class name.
+    """Updates the config with xterm colors, a new class name and a decision table.
 
     Args:
         config: The base configuration string.
@@ -144,29 +1493,622 @@ def update_config(config: str, flavor: dict[str, str], flavor_name: str) -> str:
     Returns:
         The updated configuration string.
     """
-    colors = update_config_colors(config, flavor)
-    return update_config_classname(colors, flavor_name)
+    return render_config(compile_template(config), flavor, flavor_name)
 
 
-def create_palettes() -> None:
-    """Generates configuration files for each flavor in COLORS."""
-    base = get_base_config()
-    required_keys = set(k.lower() for k in re.findall(PLACEHOLDER_PATTERN, base))
+def get_converter_digest() -> str:
+    """Hashes everything besides the inputs that shapes the generated files.
 
-    for flavor_name, flavor in COLORS.items():
-        missing_keys = required_keys - set(flavor.keys())
+    This covers the build script itself, the xterm converter (including its
+    CLUT), the ranger stub used to evaluate the schemes, and the modules that
+    rewrite them or list their color pairs.
 
-        if missing_keys:
-            raise ValueError(
-                f"Flavor {flavor_name} missing required colors: {missing_keys}"
+    Returns:
+        A hex digest identifying the current converter version.
+    """
+    digest = hashlib.sha256()
+    for module in CONVERTER_MODULES:
+        digest.update(Path(__file__).with_name(f"{module}.py").read_bytes())
+    return digest.hexdigest()
+
+
+def get_input_digest(
+    base: str,
+    flavor: dict[str, str],
+    converter: str,
+    instrument: bool = False,
+    profile: str | None = None,
+    distinct: bool = False,
+    bytecode: bool = False,
+) -> str:
+    """Hashes the inputs a single generated configuration file depends on.
+
+    Args:
+        base: The base configuration string.
+        flavor: A dictionary mapping color names to hex color codes.
+        converter: The digest returned by `get_converter_digest`.
+        instrument: Whether the file is instrumented.
+        profile: The digest of the context profile it is optimized for, from
+            `get_profile_digest`, if any.
+        distinct: Whether its colors are assigned distinct codes.
+        bytecode: Whether it is precompiled.
+
+    Returns:
+        A hex digest of the template, the flavor, the converter version and
+        the build options.
+    """
+    digest = hashlib.sha256(converter.encode())
+    digest.update(hashlib.sha256(base.encode()).digest())
+    digest.update(json.dumps(flavor, sort_keys=True).encode())
+    if instrument:
+        digest.update(b"instrument")
+    if profile:
+        digest.update(profile.encode())
+    if distinct:
+        digest.update(b"distinct")
+    if bytecode:
+        digest.update(b"bytecode")
+    return digest.hexdigest()
+
+
+def get_profile_digest(profile: Counter[frozenset[str]]) -> str:
+    """Hashes a context profile.
+
+    Args:
+        profile: How often each context was seen.
+
+    Returns:
+        A hex digest of the profile.
+    """
+    contexts = sorted((sorted(keys), count) for keys, count in profile.items())
+    return hashlib.sha256(json.dumps(contexts).encode()).hexdigest()
+
+
+def load_build_cache(output_path: Path = OUTPUT_DIR) -> dict[str, dict[str, str]]:
+    """Reads the build cache of an output directory.
+
+    Args:
+        output_path: The directory holding the generated files.
+
+    Returns:
+        A mapping from output file name to the digests of its inputs and of
+        its contents when it was written. Empty if there is no usable cache.
+    """
+    try:
+        cache = json.loads((output_path / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_build_cache(
+    cache: dict[str, dict[str, str]], output_path: Path = OUTPUT_DIR
+) -> None:
+    """Writes the build cache of an output directory.
+
+    Args:
+        cache: The mapping returned by `load_build_cache`, updated.
+        output_path: The directory holding the generated files.
+
+    Raises:
+        IOError: If there is an error writing the file.
+    """
+    output = output_path / CACHE_FILE
+    data = json.dumps(cache, indent=2, sort_keys=True) + "\n"
+
+    try:
+        write_if_changed(output, data.encode("utf-8"))
+    except IOError as e:
+        raise IOError(f"Error writing to {output}: {e}")
+
+
+def is_up_to_date(output: Path, entry: dict[str, str] | None, inputs: str) -> bool:
+    """Checks whether a generated file can be reused as is.
+
+    Args:
+        output: The generated configuration file.
+        entry: The cache entry recorded for it, if any.
+        inputs: The digest of its current inputs.
+
+    Returns:
+        True if the inputs are unchanged and the file was not touched since.
+    """
+    if not entry or entry.get("inputs") != inputs:
+        return False
+
+    try:
+        contents = output.read_bytes()
+    except OSError:
+        return False
+
+    return entry.get("output") == hashlib.sha256(contents).hexdigest()
+
+
+def build_palette(
+    template: Template,
+    flavor: dict[str, str],
+    flavor_name: str,
+    output_path: Path = OUTPUT_DIR,
+    instrument: bool = False,
+    profile: Counter[frozenset[str]] | None = None,
+    distinct: bool = False,
+    bytecode: bool = False,
+) -> str:
+    """Generates and writes the configuration file of a single flavor.
+
+    Args:
+        template: The compiled base configuration.
+        flavor: A dictionary mapping color names to hex color codes.
+        flavor_name: The name of the flavor (e.g., 'latte').
+        output_path: The directory to save the output file.
+        instrument: As for `render_config`.
+        profile: As for `render_config`.
+        distinct: As for `flavor_depths`.
+        bytecode: Also precompile the file (see `compile_bytecode`).
+
+    Returns:
+        The hex digest of the written file contents.
+
+    Raises:
+        ValueError: If the flavor is missing colors or has invalid ones.
+        IOError: If there is an error writing the file.
+    """
+    depths = flavor_depths(flavor, distinct)
+    flavor_xterm = depths.pop(DEFAULT_DEPTH)
+    config = render_config(
+        template, flavor_xterm, flavor_name, instrument, profile, depths
+    )
+    save_new_config(config, flavor_name, output_path)
+    if bytecode:
+        compile_bytecode(get_output_file(flavor_name, output_path))
+    return hashlib.sha256(config.encode("utf-8")).hexdigest()
+
+
+def _init_worker(
+    template: Template, profile: Counter[frozenset[str]] | None = None
+) -> None:
+    global _worker_template, _worker_profile
+    _worker_template = template
+    _worker_profile = profile
+
+
+def _build_worker(
+    job: tuple[str, dict[str, str], Path, bool, bool, bool],
+) -> tuple[str | None, Exception | None]:
+    flavor_name, flavor, output_path, instrument, distinct, bytecode = job
+    try:
+        digest = build_palette(
+            _worker_template,
+            flavor,
+            flavor_name,
+            output_path,
+            instrument,
+            _worker_profile,
+            distinct,
+            bytecode,
+        )
+        return digest, None
+    except Exception as e:
+        return None, e
+
+
+def create_palettes(
+    force: bool = False,
+    jobs: int | None = 1,
+    palettes: (
+        Mapping[str, dict[str, str]] | Iterable[tuple[str, dict[str, str] | ValueError]]
+    ) = COLORS,
+    output_path: Path = OUTPUT_DIR,
+    instrument: bool = False,
+    profile: Counter[frozenset[str]] | None = None,
+    distinct: bool = False,
+    bytecode: bool = False,
+) -> list[str]:
+    """Generates configuration files for each flavor in `palettes`.
+
+    Flavors whose template, colors and converter are unchanged since the
+    last build, and whose output file was not modified, are skipped. The
+    others are built in order, or spread over a process pool when `jobs` is
+    not 1; the template is read and compiled once and handed to every worker.
+    Files are only rewritten when their contents change, each through an
+    atomic rename (see `write_if_changed`); with `bytecode`, its directory is
+    synced once at the end.
+
+    `palettes` is consumed lazily, so it can be a generator such as
+    `palettes.iter_palettes`: each flavor is built as soon as it is read, and
+    at most BUILD_WINDOW flavors per worker are held in memory at a time.
+
+    Args:
+        force: Rebuild every flavor regardless of the build cache.
+        jobs: Number of worker processes, or None for one per CPU.
+        palettes: A mapping from flavor name to its colors, or an iterable of
+            (flavor name, colors) pairs. A pair may carry the ValueError that
+            makes the palette invalid instead of its colors, as from
+            `palettes.iter_palettes`; it is reported with the build errors.
+        output_path: The directory to save the output files.
+        instrument: Build instrumented schemes (see `render_config`).
+        profile: A context profile to optimize the schemes for (see
+            `update_config_table`).
+        distinct: Give the colors of each palette distinct xterm codes (see
+            `flavor_depths`).
+        bytecode: Also precompile each scheme (see `compile_bytecode`).
+
+    Returns:
+        The names of the flavors that were rebuilt.
+
+    Raises:
+        BuildError: If any palette failed; all others are still built.
+    """
+    template = compile_template(get_base_config())
+    converter = get_converter_digest()
+    profile_digest = get_profile_digest(profile) if profile else None
+    cache = {} if force else load_build_cache(output_path)
+    if isinstance(palettes, Mapping):
+        palettes = palettes.items()
+
+    jobs = jobs or os.cpu_count() or 1
+    # Computed here, so that forked workers inherit it.
+    try:
+        _probe_scheme(template.source, instrument, _profile_key(profile))
+    except ValueError:
+        pass  # Reported for each palette.
+    rebuilt: list[str] = []
+    errors: dict[str, Exception] = {}
+    outputs: set[str] = set()
+
+    def pending() -> Iterator[tuple[str, dict[str, str], str, str]]:
+        for flavor_name, flavor in palettes:
+            if isinstance(flavor, Exception):
+                errors[flavor_name] = flavor
+                continue
+            try:
+                output = get_output_file(flavor_name, output_path)
+            except ValueError as e:
+                errors[flavor_name] = e
+                continue
+            if output.name in outputs:
+                errors[flavor_name] = ValueError(
+                    f"Palette {flavor_name} would overwrite {output}"
+                )
+                continue
+            outputs.add(output.name)
+            inputs = get_input_digest(
+                template.source,
+                flavor,
+                converter,
+                instrument,
+                profile_digest,
+                distinct,
+                bytecode,
+            )
+            if not is_up_to_date(output, cache.get(output.name), inputs):
+                yield flavor_name, flavor, output.name, inputs
+
+    def collect(job, result: tuple[str | None, Exception | None]) -> None:
+        flavor_name, _, output_name, inputs = job
+        digest, error = result
+        if error is not None:
+            errors[flavor_name] = error
+        else:
+            cache[output_name] = {"inputs": inputs, "output": digest}
+            rebuilt.append(flavor_name)
+
+    options = (output_path, instrument, distinct, bytecode)
+    try:
+        if jobs == 1:
+            _init_worker(template, profile)
+            for job in pending():
+                collect(job, _build_worker((*job[:2], *options)))
+        else:
+            # Submitting everything up front, as `executor.map` does, would
+            # read every palette before the first one is built.
+            window: collections.deque = collections.deque()
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(template, profile),
+            ) as executor:
+                for job in pending():
+                    if len(window) == jobs * BUILD_WINDOW:
+                        done, future = window.popleft()
+                        collect(done, future.result())
+                    future = executor.submit(_build_worker, (*job[:2], *options))
+                    window.append((job, future))
+                for job, future in window:
+                    collect(job, future.result())
+    finally:
+        if rebuilt:
+            save_build_cache(cache, output_path)
+        if bytecode and (rebuilt or errors):
+            sync_directories(output_path / "__pycache__")
+
+    if errors:
+        raise BuildError(errors)
+
+    return rebuilt
+
+
+def load_palettes(path: Path = COLORS_FILE) -> dict[str, dict[str, str]]:
+    """Reads the palettes defined by a colors file.
+
+    The file is executed afresh on each call instead of being imported, so
+    a running build sees its latest contents.
+
+    Args:
+        path: A Python file defining `COLORS`, like colors.py.
+
+    Returns:
+        A mapping from flavor name to its colors.
+    """
+    return runpy.run_path(str(path))["COLORS"]
+
+
+def notify_reload(target: Path, flavors: list[str]) -> None:
+    """Tells running ranger instances which colorschemes were rebuilt.
+
+    The names of the rebuilt colorschemes (e.g. `catppuccin_mocha`), one per
+    line, are sent as a single datagram if `target` is a Unix socket, and
+    written to `target` otherwise, so that watching its modification time
+    is enough.
+
+    Args:
+        target: A Unix datagram socket, or a file.
+        flavors: The names of the flavors that were rebuilt.
+    """
+    message = "".join(f"{get_output_file(name).stem}\n" for name in flavors)
+    if not target.is_socket():
+        target.write_text(message, encoding="utf-8")
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        try:
+            sock.sendto(message.encode("utf-8"), str(target))
+        except OSError as e:
+            print(f"Could not notify {target}: {e}")
+
+
+def _inotify(paths: list[Path]) -> int | None:
+    # Returns an inotify descriptor watching the directories of `paths`, or
+    # None where inotify is unavailable. Directories are watched because
+    # many editors save by replacing the file.
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+
+    for directory in {path.resolve().parent for path in paths}:
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def _inotify_names(fd: int) -> set[str]:
+    names = set()
+    while True:
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+
+        offset = 0
+        while offset < len(data):
+            _, _, _, size = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            names.add(os.fsdecode(data[offset : offset + size].rstrip(b"\0")))
+            offset += size
+
+
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def wait_for_changes(paths: list[Path], fd: int | None = None) -> None:
+    """Blocks until one of `paths` is written.
+
+    Args:
+        paths: The files to watch.
+        fd: A descriptor from `_inotify`, or None to poll every WATCH_POLL
+            seconds.
+    """
+    if fd is None:
+        stamps = [_stamp(path) for path in paths]
+        while [_stamp(path) for path in paths] == stamps:
+            time.sleep(WATCH_POLL)
+        return
+
+    names = {path.name for path in paths}
+    changed = set()
+    while not changed & names:
+        select.select([fd], [], [])
+        changed = _inotify_names(fd)
+    while select.select([fd], [], [], WATCH_SETTLE)[0]:
+        _inotify_names(fd)
+
+
+def watch(
+    force: bool = False,
+    jobs: int | None = 1,
+    notify: Path | None = None,
+    colors: Path = COLORS_FILE,
+    instrument: bool = False,
+    profile: Counter[frozenset[str]] | None = None,
+    distinct: bool = False,
+    bytecode: bool = False,
+) -> None:
+    """Rebuilds the palettes whenever the template or the colors change.
+
+    Everything runs in this process: each change re-reads the template and
+    the colors, and the build cache limits the work to the flavors whose
+    output changes. Build errors are reported and the watch goes on.
+
+    Args:
+        force: Rebuild every flavor the first time, ignoring the build cache.
+        jobs: As for `create_palettes`.
+        notify: Passed to `notify_reload` after every rebuild, if given.
+        colors: The colors file to read the palettes from.
+        instrument: As for `create_palettes`.
+        profile: As for `create_palettes`.
+        distinct: As for `create_palettes`.
+        bytecode: As for `create_palettes`.
+    """
+    paths = [BASE_FILE, colors]
+    fd = _inotify(paths)
+    how = "inotify" if fd is not None else f"polling every {WATCH_POLL}s"
+    print(f"Watching {', '.join(map(str, paths))} ({how}); Ctrl-C to stop.")
+
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                rebuilt = create_palettes(
+                    force=force,
+                    jobs=jobs,
+                    palettes=load_palettes(colors),
+                    instrument=instrument,
+                    profile=profile,
+                    distinct=distinct,
+                    bytecode=bytecode,
+                )
+            except Exception as e:
+                print(f"Build failed: {e}")
+            else:
+                force = False
+                elapsed = (time.perf_counter() - start) * 1e3
+                if rebuilt:
+                    print(f"Rebuilt {', '.join(rebuilt)} in {elapsed:.0f} ms")
+                    if notify:
+                        notify_reload(notify, rebuilt)
+            wait_for_changes(paths, fd)
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=create_palettes.__doc__)
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="rebuild every flavor, ignoring the build cache",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes; 0 for one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="keep running and rebuild whenever the template or colors change",
+    )
+    parser.add_argument(
+        "--notify",
+        type=Path,
+        metavar="PATH",
+        help="after a rebuild, send the rebuilt scheme names to this Unix "
+        "datagram socket, or write them to this file",
+    )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="count and time every use() and verify_* call and branch, and dump "
+        f"the counts as JSON when ranger exits (to ${STATS_VARIABLE}, or the "
+        "temporary directory)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="TRACE",
+        help="optimize the schemes for the contexts of this trace, recorded with "
+        "context_trace.py",
+    )
+    parser.add_argument(
+        "--distinct-colors",
+        action="store_true",
+        help="assign each palette's 256-color codes jointly, so that different "
+        "colors never share one (least total CIEDE2000 error)",
+    )
+    parser.add_argument(
+        "--bytecode",
+        action="store_true",
+        help="also precompile each scheme to bytecode, for ranger's first start",
+    )
+    parser.add_argument(
+        "--palettes",
+        type=Path,
+        nargs="+",
+        metavar="PATH",
+        help="build the palettes in these JSON or TOML files, or in the files "
+        "under these directories, instead of those in colors.py",
+    )
+    args = parser.parse_args()
+
+    try:
+        profile = load_profile(args.profile) if args.profile else None
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{e}\n")
+
+    if args.watch:
+        if args.palettes:
+            parser.error("--watch rebuilds colors.py; it cannot take --palettes")
+        try:
+            watch(
+                force=args.force,
+                jobs=args.jobs,
+                notify=args.notify,
+                instrument=args.instrument,
+                profile=profile,
+                distinct=args.distinct_colors,
+                bytecode=args.bytecode,
             )
+        except KeyboardInterrupt:
+            pass
+        return
+
+    palettes = COLORS
+    if args.palettes:
+        keys = compile_template(get_base_config()).keys
+        palettes = iter_palettes(args.palettes, keys)
+
+    try:
+        rebuilt = create_palettes(
+            force=args.force,
+            jobs=args.jobs,
+            palettes=palettes,
+            instrument=args.instrument,
+            profile=profile,
+            distinct=args.distinct_colors,
+            bytecode=args.bytecode,
+        )
+    except (BuildError, ValueError) as e:
+        parser.exit(1, f"{e}\n")
+
+    if rebuilt and args.notify:
+        notify_reload(args.notify, rebuilt)
 
-        flavor_xterm = flavor_to_xterm(flavor)
-        config = update_config(base, flavor_xterm, flavor_name)
-        save_new_config(config, flavor_name)
+    if args.palettes:
+        print(f"Rebuilt {len(rebuilt)} palettes")
+        return
 
-    return
+    for flavor_name in COLORS:
+        output = get_output_file(flavor_name)
+        print(f"{output}: imports in {measure_import_time(output) * 1e3:.3f} ms")
 
 
 if __name__ == "__main__":
-    create_palettes()
+    main()
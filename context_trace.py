@@ -0,0 +1,343 @@
+"""Records the contexts a colorscheme is asked about, and replays them.
+
+A trace is an append-only binary file: a header listing the context flags,
+followed by `(bitmask, count)` records. Each flush appends the contexts seen
+since the previous one, so a trace can span any number of ranger sessions.
+
+To record, drop this file next to the generated scheme in
+`~/.config/ranger/colorschemes` and add a scheme that wraps it, e.g.
+`catppuccin_mocha_traced.py`:
+
+    from colorschemes.catppuccin_mocha import CatppuccinMocha
+    from colorschemes.context_trace import recording
+
+    Scheme = recording(CatppuccinMocha, "~/catppuccin-contexts.trace")
+
+Ranger memoizes `ColorScheme.get` and `get_attr`, so `use()` only sees each
+distinct context the first time it is drawn in a session. The recorder hooks
+`get_attr()`, which the widgets call on every draw, in front of that cache:
+the trace counts how often each context is actually drawn.
+
+To replay a trace headlessly against one or more schemes:
+
+    python3 context_trace.py replay trace output/catppuccin_*.py
+"""
+
+import argparse
+import atexit
+import os
+import struct
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Iterator
+
+TRACE_MAGIC = b"CTXT"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sBH")
+COUNT = struct.Struct("<I")
+FLUSH_EVERY = 1024
+
+
+def _context_keys() -> list[str]:
+    # Ranger's flags when recording inside ranger, the stub's otherwise.
+    try:
+        from ranger.gui.context import CONTEXT_KEYS
+    except ImportError:
+        from ranger_stub import CONTEXT_KEYS
+    return list(CONTEXT_KEYS)
+
+
+def _flatten(keys: Iterable) -> Iterator[str]:
+    # Like ranger.ext.iter_tools.flatten: widgets pass flags in nested lists.
+    for key in keys:
+        if isinstance(key, str):
+            yield key
+        else:
+            yield from _flatten(key)
+
+
+def _mask_width(flags: list[str]) -> int:
+    return (len(flags) + 7) // 8
+
+
+def read_header(f) -> list[str]:
+    """Reads the header of a trace file.
+
+    Args:
+        f: A binary file positioned at the start of the trace.
+
+    Returns:
+        The context flags, in bit order.
+
+    Raises:
+        ValueError: If the file is not a context trace.
+    """
+    header = f.read(TRACE_HEADER.size)
+    try:
+        magic, version, size = TRACE_HEADER.unpack(header)
+    except struct.error:
+        raise ValueError(f"{f.name} is not a context trace")
+
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError(f"{f.name} is not a context trace")
+
+    return f.read(size).decode("ascii").split(",")
+
+
+def _write_header(f, flags: list[str]) -> None:
+    names = ",".join(flags).encode("ascii")
+    f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(names)) + names)
+
+
+class TraceRecorder:
+    """Counts context bitmasks and appends them to a trace file.
+
+    Attributes:
+        path: The trace file.
+        flags: The context flags, in bit order: by default ranger's
+            `CONTEXT_KEYS`, or the stub's when ranger is not installed.
+    """
+
+    def __init__(self, path: str | Path, flags: list[str] | None = None):
+        self.path = Path(os.path.expanduser(path))
+        self.flags = list(flags) if flags is not None else _context_keys()
+        self.counts: Counter[int] = Counter()
+        self._bits = {flag: 1 << i for i, flag in enumerate(self.flags)}
+        self._pending = 0
+
+        if self.path.exists() and self.path.stat().st_size:
+            with self.path.open("rb") as f:
+                if read_header(f) != self.flags:
+                    raise ValueError(f"{self.path} was recorded with other flags")
+        else:
+            with self.path.open("wb") as f:
+                _write_header(f, self.flags)
+
+        atexit.register(self.flush)
+
+    def add(self, keys: Iterable[str]) -> None:
+        """Counts one context, given the flags that are set in it."""
+        bits = self._bits
+        mask = 0
+        for key in keys:
+            mask |= bits.get(key, 0)
+        self.counts[mask] += 1
+
+        self._pending += 1
+        if self._pending >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Appends the contexts counted since the last flush."""
+        if not self.counts:
+            return
+
+        width = _mask_width(self.flags)
+        records = b"".join(
+            mask.to_bytes(width, "little") + COUNT.pack(count)
+            for mask, count in self.counts.items()
+        )
+        with self.path.open("ab") as f:
+            f.write(records)
+
+        self.counts.clear()
+        self._pending = 0
+
+
+def recording(scheme_cls: type, path: str | Path) -> type:
+    """Wraps a colorscheme class so that every context drawn is traced.
+
+    Args:
+        scheme_cls: The colorscheme class, e.g. CatppuccinMocha.
+        path: The trace file to append to.
+
+    Returns:
+        A subclass of `scheme_cls` that records the flags of each
+        `get_attr()` call, before ranger's cache answers it.
+    """
+    recorder = TraceRecorder(path)
+
+    class Recording(scheme_cls):
+        def get_attr(self, *keys):
+            recorder.add(_flatten(keys))
+            return super().get_attr(*keys)
+
+    Recording.__name__ = Recording.__qualname__ = f"Recording{scheme_cls.__name__}"
+    Recording.recorder = recorder
+    return Recording
+
+
+def read_trace(path: str | Path) -> tuple[list[str], Counter[int]]:
+    """Reads a trace file.
+
+    Args:
+        path: The trace file.
+
+    Returns:
+        The context flags in bit order, and how often each bitmask was seen.
+
+    Raises:
+        ValueError: If the file is not a context trace or is truncated.
+    """
+    with open(path, "rb") as f:
+        flags = read_header(f)
+        data = f.read()
+
+    width = _mask_width(flags)
+    size = width + COUNT.size
+    if len(data) % size:
+        raise ValueError(f"{path} is truncated")
+
+    counts: Counter[int] = Counter()
+    for offset in range(0, len(data), size):
+        mask = int.from_bytes(data[offset : offset + width], "little")
+        (count,) = COUNT.unpack_from(data, offset + width)
+        counts[mask] += count
+
+    return flags, counts
+
+
+def load_scheme_file(path: str | Path) -> type:
+    """Imports a colorscheme file against the ranger stub.
+
+    Like ranger, this prefers a class named `Scheme`, and otherwise takes
+    the first ColorScheme subclass the module defines.
+
+    Args:
+        path: The colorscheme file.
+
+    Returns:
+        The colorscheme class.
+
+    Raises:
+        ValueError: If the file defines no colorscheme.
+    """
+    import ranger_stub
+
+    namespace = {"__name__": Path(path).stem}
+    with ranger_stub.installed():
+        source = Path(path).read_text(encoding="utf-8")
+        exec(compile(source, str(path), "exec"), namespace)
+
+    def is_scheme(value: object) -> bool:
+        return (
+            isinstance(value, type)
+            and issubclass(value, ranger_stub.ColorScheme)
+            and value is not ranger_stub.ColorScheme
+        )
+
+    if is_scheme(namespace.get("Scheme")):
+        return namespace["Scheme"]
+    for value in namespace.values():
+        if is_scheme(value):
+            return value
+
+    raise ValueError(f"{path} does not define a colorscheme")
+
+
+def _percentile(samples: list[tuple[float, int]], fraction: float) -> float:
+    # Weighted percentile over (value, weight) pairs sorted by value.
+    total = sum(weight for _, weight in samples)
+    seen = 0
+    for value, weight in samples:
+        seen += weight
+        if seen >= fraction * total:
+            return value
+    return samples[-1][0] if samples else 0.0
+
+
+def replay(
+    scheme_cls: type, flags: list[str], counts: Counter[int], repeat: int = 3
+) -> dict[str, float]:
+    """Feeds a trace to a fresh instance of a colorscheme.
+
+    Every context is rebuilt from its bitmask and passed to `use()` as many
+    times as it was recorded. Latency is the mean time per call for each
+    distinct context, weighted by its count.
+
+    Args:
+        scheme_cls: The colorscheme class.
+        flags: The context flags of the trace, in bit order.
+        counts: How often each bitmask was seen.
+        repeat: How many times to replay the trace; the best run is kept.
+
+    Returns:
+        Calls, total seconds, calls per second, and p50/p90/p99 latencies in
+        nanoseconds.
+    """
+    import ranger_stub
+
+    contexts = [
+        (
+            ranger_stub.Context(f for i, f in enumerate(flags) if mask >> i & 1),
+            count,
+        )
+        for mask, count in counts.items()
+    ]
+    calls = sum(counts.values())
+    best = None
+
+    for _ in range(repeat):
+        use = scheme_cls().use
+        latencies = []
+        total = 0
+        for context, count in contexts:
+            start = time.perf_counter_ns()
+            for _ in range(count):
+                use(context)
+            elapsed = time.perf_counter_ns() - start
+            total += elapsed
+            latencies.append((elapsed / count, count))
+        if best is None or total < best[0]:
+            best = (total, sorted(latencies))
+
+    total, latencies = best or (0, [])
+    seconds = total / 1e9
+    return {
+        "calls": calls,
+        "seconds": seconds,
+        "calls_per_sec": calls / seconds if seconds else 0.0,
+        "p50_ns": _percentile(latencies, 0.5),
+        "p90_ns": _percentile(latencies, 0.9),
+        "p99_ns": _percentile(latencies, 0.99),
+    }
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    summary = commands.add_parser("summary", help="show the most common contexts")
+    summary.add_argument("trace", type=Path)
+    summary.add_argument("-n", type=int, default=20, help="contexts to show")
+
+    replayer = commands.add_parser("replay", help="replay a trace against schemes")
+    replayer.add_argument("trace", type=Path)
+    replayer.add_argument("schemes", type=Path, nargs="+")
+    replayer.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+    flags, counts = read_trace(args.trace)
+
+    if args.command == "summary":
+        total = sum(counts.values())
+        print(f"{total} contexts, {len(counts)} distinct")
+        for mask, count in counts.most_common(args.n):
+            keys = " ".join(f for i, f in enumerate(flags) if mask >> i & 1)
+            print(f"{count:>10} {count / total:7.2%}  {keys or '(none)'}")
+        return
+
+    for path in args.schemes:
+        result = replay(load_scheme_file(path), flags, counts, args.repeat)
+        print(
+            f"{path}: {result['calls']} calls in {result['seconds']:.4f}s"
+            f" ({result['calls_per_sec']:,.0f}/s),"
+            f" p50 {result['p50_ns']:.0f}ns, p90 {result['p90_ns']:.0f}ns,"
+            f" p99 {result['p99_ns']:.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Guards runs of rarely taken branches behind one test, from a context profile.
+
+In a scheme's `_evaluate()`, most of the `if` statements of the `verify_*`
+helpers test flags that real contexts rarely set (`border`, `document`,
+`container`, `socket`, ...), so a plain file or directory pays for every one
+of those tests. The statements cannot be reordered: each one overrides the
+colors set by the ones before it. Instead, `guard_method` wraps runs of
+consecutive `if` statements in
+
+    if not _GUARD_0.isdisjoint(context.__dict__):
+        ...the statements, unchanged and in order...
+
+where `_GUARD_0` holds every flag their tests read, so that a context with
+none of them set skips the run with a single test.
+
+A statement is only guarded if its tests read nothing but context flags
+(combined with `and`, `or` and `not`), are all false when none of those flags
+is set, and it has no `else`. With none of its flags set, such a statement
+does nothing, so skipping it cannot change the result. Which runs are worth
+a guard is decided from a profile of real contexts (a trace recorded by
+context_trace.py): a guard costs about GUARD_COST flag reads, and saves the
+reads of its run for every context that sets none of its flags.
+"""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+from context_trace import read_trace
+
+GUARD_PREFIX = "_GUARD_"
+# What a guard costs, in flag reads: a set test against the context's
+# `__dict__` takes about as long as four `context.<flag>` lookups.
+GUARD_COST = 4
+
+
+def load_profile(path: str | Path) -> Counter[frozenset[str]]:
+    """Reads a context profile from a trace recorded by context_trace.py.
+
+    Args:
+        path: The trace file.
+
+    Returns:
+        How often each context, as the set of its flags, was seen.
+
+    Raises:
+        ValueError: If the file is not a context trace or is truncated.
+    """
+    flags, counts = read_trace(path)
+    profile: Counter[frozenset[str]] = Counter()
+    for mask, count in counts.items():
+        profile[frozenset(f for i, f in enumerate(flags) if mask >> i & 1)] += count
+    return profile
+
+
+def _test_flags(test: ast.expr) -> frozenset[str] | None:
+    # The flags a test reads, if it reads nothing else.
+    if isinstance(test, ast.BoolOp):
+        flags = [_test_flags(value) for value in test.values]
+        return None if None in flags else frozenset().union(*flags)
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        return _test_flags(test.operand)
+    if (
+        isinstance(test, ast.Attribute)
+        and isinstance(test.value, ast.Name)
+        and test.value.id == "context"
+        and not test.attr.startswith("__")
+    ):
+        return frozenset([test.attr])
+    if isinstance(test, ast.Constant):
+        return frozenset()
+    return None
+
+
+def _holds(test: ast.expr, keys: frozenset[str]) -> bool:
+    # Evaluates a test accepted by `_test_flags` for a context with `keys`.
+    if isinstance(test, ast.BoolOp):
+        values = (_holds(value, keys) for value in test.values)
+        return all(values) if isinstance(test.op, ast.And) else any(values)
+    if isinstance(test, ast.UnaryOp):
+        return not _holds(test.operand, keys)
+    if isinstance(test, ast.Attribute):
+        return test.attr in keys
+    return bool(test.value)
+
+
+def _reads(test: ast.expr) -> int:
+    # How many flags a test accepted by `_test_flags` reads when none is set.
+    if isinstance(test, ast.BoolOp):
+        if isinstance(test.op, ast.And):
+            # Stops at the first false operand.
+            for i, value in enumerate(test.values):
+                if not _holds(value, frozenset()):
+                    return sum(map(_reads, test.values[: i + 1]))
+        return sum(map(_reads, test.values))
+    if isinstance(test, ast.UnaryOp):
+        return _reads(test.operand)
+    return isinstance(test, ast.Attribute)
+
+
+def _guardable(statement: ast.stmt) -> tuple[frozenset[str], int] | None:
+    # The flags read by the tests of an `if`/`elif` chain and how many flag
+    # reads they take when none is set, if the chain then does nothing.
+    flags = frozenset()
+    reads = 0
+    while True:
+        if not isinstance(statement, ast.If):
+            return None
+        read = _test_flags(statement.test)
+        if read is None or _holds(statement.test, frozenset()):
+            return None
+        flags |= read
+        reads += _reads(statement.test)
+        if not statement.orelse:
+            return flags, reads
+        if len(statement.orelse) != 1:
+            return None
+        (statement,) = statement.orelse
+
+
+class _Guarder:
+    def __init__(self, profile: Counter[frozenset[str]]) -> None:
+        self.profile = list(profile.items())
+        self.guards: list[frozenset[str]] = []
+
+    def body(self, body: list[ast.stmt], profile: list) -> list[ast.stmt]:
+        for statement in body:
+            if isinstance(statement, ast.If):
+                self.branch(statement, profile)
+
+        total = sum(count for _, count in profile)
+        if not total:
+            return body
+        chains = [_guardable(statement) for statement in body]
+
+        # best[j]: the least expected number of flag reads for body[:j], with
+        # the guards chosen for it.
+        best = [(0.0, [])] + [None] * len(body)
+        for j in range(1, len(body) + 1):
+            cost, guards = best[j - 1]
+            best[j] = (cost + (chains[j - 1] or (None, 0))[1], guards)
+            flags = frozenset()
+            reads = 0
+            for i in range(j - 1, -1, -1):
+                if chains[i] is None:
+                    break
+                flags |= chains[i][0]
+                reads += chains[i][1]
+                taken = sum(count for keys, count in profile if flags & keys)
+                cost = best[i][0] + GUARD_COST + reads * taken / total
+                if cost < best[j][0]:
+                    best[j] = (cost, best[i][1] + [(i, j, flags)])
+
+        guarded = []
+        position = 0
+        for i, j, flags in best[-1][1]:
+            guarded.extend(body[position:i])
+            guarded.append(self.guard(body[i:j], flags))
+            position = j
+        guarded.extend(body[position:])
+        return guarded
+
+    def branch(self, statement: ast.If, profile: list) -> None:
+        if _test_flags(statement.test) is None:
+            taken = skipped = profile
+        else:
+            taken, skipped = [], []
+            for keys, count in profile:
+                holds = _holds(statement.test, keys)
+                (taken if holds else skipped).append((keys, count))
+        statement.body = self.body(statement.body, taken)
+        if statement.orelse:
+            statement.orelse = self.body(statement.orelse, skipped)
+
+    def guard(self, body: list[ast.stmt], flags: frozenset[str]) -> ast.If:
+        name = f"{GUARD_PREFIX}{len(self.guards)}"
+        self.guards.append(flags)
+        disjoint = ast.Call(
+            ast.Attribute(ast.Name(name, ast.Load()), "isdisjoint", ast.Load()),
+            [ast.Attribute(ast.Name("context", ast.Load()), "__dict__", ast.Load())],
+            [],
+        )
+        return ast.If(ast.UnaryOp(ast.Not(), disjoint), body, [])
+
+
+def guard_method(
+    config: str, class_name: str, method_name: str, profile: Counter[frozenset[str]]
+) -> str:
+    """Guards the runs of rarely taken branches of one method.
+
+    Args:
+        config: The colorscheme source.
+        class_name: The name of the colorscheme class.
+        method_name: The method to rewrite (e.g. '_evaluate'), whose context
+            argument is named `context`.
+        profile: How often each context was seen, as from `load_profile`.
+
+    Returns:
+        The colorscheme source with the method rewritten and its guards
+        defined before the class; unchanged if no guard pays off.
+
+    Raises:
+        ValueError: If the class or the method cannot be found.
+    """
+    tree = ast.parse(config)
+    classes = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == class_name
+    ]
+    if not classes:
+        raise ValueError(f"Class {class_name} not found")
+    cls = classes[0]
+
+    methods = [
+        node
+        for node in cls.body
+        if isinstance(node, ast.FunctionDef) and node.name == method_name
+    ]
+    if not methods:
+        raise ValueError(f"Method {class_name}.{method_name} not found")
+    method = methods[0]
+
+    start = (method.decorator_list[0] if method.decorator_list else method).lineno
+    end = method.end_lineno
+    guarder = _Guarder(profile)
+    method.body = guarder.body(method.body, guarder.profile)
+    if not guarder.guards:
+        return config
+    ast.fix_missing_locations(method)
+
+    source = "\n".join(
+        f"    {line}" if line else line for line in ast.unparse(method).splitlines()
+    )
+    lines = config.splitlines(keepends=True)
+    lines[start - 1 : end] = [source + "\n"]
+
+    definitions = "".join(
+        f"{GUARD_PREFIX}{i} = frozenset({sorted(flags)!r})\n"
+        for i, flags in enumerate(guarder.guards)
+    )
+    header = (cls.decorator_list[0] if cls.decorator_list else cls).lineno
+    comment = "# Generated by build.py: flags of each guard (see guard.py).\n"
+    lines.insert(header - 1, f"{comment}{definitions}\n\n")
+    return "".join(lines)
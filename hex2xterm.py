@@ -16,8 +16,19 @@ Credit goes to Micah Elliott - http://MicahElliott.com
 
 #---------------------------------------------------------------------
 
+import hashlib
+import math
+import mmap
 import re
+import struct
 import sys
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 CLUT = [  # color look-up table
 #    8-bit, RGB hex
@@ -296,6 +307,13 @@ def _strip_hash(rgb):
         rgb = rgb.lstrip('#')
     return rgb
 
+def _check_hex(rgb):
+    # `int(rgb, 16)` and `bytes.fromhex` would also take signs, prefixes and
+    # whitespace.
+    if not re.fullmatch(r'[0-9A-Fa-f]{6}', rgb):
+        raise ValueError('Invalid hex color code: %s' % rgb)
+    return rgb
+
 def _create_dicts():
     short2rgb_dict = dict(CLUT)
     rgb2short_dict = {}
@@ -304,7 +322,28 @@ def _create_dicts():
     return rgb2short_dict, short2rgb_dict
 
 def short2rgb(short):
-    return SHORT2RGB_DICT[short]
+    """ RGB hex code of an xterm-256 color code.
+    @param short: String (or integer) between 0 and 255.
+    @raises ValueError: If `short` is not an xterm-256 color code.
+    >>> short2rgb('23'), short2rgb('05'), short2rgb(244)
+    ('005f5f', '800080', '808080')
+    >>> short2rgb('256')
+    Traceback (most recent call last):
+        ...
+    ValueError: xterm codes must be between 0 and 255
+    """
+    index = int(short)
+    if not 0 <= index <= 255:
+        raise ValueError('xterm codes must be between 0 and 255')
+    return RGB_TABLE[3*index:3*index + 3].hex()
+
+def __getattr__(name):
+    # The string-keyed dicts are only built if something still asks for them.
+    if name in ('RGB2SHORT_DICT', 'SHORT2RGB_DICT'):
+        global RGB2SHORT_DICT, SHORT2RGB_DICT
+        RGB2SHORT_DICT, SHORT2RGB_DICT = _create_dicts()
+        return globals()[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 def print_all():
     """ Print all 256 xterm color codes.
@@ -317,41 +356,760 @@ def print_all():
     print("Printed all codes.")
     print("You can translate a hex or 0-255 code by providing an argument.")
 
-def rgb2short(rgb: str) -> tuple[str, str]:
+def rgb2short(rgb: str, method: str = 'cube',
+              metric: str = 'srgb') -> tuple[str, str]:
     """ Find the closest xterm-256 approximation to the given RGB value.
     @param rgb: Hex code representing an RGB value, eg, 'abcdef'
+    @param method: 'cube' snaps each channel to the 6x6x6 cube (the
+        historical behavior); 'nearest' returns the true nearest of the
+        cube and the grayscale ramp (codes 16-255); 'nearest256' also
+        considers the 16 system colors; 'system16' only considers those,
+        for terminals that show no others.
+    @param metric: How "nearest" is measured, one of METRICS: 'srgb'
+        (Euclidean sRGB), 'redmean' (weighted sRGB), 'cie76' (Euclidean
+        CIELAB) or 'ciede2000'.
     @returns: String between 0 and 255, compatible with xterm.
+    @raises ValueError: If `rgb` is not a 6-digit hex code.
     >>> rgb2short('123456')
     ('23', '005f5f')
     >>> rgb2short('ffffff')
     ('231', 'ffffff')
     >>> rgb2short('0DADD6') # vimeo logo
     ('38', '00afd7')
+    >>> rgb2short('313244'), rgb2short('313244', method='nearest') # surface0
+    (('59', '5f5f5f'), ('237', '3a3a3a'))
+    >>> rgb2short('f5c2e7'), rgb2short('f5c2e7', metric='ciede2000') # pink
+    (('218', 'ffafd7'), ('225', 'ffd7ff'))
+    >>> rgb2short('89b4fa', method='system16') # blue
+    ('07', 'c0c0c0')
+    >>> rgb2short('-12345')
+    Traceback (most recent call last):
+        ...
+    ValueError: Invalid hex color code: -12345
+    """
+    value = int(_check_hex(_strip_hash(rgb)), 16)
+    index = _indexer(method, metric)(value >> 16, value >> 8 & 0xff, value & 0xff)
+    return '%02d' % index, RGB_TABLE[3*index:3*index + 3].hex()
+
+def _create_levels():
+    """ Index of the closest `INCS` level for every 0-255 channel value, with
+    ties going to the bigger level. LEVELS and RGB_TABLE are kept as literals
+    so that importing the module computes nothing; these must hold:
+    >>> LEVELS == _create_levels()
+    True
+    >>> RGB_TABLE == bytes.fromhex(''.join(rgb for _, rgb in CLUT))
+    True
+    """
+    levels = bytearray(256)
+    for value in range(256):
+        for i in range(len(INCS) - 1):
+            if 2 * value >= INCS[i] + INCS[i+1]:
+                levels[value] = i + 1
+    return bytes(levels)
+
+def _nearest(r, g, b, system=False):
+    # The nearest cube entry is the per-channel nearest level, and the
+    # nearest gray is the ramp entry closest to the channel mean, so only
+    # those two (plus the system colors, if asked for) need comparing.
+    lr, lg, lb = LEVELS[r], LEVELS[g], LEVELS[b]
+    best = 16 + 36*lr + 6*lg + lb
+    dist = (r - INCS[lr])**2 + (g - INCS[lg])**2 + (b - INCS[lb])**2
+    k = min(max((r + g + b - 9) // 30, 0), len(GRAYS) - 1)
+    v = GRAYS[k]
+    d = (r - v)**2 + (g - v)**2 + (b - v)**2
+    if d < dist:
+        best, dist = 232 + k, d
+    if system:
+        for i, (sr, sg, sb) in enumerate(SYSTEM):
+            d = (r - sr)**2 + (g - sg)**2 + (b - sb)**2
+            if d < dist:
+                best, dist = i, d
+    return best
+
+def _nearest256(r, g, b):
+    return _nearest(r, g, b, system=True)
+
+def _nearest16(r, g, b):
+    best, dist = 0, None
+    for i, (sr, sg, sb) in enumerate(SYSTEM):
+        d = (r - sr)**2 + (g - sg)**2 + (b - sb)**2
+        if dist is None or d < dist:
+            best, dist = i, d
+    return best
+
+def _indexer(method, metric='srgb'):
+    # Returns the function mapping (r, g, b) to an xterm code for `method`.
+    # In sRGB, the nearest cube entry is the per-channel nearest level, so
+    # the historical quantizers are exact for that metric.
+    if method not in METHODS:
+        raise ValueError('Unknown method %r, expected one of %s'
+                         % (method, ', '.join(METHODS)))
+    if metric not in METRICS:
+        raise ValueError('Unknown metric %r, expected one of %s'
+                         % (metric, ', '.join(METRICS)))
+    if metric == 'srgb':
+        return {'cube': _rgb2index, 'nearest': _nearest,
+                'nearest256': _nearest256, 'system16': _nearest16}[method]
+    return lambda r, g, b: _nearest_metric(r, g, b, method, metric)
+
+# Perceptual metrics. CIELAB values use the D65 white point, and the Lab form
+# of the CLUT is computed on first use. CIEDE2000 candidates are visited in
+# CIE76 order and skipped when |dL| / S_L, a lower bound of their CIEDE2000
+# distance (the rotation term is at most 2 in magnitude, so the chroma/hue
+# part of the sum is never negative), cannot beat the best so far.
+
+def _linear(c):
+    c /= 255.0
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+def _lab_f(t):
+    return t ** (1 / 3.0) if t > 216 / 24389.0 else (24389 / 27.0 * t + 16) / 116
+
+def srgb_to_lab(r, g, b):
+    """ CIELAB coordinates of an 8-bit sRGB color.
+    >>> [ round(v, 2) for v in srgb_to_lab(0xf5, 0xc2, 0xe7) ]
+    [83.84, 24.1, -11.38]
+    """
+    rgb = _linear(r), _linear(g), _linear(b)
+    fx, fy, fz = [ _lab_f(sum(m * c for m, c in zip(row, rgb)))
+                   for row in SRGB_TO_XYZ ]
+    return 116*fy - 16, 500*(fx - fy), 200*(fy - fz)
+
+def _lab_numpy(colors):
+    c = colors.astype(numpy.float64) / 255
+    c = numpy.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    t = c @ numpy.array(SRGB_TO_XYZ).T
+    f = numpy.where(t > 216 / 24389.0, numpy.cbrt(t), (24389 / 27.0 * t + 16) / 116)
+    return numpy.stack([116*f[..., 1] - 16, 500*(f[..., 0] - f[..., 1]),
+                        200*(f[..., 1] - f[..., 2])], axis=-1)
+
+def ciede2000(lab1, lab2):
+    """ CIEDE2000 color difference of two CIELAB colors.
+    >>> round(ciede2000((50, 2.6772, -79.7751), (50, 0, -82.7485)), 4)
+    2.0425
+    >>> round(ciede2000((50, 0, 0), (50, -1, 2)), 4)
+    2.3669
+    """
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+    c7 = ((math.hypot(a1, b1) + math.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - math.sqrt(c7 / (c7 + 25.0**7)))
+    a1, a2 = (1 + g) * a1, (1 + g) * a2
+    c1, c2 = math.hypot(a1, b1), math.hypot(a2, b2)
+    h1 = math.degrees(math.atan2(b1, a1)) % 360 if c1 else 0.0
+    h2 = math.degrees(math.atan2(b2, a2)) % 360 if c2 else 0.0
+
+    dl, dc, dh = l2 - l1, c2 - c1, h2 - h1
+    hsum = h1 + h2
+    if not c1 * c2:
+        dh = 0.0
+    elif dh > 180:
+        dh -= 360
+        hsum += 360 if hsum < 360 else -360
+    elif dh < -180:
+        dh += 360
+        hsum += 360 if hsum < 360 else -360
+    dh = 2 * math.sqrt(c1 * c2) * math.sin(math.radians(dh / 2))
+    h = hsum if not c1 * c2 else hsum / 2
+
+    l = (l1 + l2) / 2 - 50
+    c = (c1 + c2) / 2
+    t = (1 - 0.17*math.cos(math.radians(h - 30)) + 0.24*math.cos(math.radians(2*h))
+         + 0.32*math.cos(math.radians(3*h + 6)) - 0.20*math.cos(math.radians(4*h - 63)))
+    sl = _sl(l)
+    sc = 1 + 0.045 * c
+    sh = 1 + 0.015 * c * t
+    rt = (-2 * math.sqrt(c**7 / (c**7 + 25.0**7))
+          * math.sin(math.radians(60 * math.exp(-((h - 275) / 25) ** 2))))
+    dl, dc, dh = dl / sl, dc / sc, dh / sh
+    return math.sqrt(dl*dl + dc*dc + dh*dh + rt*dc*dh)
+
+def _sl(l):
+    # CIEDE2000 lightness weight, for the mean lightness minus 50.
+    return 1 + 0.015 * l * l / (20 + l * l) ** 0.5
+
+def _ciede2000_numpy(lab1, lab2):
+    # ciede2000 over broadcast arrays of Lab triples (last axis).
+    l1, a1, b1 = numpy.moveaxis(lab1, -1, 0)
+    l2, a2, b2 = numpy.moveaxis(lab2, -1, 0)
+    c7 = ((numpy.hypot(a1, b1) + numpy.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - numpy.sqrt(c7 / (c7 + 25.0**7)))
+    a1, a2 = (1 + g) * a1, (1 + g) * a2
+    c1, c2 = numpy.hypot(a1, b1), numpy.hypot(a2, b2)
+    h1 = numpy.where(c1 > 0, numpy.degrees(numpy.arctan2(b1, a1)) % 360, 0)
+    h2 = numpy.where(c2 > 0, numpy.degrees(numpy.arctan2(b2, a2)) % 360, 0)
+
+    dl, dc, dh = l2 - l1, c2 - c1, h2 - h1
+    hsum = h1 + h2
+    chromatic = c1 * c2 > 0
+    wrap = chromatic & (numpy.abs(dh) > 180)
+    dh = numpy.where(chromatic, dh - 360 * numpy.sign(dh) * wrap, 0)
+    hsum = numpy.where(wrap, hsum + numpy.where(hsum < 360, 360, -360), hsum)
+    dh = 2 * numpy.sqrt(c1 * c2) * numpy.sin(numpy.radians(dh / 2))
+    h = numpy.where(chromatic, hsum / 2, hsum)
+
+    l = (l1 + l2) / 2 - 50
+    c = (c1 + c2) / 2
+    t = (1 - 0.17*numpy.cos(numpy.radians(h - 30)) + 0.24*numpy.cos(numpy.radians(2*h))
+         + 0.32*numpy.cos(numpy.radians(3*h + 6)) - 0.20*numpy.cos(numpy.radians(4*h - 63)))
+    rt = (-2 * numpy.sqrt(c**7 / (c**7 + 25.0**7))
+          * numpy.sin(numpy.radians(60 * numpy.exp(-((h - 275) / 25) ** 2))))
+    dl, dc, dh = dl / _sl(l), dc / (1 + 0.045 * c), dh / (1 + 0.015 * c * t)
+    return numpy.sqrt(dl*dl + dc*dc + dh*dh + rt*dc*dh)
+
+@lru_cache(maxsize=None)
+def _candidates(method):
+    # Codes a method may return, with system colors that duplicate a later
+    # code left out so that every candidate color is distinct.
+    if method == 'cube':
+        return tuple(range(16, 232))
+    if method == 'system16':
+        return tuple(range(16))
+    codes = tuple(range(16, 256))
+    if method == 'nearest256':
+        seen = { RGB_TABLE[3*i:3*i + 3] for i in codes }
+        codes += tuple(i for i in range(16) if RGB_TABLE[3*i:3*i + 3] not in seen)
+    return codes
+
+@lru_cache(maxsize=None)
+def lab_clut():
+    """ CIELAB coordinates of all 256 xterm colors, computed once.
     """
-    rgb = _strip_hash(rgb)
-    incs = (0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff)
-    # Break 6-char RGB code into 3 integer vals.
-    parts = [ int(h, 16) for h in re.split(r'(..)(..)(..)', rgb)[1:4] ]
-    res = []
-    for part in parts:
-        i = 0
-        while i < len(incs)-1:
-            s, b = incs[i], incs[i+1]  # smaller, bigger
-            if s <= part <= b:
-                s1 = abs(s - part)
-                b1 = abs(b - part)
-                if s1 < b1: closest = s
-                else: closest = b
-                res.append(closest)
-                break
-            i += 1
-    #print '***', res
-    res = ''.join([ ('%02.x' % i) for i in res ])
-    equiv = RGB2SHORT_DICT[ res ]
-    #print '***', res, equiv
-    return equiv, res
-
-RGB2SHORT_DICT, SHORT2RGB_DICT = _create_dicts()
+    return tuple(srgb_to_lab(*RGB_TABLE[3*i:3*i + 3]) for i in range(256))
+
+def _nearest_metric_numpy(colors, method, metric, chunk=2048):
+    # Each distinct color is compared with every candidate, `chunk` colors
+    # at a time to bound the size of the distance matrices.
+    packed = (colors[:, 0].astype(numpy.int32) << 16
+              | colors[:, 1].astype(numpy.int32) << 8 | colors[:, 2])
+    values, inverse = numpy.unique(packed, return_inverse=True)
+    unique = numpy.stack([values >> 16, values >> 8 & 0xff, values & 0xff], axis=-1)
+    codes = numpy.array(_candidates(method), dtype=numpy.uint8)
+    if metric == 'redmean':
+        table = numpy.frombuffer(RGB_TABLE, dtype=numpy.uint8).reshape(256, 3)
+        table = table[codes].astype(numpy.float64)
+    else:
+        table = numpy.array(lab_clut())[codes]
+
+    best = numpy.empty(len(unique), dtype=numpy.uint8)
+    for start in range(0, len(unique), chunk):
+        c = unique[start:start + chunk]
+        if metric == 'redmean':
+            c = c.astype(numpy.float64)[:, None, :]
+            m = (c[..., 0] + table[:, 0]) / 2
+            d = ((2 + m / 256) * (c[..., 0] - table[:, 0])**2
+                 + 4 * (c[..., 1] - table[:, 1])**2
+                 + (2 + (255 - m) / 256) * (c[..., 2] - table[:, 2])**2)
+        else:
+            lab = _lab_numpy(c)
+            d = ((lab[:, None, :] - table)**2).sum(axis=-1)
+            if metric == 'ciede2000':
+                # Same pruning as _nearest_metric: the CIE76 winner bounds
+                # the result, and only candidates whose lightness bound is
+                # below it are evaluated.
+                first = d.argmin(axis=1)
+                bound = _ciede2000_numpy(lab, table[first])
+                l1, l2 = lab[:, None, 0], table[:, 0]
+                lower = numpy.abs(l1 - l2) / _sl((l1 + l2) / 2 - 50)
+                rows, cols = numpy.nonzero(lower < bound[:, None])
+                d = numpy.full(d.shape, numpy.inf)
+                d[numpy.arange(len(c)), first] = bound
+                d[rows, cols] = _ciede2000_numpy(lab[rows], table[cols])
+        best[start:start + chunk] = codes[d.argmin(axis=1)]
+    return best[inverse.reshape(-1)]
+
+@lru_cache(maxsize=1 << 16)
+def _nearest_metric(r, g, b, method, metric):
+    codes = _candidates(method)
+    if metric == 'redmean':
+        def distance(i):
+            cr, cg, cb = RGB_TABLE[3*i:3*i + 3]
+            m = (r + cr) / 2.0
+            return ((2 + m / 256) * (r - cr)**2 + 4 * (g - cg)**2
+                    + (2 + (255 - m) / 256) * (b - cb)**2)
+        return min(codes, key=distance)
+
+    clut = lab_clut()
+    lab = srgb_to_lab(r, g, b)
+    def cie76(i):
+        l, a, b = clut[i]
+        return (lab[0] - l)**2 + (lab[1] - a)**2 + (lab[2] - b)**2
+    if metric == 'cie76':
+        return min(codes, key=cie76)
+
+    best, dist = None, float('inf')
+    for i in sorted(codes, key=cie76):
+        l = clut[i][0]
+        if abs(lab[0] - l) >= dist * _sl((lab[0] + l) / 2 - 50):
+            continue
+        d = ciede2000(lab, clut[i])
+        if d < dist:
+            best, dist = i, d
+    return best
+
+def _pack_hex(colors):
+    return bytes.fromhex(''.join(_check_hex(_strip_hash(c)) for c in colors))
+
+def _system_numpy(c):
+    # The nearest system color of each color, and its distance.
+    d = ((c[:, None, :] - numpy.array(SYSTEM)[None])**2).sum(axis=2)
+    i = d.argmin(axis=1)
+    return i, d[numpy.arange(len(d)), i]
+
+def _nearest_numpy(colors, system):
+    c = colors.astype(numpy.int32)
+    levels = numpy.frombuffer(LEVELS, dtype=numpy.uint8)[colors].astype(numpy.int32)
+    best = 16 + 36*levels[:, 0] + 6*levels[:, 1] + levels[:, 2]
+    dist = ((c - numpy.array(INCS)[levels])**2).sum(axis=1)
+    k = numpy.clip((c.sum(axis=1) - 9) // 30, 0, len(GRAYS) - 1)
+    d = ((c - numpy.array(GRAYS)[k][:, None])**2).sum(axis=1)
+    best = numpy.where(d < dist, 232 + k, best)
+    dist = numpy.minimum(d, dist)
+    if system:
+        i, d = _system_numpy(c)
+        best = numpy.where(d < dist, i, best)
+    return best.astype(numpy.uint8)
+
+def rgb2short_batch(colors, method='cube', metric='srgb'):
+    """ Find the closest xterm-256 approximation to many RGB values at once.
+    @param colors: Either a sequence of hex codes ('abcdef' or '#abcdef'),
+        a packed RGB buffer (bytes, bytearray, memoryview; 3 bytes per
+        color), or a NumPy array of shape (n, 3) or of packed 0xRRGGBB ints.
+    @param method: As for rgb2short.
+    @param metric: As for rgb2short.
+    @returns: The xterm codes as a NumPy uint8 array when NumPy is
+        available, an array('B') otherwise.
+    >>> rgb2short_batch(['123456', 'ffffff', '#0DADD6']).tolist()
+    [23, 231, 38]
+    >>> rgb2short_batch(b'\\x12\\x34\\x56\\xff\\xff\\xff').tolist()
+    [23, 231]
+    >>> rgb2short_batch(['7f849c', '313244'], method='nearest').tolist()
+    [103, 237]
+    >>> rgb2short_batch(['f5c2e7', '89b4fa'], metric='ciede2000').tolist()
+    [225, 111]
+    """
+    indexer = _indexer(method, metric)
+    if numpy is not None and isinstance(colors, numpy.ndarray):
+        if colors.ndim == 1:
+            colors = numpy.stack(
+                [colors >> 16 & 0xff, colors >> 8 & 0xff, colors & 0xff], axis=-1)
+        colors = colors.astype(numpy.uint8, copy=False)
+    elif isinstance(colors, (bytes, bytearray, memoryview)):
+        colors = bytes(colors)
+    else:
+        colors = _pack_hex(colors)
+
+    if isinstance(colors, bytes):
+        if len(colors) % 3:
+            raise ValueError('Packed RGB buffer length must be a multiple of 3')
+        if numpy is not None:
+            colors = numpy.frombuffer(colors, dtype=numpy.uint8).reshape(-1, 3)
+        elif method == 'cube' and metric == 'srgb':
+            levels = colors.translate(LEVELS)
+            return array('B', [ 16 + 36*r + 6*g + b for r, g, b
+                                in zip(levels[0::3], levels[1::3], levels[2::3]) ])
+        else:
+            return array('B', [ indexer(r, g, b) for r, g, b
+                                in zip(colors[0::3], colors[1::3], colors[2::3]) ])
+
+    if metric != 'srgb':
+        return _nearest_metric_numpy(colors, method, metric)
+    if method == 'system16':
+        return _system_numpy(colors.astype(numpy.int32))[0].astype(numpy.uint8)
+    if method != 'cube':
+        return _nearest_numpy(colors, system=method == 'nearest256')
+    levels = numpy.frombuffer(LEVELS, dtype=numpy.uint8)[colors]
+    return (16 + 36*levels[:, 0] + 6*levels[:, 1] + levels[:, 2]).astype(numpy.uint8)
+
+def short2rgb_batch(codes, out=None):
+    """ Expand many xterm-256 color codes to packed RGB at once.
+    @param codes: The xterm codes, one byte each: bytes, bytearray,
+        memoryview, array('B'), or a NumPy array of any shape.
+    @param out: Optional writable buffer of at least 3 bytes per code
+        (bytearray, array('B'), mmap, NumPy uint8 array, ...) that receives
+        the R, G, B bytes of every code in order.
+    @returns: `out` when given. Otherwise a bytearray, or for NumPy input a
+        uint8 array of shape codes.shape + (3,).
+    >>> short2rgb_batch(bytes([23, 231, 8])).hex()
+    '005f5fffffff808080'
+    >>> buf = bytearray(6)
+    >>> short2rgb_batch(array('B', [196, 0]), buf) is buf, buf.hex()
+    (True, 'ff0000000000')
+    """
+    if numpy is not None and isinstance(codes, numpy.ndarray):
+        if codes.dtype != numpy.uint8 and codes.size and (
+                codes.min() < 0 or codes.max() > 255):
+            raise ValueError('xterm codes must be between 0 and 255')
+        table = numpy.frombuffer(RGB_TABLE, dtype=numpy.uint8).reshape(256, 3)
+        if out is None:
+            return table[codes]
+        target = numpy.frombuffer(out, dtype=numpy.uint8) \
+            if not isinstance(out, numpy.ndarray) else out.reshape(-1)
+        if len(target) < 3*codes.size:
+            raise ValueError('Output buffer is too small')
+        numpy.take(table, codes.reshape(-1), axis=0,
+                   out=target[:3*codes.size].reshape(-1, 3))
+        return out
+
+    view = memoryview(codes)
+    if view.itemsize != 1:
+        raise ValueError('xterm codes must be one byte each')
+    codes = view.cast('B').tobytes()
+    size = len(codes)
+    if out is None:
+        out = bytearray(3*size)
+    target = memoryview(out).cast('B')
+    if len(target) < 3*size:
+        raise ValueError('Output buffer is too small')
+    # Each channel is a 256-byte translation table, so the expansion runs in
+    # C without creating a Python object per code.
+    target[0:3*size:3] = codes.translate(RGB_TABLE[0::3])
+    target[1:3*size:3] = codes.translate(RGB_TABLE[1::3])
+    target[2:3*size:3] = codes.translate(RGB_TABLE[2::3])
+    return out
+
+def _distances(colors, method, metric):
+    # Rows of distances, per `metric`, from each (r, g, b) of `colors` to
+    # every candidate of `method`.
+    codes = list(_candidates(method))
+    if numpy is not None:
+        c = numpy.array(colors, dtype=numpy.float64).reshape(-1, 3)[:, None, :]
+        if metric in ('srgb', 'redmean'):
+            table = numpy.frombuffer(RGB_TABLE, dtype=numpy.uint8).reshape(256, 3)
+            d = (c - table[codes]) ** 2
+            if metric == 'redmean':
+                m = (c[..., 0] + table[codes, 0]) / 2
+                d = d * numpy.stack([2 + m / 256, numpy.full(m.shape, 4.0),
+                                     2 + (255 - m) / 256], axis=-1)
+            d = numpy.sqrt(d.sum(axis=-1))
+        else:
+            lab = _lab_numpy(c)
+            table = numpy.array(lab_clut())[codes]
+            if metric == 'cie76':
+                d = numpy.sqrt(((lab - table) ** 2).sum(axis=-1))
+            else:
+                d = _ciede2000_numpy(lab, table[None])
+        return d.tolist()
+
+    clut = lab_clut()
+    rows = []
+    for r, g, b in colors:
+        row = []
+        lab = srgb_to_lab(r, g, b)
+        for i in codes:
+            cr, cg, cb = RGB_TABLE[3*i:3*i + 3]
+            if metric == 'srgb':
+                row.append(math.sqrt((r - cr)**2 + (g - cg)**2 + (b - cb)**2))
+            elif metric == 'redmean':
+                m = (r + cr) / 2.0
+                row.append(math.sqrt((2 + m / 256) * (r - cr)**2 + 4 * (g - cg)**2
+                                     + (2 + (255 - m) / 256) * (b - cb)**2))
+            elif metric == 'cie76':
+                row.append(math.dist(lab, clut[i]))
+            else:
+                row.append(ciede2000(lab, clut[i]))
+        rows.append(row)
+    return rows
+
+def _assign(cost):
+    # The column of each row of `cost` (n rows, at least n columns) that
+    # minimize the total cost, with every row in a different column: the
+    # Hungarian method, adding one row at a time along a shortest augmenting
+    # path. A row only needs its n cheapest columns (given any other, one of
+    # those would be free and no dearer), so the others are dropped first.
+    n = len(cost)
+    columns = sorted({ j for row in cost
+                       for j in sorted(range(len(row)), key=row.__getitem__)[:n] })
+    m = len(columns)
+    a = [ None ] + [ [ 0.0 ] + [ row[j] for j in columns ] for row in cost ]
+    inf = float('inf')
+    u, v = [ 0.0 ] * (n + 1), [ 0.0 ] * (m + 1)
+    owner, way = [ 0 ] * (m + 1), [ 0 ] * (m + 1)
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        minv = [ inf ] * (m + 1)
+        used = [ False ] * (m + 1)
+        while owner[j0]:
+            used[j0] = True
+            delta, j1 = inf, 0
+            row, ui = a[owner[j0]], u[owner[j0]]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j] - ui - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+    result = [ None ] * n
+    for j in range(1, m + 1):
+        if owner[j]:
+            result[owner[j] - 1] = columns[j - 1]
+    return result
+
+def rgb2short_distinct(colors, method='cube', metric='srgb'):
+    """ Find distinct xterm-256 codes for a whole palette at once.
+    Rather than each color getting its nearest code, as from
+    rgb2short_batch, the codes minimize the sum of the distances between the
+    colors and their codes, subject to different colors getting different
+    codes, so that close colors of a palette stay apart. Identical colors
+    share a code.
+    @param colors: A sequence of hex codes ('abcdef' or '#abcdef'), or a
+        packed RGB buffer (3 bytes per color).
+    @param method: As for rgb2short: which codes may be used.
+    @param metric: As for rgb2short.
+    @returns: The xterm codes, as a list of ints.
+    @raises ValueError: If there are more distinct colors than codes.
+    >>> rgb2short_batch(['f5e0dc', 'f2cdcd']).tolist() # rosewater, flamingo
+    [224, 224]
+    >>> rgb2short_distinct(['f5e0dc', 'f2cdcd'])
+    [224, 188]
+    """
+    _indexer(method, metric)
+    if isinstance(colors, (bytes, bytearray, memoryview)):
+        colors = bytes(colors)
+        if len(colors) % 3:
+            raise ValueError('Packed RGB buffer length must be a multiple of 3')
+    else:
+        colors = _pack_hex(colors)
+    colors = [ colors[i:i + 3] for i in range(0, len(colors), 3) ]
+    unique = list(dict.fromkeys(colors))
+    codes = _candidates(method)
+    if len(unique) > len(codes):
+        raise ValueError('Cannot give %d colors distinct codes out of %d'
+                         % (len(unique), len(codes)))
+
+    cost = _distances([ tuple(c) for c in unique ], method, metric)
+    nearest = [ min(range(len(row)), key=row.__getitem__) for row in cost ]
+    if len(set(nearest)) < len(nearest):
+        nearest = _assign(cost)
+    assigned = dict(zip(unique, (codes[j] for j in nearest)))
+    return [ assigned[c] for c in colors ]
+
+# On-disk lookup tables: a header followed by one xterm code per RGB color
+# (bits=8) or per cell of a 2**bits-per-channel cube. Cube tables end with a
+# bitmap of the cells whose corners do not all map to the same code; lookups
+# in those cells are refined with the exact computation. Every method maps
+# colors to convex regions, so a cell whose corners agree is uniform.
+LUT_MAGIC = b'XLUT'
+LUT_VERSION = 2
+LUT_HEADER = struct.Struct('<4sBBB1x32s')
+
+def clut_checksum(method='cube'):
+    """ Digest of CLUT and the quantizer, stored in every lookup table.
+    """
+    _indexer(method)
+    digest = hashlib.sha256(('%s;' % method).encode('ascii'))
+    for short, rgb in CLUT:
+        digest.update(('%s:%s;' % (short, rgb)).encode('ascii'))
+    return digest.digest()
+
+def _rgb2index(r, g, b):
+    return 16 + 36*LEVELS[r] + 6*LEVELS[g] + LEVELS[b]
+
+def _grid(values):
+    # Packed RGB buffer of every (r, g, b) combination of `values`.
+    n = len(values)
+    grid = bytearray(n ** 3 * 3)
+    grid[0::3] = bytes(v for v in values for _ in range(n * n))
+    grid[1::3] = bytes(v for v in values for _ in range(n)) * n
+    grid[2::3] = bytes(values) * (n * n)
+    return grid
+
+def _lut_planes(method):
+    # Yields the xterm codes of all colors, one 256x256 red plane at a time.
+    plane = _grid(range(256))[:256 * 256 * 3]
+    for r in range(256):
+        plane[0::3] = bytes([r]) * (256 * 256)
+        yield bytes(rgb2short_batch(plane, method))
+
+def _lut_cells(bits, method):
+    # Yields the cube table, then the bitmap of cells needing refinement.
+    shift = 8 - bits
+    size = 1 << bits
+    n = 2 * size
+    corners = rgb2short_batch(_grid(
+        [ v for c in range(size) for v in (c << shift, ((c + 1) << shift) - 1) ]),
+        method)
+    table = bytearray(size ** 3)
+    bitmap = bytearray((size ** 3 + 7) // 8)
+    cell = 0
+    for r in range(0, n, 2):
+        for g in range(0, n, 2):
+            for b in range(0, n, 2):
+                base = (r * n + g) * n + b
+                codes = { corners[base + (dr * n + dg) * n + db]
+                          for dr in (0, 1) for dg in (0, 1) for db in (0, 1) }
+                table[cell] = min(codes)
+                if len(codes) > 1:
+                    bitmap[cell >> 3] |= 1 << (cell & 7)
+                cell += 1
+    yield bytes(table)
+    yield bytes(bitmap)
+
+def write_lut(path, bits=8, method='cube'):
+    """ Write a lookup table covering every 24-bit color to `path`.
+    @param path: Destination file.
+    @param bits: Bits kept per channel: 8 for the full 16.7M-entry table,
+        5 or 6 (or anything below 8) for a cube table with refinement.
+    @param method: As for rgb2short.
+    """
+    if not 1 <= bits <= 8:
+        raise ValueError('bits must be between 1 and 8, got %r' % bits)
+    checksum = clut_checksum(method)
+    chunks = _lut_planes(method) if bits == 8 else _lut_cells(bits, method)
+    with open(path, 'wb') as f:
+        f.write(LUT_HEADER.pack(LUT_MAGIC, LUT_VERSION, bits,
+                                METHODS.index(method), checksum))
+        for chunk in chunks:
+            f.write(chunk)
+
+class XtermLUT(object):
+    """ Memory-mapped lookup table written by write_lut.
+
+    Indexing with a 0xRRGGBB integer, or a hex code as rgb2short takes,
+    returns the xterm code:
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cube.lut')
+    >>> write_lut(path, bits=6)
+    >>> with XtermLUT(path) as lut:
+    ...     lut[0x123456], lut[0xffffff], lut['#0dadd6']
+    (23, 231, 38)
+    >>> with XtermLUT(path) as lut:
+    ...     lut[0x1000000]
+    Traceback (most recent call last):
+        ...
+    KeyError: '0x1000000 is not a 24-bit RGB color'
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, bits, method, checksum = \
+                LUT_HEADER.unpack_from(self._mmap)
+        except struct.error:
+            self.close()
+            raise ValueError('%s is not an xterm lookup table' % path)
+        size = 1 << 3 * bits
+        expected = LUT_HEADER.size + size + (0 if bits == 8 else (size + 7) // 8)
+        if (magic != LUT_MAGIC or version != LUT_VERSION
+                or method >= len(METHODS) or len(self._mmap) != expected):
+            self.close()
+            raise ValueError('%s is not an xterm lookup table' % path)
+        self.method = METHODS[method]
+        if checksum != clut_checksum(self.method):
+            self.close()
+            raise ValueError('%s is stale: it was built from a different CLUT' % path)
+        self.bits = bits
+        self._indexer = _indexer(self.method)
+        self._shift = 8 - bits
+        view = memoryview(self._mmap)
+        self._table = view[LUT_HEADER.size:LUT_HEADER.size + size]
+        self._refine = view[LUT_HEADER.size + size:]
+
+    def __getitem__(self, rgb):
+        if isinstance(rgb, str):
+            rgb = int(_check_hex(_strip_hash(rgb)), 16)
+        elif not 0 <= rgb <= 0xffffff:
+            raise KeyError('%#x is not a 24-bit RGB color' % rgb)
+        if self._shift == 0:
+            return self._table[rgb]
+        r, g, b = rgb >> 16 & 0xff, rgb >> 8 & 0xff, rgb & 0xff
+        s, bits = self._shift, self.bits
+        cell = (r >> s) << 2 * bits | (g >> s) << bits | b >> s
+        if self._refine[cell >> 3] >> (cell & 7) & 1:
+            return self._indexer(r, g, b)
+        return self._table[cell]
+
+    def close(self):
+        for view in ('_table', '_refine'):
+            if hasattr(self, view):
+                getattr(self, view).release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Integer tables, all literals so that importing the module builds nothing.
+# The xterm code of a cube color is 16 + 36*r + 6*g + b for its levels, and
+# RGB_TABLE holds the R, G, B bytes of every code.
+METHODS = ('cube', 'nearest', 'nearest256', 'system16')
+METRICS = ('srgb', 'redmean', 'cie76', 'ciede2000')
+SRGB_TO_XYZ = (  # linear sRGB to XYZ, each row divided by the D65 white
+    (0.4124564 / 0.95047, 0.3575761 / 0.95047, 0.1804375 / 0.95047),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339 / 1.08883, 0.1191920 / 1.08883, 0.9503041 / 1.08883),
+)
+INCS = (0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff)
+GRAYS = (8, 18, 28, 38, 48, 58, 68, 78, 88, 98, 108, 118, 128, 138, 148, 158, 168, 178, 188, 198, 208, 218, 228, 238)
+SYSTEM = (
+    (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+    (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+    (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+LEVELS = (b'\x00' * 48 + b'\x01' * 67 + b'\x02' * 40 + b'\x03' * 40
+          + b'\x04' * 40 + b'\x05' * 21)
+RGB_TABLE = (
+    b'\x00\x00\x00\x80\x00\x00\x00\x80\x00\x80\x80\x00\x00\x00\x80\x80\x00\x80'  # 0-5
+    b'\x00\x80\x80\xc0\xc0\xc0\x80\x80\x80\xff\x00\x00\x00\xff\x00\xff\xff\x00'  # 6-11
+    b'\x00\x00\xff\xff\x00\xff\x00\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x5f'  # 12-17
+    b'\x00\x00\x87\x00\x00\xaf\x00\x00\xd7\x00\x00\xff\x00\x5f\x00\x00\x5f\x5f'  # 18-23
+    b'\x00\x5f\x87\x00\x5f\xaf\x00\x5f\xd7\x00\x5f\xff\x00\x87\x00\x00\x87\x5f'  # 24-29
+    b'\x00\x87\x87\x00\x87\xaf\x00\x87\xd7\x00\x87\xff\x00\xaf\x00\x00\xaf\x5f'  # 30-35
+    b'\x00\xaf\x87\x00\xaf\xaf\x00\xaf\xd7\x00\xaf\xff\x00\xd7\x00\x00\xd7\x5f'  # 36-41
+    b'\x00\xd7\x87\x00\xd7\xaf\x00\xd7\xd7\x00\xd7\xff\x00\xff\x00\x00\xff\x5f'  # 42-47
+    b'\x00\xff\x87\x00\xff\xaf\x00\xff\xd7\x00\xff\xff\x5f\x00\x00\x5f\x00\x5f'  # 48-53
+    b'\x5f\x00\x87\x5f\x00\xaf\x5f\x00\xd7\x5f\x00\xff\x5f\x5f\x00\x5f\x5f\x5f'  # 54-59
+    b'\x5f\x5f\x87\x5f\x5f\xaf\x5f\x5f\xd7\x5f\x5f\xff\x5f\x87\x00\x5f\x87\x5f'  # 60-65
+    b'\x5f\x87\x87\x5f\x87\xaf\x5f\x87\xd7\x5f\x87\xff\x5f\xaf\x00\x5f\xaf\x5f'  # 66-71
+    b'\x5f\xaf\x87\x5f\xaf\xaf\x5f\xaf\xd7\x5f\xaf\xff\x5f\xd7\x00\x5f\xd7\x5f'  # 72-77
+    b'\x5f\xd7\x87\x5f\xd7\xaf\x5f\xd7\xd7\x5f\xd7\xff\x5f\xff\x00\x5f\xff\x5f'  # 78-83
+    b'\x5f\xff\x87\x5f\xff\xaf\x5f\xff\xd7\x5f\xff\xff\x87\x00\x00\x87\x00\x5f'  # 84-89
+    b'\x87\x00\x87\x87\x00\xaf\x87\x00\xd7\x87\x00\xff\x87\x5f\x00\x87\x5f\x5f'  # 90-95
+    b'\x87\x5f\x87\x87\x5f\xaf\x87\x5f\xd7\x87\x5f\xff\x87\x87\x00\x87\x87\x5f'  # 96-101
+    b'\x87\x87\x87\x87\x87\xaf\x87\x87\xd7\x87\x87\xff\x87\xaf\x00\x87\xaf\x5f'  # 102-107
+    b'\x87\xaf\x87\x87\xaf\xaf\x87\xaf\xd7\x87\xaf\xff\x87\xd7\x00\x87\xd7\x5f'  # 108-113
+    b'\x87\xd7\x87\x87\xd7\xaf\x87\xd7\xd7\x87\xd7\xff\x87\xff\x00\x87\xff\x5f'  # 114-119
+    b'\x87\xff\x87\x87\xff\xaf\x87\xff\xd7\x87\xff\xff\xaf\x00\x00\xaf\x00\x5f'  # 120-125
+    b'\xaf\x00\x87\xaf\x00\xaf\xaf\x00\xd7\xaf\x00\xff\xaf\x5f\x00\xaf\x5f\x5f'  # 126-131
+    b'\xaf\x5f\x87\xaf\x5f\xaf\xaf\x5f\xd7\xaf\x5f\xff\xaf\x87\x00\xaf\x87\x5f'  # 132-137
+    b'\xaf\x87\x87\xaf\x87\xaf\xaf\x87\xd7\xaf\x87\xff\xaf\xaf\x00\xaf\xaf\x5f'  # 138-143
+    b'\xaf\xaf\x87\xaf\xaf\xaf\xaf\xaf\xd7\xaf\xaf\xff\xaf\xd7\x00\xaf\xd7\x5f'  # 144-149
+    b'\xaf\xd7\x87\xaf\xd7\xaf\xaf\xd7\xd7\xaf\xd7\xff\xaf\xff\x00\xaf\xff\x5f'  # 150-155
+    b'\xaf\xff\x87\xaf\xff\xaf\xaf\xff\xd7\xaf\xff\xff\xd7\x00\x00\xd7\x00\x5f'  # 156-161
+    b'\xd7\x00\x87\xd7\x00\xaf\xd7\x00\xd7\xd7\x00\xff\xd7\x5f\x00\xd7\x5f\x5f'  # 162-167
+    b'\xd7\x5f\x87\xd7\x5f\xaf\xd7\x5f\xd7\xd7\x5f\xff\xd7\x87\x00\xd7\x87\x5f'  # 168-173
+    b'\xd7\x87\x87\xd7\x87\xaf\xd7\x87\xd7\xd7\x87\xff\xd7\xaf\x00\xd7\xaf\x5f'  # 174-179
+    b'\xd7\xaf\x87\xd7\xaf\xaf\xd7\xaf\xd7\xd7\xaf\xff\xd7\xd7\x00\xd7\xd7\x5f'  # 180-185
+    b'\xd7\xd7\x87\xd7\xd7\xaf\xd7\xd7\xd7\xd7\xd7\xff\xd7\xff\x00\xd7\xff\x5f'  # 186-191
+    b'\xd7\xff\x87\xd7\xff\xaf\xd7\xff\xd7\xd7\xff\xff\xff\x00\x00\xff\x00\x5f'  # 192-197
+    b'\xff\x00\x87\xff\x00\xaf\xff\x00\xd7\xff\x00\xff\xff\x5f\x00\xff\x5f\x5f'  # 198-203
+    b'\xff\x5f\x87\xff\x5f\xaf\xff\x5f\xd7\xff\x5f\xff\xff\x87\x00\xff\x87\x5f'  # 204-209
+    b'\xff\x87\x87\xff\x87\xaf\xff\x87\xd7\xff\x87\xff\xff\xaf\x00\xff\xaf\x5f'  # 210-215
+    b'\xff\xaf\x87\xff\xaf\xaf\xff\xaf\xd7\xff\xaf\xff\xff\xd7\x00\xff\xd7\x5f'  # 216-221
+    b'\xff\xd7\x87\xff\xd7\xaf\xff\xd7\xd7\xff\xd7\xff\xff\xff\x00\xff\xff\x5f'  # 222-227
+    b'\xff\xff\x87\xff\xff\xaf\xff\xff\xd7\xff\xff\xff\x08\x08\x08\x12\x12\x12'  # 228-233
+    b'\x1c\x1c\x1c\x26\x26\x26\x30\x30\x30\x3a\x3a\x3a\x44\x44\x44\x4e\x4e\x4e'  # 234-239
+    b'\x58\x58\x58\x62\x62\x62\x6c\x6c\x6c\x76\x76\x76\x80\x80\x80\x8a\x8a\x8a'  # 240-245
+    b'\x94\x94\x94\x9e\x9e\x9e\xa8\xa8\xa8\xb2\xb2\xb2\xbc\xbc\xbc\xc6\xc6\xc6'  # 246-251
+    b'\xd0\xd0\xd0\xda\xda\xda\xe4\xe4\xe4\xee\xee\xee'  # 252-255
+)
 
 #---------------------------------------------------------------------
 
@@ -0,0 +1,273 @@
+"""Adds hot-path counters to a flavor's colorscheme, for `build.py --instrument`.
+
+Instrumentation happens in two steps around `build.update_config_table`:
+
+- `instrument_branches` runs first, on the scheme with its colors
+  substituted. It counts every entry into `use()` (which becomes the
+  generated `_evaluate()`, and is labelled so) and the `verify_*` helpers,
+  and into every block of their `if` statements, with one `_HITS[i] += 1`
+  line each. The lines are inserted without reformatting the rest of the
+  source, and are inlined and specialized along with the code they count, so
+  they keep counting in the generated `_evaluate()`.
+- `instrument_use` runs last. It wraps the table-driven `use()` to count and
+  time every call, in a histogram with one bucket per power of two
+  nanoseconds, and registers an exit hook that dumps everything as JSON when
+  the scheme runs inside ranger. `_evaluate()` only runs on the contexts the
+  table and its memo of misses cannot answer, so for every call the table
+  answers, the wrapper adds the counts `_evaluate()` would have made, as
+  found by `count_branches` at build time (or on the call that added a miss
+  to the memo), outside the timed section.
+
+A scheme built without `--instrument` goes through neither step.
+"""
+
+import ast
+from typing import Callable, Mapping
+
+# Directory the statistics are written to; the system's temporary directory
+# if unset.
+STATS_VARIABLE = "CATPPUCCIN_RANGER_STATS"
+COUNTER = "_HITS"
+# Label of the counter at the entry into `_evaluate()` (the original `use()`).
+EVALUATE_LABEL = "_evaluate"
+HISTOGRAM_BUCKETS = 64
+
+STATS_SOURCE = """
+
+# Generated by build.py --instrument: hot-path statistics, dumped at exit.
+import time as _time
+
+_perf_counter_ns = _time.perf_counter_ns
+_LABELS = (
+{labels})
+_CALLS = [0] * {buckets}
+_NANOSECONDS = [0] * {buckets}
+# The counters each table entry stands for, once per increment.
+_BRANCHES = {{
+{branches}}}
+
+
+def _dump_stats():
+    import json
+    import os
+    import tempfile
+
+    directory = os.environ.get("{variable}") or tempfile.gettempdir()
+    counts = dict(zip(_LABELS, {counter}))
+    stats = {{
+        "scheme": "{class_name}",
+        "calls": sum(_CALLS),
+        "total_ns": sum(_NANOSECONDS),
+        "time_histogram": [
+            {{"below_ns": 1 << bucket, "calls": calls, "total_ns": total}}
+            for bucket, (calls, total) in enumerate(zip(_CALLS, _NANOSECONDS))
+            if calls
+        ],
+        "methods": {{k: v for k, v in counts.items() if ":" not in k}},
+        "branches": {{k: v for k, v in counts.items() if ":" in k}},
+    }}
+    path = os.path.join(directory, f"{class_name}-{{os.getpid()}}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats, f, indent=2)
+        f.write("\\n")
+
+
+# Only inside ranger: the build loads schemes against a stub without ranger.api.
+try:
+    import ranger.api
+except ImportError:
+    pass
+else:
+    import atexit
+
+    atexit.register(_dump_stats)
+"""
+
+USE_WRAPPER = """
+    def use(self, context):
+        flags = tuple(context.__dict__)
+        key = _KEYS.get(flags)
+        if key is None:
+            key = _intern_key(flags)
+        branches = _BRANCHES.get(key) if key in _COLORS else None
+        if branches is None:
+            before = {counter}[:]
+        start = _perf_counter_ns()
+        colors = self._use(context)
+        elapsed = _perf_counter_ns() - start
+        bucket = min(elapsed.bit_length(), {last})
+        _CALLS[bucket] += 1
+        _NANOSECONDS[bucket] += elapsed
+        if branches is None and key in _COLORS and {counter} == before:
+            # Answered by the table this call loaded.
+            branches = _BRANCHES.get(key, ())
+        if branches is not None:
+            # Answered by the table: count the branches its entry stands for.
+            for i in branches:
+                {counter}[i] += 1
+        elif key in _COLORS:
+            # Added to the memo of misses: later calls count what this one did.
+            _BRANCHES[key] = tuple(
+                i
+                for i, (after, count) in enumerate(zip({counter}, before))
+                for _ in range(after - count)
+            )
+        return colors
+"""
+
+
+def _class(tree: ast.Module, class_name: str) -> ast.ClassDef:
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return node
+    raise ValueError(f"Class {class_name} not found")
+
+
+def _method(cls: ast.ClassDef, name: str) -> ast.FunctionDef:
+    for node in cls.body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            return node
+    raise ValueError(f"Method {cls.name}.{name} not found")
+
+
+def _blocks(method: ast.FunctionDef) -> list[tuple[str, list[ast.stmt]]]:
+    # The method's body, then both blocks of each of its `if`s, with the label
+    # they are counted under. The `else` of an `if` whose `else` is an `elif`
+    # is left to the `elif`.
+    name = EVALUATE_LABEL if method.name == "use" else method.name
+    blocks = [(name, method.body)]
+    for node in ast.walk(method):
+        if not isinstance(node, ast.If):
+            continue
+        blocks.append((f"{name}:{node.body[0].lineno}", node.body))
+        orelse = node.orelse
+        if orelse and not (
+            len(orelse) == 1
+            and isinstance(orelse[0], ast.If)
+            and orelse[0].col_offset == node.col_offset
+        ):
+            blocks.append((f"{name}:{orelse[0].lineno}", orelse))
+    return blocks
+
+
+def instrument_branches(config: str, class_name: str) -> tuple[str, list[str]]:
+    """Counts the entries into `use()`, the `verify_*` helpers and their blocks.
+
+    Args:
+        config: The colorscheme source, with all colors substituted.
+        class_name: The name of the colorscheme class.
+
+    Returns:
+        The instrumented source, and the label of each counter: the name of
+        the method, or the method and the line of the first statement of the
+        block, e.g. `verify_browser:45`. `use()` is labelled `_evaluate`,
+        the name it is generated under.
+
+    Raises:
+        ValueError: If the class cannot be found, or a block starts on the
+            line of its `def`, `if` or `else`.
+    """
+    tree = ast.parse(config)
+    cls = _class(tree, class_name)
+    methods = [
+        node
+        for node in cls.body
+        if isinstance(node, ast.FunctionDef)
+        and (node.name == "use" or node.name.startswith("verify_"))
+    ]
+
+    lines = config.splitlines(keepends=True)
+    labels = []
+    insertions = []
+    for method in methods:
+        for label, body in _blocks(method):
+            first = body[0]
+            if lines[first.lineno - 1][: first.col_offset].strip():
+                raise ValueError(f"Cannot count {label}: it shares a line")
+            insertions.append((first.lineno, first.col_offset, len(labels)))
+            labels.append(label)
+
+    for lineno, column, index in sorted(insertions, reverse=True):
+        lines.insert(lineno - 1, f"{' ' * column}{COUNTER}[{index}] += 1\n")
+
+    # Before the class: build.py expects the class to end the module.
+    start = (cls.decorator_list[0] if cls.decorator_list else cls).lineno
+    lines.insert(start - 1, f"{COUNTER} = [0] * {len(labels)}\n\n\n")
+    return "".join(lines), labels
+
+
+def count_branches(
+    evaluate: Callable[[object], object], contexts: Mapping[int, object]
+) -> dict[int, tuple[int, ...]]:
+    """Finds the counters `_evaluate()` increments for each of some contexts.
+
+    Args:
+        evaluate: The `_evaluate()` of a scheme loaded from a config that went
+            through `instrument_branches` (and not yet specialized).
+        contexts: The contexts, by table key.
+
+    Returns:
+        For each key, the index of every counter its context increments, once
+        per increment.
+    """
+    counters = evaluate.__globals__[COUNTER]
+    branches = {}
+    for key, context in contexts.items():
+        before = counters[:]
+        evaluate(context)
+        branches[key] = tuple(
+            i
+            for i, (after, count) in enumerate(zip(counters, before))
+            for _ in range(after - count)
+        )
+    return branches
+
+
+def instrument_use(
+    config: str,
+    class_name: str,
+    labels: list[str],
+    branches: Mapping[int, tuple[int, ...]],
+) -> str:
+    """Times the table-driven `use()` and dumps the statistics at exit.
+
+    Args:
+        config: The generated colorscheme source, from a config that went
+            through `instrument_branches`.
+        class_name: The name of the colorscheme class.
+        labels: The counter labels returned by `instrument_branches`.
+        branches: The counters each entry of the decision table stands for,
+            from `count_branches`.
+
+    Returns:
+        The source with `use()` renamed to `_use()` behind a timing wrapper,
+        and the statistics appended.
+
+    Raises:
+        ValueError: If the class or its `use()` cannot be found, or `labels`
+            has no counter for `_evaluate()`.
+    """
+    if EVALUATE_LABEL not in labels:
+        raise ValueError(f"No counter labelled {EVALUATE_LABEL}")
+    tree = ast.parse(config)
+    cls = _class(tree, class_name)
+    use = _method(cls, "use")
+
+    lines = config.splitlines(keepends=True)
+    header = use.lineno - 1
+    lines[header] = lines[header].replace("def use(", "def _use(", 1)
+    wrapper = USE_WRAPPER.format(counter=COUNTER, last=HISTOGRAM_BUCKETS - 1)
+    lines.insert(cls.end_lineno, wrapper)
+
+    stats = STATS_SOURCE.format(
+        labels="".join(f"    {label!r},\n" for label in labels),
+        buckets=HISTOGRAM_BUCKETS,
+        branches="".join(
+            f"    {key:#x}: {counters!r},\n"
+            for key, counters in sorted(branches.items())
+        ),
+        variable=STATS_VARIABLE,
+        counter=COUNTER,
+        class_name=class_name,
+    )
+    return "".join(lines).rstrip("\n") + "\n" + stats
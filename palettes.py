@@ -0,0 +1,205 @@
+"""Streams palettes from JSON and TOML files for the build.
+
+Three layouts are understood, in either format:
+
+- catppuccin's upstream `palette.json`: flavors mapping to an object whose
+  `colors` map each color name (`surface0`, ...) to an object with a `hex`;
+- a collection, mapping palette names to `{color name: hex}` objects, like
+  `COLORS` in colors.py;
+- a single palette, mapping color names to hex codes; the palette is named
+  after the file.
+
+Color names are matched to the template's placeholders case-insensitively,
+and upstream names such as `surface0` also match `SURFACE_0`.
+
+Palettes are produced one at a time: directories are walked lazily, and the
+top-level object of a JSON file is decoded one member at a time, so memory
+use does not grow with the number of palettes and the build can start on the
+first palette while the rest are still unread.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+EXTENSIONS = (".json", ".toml")
+CHUNK_SIZE = 64 * 1024
+HEX_PATTERN = re.compile(r"#?[0-9a-fA-F]{6}")
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+def _members(path: Path) -> Iterator[tuple[str, object]]:
+    # Decodes the members of the top-level JSON object of `path` one by one,
+    # reading the file in chunks.
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        position = 0
+        eof = False
+
+        def token(expected: str | None = None) -> object:
+            nonlocal buffer, position, eof
+            while True:
+                start = _whitespace.match(buffer, position).end()
+                try:
+                    if expected is not None:
+                        if start < len(buffer):
+                            if buffer[start] not in expected:
+                                raise ValueError(
+                                    f"expected {expected!r} at offset {start}"
+                                )
+                            position = start + 1
+                            return buffer[start]
+                    else:
+                        value, end = decoder.raw_decode(buffer, start)
+                        # A number or literal might continue in the next chunk.
+                        if end < len(buffer) or eof:
+                            position = end
+                            return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                if eof:
+                    raise ValueError("unexpected end of file")
+
+                chunk = f.read(CHUNK_SIZE)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+
+        token("{")
+        if token('}"') == "}":
+            return
+        position -= 1
+        while True:
+            key = token()
+            if not isinstance(key, str):
+                raise ValueError(f"expected a member name, got {key!r}")
+            token(":")
+            yield key, token()
+            if token(",}") == "}":
+                return
+
+
+def _read(path: Path) -> Iterator[tuple[str, object]]:
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError("reading TOML requires Python 3.11 or later")
+        with open(path, "rb") as f:
+            yield from tomllib.load(f).items()
+    else:
+        yield from _members(path)
+
+
+def _palettes_in(path: Path) -> Iterator[tuple[str, dict]]:
+    members = _read(path)
+    for name, value in members:
+        if isinstance(value, str) and HEX_PATTERN.fullmatch(value):
+            # A single palette: its members are colors.
+            colors = {name: value}
+            colors.update(members)
+            yield path.stem, colors
+        elif isinstance(value, dict) and isinstance(value.get("colors"), dict):
+            yield name, {
+                color: entry["hex"] if isinstance(entry, dict) else entry
+                for color, entry in value["colors"].items()
+            }
+        elif isinstance(value, dict):
+            yield name, value
+        # Anything else, like the upstream `"version": "1.7.1"`, is metadata.
+
+
+def _files(paths: Iterable[str | Path]) -> Iterator[Path]:
+    for path in map(Path, paths):
+        if not path.is_dir():
+            yield path
+            continue
+        for root, directories, files in os.walk(path):
+            directories.sort()
+            for name in sorted(files):
+                if name.endswith(EXTENSIONS):
+                    yield Path(root) / name
+
+
+def normalize_colors(
+    palette_name: str, colors: dict, keys: Iterable[str]
+) -> dict[str, str]:
+    """Checks a palette against the template and renames its colors to match.
+
+    Args:
+        palette_name: The name of the palette, for error messages.
+        colors: The palette as read, mapping color names to hex codes.
+        keys: The lowercase color names the template needs.
+
+    Returns:
+        A mapping from each of `keys` to its hex code.
+
+    Raises:
+        ValueError: If a color is missing or is not a hex code.
+    """
+    by_name = {}
+    for name, value in colors.items():
+        name = str(name).lower()
+        by_name[name] = value
+        by_name.setdefault(re.sub(r"(?<=[a-z])(?=[0-9]+$)", "_", name), value)
+
+    normalized = {}
+    missing = []
+    for key in sorted(keys):
+        if key not in by_name:
+            missing.append(key)
+        elif not isinstance(by_name[key], str) or not HEX_PATTERN.fullmatch(
+            by_name[key]
+        ):
+            raise ValueError(
+                f"Palette {palette_name}: {key} is not a hex color: {by_name[key]!r}"
+            )
+        else:
+            normalized[key] = by_name[key]
+
+    if missing:
+        raise ValueError(f"Palette {palette_name} missing required colors: {missing}")
+
+    return normalized
+
+
+def iter_palettes(
+    paths: Iterable[str | Path], keys: Iterable[str]
+) -> Iterator[tuple[str, dict[str, str] | ValueError]]:
+    """Reads palettes from files and directories, one at a time.
+
+    Directories are searched recursively, in sorted order, for `.json` and
+    `.toml` files.
+
+    Args:
+        paths: Palette files and directories.
+        keys: The lowercase color names the template needs, e.g.
+            `Template.keys`.
+
+    Yields:
+        The name of each palette and its colors, restricted to `keys`. An
+        invalid palette comes with the ValueError describing it instead of
+        its colors, and so does a file that cannot be read or parsed (named
+        after the file, after any palettes read from it), so that reading
+        goes on with the next one.
+    """
+    keys = frozenset(keys)
+    for path in _files(paths):
+        try:
+            for name, colors in _palettes_in(path):
+                try:
+                    colors = normalize_colors(f"{name} ({path})", colors, keys)
+                except ValueError as e:
+                    colors = e
+                yield name, colors
+        # JSON, TOML and UTF-8 decoding errors are all ValueErrors.
+        except (OSError, ValueError) as e:
+            yield str(path), e if isinstance(e, ValueError) else ValueError(e)
@@ -0,0 +1,144 @@
+"""Minimal stand-in for the parts of ranger used by the colorschemes.
+
+The build evaluates `base_config.py` at build time, and the tooling around it
+runs generated schemes headlessly, so neither may depend on ranger (or curses)
+being installed. The modules registered here mirror `ranger.gui.color`,
+`ranger.gui.colorscheme` and `ranger.gui.context` closely enough for that.
+"""
+
+import sys
+import types
+from contextlib import contextmanager
+from typing import Iterator
+
+# Same values as the ncurses attributes ranger re-exports.
+normal = 0
+reverse = 1 << 18
+bold = 1 << 21
+blink = 1 << 19
+underline = 1 << 17
+invisible = 1 << 23
+dim = 1 << 20
+italic = 1 << 31
+
+default = -1
+black = 0
+red = 1
+green = 2
+yellow = 3
+blue = 4
+magenta = 5
+cyan = 6
+white = 7
+
+default_colors = (default, default, normal)
+
+# fmt: off
+ATTRIBUTE_NAMES = (
+    "reverse", "bold", "blink", "underline", "invisible", "dim", "italic",
+)
+COLOR_NAMES = ATTRIBUTE_NAMES + (
+    "normal", "default", "black", "red", "green", "yellow", "blue", "magenta",
+    "cyan", "white", "default_colors",
+)
+
+CONTEXT_KEYS = [
+    "reset", "error", "badinfo",
+    "in_browser", "in_statusbar", "in_titlebar", "in_console",
+    "in_pager", "in_taskview",
+    "active_pane", "inactive_pane",
+    "directory", "file", "hostname",
+    "executable", "media", "link", "fifo", "socket", "device",
+    "video", "audio", "image", "document", "container",
+    "selected", "empty", "main_column", "message", "background",
+    "good", "bad",
+    "space", "permissions", "owner", "group", "mtime", "nlink",
+    "scroll", "all", "bot", "top", "percentage", "filter",
+    "flat", "marked", "tagged", "tag_marker", "line_number",
+    "cut", "copied", "frozen",
+    "help_markup", "seperator", "key", "special", "border",
+    "title", "text", "highlight", "bars", "quotes", "tab", "loaded",
+    "keybuffer", "infostring",
+    "vcsfile", "vcsremote", "vcsinfo", "vcscommit", "vcsdate",
+    "vcsconflict", "vcschanged", "vcsunknown", "vcsignored", "vcsuntracked",
+    "vcsstaged", "vcssync", "vcsnone", "vcsbehind", "vcsahead", "vcsdiverged",
+]
+# fmt: on
+
+
+class Context:
+    """Context object as built by ranger: only the given keys are set."""
+
+    def __init__(self, keys):
+        dictionary = self.__dict__
+        for key in keys:
+            dictionary[key] = True
+
+
+for _key in CONTEXT_KEYS:
+    setattr(Context, _key, False)
+
+
+class ColorScheme:
+    """Base class matching `ranger.gui.colorscheme.ColorScheme`."""
+
+    def get(self, *keys):
+        return self.use(Context(keys))
+
+    def get_attr(self, *keys):
+        # Ranger also adds the curses color pair of (fg, bg), which needs curses.
+        return self.get(*keys)[2]
+
+    @staticmethod
+    def use(_):
+        return default_colors
+
+
+def _build_modules() -> dict[str, types.ModuleType]:
+    ranger = types.ModuleType("ranger")
+    gui = types.ModuleType("ranger.gui")
+    color = types.ModuleType("ranger.gui.color")
+    colorscheme = types.ModuleType("ranger.gui.colorscheme")
+    context = types.ModuleType("ranger.gui.context")
+
+    this = sys.modules[__name__]
+    for name in COLOR_NAMES:
+        setattr(color, name, getattr(this, name))
+
+    colorscheme.ColorScheme = ColorScheme
+    context.Context = Context
+    context.CONTEXT_KEYS = CONTEXT_KEYS
+
+    ranger.gui = gui
+    gui.color = color
+    gui.colorscheme = colorscheme
+    gui.context = context
+
+    return {
+        "ranger": ranger,
+        "ranger.gui": gui,
+        "ranger.gui.color": color,
+        "ranger.gui.colorscheme": colorscheme,
+        "ranger.gui.context": context,
+    }
+
+
+@contextmanager
+def installed() -> Iterator[None]:
+    """Temporarily registers the stub modules in `sys.modules`.
+
+    Any real ranger modules that were already imported are restored on exit.
+    """
+
+    modules = _build_modules()
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+
+    try:
+        yield
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
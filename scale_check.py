@@ -0,0 +1,276 @@
+"""Scale check of the build pipeline, against golden snapshots and budgets.
+
+Builds the flavors of colors.py and a large number of synthetic palettes
+(seeded, so that every run builds the same ones) through
+`build.create_palettes`, and checks that:
+
+- the schemes of the real flavors are identical to their snapshots in
+  SNAPSHOT_DIR, and those of the synthetic palettes hash to the digest
+  recorded in the budget file, so that any change to the generated code or to
+  the hex to xterm conversion shows up;
+- every generated module compiles, at every level of `build.BYTECODE_LEVELS`;
+- the wall time per palette and the peak memory of the build stay within the
+  budgets recorded in BUDGET_FILE, give or take `--tolerance`.
+
+Palettes are built BATCH at a time, each batch in a temporary directory that
+is checked and removed before the next one, so disk use does not grow with
+`--count`. After an intended change, `--update` rewrites the snapshots and the
+budgets; without a budget file, the check fails. Like bench.py, it runs
+without ranger installed.
+"""
+
+import argparse
+import difflib
+import hashlib
+import itertools
+import json
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import bench
+import build
+from colors import COLORS
+
+SNAPSHOT_DIR = Path("snapshots")
+BUDGET_FILE = Path("scale_budget.json")
+PALETTES = 10_000
+BATCH = 1000
+DIFF_LINES = 40
+
+
+def peak_memory() -> dict[str, int]:
+    """Returns the peak resident set size of this process and its workers.
+
+    Returns:
+        The peaks of this process ("self") and of its largest finished child
+        process ("workers"), in KiB.
+    """
+    # ru_maxrss is in bytes on macOS, in KiB elsewhere.
+    unit = 1024 if sys.platform == "darwin" else 1
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // unit,
+        "workers": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // unit,
+    }
+
+
+def check_batch(output: Path) -> tuple[dict[str, str], list[str]]:
+    """Compiles every module of a build directory and hashes its contents.
+
+    Args:
+        output: The directory of one `create_palettes` call.
+
+    Returns:
+        The SHA-256 digest of each module, by file name, and a description of
+        each one that does not compile.
+    """
+    digests = {}
+    failures = []
+    for module in sorted(output.glob("*.py")):
+        source = module.read_bytes()
+        digests[module.name] = hashlib.sha256(source).hexdigest()
+        # Compiled here rather than through `build.compile_bytecode`, which
+        # skips modules whose bytecode is current.
+        try:
+            for level in build.BYTECODE_LEVELS:
+                compile(source, str(module), "exec", optimize=level)
+        except (SyntaxError, ValueError) as e:
+            failures.append(f"{module.name} does not compile: {e}")
+    return digests, failures
+
+
+def check_snapshots(output: Path, snapshots: Path, update: bool) -> list[str]:
+    """Compares the schemes of the flavors in COLORS to their snapshots.
+
+    Args:
+        output: The directory the flavors were built in.
+        snapshots: The directory holding the snapshots.
+        update: Overwrite the snapshots with the new schemes instead.
+
+    Returns:
+        A description, with the start of a diff, of each scheme that changed.
+    """
+    failures = []
+    for flavor_name in COLORS:
+        scheme = build.get_output_file(flavor_name, output)
+        snapshot = snapshots / scheme.name
+        if not scheme.exists():
+            failures.append(f"{scheme.name} was not built")
+            continue
+        if update:
+            snapshots.mkdir(exist_ok=True)
+            build.write_if_changed(snapshot, scheme.read_bytes())
+            continue
+
+        new = scheme.read_text(encoding="utf-8").splitlines(keepends=True)
+        try:
+            old = snapshot.read_text(encoding="utf-8").splitlines(keepends=True)
+        except FileNotFoundError:
+            failures.append(f"{snapshot} is missing; run with --update")
+            continue
+        if old != new:
+            diff = difflib.unified_diff(old, new, str(snapshot), str(scheme))
+            lines = "".join(itertools.islice(diff, DIFF_LINES))
+            failures.append(f"{scheme.name} differs from its snapshot:\n{lines}")
+    return failures
+
+
+def run(
+    count: int, seed: int, jobs: int | None, snapshots: Path, update: bool
+) -> tuple[dict, list[str]]:
+    """Builds the flavors and `count` synthetic palettes, checking each batch.
+
+    The flavors of COLORS are built in the first batch, and only compared to
+    their snapshots.
+
+    Args:
+        count: How many synthetic palettes to build.
+        seed: Seed for the synthetic palettes.
+        jobs: Worker processes for `create_palettes`, or None for one per CPU.
+        snapshots: The directory holding the snapshots.
+        update: Overwrite the snapshots instead of comparing them.
+
+    Returns:
+        The report of the run, and a description of each failure.
+    """
+    palettes = itertools.chain(COLORS.items(), bench.synthetic_palettes(count, seed))
+    synthetic: dict[str, str] = {}
+    failures: list[str] = []
+    seconds = 0.0
+    built = 0
+    first = True
+
+    while batch := dict(itertools.islice(palettes, BATCH)):
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory)
+            start = time.perf_counter()
+            try:
+                build.create_palettes(
+                    force=True, jobs=jobs, palettes=batch, output_path=output
+                )
+            except build.BuildError as e:
+                failures.append(str(e))
+            seconds += time.perf_counter() - start
+
+            if first:
+                first = False
+                failures.extend(check_snapshots(output, snapshots, update))
+                for flavor_name in COLORS:
+                    batch.pop(flavor_name)
+                    build.get_output_file(flavor_name, output).unlink(missing_ok=True)
+            digests, errors = check_batch(output)
+        failures.extend(errors)
+        if len(digests) != len(batch):
+            failures.append(f"{len(batch) - len(digests)} palettes were not built")
+        synthetic.update(digests)
+        built += len(batch)
+
+    # Hashed in order of name, so that it does not depend on BATCH.
+    listing = "".join(f"{name} {synthetic[name]}\n" for name in sorted(synthetic))
+    report = {
+        "palettes": count,
+        "seed": seed,
+        "jobs": jobs,
+        "seconds": seconds,
+        "seconds_per_palette": seconds / (built + len(COLORS)),
+        "peak_rss_kib": peak_memory(),
+        "synthetic_digest": hashlib.sha256(listing.encode("utf-8")).hexdigest(),
+    }
+    return report, failures
+
+
+def compare(report: dict, budget: dict, tolerance: float) -> list[str]:
+    """Lists the ways a report exceeds a budget.
+
+    Args:
+        report: The report of this run.
+        budget: The report of a previous run. Synthetic schemes are only
+            compared for the same palettes, and times for the same `jobs`.
+        tolerance: Allowed excess, as a fraction of the budget.
+
+    Returns:
+        A description of each excess; empty if there is none.
+    """
+    failures = []
+    if (report["palettes"], report["seed"]) == (budget["palettes"], budget["seed"]):
+        if report["synthetic_digest"] != budget["synthetic_digest"]:
+            failures.append("synthetic schemes changed")
+
+    limit = budget["seconds_per_palette"] * (1 + tolerance)
+    if report["jobs"] == budget["jobs"] and report["seconds_per_palette"] > limit:
+        failures.append(
+            f"{report['seconds_per_palette'] * 1000:.1f} ms per palette vs "
+            f"{budget['seconds_per_palette'] * 1000:.1f} ms"
+        )
+
+    for process, peak in report["peak_rss_kib"].items():
+        previous = budget["peak_rss_kib"].get(process)
+        if previous and peak > previous * (1 + tolerance):
+            failures.append(
+                f"peak memory of {process}: {peak >> 10} MiB vs {previous >> 10} MiB"
+            )
+    return failures
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=int,
+        default=PALETTES,
+        help=f"synthetic palettes to build (default: {PALETTES})",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=bench.SEED, help="seed for the synthetic palettes"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes (0: one per CPU)"
+    )
+    parser.add_argument(
+        "--snapshots",
+        type=Path,
+        default=SNAPSHOT_DIR,
+        help="directory of the flavors' snapshots",
+    )
+    parser.add_argument(
+        "--budget", type=Path, default=BUDGET_FILE, help="budget JSON file"
+    )
+    parser.add_argument(
+        "--update",
+        "--record",
+        action="store_true",
+        help="store the snapshots and the budget of this run instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed excess as a fraction of the budget (default: 0.5)",
+    )
+    args = parser.parse_args()
+
+    report, failures = run(
+        args.count, args.seed, args.jobs or None, args.snapshots, args.update
+    )
+    text = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    sys.stdout.write(text)
+
+    if args.update:
+        if not failures:
+            args.budget.write_text(text, encoding="utf-8")
+    elif args.budget.exists():
+        budget = json.loads(args.budget.read_text(encoding="utf-8"))
+        failures.extend(compare(report, budget, args.tolerance))
+    else:
+        failures.append(f"{args.budget} is missing; record one with --update")
+
+    if failures:
+        parser.exit(1, "Failures:\n  " + "\n  ".join(failures) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2024 @@
+# This file is part of ranger, the console file manager.
+# Available at https://github.com/ranger/ranger
+# License: GNU GPL version 3, see the file "AUTHORS" for details.
+# This theme was greatly inspired by "Dracula" for ranger
+# It can be found in: `https://github.com/dracula/ranger`
+
+from ranger.gui.color import bold, reverse
+from ranger.gui.colorscheme import ColorScheme
+
+ROSEWATER = 224
+FLAMINGO = 217
+PINK = 218
+MAUVE = 182
+RED = 174
+MAROON = 175
+PEACH = 216
+YELLOW = 186
+GREEN = 150
+TEAL = 115
+SKY = 116
+SAPPHIRE = 110
+BLUE = 111
+LAVENDER = 147
+TEXT = 189
+SUBTEXT_1 = 146
+SUBTEXT_0 = 146
+OVERLAY_2 = 109
+OVERLAY_1 = 103
+OVERLAY_0 = 102
+SURFACE_2 = 60
+SURFACE_1 = 59
+SURFACE_0 = 59
+BASE = 59
+MANTLE = 17
+CRUST = 17
+
+
+class CatppuccinFrappe(ColorScheme):
+    progress_bar_color = BLUE
+
+
+
+
+
+
+
+    def _evaluate(self, context):
+        fg, bg, attr = (-1, -1, 0)
+        if context.reset:
+            return (-1, -1, 0)
+        elif context.in_browser:
+            if context.selected:
+                bg = 1020
+                fg = 1000
+                attr &= ~bold
+            else:
+                attr = 0
+            if context.empty or context.error:
+                bg = 1014
+                fg = 1000
+            if context.border:
+                fg = 1001
+                bg = 1014
+            if context.document:
+                fg = 1008
+            if context.media:
+                if context.image:
+                    fg = 1025
+                elif context.video:
+                    fg = 1014
+                elif context.audio:
+                    fg = 1023
+                else:
+                    fg = 1004
+            if context.container:
+                attr |= bold
+                fg = 1007
+            if context.directory:
+                attr |= bold
+                fg = 1016
+            elif context.executable and (not any((context.media, context.container, context.fifo, context.socket))):
+                attr |= bold
+                fg = 1004
+            if context.socket:
+                fg = 1013
+                attr |= bold
+            if context.fifo or context.device:
+                fg = 1025
+                if context.device:
+                    attr |= bold
+            if context.link:
+                fg = 1023 if context.good else 1008
+            if context.tag_marker and (not context.selected):
+                attr |= bold
+                if fg in (1014, 1013, 1007):
+                    fg = 15
+                else:
+                    fg = 1014
+            if not context.selected and (context.cut or context.copied):
+                fg = 1010
+                attr |= bold
+            if context.main_column:
+                if context.selected:
+                    attr |= bold
+                if context.marked:
+                    attr |= bold
+                    fg = 1025
+            if context.badinfo:
+                if attr & reverse:
+                    bg = 1013
+                else:
+                    fg = 1013
+            if context.inactive_pane:
+                fg = 1023
+        elif context.in_titlebar:
+            attr |= bold
+            if context.hostname:
+                fg = 1014 if context.bad else 1004
+            elif context.directory:
+                fg = 1001
+            elif context.tab:
+                if context.good:
+                    bg = 1004
+            elif context.link:
+                fg = 1023
+        elif context.in_statusbar:
+            if context.permissions:
+                if context.good:
+                    fg = 1004
+                elif context.bad:
+                    bg = 1013
+                    fg = 1010
+            if context.marked:
+                attr |= bold | reverse
+                fg = 1025
+            if context.frozen:
+                attr |= bold | reverse
+                fg = 1023
+            if context.message:
+                if context.bad:
+                    attr |= bold
+                    fg = 1014
+            if context.loaded:
+                bg = 1001
+            if context.vcsinfo:
+                fg = 1001
+                attr &= ~bold
+            if context.vcscommit:
+                fg = 1025
+                attr &= ~bold
+            if context.vcsdate:
+                fg = 1023
+                attr &= ~bold
+        if context.text and context.highlight:
+            attr |= reverse
+        if context.in_taskview:
+            if context.title:
+                fg = 1001
+            if context.selected:
+                attr |= reverse
+            if context.loaded:
+                if context.selected:
+                    fg = 1001
+                else:
+                    bg = 1001
+        if context.vcsfile and (not context.selected):
+            attr &= ~bold
+            if context.vcsconflict:
+                fg = 1013
+            elif context.vcschanged:
+                fg = 1014
+            elif context.vcsunknown:
+                fg = 1014
+            elif context.vcsstaged:
+                fg = 1004
+            elif context.vcssync:
+                fg = 1004
+            elif context.vcsignored:
+                fg = -1
+        elif context.vcsremote and (not context.selected):
+            attr &= ~bold
+            if context.vcssync or context.vcsnone:
+                fg = 1004
+            elif context.vcsbehind:
+                fg = 1014
+            elif context.vcsahead:
+                fg = 1023
+            elif context.vcsdiverged:
+                fg = 1013
+            elif context.vcsunknown:
+                fg = 1014
+        return (fg, bg, attr)
+
+    def __init__(self):
+        super().__init__()
+        if not _allocate_color_pairs():
+            _allocate_when_ready()
+
+    def use(self, context):
+        flags = tuple(context.__dict__)
+        key = _KEYS.get(flags)
+        if key is None:
+            key = _intern_key(flags)
+        try:
+            return _COLORS[key]
+        except KeyError:
+            if _DEPTH is None:
+                _use_depth(_color_depth())
+                if key in _COLORS:
+                    return _COLORS[key]
+            fg, bg, attr = self._evaluate(context)
+            colors = (_CODES.get(fg, fg), _CODES.get(bg, bg), attr)
+            if len(_COLORS) < _COLORS_LIMIT:
+                _COLORS[key] = colors
+            return colors
+
+
+def _shared_keys(name, flag_bits):
+    # One table of context keys for every loaded scheme with the same flags.
+    import sys
+    import types
+
+    shared = sys.modules.get(name)
+    if shared is None:
+        shared = sys.modules[name] = types.ModuleType(name)
+        shared.FLAG_BITS = flag_bits
+        shared.KEYS = {}
+    return shared.FLAG_BITS, shared.KEYS
+
+
+def _intern_key(flags):
+    key = 0
+    for flag in flags:
+        key |= _FLAG_BITS.get(flag, 0)
+    if len(_KEYS) < 4096:
+        _KEYS[flags] = key
+    return key
+
+
+# Generated by build.py: bit of each context flag read by the scheme, and the
+# bitmask of each tuple of flags seen.
+_FLAG_BITS, _KEYS = _shared_keys(
+    "_catppuccin_ranger_keys_e734dcb2bc56d5f1",
+    {
+        'selected': 1 << 0,
+        'empty': 1 << 1,
+        'error': 1 << 2,
+        'border': 1 << 3,
+        'document': 1 << 4,
+        'media': 1 << 5,
+        'image': 1 << 6,
+        'video': 1 << 7,
+        'audio': 1 << 8,
+        'container': 1 << 9,
+        'directory': 1 << 10,
+        'executable': 1 << 11,
+        'fifo': 1 << 12,
+        'socket': 1 << 13,
+        'device': 1 << 14,
+        'link': 1 << 15,
+        'good': 1 << 16,
+        'tag_marker': 1 << 17,
+        'cut': 1 << 18,
+        'copied': 1 << 19,
+        'main_column': 1 << 20,
+        'marked': 1 << 21,
+        'badinfo': 1 << 22,
+        'inactive_pane': 1 << 23,
+        'hostname': 1 << 24,
+        'bad': 1 << 25,
+        'tab': 1 << 26,
+        'permissions': 1 << 27,
+        'frozen': 1 << 28,
+        'message': 1 << 29,
+        'loaded': 1 << 30,
+        'vcsinfo': 1 << 31,
+        'vcscommit': 1 << 32,
+        'vcsdate': 1 << 33,
+        'title': 1 << 34,
+        'vcsconflict': 1 << 35,
+        'vcschanged': 1 << 36,
+        'vcsunknown': 1 << 37,
+        'vcsstaged': 1 << 38,
+        'vcssync': 1 << 39,
+        'vcsignored': 1 << 40,
+        'vcsnone': 1 << 41,
+        'vcsbehind': 1 << 42,
+        'vcsahead': 1 << 43,
+        'vcsdiverged': 1 << 44,
+        'reset': 1 << 45,
+        'in_browser': 1 << 46,
+        'in_titlebar': 1 << 47,
+        'in_statusbar': 1 << 48,
+        'text': 1 << 49,
+        'highlight': 1 << 50,
+        'in_taskview': 1 << 51,
+        'vcsfile': 1 << 52,
+        'vcsremote': 1 << 53,
+    },
+)
+
+
+def _allocate_color_pairs():
+    try:
+        import curses
+        from ranger.gui.color import COLOR_PAIRS, get_color
+
+        limit = curses.COLOR_PAIRS
+    except (ImportError, AttributeError):
+        return False
+
+    if _DEPTH is None:
+        _use_depth(_color_depth())
+    for pair in _COLOR_PAIRS:
+        if pair not in COLOR_PAIRS:
+            if len(COLOR_PAIRS) >= limit:
+                break
+            get_color(*pair)
+    return True
+
+
+def _allocate_when_ready():
+    # ranger creates the scheme while reading rc.conf, before it starts curses.
+    try:
+        import ranger.api
+    except ImportError:
+        return
+    hook_ready = ranger.api.hook_ready
+
+    def allocate_then_hook_ready(fm):
+        _allocate_color_pairs()
+        return hook_ready(fm)
+
+    ranger.api.hook_ready = allocate_then_hook_ready
+
+
+# Generated by build.py: (fg, bg, attr) for each context-flag bitmask, at each
+# color depth; only the terminal's is built.
+
+def _colors_truecolor():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (3159110, 4277593, 0),
+        0x400000000002: (3159110, 15172228, 0),
+        0x400000000003: (3159110, 15172228, 0),
+        0x400000000004: (3159110, 15172228, 0),
+        0x400000000005: (3159110, 15172228, 0),
+        0x400000000006: (3159110, 15172228, 0),
+        0x400000000008: (9218798, 15172228, 0),
+        0x400000000009: (9218798, 15172228, 0),
+        0x40000000000a: (9218798, 15172228, 0),
+        0x40000000000c: (9218798, 15172228, 0),
+        0x400000000010: (13278950, -1, 0),
+        0x400000000011: (13278950, 4277593, 0),
+        0x400000000012: (13278950, 15172228, 0),
+        0x400000000014: (13278950, 15172228, 0),
+        0x400000000018: (13278950, 15172228, 0),
+        0x400000000020: (10932617, -1, 0),
+        0x400000000021: (10932617, 4277593, 0),
+        0x400000000022: (10932617, 15172228, 0),
+        0x400000000024: (10932617, 15172228, 0),
+        0x400000000028: (10932617, 15172228, 0),
+        0x400000000030: (10932617, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (3159110, 4277593, 0),
+        0x400000000042: (3159110, 15172228, 0),
+        0x400000000044: (3159110, 15172228, 0),
+        0x400000000048: (9218798, 15172228, 0),
+        0x400000000050: (13278950, -1, 0),
+        0x400000000060: (15059088, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (3159110, 4277593, 0),
+        0x400000000082: (3159110, 15172228, 0),
+        0x400000000084: (3159110, 15172228, 0),
+        0x400000000088: (9218798, 15172228, 0),
+        0x400000000090: (13278950, -1, 0),
+        0x4000000000a0: (15172228, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (3159110, 4277593, 0),
+        0x400000000102: (3159110, 15172228, 0),
+        0x400000000104: (3159110, 15172228, 0),
+        0x400000000108: (9218798, 15172228, 0),
+        0x400000000110: (13278950, -1, 0),
+        0x400000000120: (8505534, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (15374748, -1, 2097152),
+        0x400000000201: (15374748, 4277593, 2097152),
+        0x400000000202: (15374748, 15172228, 2097152),
+        0x400000000204: (15374748, 15172228, 2097152),
+        0x400000000208: (15374748, 15172228, 2097152),
+        0x400000000210: (15374748, -1, 2097152),
+        0x400000000220: (15374748, -1, 2097152),
+        0x400000000240: (15374748, -1, 2097152),
+        0x400000000280: (15374748, -1, 2097152),
+        0x400000000300: (15374748, -1, 2097152),
+        0x400000000400: (8765916, -1, 2097152),
+        0x400000000401: (8765916, 4277593, 2097152),
+        0x400000000402: (8765916, 15172228, 2097152),
+        0x400000000404: (8765916, 15172228, 2097152),
+        0x400000000408: (8765916, 15172228, 2097152),
+        0x400000000410: (8765916, -1, 2097152),
+        0x400000000420: (8765916, -1, 2097152),
+        0x400000000440: (8765916, -1, 2097152),
+        0x400000000480: (8765916, -1, 2097152),
+        0x400000000500: (8765916, -1, 2097152),
+        0x400000000600: (8765916, -1, 2097152),
+        0x400000000800: (10932617, -1, 2097152),
+        0x400000000801: (10932617, 4277593, 2097152),
+        0x400000000802: (10932617, 15172228, 2097152),
+        0x400000000804: (10932617, 15172228, 2097152),
+        0x400000000808: (10932617, 15172228, 2097152),
+        0x400000000810: (10932617, -1, 2097152),
+        0x400000000820: (10932617, -1, 0),
+        0x400000000840: (10932617, -1, 2097152),
+        0x400000000880: (10932617, -1, 2097152),
+        0x400000000900: (10932617, -1, 2097152),
+        0x400000000a00: (15374748, -1, 2097152),
+        0x400000000c00: (8765916, -1, 2097152),
+        0x400000001000: (15059088, -1, 0),
+        0x400000001001: (15059088, 4277593, 0),
+        0x400000001002: (15059088, 15172228, 0),
+        0x400000001004: (15059088, 15172228, 0),
+        0x400000001008: (15059088, 15172228, 0),
+        0x400000001010: (15059088, -1, 0),
+        0x400000001020: (15059088, -1, 0),
+        0x400000001040: (15059088, -1, 0),
+        0x400000001080: (15059088, -1, 0),
+        0x400000001100: (15059088, -1, 0),
+        0x400000001200: (15059088, -1, 2097152),
+        0x400000001400: (15059088, -1, 2097152),
+        0x400000001800: (15059088, -1, 0),
+        0x400000002000: (16038116, -1, 2097152),
+        0x400000002001: (16038116, 4277593, 2097152),
+        0x400000002002: (16038116, 15172228, 2097152),
+        0x400000002004: (16038116, 15172228, 2097152),
+        0x400000002008: (16038116, 15172228, 2097152),
+        0x400000002010: (16038116, -1, 2097152),
+        0x400000002020: (16038116, -1, 2097152),
+        0x400000002040: (16038116, -1, 2097152),
+        0x400000002080: (16038116, -1, 2097152),
+        0x400000002100: (16038116, -1, 2097152),
+        0x400000002200: (16038116, -1, 2097152),
+        0x400000002400: (16038116, -1, 2097152),
+        0x400000002800: (16038116, -1, 2097152),
+        0x400000003000: (15059088, -1, 2097152),
+        0x400000004000: (15059088, -1, 2097152),
+        0x400000004001: (15059088, 4277593, 2097152),
+        0x400000004002: (15059088, 15172228, 2097152),
+        0x400000004004: (15059088, 15172228, 2097152),
+        0x400000004008: (15059088, 15172228, 2097152),
+        0x400000004010: (15059088, -1, 2097152),
+        0x400000004020: (15059088, -1, 2097152),
+        0x400000004040: (15059088, -1, 2097152),
+        0x400000004080: (15059088, -1, 2097152),
+        0x400000004100: (15059088, -1, 2097152),
+        0x400000004200: (15059088, -1, 2097152),
+        0x400000004400: (15059088, -1, 2097152),
+        0x400000004800: (15059088, -1, 2097152),
+        0x400000005000: (15059088, -1, 2097152),
+        0x400000006000: (15059088, -1, 2097152),
+        0x400000008000: (13278950, -1, 0),
+        0x400000008001: (13278950, 4277593, 0),
+        0x400000008002: (13278950, 15172228, 0),
+        0x400000008004: (13278950, 15172228, 0),
+        0x400000008008: (13278950, 15172228, 0),
+        0x400000008010: (13278950, -1, 0),
+        0x400000008020: (13278950, -1, 0),
+        0x400000008040: (13278950, -1, 0),
+        0x400000008080: (13278950, -1, 0),
+        0x400000008100: (13278950, -1, 0),
+        0x400000008200: (13278950, -1, 2097152),
+        0x400000008400: (13278950, -1, 2097152),
+        0x400000008800: (13278950, -1, 2097152),
+        0x400000009000: (13278950, -1, 0),
+        0x40000000a000: (13278950, -1, 2097152),
+        0x40000000c000: (13278950, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (3159110, 4277593, 0),
+        0x400000010002: (3159110, 15172228, 0),
+        0x400000010004: (3159110, 15172228, 0),
+        0x400000010008: (9218798, 15172228, 0),
+        0x400000010010: (13278950, -1, 0),
+        0x400000010020: (10932617, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (15374748, -1, 2097152),
+        0x400000010400: (8765916, -1, 2097152),
+        0x400000010800: (10932617, -1, 2097152),
+        0x400000011000: (15059088, -1, 0),
+        0x400000012000: (16038116, -1, 2097152),
+        0x400000014000: (15059088, -1, 2097152),
+        0x400000018000: (8505534, -1, 0),
+        0x400000020000: (15172228, -1, 2097152),
+        0x400000020001: (3159110, 4277593, 0),
+        0x400000020002: (15172228, 15172228, 2097152),
+        0x400000020004: (15172228, 15172228, 2097152),
+        0x400000020008: (15172228, 15172228, 2097152),
+        0x400000020010: (15172228, -1, 2097152),
+        0x400000020020: (15172228, -1, 2097152),
+        0x400000020040: (15172228, -1, 2097152),
+        0x400000020080: (15172228, -1, 2097152),
+        0x400000020100: (15172228, -1, 2097152),
+        0x400000020200: (16777215, -1, 2097152),
+        0x400000020400: (15172228, -1, 2097152),
+        0x400000020800: (15172228, -1, 2097152),
+        0x400000021000: (15172228, -1, 2097152),
+        0x400000022000: (16777215, -1, 2097152),
+        0x400000024000: (15172228, -1, 2097152),
+        0x400000028000: (15172228, -1, 2097152),
+        0x400000030000: (15172228, -1, 2097152),
+        0x400000040000: (8620967, -1, 2097152),
+        0x400000040001: (3159110, 4277593, 0),
+        0x400000040002: (8620967, 15172228, 2097152),
+        0x400000040004: (8620967, 15172228, 2097152),
+        0x400000040008: (8620967, 15172228, 2097152),
+        0x400000040010: (8620967, -1, 2097152),
+        0x400000040020: (8620967, -1, 2097152),
+        0x400000040040: (8620967, -1, 2097152),
+        0x400000040080: (8620967, -1, 2097152),
+        0x400000040100: (8620967, -1, 2097152),
+        0x400000040200: (8620967, -1, 2097152),
+        0x400000040400: (8620967, -1, 2097152),
+        0x400000040800: (8620967, -1, 2097152),
+        0x400000041000: (8620967, -1, 2097152),
+        0x400000042000: (8620967, -1, 2097152),
+        0x400000044000: (8620967, -1, 2097152),
+        0x400000048000: (8620967, -1, 2097152),
+        0x400000050000: (8620967, -1, 2097152),
+        0x400000060000: (8620967, -1, 2097152),
+        0x400000080000: (8620967, -1, 2097152),
+        0x400000080001: (3159110, 4277593, 0),
+        0x400000080002: (8620967, 15172228, 2097152),
+        0x400000080004: (8620967, 15172228, 2097152),
+        0x400000080008: (8620967, 15172228, 2097152),
+        0x400000080010: (8620967, -1, 2097152),
+        0x400000080020: (8620967, -1, 2097152),
+        0x400000080040: (8620967, -1, 2097152),
+        0x400000080080: (8620967, -1, 2097152),
+        0x400000080100: (8620967, -1, 2097152),
+        0x400000080200: (8620967, -1, 2097152),
+        0x400000080400: (8620967, -1, 2097152),
+        0x400000080800: (8620967, -1, 2097152),
+        0x400000081000: (8620967, -1, 2097152),
+        0x400000082000: (8620967, -1, 2097152),
+        0x400000084000: (8620967, -1, 2097152),
+        0x400000088000: (8620967, -1, 2097152),
+        0x400000090000: (8620967, -1, 2097152),
+        0x4000000a0000: (8620967, -1, 2097152),
+        0x4000000c0000: (8620967, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (3159110, 4277593, 2097152),
+        0x400000100002: (3159110, 15172228, 0),
+        0x400000100004: (3159110, 15172228, 0),
+        0x400000100008: (9218798, 15172228, 0),
+        0x400000100010: (13278950, -1, 0),
+        0x400000100020: (10932617, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (15374748, -1, 2097152),
+        0x400000100400: (8765916, -1, 2097152),
+        0x400000100800: (10932617, -1, 2097152),
+        0x400000101000: (15059088, -1, 0),
+        0x400000102000: (16038116, -1, 2097152),
+        0x400000104000: (15059088, -1, 2097152),
+        0x400000108000: (13278950, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (15172228, -1, 2097152),
+        0x400000140000: (8620967, -1, 2097152),
+        0x400000180000: (8620967, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (3159110, 4277593, 0),
+        0x400000200002: (3159110, 15172228, 0),
+        0x400000200004: (3159110, 15172228, 0),
+        0x400000200008: (9218798, 15172228, 0),
+        0x400000200010: (13278950, -1, 0),
+        0x400000200020: (10932617, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (15374748, -1, 2097152),
+        0x400000200400: (8765916, -1, 2097152),
+        0x400000200800: (10932617, -1, 2097152),
+        0x400000201000: (15059088, -1, 0),
+        0x400000202000: (16038116, -1, 2097152),
+        0x400000204000: (15059088, -1, 2097152),
+        0x400000208000: (13278950, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (15172228, -1, 2097152),
+        0x400000240000: (8620967, -1, 2097152),
+        0x400000280000: (8620967, -1, 2097152),
+        0x400000300000: (15059088, -1, 2097152),
+        0x400000400000: (16038116, -1, 0),
+        0x400000400001: (16038116, 4277593, 0),
+        0x400000400002: (16038116, 15172228, 0),
+        0x400000400004: (16038116, 15172228, 0),
+        0x400000400008: (16038116, 15172228, 0),
+        0x400000400010: (16038116, -1, 0),
+        0x400000400020: (16038116, -1, 0),
+        0x400000400040: (16038116, -1, 0),
+        0x400000400080: (16038116, -1, 0),
+        0x400000400100: (16038116, -1, 0),
+        0x400000400200: (16038116, -1, 2097152),
+        0x400000400400: (16038116, -1, 2097152),
+        0x400000400800: (16038116, -1, 2097152),
+        0x400000401000: (16038116, -1, 0),
+        0x400000402000: (16038116, -1, 2097152),
+        0x400000404000: (16038116, -1, 2097152),
+        0x400000408000: (16038116, -1, 0),
+        0x400000410000: (16038116, -1, 0),
+        0x400000420000: (16038116, -1, 2097152),
+        0x400000440000: (16038116, -1, 2097152),
+        0x400000480000: (16038116, -1, 2097152),
+        0x400000500000: (16038116, -1, 0),
+        0x400000600000: (16038116, -1, 0),
+        0x400000800000: (8505534, -1, 0),
+        0x400000800001: (8505534, 4277593, 0),
+        0x400000800002: (8505534, 15172228, 0),
+        0x400000800004: (8505534, 15172228, 0),
+        0x400000800008: (8505534, 15172228, 0),
+        0x400000800010: (8505534, -1, 0),
+        0x400000800020: (8505534, -1, 0),
+        0x400000800040: (8505534, -1, 0),
+        0x400000800080: (8505534, -1, 0),
+        0x400000800100: (8505534, -1, 0),
+        0x400000800200: (8505534, -1, 2097152),
+        0x400000800400: (8505534, -1, 2097152),
+        0x400000800800: (8505534, -1, 2097152),
+        0x400000801000: (8505534, -1, 0),
+        0x400000802000: (8505534, -1, 2097152),
+        0x400000804000: (8505534, -1, 2097152),
+        0x400000808000: (8505534, -1, 0),
+        0x400000810000: (8505534, -1, 0),
+        0x400000820000: (8505534, -1, 2097152),
+        0x400000840000: (8505534, -1, 2097152),
+        0x400000880000: (8505534, -1, 2097152),
+        0x400000900000: (8505534, -1, 0),
+        0x400000a00000: (8505534, -1, 0),
+        0x400000c00000: (8505534, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (9218798, -1, 2097152),
+        0x800000008000: (8505534, -1, 2097152),
+        0x800000008400: (9218798, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (9218798, -1, 2097152),
+        0x800000018000: (8505534, -1, 2097152),
+        0x800001000000: (10932617, -1, 2097152),
+        0x800001000400: (10932617, -1, 2097152),
+        0x800001008000: (10932617, -1, 2097152),
+        0x800001010000: (10932617, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (9218798, -1, 2097152),
+        0x800002008000: (8505534, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (15172228, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (9218798, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 10932617, 2097152),
+        0x800005000000: (10932617, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (15059088, -1, 2359296),
+        0x1000000210000: (15059088, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (15059088, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (10932617, -1, 0),
+        0x1000008200000: (15059088, -1, 2359296),
+        0x100000a000000: (8620967, 16038116, 0),
+        0x1000010000000: (8505534, -1, 2359296),
+        0x1000010010000: (8505534, -1, 2359296),
+        0x1000010200000: (8505534, -1, 2359296),
+        0x1000012000000: (8505534, -1, 2359296),
+        0x1000018000000: (8505534, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (15059088, -1, 2359296),
+        0x1000022000000: (15172228, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (8505534, -1, 2359296),
+        0x1000040000000: (-1, 9218798, 0),
+        0x1000040010000: (-1, 9218798, 0),
+        0x1000040200000: (15059088, 9218798, 2359296),
+        0x1000042000000: (-1, 9218798, 0),
+        0x1000048000000: (-1, 9218798, 0),
+        0x1000050000000: (8505534, 9218798, 2359296),
+        0x1000060000000: (-1, 9218798, 0),
+        0x1000080000000: (9218798, -1, 0),
+        0x1000080010000: (9218798, -1, 0),
+        0x1000080200000: (9218798, -1, 262144),
+        0x1000082000000: (9218798, -1, 0),
+        0x1000088000000: (9218798, -1, 0),
+        0x1000090000000: (9218798, -1, 262144),
+        0x10000a0000000: (9218798, -1, 0),
+        0x10000c0000000: (9218798, 9218798, 0),
+        0x1000100000000: (15059088, -1, 0),
+        0x1000100010000: (15059088, -1, 0),
+        0x1000100200000: (15059088, -1, 262144),
+        0x1000102000000: (15059088, -1, 0),
+        0x1000108000000: (15059088, -1, 0),
+        0x1000110000000: (15059088, -1, 262144),
+        0x1000120000000: (15059088, -1, 0),
+        0x1000140000000: (15059088, 9218798, 0),
+        0x1000180000000: (15059088, -1, 0),
+        0x1000200000000: (8505534, -1, 0),
+        0x1000200010000: (8505534, -1, 0),
+        0x1000200200000: (8505534, -1, 262144),
+        0x1000202000000: (8505534, -1, 0),
+        0x1000208000000: (8505534, -1, 0),
+        0x1000210000000: (8505534, -1, 262144),
+        0x1000220000000: (8505534, -1, 0),
+        0x1000240000000: (8505534, 9218798, 0),
+        0x1000280000000: (8505534, -1, 0),
+        0x1000300000000: (8505534, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 9218798, 0),
+        0x8000040000001: (9218798, -1, 262144),
+        0x8000400000000: (9218798, -1, 0),
+        0x8000400000001: (9218798, -1, 262144),
+        0x8000440000000: (9218798, 9218798, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (16038116, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (15172228, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (16038116, -1, 0),
+        0x10002000000000: (15172228, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (16038116, -1, 0),
+        0x10003000000000: (15172228, -1, 0),
+        0x10004000000000: (10932617, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (16038116, -1, 0),
+        0x10005000000000: (15172228, -1, 0),
+        0x10006000000000: (15172228, -1, 0),
+        0x10008000000000: (10932617, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (16038116, -1, 0),
+        0x10009000000000: (15172228, -1, 0),
+        0x1000a000000000: (15172228, -1, 0),
+        0x1000c000000000: (10932617, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (16038116, -1, 0),
+        0x10011000000000: (15172228, -1, 0),
+        0x10012000000000: (15172228, -1, 0),
+        0x10014000000000: (10932617, -1, 0),
+        0x10018000000000: (10932617, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (15172228, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (10932617, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (10932617, -1, 0),
+        0x20020000000000: (10932617, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (10932617, -1, 0),
+        0x20028000000000: (10932617, -1, 0),
+        0x20040000000000: (15172228, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (15172228, -1, 0),
+        0x20048000000000: (10932617, -1, 0),
+        0x20060000000000: (10932617, -1, 0),
+        0x20080000000000: (8505534, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (8505534, -1, 0),
+        0x20088000000000: (10932617, -1, 0),
+        0x200a0000000000: (10932617, -1, 0),
+        0x200c0000000000: (15172228, -1, 0),
+        0x20100000000000: (16038116, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (16038116, -1, 0),
+        0x20108000000000: (10932617, -1, 0),
+        0x20120000000000: (10932617, -1, 0),
+        0x20140000000000: (15172228, -1, 0),
+        0x20180000000000: (8505534, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_256():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (59, 59, 0),
+        0x400000000002: (59, 174, 0),
+        0x400000000003: (59, 174, 0),
+        0x400000000004: (59, 174, 0),
+        0x400000000005: (59, 174, 0),
+        0x400000000006: (59, 174, 0),
+        0x400000000008: (111, 174, 0),
+        0x400000000009: (111, 174, 0),
+        0x40000000000a: (111, 174, 0),
+        0x40000000000c: (111, 174, 0),
+        0x400000000010: (182, -1, 0),
+        0x400000000011: (182, 59, 0),
+        0x400000000012: (182, 174, 0),
+        0x400000000014: (182, 174, 0),
+        0x400000000018: (182, 174, 0),
+        0x400000000020: (150, -1, 0),
+        0x400000000021: (150, 59, 0),
+        0x400000000022: (150, 174, 0),
+        0x400000000024: (150, 174, 0),
+        0x400000000028: (150, 174, 0),
+        0x400000000030: (150, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (59, 59, 0),
+        0x400000000042: (59, 174, 0),
+        0x400000000044: (59, 174, 0),
+        0x400000000048: (111, 174, 0),
+        0x400000000050: (182, -1, 0),
+        0x400000000060: (186, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (59, 59, 0),
+        0x400000000082: (59, 174, 0),
+        0x400000000084: (59, 174, 0),
+        0x400000000088: (111, 174, 0),
+        0x400000000090: (182, -1, 0),
+        0x4000000000a0: (174, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (59, 59, 0),
+        0x400000000102: (59, 174, 0),
+        0x400000000104: (59, 174, 0),
+        0x400000000108: (111, 174, 0),
+        0x400000000110: (182, -1, 0),
+        0x400000000120: (115, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (175, -1, 2097152),
+        0x400000000201: (175, 59, 2097152),
+        0x400000000202: (175, 174, 2097152),
+        0x400000000204: (175, 174, 2097152),
+        0x400000000208: (175, 174, 2097152),
+        0x400000000210: (175, -1, 2097152),
+        0x400000000220: (175, -1, 2097152),
+        0x400000000240: (175, -1, 2097152),
+        0x400000000280: (175, -1, 2097152),
+        0x400000000300: (175, -1, 2097152),
+        0x400000000400: (110, -1, 2097152),
+        0x400000000401: (110, 59, 2097152),
+        0x400000000402: (110, 174, 2097152),
+        0x400000000404: (110, 174, 2097152),
+        0x400000000408: (110, 174, 2097152),
+        0x400000000410: (110, -1, 2097152),
+        0x400000000420: (110, -1, 2097152),
+        0x400000000440: (110, -1, 2097152),
+        0x400000000480: (110, -1, 2097152),
+        0x400000000500: (110, -1, 2097152),
+        0x400000000600: (110, -1, 2097152),
+        0x400000000800: (150, -1, 2097152),
+        0x400000000801: (150, 59, 2097152),
+        0x400000000802: (150, 174, 2097152),
+        0x400000000804: (150, 174, 2097152),
+        0x400000000808: (150, 174, 2097152),
+        0x400000000810: (150, -1, 2097152),
+        0x400000000820: (150, -1, 0),
+        0x400000000840: (150, -1, 2097152),
+        0x400000000880: (150, -1, 2097152),
+        0x400000000900: (150, -1, 2097152),
+        0x400000000a00: (175, -1, 2097152),
+        0x400000000c00: (110, -1, 2097152),
+        0x400000001000: (186, -1, 0),
+        0x400000001001: (186, 59, 0),
+        0x400000001002: (186, 174, 0),
+        0x400000001004: (186, 174, 0),
+        0x400000001008: (186, 174, 0),
+        0x400000001010: (186, -1, 0),
+        0x400000001020: (186, -1, 0),
+        0x400000001040: (186, -1, 0),
+        0x400000001080: (186, -1, 0),
+        0x400000001100: (186, -1, 0),
+        0x400000001200: (186, -1, 2097152),
+        0x400000001400: (186, -1, 2097152),
+        0x400000001800: (186, -1, 0),
+        0x400000002000: (218, -1, 2097152),
+        0x400000002001: (218, 59, 2097152),
+        0x400000002002: (218, 174, 2097152),
+        0x400000002004: (218, 174, 2097152),
+        0x400000002008: (218, 174, 2097152),
+        0x400000002010: (218, -1, 2097152),
+        0x400000002020: (218, -1, 2097152),
+        0x400000002040: (218, -1, 2097152),
+        0x400000002080: (218, -1, 2097152),
+        0x400000002100: (218, -1, 2097152),
+        0x400000002200: (218, -1, 2097152),
+        0x400000002400: (218, -1, 2097152),
+        0x400000002800: (218, -1, 2097152),
+        0x400000003000: (186, -1, 2097152),
+        0x400000004000: (186, -1, 2097152),
+        0x400000004001: (186, 59, 2097152),
+        0x400000004002: (186, 174, 2097152),
+        0x400000004004: (186, 174, 2097152),
+        0x400000004008: (186, 174, 2097152),
+        0x400000004010: (186, -1, 2097152),
+        0x400000004020: (186, -1, 2097152),
+        0x400000004040: (186, -1, 2097152),
+        0x400000004080: (186, -1, 2097152),
+        0x400000004100: (186, -1, 2097152),
+        0x400000004200: (186, -1, 2097152),
+        0x400000004400: (186, -1, 2097152),
+        0x400000004800: (186, -1, 2097152),
+        0x400000005000: (186, -1, 2097152),
+        0x400000006000: (186, -1, 2097152),
+        0x400000008000: (182, -1, 0),
+        0x400000008001: (182, 59, 0),
+        0x400000008002: (182, 174, 0),
+        0x400000008004: (182, 174, 0),
+        0x400000008008: (182, 174, 0),
+        0x400000008010: (182, -1, 0),
+        0x400000008020: (182, -1, 0),
+        0x400000008040: (182, -1, 0),
+        0x400000008080: (182, -1, 0),
+        0x400000008100: (182, -1, 0),
+        0x400000008200: (182, -1, 2097152),
+        0x400000008400: (182, -1, 2097152),
+        0x400000008800: (182, -1, 2097152),
+        0x400000009000: (182, -1, 0),
+        0x40000000a000: (182, -1, 2097152),
+        0x40000000c000: (182, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (59, 59, 0),
+        0x400000010002: (59, 174, 0),
+        0x400000010004: (59, 174, 0),
+        0x400000010008: (111, 174, 0),
+        0x400000010010: (182, -1, 0),
+        0x400000010020: (150, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (175, -1, 2097152),
+        0x400000010400: (110, -1, 2097152),
+        0x400000010800: (150, -1, 2097152),
+        0x400000011000: (186, -1, 0),
+        0x400000012000: (218, -1, 2097152),
+        0x400000014000: (186, -1, 2097152),
+        0x400000018000: (115, -1, 0),
+        0x400000020000: (174, -1, 2097152),
+        0x400000020001: (59, 59, 0),
+        0x400000020002: (174, 174, 2097152),
+        0x400000020004: (174, 174, 2097152),
+        0x400000020008: (174, 174, 2097152),
+        0x400000020010: (174, -1, 2097152),
+        0x400000020020: (174, -1, 2097152),
+        0x400000020040: (174, -1, 2097152),
+        0x400000020080: (174, -1, 2097152),
+        0x400000020100: (174, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (174, -1, 2097152),
+        0x400000020800: (174, -1, 2097152),
+        0x400000021000: (174, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (174, -1, 2097152),
+        0x400000028000: (174, -1, 2097152),
+        0x400000030000: (174, -1, 2097152),
+        0x400000040000: (103, -1, 2097152),
+        0x400000040001: (59, 59, 0),
+        0x400000040002: (103, 174, 2097152),
+        0x400000040004: (103, 174, 2097152),
+        0x400000040008: (103, 174, 2097152),
+        0x400000040010: (103, -1, 2097152),
+        0x400000040020: (103, -1, 2097152),
+        0x400000040040: (103, -1, 2097152),
+        0x400000040080: (103, -1, 2097152),
+        0x400000040100: (103, -1, 2097152),
+        0x400000040200: (103, -1, 2097152),
+        0x400000040400: (103, -1, 2097152),
+        0x400000040800: (103, -1, 2097152),
+        0x400000041000: (103, -1, 2097152),
+        0x400000042000: (103, -1, 2097152),
+        0x400000044000: (103, -1, 2097152),
+        0x400000048000: (103, -1, 2097152),
+        0x400000050000: (103, -1, 2097152),
+        0x400000060000: (103, -1, 2097152),
+        0x400000080000: (103, -1, 2097152),
+        0x400000080001: (59, 59, 0),
+        0x400000080002: (103, 174, 2097152),
+        0x400000080004: (103, 174, 2097152),
+        0x400000080008: (103, 174, 2097152),
+        0x400000080010: (103, -1, 2097152),
+        0x400000080020: (103, -1, 2097152),
+        0x400000080040: (103, -1, 2097152),
+        0x400000080080: (103, -1, 2097152),
+        0x400000080100: (103, -1, 2097152),
+        0x400000080200: (103, -1, 2097152),
+        0x400000080400: (103, -1, 2097152),
+        0x400000080800: (103, -1, 2097152),
+        0x400000081000: (103, -1, 2097152),
+        0x400000082000: (103, -1, 2097152),
+        0x400000084000: (103, -1, 2097152),
+        0x400000088000: (103, -1, 2097152),
+        0x400000090000: (103, -1, 2097152),
+        0x4000000a0000: (103, -1, 2097152),
+        0x4000000c0000: (103, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (59, 59, 2097152),
+        0x400000100002: (59, 174, 0),
+        0x400000100004: (59, 174, 0),
+        0x400000100008: (111, 174, 0),
+        0x400000100010: (182, -1, 0),
+        0x400000100020: (150, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (175, -1, 2097152),
+        0x400000100400: (110, -1, 2097152),
+        0x400000100800: (150, -1, 2097152),
+        0x400000101000: (186, -1, 0),
+        0x400000102000: (218, -1, 2097152),
+        0x400000104000: (186, -1, 2097152),
+        0x400000108000: (182, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (174, -1, 2097152),
+        0x400000140000: (103, -1, 2097152),
+        0x400000180000: (103, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (59, 59, 0),
+        0x400000200002: (59, 174, 0),
+        0x400000200004: (59, 174, 0),
+        0x400000200008: (111, 174, 0),
+        0x400000200010: (182, -1, 0),
+        0x400000200020: (150, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (175, -1, 2097152),
+        0x400000200400: (110, -1, 2097152),
+        0x400000200800: (150, -1, 2097152),
+        0x400000201000: (186, -1, 0),
+        0x400000202000: (218, -1, 2097152),
+        0x400000204000: (186, -1, 2097152),
+        0x400000208000: (182, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (174, -1, 2097152),
+        0x400000240000: (103, -1, 2097152),
+        0x400000280000: (103, -1, 2097152),
+        0x400000300000: (186, -1, 2097152),
+        0x400000400000: (218, -1, 0),
+        0x400000400001: (218, 59, 0),
+        0x400000400002: (218, 174, 0),
+        0x400000400004: (218, 174, 0),
+        0x400000400008: (218, 174, 0),
+        0x400000400010: (218, -1, 0),
+        0x400000400020: (218, -1, 0),
+        0x400000400040: (218, -1, 0),
+        0x400000400080: (218, -1, 0),
+        0x400000400100: (218, -1, 0),
+        0x400000400200: (218, -1, 2097152),
+        0x400000400400: (218, -1, 2097152),
+        0x400000400800: (218, -1, 2097152),
+        0x400000401000: (218, -1, 0),
+        0x400000402000: (218, -1, 2097152),
+        0x400000404000: (218, -1, 2097152),
+        0x400000408000: (218, -1, 0),
+        0x400000410000: (218, -1, 0),
+        0x400000420000: (218, -1, 2097152),
+        0x400000440000: (218, -1, 2097152),
+        0x400000480000: (218, -1, 2097152),
+        0x400000500000: (218, -1, 0),
+        0x400000600000: (218, -1, 0),
+        0x400000800000: (115, -1, 0),
+        0x400000800001: (115, 59, 0),
+        0x400000800002: (115, 174, 0),
+        0x400000800004: (115, 174, 0),
+        0x400000800008: (115, 174, 0),
+        0x400000800010: (115, -1, 0),
+        0x400000800020: (115, -1, 0),
+        0x400000800040: (115, -1, 0),
+        0x400000800080: (115, -1, 0),
+        0x400000800100: (115, -1, 0),
+        0x400000800200: (115, -1, 2097152),
+        0x400000800400: (115, -1, 2097152),
+        0x400000800800: (115, -1, 2097152),
+        0x400000801000: (115, -1, 0),
+        0x400000802000: (115, -1, 2097152),
+        0x400000804000: (115, -1, 2097152),
+        0x400000808000: (115, -1, 0),
+        0x400000810000: (115, -1, 0),
+        0x400000820000: (115, -1, 2097152),
+        0x400000840000: (115, -1, 2097152),
+        0x400000880000: (115, -1, 2097152),
+        0x400000900000: (115, -1, 0),
+        0x400000a00000: (115, -1, 0),
+        0x400000c00000: (115, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (111, -1, 2097152),
+        0x800000008000: (115, -1, 2097152),
+        0x800000008400: (111, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (111, -1, 2097152),
+        0x800000018000: (115, -1, 2097152),
+        0x800001000000: (150, -1, 2097152),
+        0x800001000400: (150, -1, 2097152),
+        0x800001008000: (150, -1, 2097152),
+        0x800001010000: (150, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (111, -1, 2097152),
+        0x800002008000: (115, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (174, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (111, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 150, 2097152),
+        0x800005000000: (150, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (186, -1, 2359296),
+        0x1000000210000: (186, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (186, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (150, -1, 0),
+        0x1000008200000: (186, -1, 2359296),
+        0x100000a000000: (103, 218, 0),
+        0x1000010000000: (115, -1, 2359296),
+        0x1000010010000: (115, -1, 2359296),
+        0x1000010200000: (115, -1, 2359296),
+        0x1000012000000: (115, -1, 2359296),
+        0x1000018000000: (115, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (186, -1, 2359296),
+        0x1000022000000: (174, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (115, -1, 2359296),
+        0x1000040000000: (-1, 111, 0),
+        0x1000040010000: (-1, 111, 0),
+        0x1000040200000: (186, 111, 2359296),
+        0x1000042000000: (-1, 111, 0),
+        0x1000048000000: (-1, 111, 0),
+        0x1000050000000: (115, 111, 2359296),
+        0x1000060000000: (-1, 111, 0),
+        0x1000080000000: (111, -1, 0),
+        0x1000080010000: (111, -1, 0),
+        0x1000080200000: (111, -1, 262144),
+        0x1000082000000: (111, -1, 0),
+        0x1000088000000: (111, -1, 0),
+        0x1000090000000: (111, -1, 262144),
+        0x10000a0000000: (111, -1, 0),
+        0x10000c0000000: (111, 111, 0),
+        0x1000100000000: (186, -1, 0),
+        0x1000100010000: (186, -1, 0),
+        0x1000100200000: (186, -1, 262144),
+        0x1000102000000: (186, -1, 0),
+        0x1000108000000: (186, -1, 0),
+        0x1000110000000: (186, -1, 262144),
+        0x1000120000000: (186, -1, 0),
+        0x1000140000000: (186, 111, 0),
+        0x1000180000000: (186, -1, 0),
+        0x1000200000000: (115, -1, 0),
+        0x1000200010000: (115, -1, 0),
+        0x1000200200000: (115, -1, 262144),
+        0x1000202000000: (115, -1, 0),
+        0x1000208000000: (115, -1, 0),
+        0x1000210000000: (115, -1, 262144),
+        0x1000220000000: (115, -1, 0),
+        0x1000240000000: (115, 111, 0),
+        0x1000280000000: (115, -1, 0),
+        0x1000300000000: (115, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 111, 0),
+        0x8000040000001: (111, -1, 262144),
+        0x8000400000000: (111, -1, 0),
+        0x8000400000001: (111, -1, 262144),
+        0x8000440000000: (111, 111, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (218, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (174, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (218, -1, 0),
+        0x10002000000000: (174, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (218, -1, 0),
+        0x10003000000000: (174, -1, 0),
+        0x10004000000000: (150, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (218, -1, 0),
+        0x10005000000000: (174, -1, 0),
+        0x10006000000000: (174, -1, 0),
+        0x10008000000000: (150, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (218, -1, 0),
+        0x10009000000000: (174, -1, 0),
+        0x1000a000000000: (174, -1, 0),
+        0x1000c000000000: (150, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (218, -1, 0),
+        0x10011000000000: (174, -1, 0),
+        0x10012000000000: (174, -1, 0),
+        0x10014000000000: (150, -1, 0),
+        0x10018000000000: (150, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (174, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (150, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (150, -1, 0),
+        0x20020000000000: (150, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (150, -1, 0),
+        0x20028000000000: (150, -1, 0),
+        0x20040000000000: (174, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (174, -1, 0),
+        0x20048000000000: (150, -1, 0),
+        0x20060000000000: (150, -1, 0),
+        0x20080000000000: (115, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (115, -1, 0),
+        0x20088000000000: (150, -1, 0),
+        0x200a0000000000: (150, -1, 0),
+        0x200c0000000000: (174, -1, 0),
+        0x20100000000000: (218, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (218, -1, 0),
+        0x20108000000000: (150, -1, 0),
+        0x20120000000000: (150, -1, 0),
+        0x20140000000000: (174, -1, 0),
+        0x20180000000000: (115, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_16():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (0, 0, 0),
+        0x400000000002: (0, 9, 0),
+        0x400000000003: (0, 9, 0),
+        0x400000000004: (0, 9, 0),
+        0x400000000005: (0, 9, 0),
+        0x400000000006: (0, 9, 0),
+        0x400000000008: (7, 9, 0),
+        0x400000000009: (7, 9, 0),
+        0x40000000000a: (7, 9, 0),
+        0x40000000000c: (7, 9, 0),
+        0x400000000010: (13, -1, 0),
+        0x400000000011: (13, 0, 0),
+        0x400000000012: (13, 9, 0),
+        0x400000000014: (13, 9, 0),
+        0x400000000018: (13, 9, 0),
+        0x400000000020: (10, -1, 0),
+        0x400000000021: (10, 0, 0),
+        0x400000000022: (10, 9, 0),
+        0x400000000024: (10, 9, 0),
+        0x400000000028: (10, 9, 0),
+        0x400000000030: (10, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (0, 0, 0),
+        0x400000000042: (0, 9, 0),
+        0x400000000044: (0, 9, 0),
+        0x400000000048: (7, 9, 0),
+        0x400000000050: (13, -1, 0),
+        0x400000000060: (7, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (0, 0, 0),
+        0x400000000082: (0, 9, 0),
+        0x400000000084: (0, 9, 0),
+        0x400000000088: (7, 9, 0),
+        0x400000000090: (13, -1, 0),
+        0x4000000000a0: (9, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (0, 0, 0),
+        0x400000000102: (0, 9, 0),
+        0x400000000104: (0, 9, 0),
+        0x400000000108: (7, 9, 0),
+        0x400000000110: (13, -1, 0),
+        0x400000000120: (14, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (7, -1, 2097152),
+        0x400000000201: (7, 0, 2097152),
+        0x400000000202: (7, 9, 2097152),
+        0x400000000204: (7, 9, 2097152),
+        0x400000000208: (7, 9, 2097152),
+        0x400000000210: (7, -1, 2097152),
+        0x400000000220: (7, -1, 2097152),
+        0x400000000240: (7, -1, 2097152),
+        0x400000000280: (7, -1, 2097152),
+        0x400000000300: (7, -1, 2097152),
+        0x400000000400: (7, -1, 2097152),
+        0x400000000401: (7, 0, 2097152),
+        0x400000000402: (7, 9, 2097152),
+        0x400000000404: (7, 9, 2097152),
+        0x400000000408: (7, 9, 2097152),
+        0x400000000410: (7, -1, 2097152),
+        0x400000000420: (7, -1, 2097152),
+        0x400000000440: (7, -1, 2097152),
+        0x400000000480: (7, -1, 2097152),
+        0x400000000500: (7, -1, 2097152),
+        0x400000000600: (7, -1, 2097152),
+        0x400000000800: (10, -1, 2097152),
+        0x400000000801: (10, 0, 2097152),
+        0x400000000802: (10, 9, 2097152),
+        0x400000000804: (10, 9, 2097152),
+        0x400000000808: (10, 9, 2097152),
+        0x400000000810: (10, -1, 2097152),
+        0x400000000820: (10, -1, 0),
+        0x400000000840: (10, -1, 2097152),
+        0x400000000880: (10, -1, 2097152),
+        0x400000000900: (10, -1, 2097152),
+        0x400000000a00: (7, -1, 2097152),
+        0x400000000c00: (7, -1, 2097152),
+        0x400000001000: (7, -1, 0),
+        0x400000001001: (7, 0, 0),
+        0x400000001002: (7, 9, 0),
+        0x400000001004: (7, 9, 0),
+        0x400000001008: (7, 9, 0),
+        0x400000001010: (7, -1, 0),
+        0x400000001020: (7, -1, 0),
+        0x400000001040: (7, -1, 0),
+        0x400000001080: (7, -1, 0),
+        0x400000001100: (7, -1, 0),
+        0x400000001200: (7, -1, 2097152),
+        0x400000001400: (7, -1, 2097152),
+        0x400000001800: (7, -1, 0),
+        0x400000002000: (7, -1, 2097152),
+        0x400000002001: (7, 0, 2097152),
+        0x400000002002: (7, 9, 2097152),
+        0x400000002004: (7, 9, 2097152),
+        0x400000002008: (7, 9, 2097152),
+        0x400000002010: (7, -1, 2097152),
+        0x400000002020: (7, -1, 2097152),
+        0x400000002040: (7, -1, 2097152),
+        0x400000002080: (7, -1, 2097152),
+        0x400000002100: (7, -1, 2097152),
+        0x400000002200: (7, -1, 2097152),
+        0x400000002400: (7, -1, 2097152),
+        0x400000002800: (7, -1, 2097152),
+        0x400000003000: (7, -1, 2097152),
+        0x400000004000: (7, -1, 2097152),
+        0x400000004001: (7, 0, 2097152),
+        0x400000004002: (7, 9, 2097152),
+        0x400000004004: (7, 9, 2097152),
+        0x400000004008: (7, 9, 2097152),
+        0x400000004010: (7, -1, 2097152),
+        0x400000004020: (7, -1, 2097152),
+        0x400000004040: (7, -1, 2097152),
+        0x400000004080: (7, -1, 2097152),
+        0x400000004100: (7, -1, 2097152),
+        0x400000004200: (7, -1, 2097152),
+        0x400000004400: (7, -1, 2097152),
+        0x400000004800: (7, -1, 2097152),
+        0x400000005000: (7, -1, 2097152),
+        0x400000006000: (7, -1, 2097152),
+        0x400000008000: (13, -1, 0),
+        0x400000008001: (13, 0, 0),
+        0x400000008002: (13, 9, 0),
+        0x400000008004: (13, 9, 0),
+        0x400000008008: (13, 9, 0),
+        0x400000008010: (13, -1, 0),
+        0x400000008020: (13, -1, 0),
+        0x400000008040: (13, -1, 0),
+        0x400000008080: (13, -1, 0),
+        0x400000008100: (13, -1, 0),
+        0x400000008200: (13, -1, 2097152),
+        0x400000008400: (13, -1, 2097152),
+        0x400000008800: (13, -1, 2097152),
+        0x400000009000: (13, -1, 0),
+        0x40000000a000: (13, -1, 2097152),
+        0x40000000c000: (13, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (0, 0, 0),
+        0x400000010002: (0, 9, 0),
+        0x400000010004: (0, 9, 0),
+        0x400000010008: (7, 9, 0),
+        0x400000010010: (13, -1, 0),
+        0x400000010020: (10, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (7, -1, 2097152),
+        0x400000010400: (7, -1, 2097152),
+        0x400000010800: (10, -1, 2097152),
+        0x400000011000: (7, -1, 0),
+        0x400000012000: (7, -1, 2097152),
+        0x400000014000: (7, -1, 2097152),
+        0x400000018000: (14, -1, 0),
+        0x400000020000: (9, -1, 2097152),
+        0x400000020001: (0, 0, 0),
+        0x400000020002: (9, 9, 2097152),
+        0x400000020004: (9, 9, 2097152),
+        0x400000020008: (9, 9, 2097152),
+        0x400000020010: (9, -1, 2097152),
+        0x400000020020: (9, -1, 2097152),
+        0x400000020040: (9, -1, 2097152),
+        0x400000020080: (9, -1, 2097152),
+        0x400000020100: (9, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (9, -1, 2097152),
+        0x400000020800: (9, -1, 2097152),
+        0x400000021000: (9, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (9, -1, 2097152),
+        0x400000028000: (9, -1, 2097152),
+        0x400000030000: (9, -1, 2097152),
+        0x400000040000: (8, -1, 2097152),
+        0x400000040001: (0, 0, 0),
+        0x400000040002: (8, 9, 2097152),
+        0x400000040004: (8, 9, 2097152),
+        0x400000040008: (8, 9, 2097152),
+        0x400000040010: (8, -1, 2097152),
+        0x400000040020: (8, -1, 2097152),
+        0x400000040040: (8, -1, 2097152),
+        0x400000040080: (8, -1, 2097152),
+        0x400000040100: (8, -1, 2097152),
+        0x400000040200: (8, -1, 2097152),
+        0x400000040400: (8, -1, 2097152),
+        0x400000040800: (8, -1, 2097152),
+        0x400000041000: (8, -1, 2097152),
+        0x400000042000: (8, -1, 2097152),
+        0x400000044000: (8, -1, 2097152),
+        0x400000048000: (8, -1, 2097152),
+        0x400000050000: (8, -1, 2097152),
+        0x400000060000: (8, -1, 2097152),
+        0x400000080000: (8, -1, 2097152),
+        0x400000080001: (0, 0, 0),
+        0x400000080002: (8, 9, 2097152),
+        0x400000080004: (8, 9, 2097152),
+        0x400000080008: (8, 9, 2097152),
+        0x400000080010: (8, -1, 2097152),
+        0x400000080020: (8, -1, 2097152),
+        0x400000080040: (8, -1, 2097152),
+        0x400000080080: (8, -1, 2097152),
+        0x400000080100: (8, -1, 2097152),
+        0x400000080200: (8, -1, 2097152),
+        0x400000080400: (8, -1, 2097152),
+        0x400000080800: (8, -1, 2097152),
+        0x400000081000: (8, -1, 2097152),
+        0x400000082000: (8, -1, 2097152),
+        0x400000084000: (8, -1, 2097152),
+        0x400000088000: (8, -1, 2097152),
+        0x400000090000: (8, -1, 2097152),
+        0x4000000a0000: (8, -1, 2097152),
+        0x4000000c0000: (8, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (0, 0, 2097152),
+        0x400000100002: (0, 9, 0),
+        0x400000100004: (0, 9, 0),
+        0x400000100008: (7, 9, 0),
+        0x400000100010: (13, -1, 0),
+        0x400000100020: (10, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (7, -1, 2097152),
+        0x400000100400: (7, -1, 2097152),
+        0x400000100800: (10, -1, 2097152),
+        0x400000101000: (7, -1, 0),
+        0x400000102000: (7, -1, 2097152),
+        0x400000104000: (7, -1, 2097152),
+        0x400000108000: (13, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (9, -1, 2097152),
+        0x400000140000: (8, -1, 2097152),
+        0x400000180000: (8, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (0, 0, 0),
+        0x400000200002: (0, 9, 0),
+        0x400000200004: (0, 9, 0),
+        0x400000200008: (7, 9, 0),
+        0x400000200010: (13, -1, 0),
+        0x400000200020: (10, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (7, -1, 2097152),
+        0x400000200400: (7, -1, 2097152),
+        0x400000200800: (10, -1, 2097152),
+        0x400000201000: (7, -1, 0),
+        0x400000202000: (7, -1, 2097152),
+        0x400000204000: (7, -1, 2097152),
+        0x400000208000: (13, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (9, -1, 2097152),
+        0x400000240000: (8, -1, 2097152),
+        0x400000280000: (8, -1, 2097152),
+        0x400000300000: (7, -1, 2097152),
+        0x400000400000: (7, -1, 0),
+        0x400000400001: (7, 0, 0),
+        0x400000400002: (7, 9, 0),
+        0x400000400004: (7, 9, 0),
+        0x400000400008: (7, 9, 0),
+        0x400000400010: (7, -1, 0),
+        0x400000400020: (7, -1, 0),
+        0x400000400040: (7, -1, 0),
+        0x400000400080: (7, -1, 0),
+        0x400000400100: (7, -1, 0),
+        0x400000400200: (7, -1, 2097152),
+        0x400000400400: (7, -1, 2097152),
+        0x400000400800: (7, -1, 2097152),
+        0x400000401000: (7, -1, 0),
+        0x400000402000: (7, -1, 2097152),
+        0x400000404000: (7, -1, 2097152),
+        0x400000408000: (7, -1, 0),
+        0x400000410000: (7, -1, 0),
+        0x400000420000: (7, -1, 2097152),
+        0x400000440000: (7, -1, 2097152),
+        0x400000480000: (7, -1, 2097152),
+        0x400000500000: (7, -1, 0),
+        0x400000600000: (7, -1, 0),
+        0x400000800000: (14, -1, 0),
+        0x400000800001: (14, 0, 0),
+        0x400000800002: (14, 9, 0),
+        0x400000800004: (14, 9, 0),
+        0x400000800008: (14, 9, 0),
+        0x400000800010: (14, -1, 0),
+        0x400000800020: (14, -1, 0),
+        0x400000800040: (14, -1, 0),
+        0x400000800080: (14, -1, 0),
+        0x400000800100: (14, -1, 0),
+        0x400000800200: (14, -1, 2097152),
+        0x400000800400: (14, -1, 2097152),
+        0x400000800800: (14, -1, 2097152),
+        0x400000801000: (14, -1, 0),
+        0x400000802000: (14, -1, 2097152),
+        0x400000804000: (14, -1, 2097152),
+        0x400000808000: (14, -1, 0),
+        0x400000810000: (14, -1, 0),
+        0x400000820000: (14, -1, 2097152),
+        0x400000840000: (14, -1, 2097152),
+        0x400000880000: (14, -1, 2097152),
+        0x400000900000: (14, -1, 0),
+        0x400000a00000: (14, -1, 0),
+        0x400000c00000: (14, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (7, -1, 2097152),
+        0x800000008000: (14, -1, 2097152),
+        0x800000008400: (7, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (7, -1, 2097152),
+        0x800000018000: (14, -1, 2097152),
+        0x800001000000: (10, -1, 2097152),
+        0x800001000400: (10, -1, 2097152),
+        0x800001008000: (10, -1, 2097152),
+        0x800001010000: (10, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (7, -1, 2097152),
+        0x800002008000: (14, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (9, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (7, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 10, 2097152),
+        0x800005000000: (10, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (7, -1, 2359296),
+        0x1000000210000: (7, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (7, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (10, -1, 0),
+        0x1000008200000: (7, -1, 2359296),
+        0x100000a000000: (8, 7, 0),
+        0x1000010000000: (14, -1, 2359296),
+        0x1000010010000: (14, -1, 2359296),
+        0x1000010200000: (14, -1, 2359296),
+        0x1000012000000: (14, -1, 2359296),
+        0x1000018000000: (14, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (7, -1, 2359296),
+        0x1000022000000: (9, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (14, -1, 2359296),
+        0x1000040000000: (-1, 7, 0),
+        0x1000040010000: (-1, 7, 0),
+        0x1000040200000: (7, 7, 2359296),
+        0x1000042000000: (-1, 7, 0),
+        0x1000048000000: (-1, 7, 0),
+        0x1000050000000: (14, 7, 2359296),
+        0x1000060000000: (-1, 7, 0),
+        0x1000080000000: (7, -1, 0),
+        0x1000080010000: (7, -1, 0),
+        0x1000080200000: (7, -1, 262144),
+        0x1000082000000: (7, -1, 0),
+        0x1000088000000: (7, -1, 0),
+        0x1000090000000: (7, -1, 262144),
+        0x10000a0000000: (7, -1, 0),
+        0x10000c0000000: (7, 7, 0),
+        0x1000100000000: (7, -1, 0),
+        0x1000100010000: (7, -1, 0),
+        0x1000100200000: (7, -1, 262144),
+        0x1000102000000: (7, -1, 0),
+        0x1000108000000: (7, -1, 0),
+        0x1000110000000: (7, -1, 262144),
+        0x1000120000000: (7, -1, 0),
+        0x1000140000000: (7, 7, 0),
+        0x1000180000000: (7, -1, 0),
+        0x1000200000000: (14, -1, 0),
+        0x1000200010000: (14, -1, 0),
+        0x1000200200000: (14, -1, 262144),
+        0x1000202000000: (14, -1, 0),
+        0x1000208000000: (14, -1, 0),
+        0x1000210000000: (14, -1, 262144),
+        0x1000220000000: (14, -1, 0),
+        0x1000240000000: (14, 7, 0),
+        0x1000280000000: (14, -1, 0),
+        0x1000300000000: (14, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 7, 0),
+        0x8000040000001: (7, -1, 262144),
+        0x8000400000000: (7, -1, 0),
+        0x8000400000001: (7, -1, 262144),
+        0x8000440000000: (7, 7, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (7, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (9, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (7, -1, 0),
+        0x10002000000000: (9, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (7, -1, 0),
+        0x10003000000000: (9, -1, 0),
+        0x10004000000000: (10, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (7, -1, 0),
+        0x10005000000000: (9, -1, 0),
+        0x10006000000000: (9, -1, 0),
+        0x10008000000000: (10, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (7, -1, 0),
+        0x10009000000000: (9, -1, 0),
+        0x1000a000000000: (9, -1, 0),
+        0x1000c000000000: (10, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (7, -1, 0),
+        0x10011000000000: (9, -1, 0),
+        0x10012000000000: (9, -1, 0),
+        0x10014000000000: (10, -1, 0),
+        0x10018000000000: (10, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (9, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (10, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (10, -1, 0),
+        0x20020000000000: (10, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (10, -1, 0),
+        0x20028000000000: (10, -1, 0),
+        0x20040000000000: (9, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (9, -1, 0),
+        0x20048000000000: (10, -1, 0),
+        0x20060000000000: (10, -1, 0),
+        0x20080000000000: (14, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (14, -1, 0),
+        0x20088000000000: (10, -1, 0),
+        0x200a0000000000: (10, -1, 0),
+        0x200c0000000000: (9, -1, 0),
+        0x20100000000000: (7, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (7, -1, 0),
+        0x20108000000000: (10, -1, 0),
+        0x20120000000000: (10, -1, 0),
+        0x20140000000000: (9, -1, 0),
+        0x20180000000000: (14, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+_TABLES = {
+    'truecolor': _colors_truecolor,
+    '256': _colors_256,
+    '16': _colors_16,
+}
+
+# Generated by build.py: the code at each color depth of the colors
+# _evaluate() returns.
+_DEPTH_CODES = {
+    'truecolor': {15: 16777215, 1000: 3159110, 1001: 9218798, 1002: 2303540, 1003: 15646398, 1004: 10932617, 1005: 12237809, 1006: 2698300, 1007: 15374748, 1008: 13278950, 1009: 7567764, 1010: 8620967, 1011: 9739451, 1012: 15703926, 1013: 16038116, 1014: 15172228, 1015: 15914447, 1016: 8765916, 1017: 10080731, 1018: 10857934, 1019: 11911138, 1020: 4277593, 1021: 5330797, 1022: 6449280, 1023: 8505534, 1024: 13029621, 1025: 15059088},
+    '256': {1000: 59, 1001: 111, 1002: 17, 1003: 217, 1004: 150, 1005: 147, 1006: 17, 1007: 175, 1008: 182, 1009: 102, 1010: 103, 1011: 109, 1012: 216, 1013: 218, 1014: 174, 1015: 224, 1016: 110, 1017: 116, 1018: 146, 1019: 146, 1020: 59, 1021: 59, 1022: 60, 1023: 115, 1024: 189, 1025: 186},
+    '16': {1000: 0, 1001: 7, 1002: 0, 1003: 7, 1004: 10, 1005: 7, 1006: 0, 1007: 7, 1008: 13, 1009: 8, 1010: 8, 1011: 8, 1012: 7, 1013: 7, 1014: 9, 1015: 7, 1016: 7, 1017: 14, 1018: 7, 1019: 7, 1020: 0, 1021: 8, 1022: 8, 1023: 14, 1024: 7, 1025: 7},
+}
+
+# Generated by build.py: the value of each color constant at each color depth.
+_DEPTH_CONSTANTS = {
+    'truecolor': {'BASE': 3159110, 'BLUE': 9218798, 'CRUST': 2303540, 'FLAMINGO': 15646398, 'GREEN': 10932617, 'LAVENDER': 12237809, 'MANTLE': 2698300, 'MAROON': 15374748, 'MAUVE': 13278950, 'OVERLAY_0': 7567764, 'OVERLAY_1': 8620967, 'OVERLAY_2': 9739451, 'PEACH': 15703926, 'PINK': 16038116, 'RED': 15172228, 'ROSEWATER': 15914447, 'SAPPHIRE': 8765916, 'SKY': 10080731, 'SUBTEXT_0': 10857934, 'SUBTEXT_1': 11911138, 'SURFACE_0': 4277593, 'SURFACE_1': 5330797, 'SURFACE_2': 6449280, 'TEAL': 8505534, 'TEXT': 13029621, 'YELLOW': 15059088},
+    '256': {'BASE': 59, 'BLUE': 111, 'CRUST': 17, 'FLAMINGO': 217, 'GREEN': 150, 'LAVENDER': 147, 'MANTLE': 17, 'MAROON': 175, 'MAUVE': 182, 'OVERLAY_0': 102, 'OVERLAY_1': 103, 'OVERLAY_2': 109, 'PEACH': 216, 'PINK': 218, 'RED': 174, 'ROSEWATER': 224, 'SAPPHIRE': 110, 'SKY': 116, 'SUBTEXT_0': 146, 'SUBTEXT_1': 146, 'SURFACE_0': 59, 'SURFACE_1': 59, 'SURFACE_2': 60, 'TEAL': 115, 'TEXT': 189, 'YELLOW': 186},
+    '16': {'BASE': 0, 'BLUE': 7, 'CRUST': 0, 'FLAMINGO': 7, 'GREEN': 10, 'LAVENDER': 7, 'MANTLE': 0, 'MAROON': 7, 'MAUVE': 13, 'OVERLAY_0': 8, 'OVERLAY_1': 8, 'OVERLAY_2': 8, 'PEACH': 7, 'PINK': 7, 'RED': 9, 'ROSEWATER': 7, 'SAPPHIRE': 7, 'SKY': 14, 'SUBTEXT_0': 7, 'SUBTEXT_1': 7, 'SURFACE_0': 0, 'SURFACE_1': 8, 'SURFACE_2': 8, 'TEAL': 14, 'TEXT': 7, 'YELLOW': 7},
+}
+
+# Generated by build.py: every (fg, bg) use() can return, most common first,
+# at each color depth.
+_DEPTH_PAIRS = {
+    'truecolor': (
+        (-1, -1),
+        (-1, 9218798),
+        (3159110, 15172228),
+        (3159110, 4277593),
+        (9218798, -1),
+        (10932617, -1),
+        (15374748, -1),
+        (16038116, -1),
+        (15172228, -1),
+        (8765916, -1),
+        (8505534, -1),
+        (15059088, -1),
+        (-1, 10932617),
+        (16777215, -1),
+        (9218798, 9218798),
+        (9218798, 15172228),
+        (10932617, 15172228),
+        (10932617, 4277593),
+        (15374748, 15172228),
+        (15374748, 4277593),
+        (13278950, -1),
+        (8620967, -1),
+        (8620967, 16038116),
+        (8765916, 15172228),
+        (8765916, 4277593),
+        (8505534, 9218798),
+        (15059088, 9218798),
+        (15059088, 4277593),
+        (16777215, 15172228),
+        (9218798, 16038116),
+        (10932617, 9218798),
+        (13278950, 15172228),
+        (13278950, 4277593),
+        (8620967, 9218798),
+        (8620967, 15172228),
+        (16038116, 9218798),
+        (16038116, 4277593),
+        (15172228, 9218798),
+        (15172228, 16038116),
+        (15172228, 15172228),
+        (15172228, 4277593),
+        (8505534, 16038116),
+        (8505534, 4277593),
+        (15059088, 16038116),
+        (-1, 16038116),
+        (10932617, 10932617),
+        (10932617, 16038116),
+        (16038116, 10932617),
+        (16038116, 16038116),
+        (16038116, 15172228),
+        (15172228, 10932617),
+        (8505534, 10932617),
+        (8505534, 15172228),
+        (-1, 15172228),
+        (15059088, 15172228),
+    ),
+    '256': (
+        (-1, -1),
+        (-1, 111),
+        (59, 174),
+        (59, 59),
+        (111, -1),
+        (150, -1),
+        (175, -1),
+        (218, -1),
+        (174, -1),
+        (110, -1),
+        (115, -1),
+        (186, -1),
+        (-1, 150),
+        (15, -1),
+        (111, 111),
+        (111, 174),
+        (150, 174),
+        (150, 59),
+        (175, 174),
+        (175, 59),
+        (182, -1),
+        (103, -1),
+        (103, 218),
+        (110, 174),
+        (110, 59),
+        (115, 111),
+        (186, 111),
+        (186, 59),
+        (15, 174),
+        (111, 218),
+        (150, 111),
+        (182, 174),
+        (182, 59),
+        (103, 111),
+        (103, 174),
+        (218, 111),
+        (218, 59),
+        (174, 111),
+        (174, 218),
+        (174, 174),
+        (174, 59),
+        (115, 218),
+        (115, 59),
+        (186, 218),
+        (-1, 218),
+        (150, 150),
+        (150, 218),
+        (218, 150),
+        (218, 218),
+        (218, 174),
+        (174, 150),
+        (115, 150),
+        (115, 174),
+        (-1, 174),
+        (186, 174),
+    ),
+    '16': (
+        (-1, -1),
+        (-1, 7),
+        (0, 9),
+        (0, 0),
+        (7, -1),
+        (10, -1),
+        (9, -1),
+        (14, -1),
+        (-1, 10),
+        (15, -1),
+        (7, 7),
+        (7, 9),
+        (10, 9),
+        (10, 0),
+        (7, 0),
+        (13, -1),
+        (8, -1),
+        (8, 7),
+        (14, 7),
+        (15, 9),
+        (10, 7),
+        (13, 9),
+        (13, 0),
+        (8, 9),
+        (9, 7),
+        (9, 9),
+        (9, 0),
+        (14, 0),
+        (10, 10),
+        (7, 10),
+        (9, 10),
+        (14, 10),
+        (14, 9),
+        (-1, 9),
+    ),
+}
+
+# Generated by build.py: for terminals with fewer colors than any table, the
+# table they use and the code each of its codes 0-15 becomes.
+_FEWER_COLORS = {'8': ('16', (0, 1, 2, 3, 4, 5, 6, 7, 0, 1, 2, 3, 4, 5, 6, 7)), 'monochrome': ('16', (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1))}
+
+# Generated by build.py: the least number of colors of each depth's terminals.
+_DEPTH_COLORS = ((16777216, 'truecolor'), (256, '256'), (16, '16'), (8, '8'), (0, 'monochrome'))
+
+
+def _color_depth():
+    # The terminal's, from its terminfo entry, unless set in the environment.
+    import os
+
+    depth = os.environ.get("CATPPUCCIN_RANGER_DEPTH")
+    if depth in _TABLES or depth in _FEWER_COLORS:
+        return depth
+    try:
+        import curses
+
+        try:
+            colors = curses.COLORS  # Only once curses is started.
+        except AttributeError:
+            curses.setupterm()
+            colors = curses.tigetnum("colors")  # -1 if it has none.
+    except Exception:  # No curses, no terminal, unknown $TERM, ...
+        return "256"
+    for least, depth in _DEPTH_COLORS:
+        if colors >= least:
+            break
+    return depth
+
+
+def _use_depth(depth):
+    global _DEPTH, _CODES, _COLORS, _COLORS_LIMIT, _COLOR_PAIRS
+    _DEPTH = depth
+    depth, fewer = _FEWER_COLORS.get(depth, (depth, None))
+    _CODES = _DEPTH_CODES[depth]
+    _COLORS = _TABLES[depth]()
+    constants = _DEPTH_CONSTANTS[depth]
+    _COLOR_PAIRS = _DEPTH_PAIRS[depth]
+    if fewer:
+
+        def convert(code):
+            return fewer[code] if 0 <= code < 16 else code
+
+        _CODES = {code: convert(value) for code, value in _CODES.items()}
+        _CODES.update((code, convert(code)) for code in range(16))
+        _COLORS = {
+            key: (convert(fg), convert(bg), attr)
+            for key, (fg, bg, attr) in _COLORS.items()
+        }
+        constants = {name: convert(code) for name, code in constants.items()}
+        _COLOR_PAIRS = tuple(
+            dict.fromkeys((convert(fg), convert(bg)) for fg, bg in _COLOR_PAIRS)
+        )
+    if reverse != 262144 or bold != 2097152:
+        _COLORS = {}
+    _COLORS_LIMIT = len(_COLORS) + 1024
+    globals().update(constants)
+    CatppuccinFrappe.progress_bar_color = BLUE
+
+
+# Chosen by the first use() or color pair allocation, which ranger only does
+# once curses is started, so that importing the scheme leaves the terminal
+# alone.
+_DEPTH = None
+_COLORS = {}
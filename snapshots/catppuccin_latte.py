@@ -0,0 +1,2036 @@
+# This file is part of ranger, the console file manager.
+# Available at https://github.com/ranger/ranger
+# License: GNU GPL version 3, see the file "AUTHORS" for details.
+# This theme was greatly inspired by "Dracula" for ranger
+# It can be found in: `https://github.com/dracula/ranger`
+
+from ranger.gui.color import bold, reverse
+from ranger.gui.colorscheme import ColorScheme
+
+ROSEWATER = 174
+FLAMINGO = 174
+PINK = 176
+MAUVE = 99
+RED = 161
+MAROON = 167
+PEACH = 202
+YELLOW = 172
+GREEN = 70
+TEAL = 30
+SKY = 38
+SAPPHIRE = 37
+BLUE = 27
+LAVENDER = 69
+TEXT = 59
+SUBTEXT_1 = 60
+SUBTEXT_0 = 60
+OVERLAY_2 = 102
+OVERLAY_1 = 103
+OVERLAY_0 = 145
+SURFACE_2 = 145
+SURFACE_1 = 146
+SURFACE_0 = 188
+BASE = 231
+MANTLE = 189
+CRUST = 188
+
+
+class CatppuccinLatte(ColorScheme):
+    progress_bar_color = BLUE
+
+
+
+
+
+
+
+    def _evaluate(self, context):
+        fg, bg, attr = (-1, -1, 0)
+        if context.reset:
+            return (-1, -1, 0)
+        elif context.in_browser:
+            if context.selected:
+                bg = 1020
+                fg = 1000
+                attr &= ~bold
+            else:
+                attr = 0
+            if context.empty or context.error:
+                bg = 1014
+                fg = 1000
+            if context.border:
+                fg = 1001
+                bg = 1014
+            if context.document:
+                fg = 1008
+            if context.media:
+                if context.image:
+                    fg = 1025
+                elif context.video:
+                    fg = 1014
+                elif context.audio:
+                    fg = 1023
+                else:
+                    fg = 1004
+            if context.container:
+                attr |= bold
+                fg = 1007
+            if context.directory:
+                attr |= bold
+                fg = 1016
+            elif context.executable and (not any((context.media, context.container, context.fifo, context.socket))):
+                attr |= bold
+                fg = 1004
+            if context.socket:
+                fg = 1013
+                attr |= bold
+            if context.fifo or context.device:
+                fg = 1025
+                if context.device:
+                    attr |= bold
+            if context.link:
+                fg = 1023 if context.good else 1008
+            if context.tag_marker and (not context.selected):
+                attr |= bold
+                if fg in (1014, 1013, 1007):
+                    fg = 15
+                else:
+                    fg = 1014
+            if not context.selected and (context.cut or context.copied):
+                fg = 1010
+                attr |= bold
+            if context.main_column:
+                if context.selected:
+                    attr |= bold
+                if context.marked:
+                    attr |= bold
+                    fg = 1025
+            if context.badinfo:
+                if attr & reverse:
+                    bg = 1013
+                else:
+                    fg = 1013
+            if context.inactive_pane:
+                fg = 1023
+        elif context.in_titlebar:
+            attr |= bold
+            if context.hostname:
+                fg = 1014 if context.bad else 1004
+            elif context.directory:
+                fg = 1001
+            elif context.tab:
+                if context.good:
+                    bg = 1004
+            elif context.link:
+                fg = 1023
+        elif context.in_statusbar:
+            if context.permissions:
+                if context.good:
+                    fg = 1004
+                elif context.bad:
+                    bg = 1013
+                    fg = 1010
+            if context.marked:
+                attr |= bold | reverse
+                fg = 1025
+            if context.frozen:
+                attr |= bold | reverse
+                fg = 1023
+            if context.message:
+                if context.bad:
+                    attr |= bold
+                    fg = 1014
+            if context.loaded:
+                bg = 1001
+            if context.vcsinfo:
+                fg = 1001
+                attr &= ~bold
+            if context.vcscommit:
+                fg = 1025
+                attr &= ~bold
+            if context.vcsdate:
+                fg = 1023
+                attr &= ~bold
+        if context.text and context.highlight:
+            attr |= reverse
+        if context.in_taskview:
+            if context.title:
+                fg = 1001
+            if context.selected:
+                attr |= reverse
+            if context.loaded:
+                if context.selected:
+                    fg = 1001
+                else:
+                    bg = 1001
+        if context.vcsfile and (not context.selected):
+            attr &= ~bold
+            if context.vcsconflict:
+                fg = 1013
+            elif context.vcschanged:
+                fg = 1014
+            elif context.vcsunknown:
+                fg = 1014
+            elif context.vcsstaged:
+                fg = 1004
+            elif context.vcssync:
+                fg = 1004
+            elif context.vcsignored:
+                fg = -1
+        elif context.vcsremote and (not context.selected):
+            attr &= ~bold
+            if context.vcssync or context.vcsnone:
+                fg = 1004
+            elif context.vcsbehind:
+                fg = 1014
+            elif context.vcsahead:
+                fg = 1023
+            elif context.vcsdiverged:
+                fg = 1013
+            elif context.vcsunknown:
+                fg = 1014
+        return (fg, bg, attr)
+
+    def __init__(self):
+        super().__init__()
+        if not _allocate_color_pairs():
+            _allocate_when_ready()
+
+    def use(self, context):
+        flags = tuple(context.__dict__)
+        key = _KEYS.get(flags)
+        if key is None:
+            key = _intern_key(flags)
+        try:
+            return _COLORS[key]
+        except KeyError:
+            if _DEPTH is None:
+                _use_depth(_color_depth())
+                if key in _COLORS:
+                    return _COLORS[key]
+            fg, bg, attr = self._evaluate(context)
+            colors = (_CODES.get(fg, fg), _CODES.get(bg, bg), attr)
+            if len(_COLORS) < _COLORS_LIMIT:
+                _COLORS[key] = colors
+            return colors
+
+
+def _shared_keys(name, flag_bits):
+    # One table of context keys for every loaded scheme with the same flags.
+    import sys
+    import types
+
+    shared = sys.modules.get(name)
+    if shared is None:
+        shared = sys.modules[name] = types.ModuleType(name)
+        shared.FLAG_BITS = flag_bits
+        shared.KEYS = {}
+    return shared.FLAG_BITS, shared.KEYS
+
+
+def _intern_key(flags):
+    key = 0
+    for flag in flags:
+        key |= _FLAG_BITS.get(flag, 0)
+    if len(_KEYS) < 4096:
+        _KEYS[flags] = key
+    return key
+
+
+# Generated by build.py: bit of each context flag read by the scheme, and the
+# bitmask of each tuple of flags seen.
+_FLAG_BITS, _KEYS = _shared_keys(
+    "_catppuccin_ranger_keys_e734dcb2bc56d5f1",
+    {
+        'selected': 1 << 0,
+        'empty': 1 << 1,
+        'error': 1 << 2,
+        'border': 1 << 3,
+        'document': 1 << 4,
+        'media': 1 << 5,
+        'image': 1 << 6,
+        'video': 1 << 7,
+        'audio': 1 << 8,
+        'container': 1 << 9,
+        'directory': 1 << 10,
+        'executable': 1 << 11,
+        'fifo': 1 << 12,
+        'socket': 1 << 13,
+        'device': 1 << 14,
+        'link': 1 << 15,
+        'good': 1 << 16,
+        'tag_marker': 1 << 17,
+        'cut': 1 << 18,
+        'copied': 1 << 19,
+        'main_column': 1 << 20,
+        'marked': 1 << 21,
+        'badinfo': 1 << 22,
+        'inactive_pane': 1 << 23,
+        'hostname': 1 << 24,
+        'bad': 1 << 25,
+        'tab': 1 << 26,
+        'permissions': 1 << 27,
+        'frozen': 1 << 28,
+        'message': 1 << 29,
+        'loaded': 1 << 30,
+        'vcsinfo': 1 << 31,
+        'vcscommit': 1 << 32,
+        'vcsdate': 1 << 33,
+        'title': 1 << 34,
+        'vcsconflict': 1 << 35,
+        'vcschanged': 1 << 36,
+        'vcsunknown': 1 << 37,
+        'vcsstaged': 1 << 38,
+        'vcssync': 1 << 39,
+        'vcsignored': 1 << 40,
+        'vcsnone': 1 << 41,
+        'vcsbehind': 1 << 42,
+        'vcsahead': 1 << 43,
+        'vcsdiverged': 1 << 44,
+        'reset': 1 << 45,
+        'in_browser': 1 << 46,
+        'in_titlebar': 1 << 47,
+        'in_statusbar': 1 << 48,
+        'text': 1 << 49,
+        'highlight': 1 << 50,
+        'in_taskview': 1 << 51,
+        'vcsfile': 1 << 52,
+        'vcsremote': 1 << 53,
+    },
+)
+
+
+def _allocate_color_pairs():
+    try:
+        import curses
+        from ranger.gui.color import COLOR_PAIRS, get_color
+
+        limit = curses.COLOR_PAIRS
+    except (ImportError, AttributeError):
+        return False
+
+    if _DEPTH is None:
+        _use_depth(_color_depth())
+    for pair in _COLOR_PAIRS:
+        if pair not in COLOR_PAIRS:
+            if len(COLOR_PAIRS) >= limit:
+                break
+            get_color(*pair)
+    return True
+
+
+def _allocate_when_ready():
+    # ranger creates the scheme while reading rc.conf, before it starts curses.
+    try:
+        import ranger.api
+    except ImportError:
+        return
+    hook_ready = ranger.api.hook_ready
+
+    def allocate_then_hook_ready(fm):
+        _allocate_color_pairs()
+        return hook_ready(fm)
+
+    ranger.api.hook_ready = allocate_then_hook_ready
+
+
+# Generated by build.py: (fg, bg, attr) for each context-flag bitmask, at each
+# color depth; only the terminal's is built.
+
+def _colors_truecolor():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (15725045, 13422810, 0),
+        0x400000000002: (15725045, 13766457, 0),
+        0x400000000003: (15725045, 13766457, 0),
+        0x400000000004: (15725045, 13766457, 0),
+        0x400000000005: (15725045, 13766457, 0),
+        0x400000000006: (15725045, 13766457, 0),
+        0x400000000008: (1992437, 13766457, 0),
+        0x400000000009: (1992437, 13766457, 0),
+        0x40000000000a: (1992437, 13766457, 0),
+        0x40000000000c: (1992437, 13766457, 0),
+        0x400000000010: (8927727, -1, 0),
+        0x400000000011: (8927727, 13422810, 0),
+        0x400000000012: (8927727, 13766457, 0),
+        0x400000000014: (8927727, 13766457, 0),
+        0x400000000018: (8927727, 13766457, 0),
+        0x400000000020: (4235307, -1, 0),
+        0x400000000021: (4235307, 13422810, 0),
+        0x400000000022: (4235307, 13766457, 0),
+        0x400000000024: (4235307, 13766457, 0),
+        0x400000000028: (4235307, 13766457, 0),
+        0x400000000030: (4235307, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (15725045, 13422810, 0),
+        0x400000000042: (15725045, 13766457, 0),
+        0x400000000044: (15725045, 13766457, 0),
+        0x400000000048: (1992437, 13766457, 0),
+        0x400000000050: (8927727, -1, 0),
+        0x400000000060: (14650909, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (15725045, 13422810, 0),
+        0x400000000082: (15725045, 13766457, 0),
+        0x400000000084: (15725045, 13766457, 0),
+        0x400000000088: (1992437, 13766457, 0),
+        0x400000000090: (8927727, -1, 0),
+        0x4000000000a0: (13766457, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (15725045, 13422810, 0),
+        0x400000000102: (15725045, 13766457, 0),
+        0x400000000104: (15725045, 13766457, 0),
+        0x400000000108: (1992437, 13766457, 0),
+        0x400000000110: (8927727, -1, 0),
+        0x400000000120: (1544857, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (15091027, -1, 2097152),
+        0x400000000201: (15091027, 13422810, 2097152),
+        0x400000000202: (15091027, 13766457, 2097152),
+        0x400000000204: (15091027, 13766457, 2097152),
+        0x400000000208: (15091027, 13766457, 2097152),
+        0x400000000210: (15091027, -1, 2097152),
+        0x400000000220: (15091027, -1, 2097152),
+        0x400000000240: (15091027, -1, 2097152),
+        0x400000000280: (15091027, -1, 2097152),
+        0x400000000300: (15091027, -1, 2097152),
+        0x400000000400: (2138037, -1, 2097152),
+        0x400000000401: (2138037, 13422810, 2097152),
+        0x400000000402: (2138037, 13766457, 2097152),
+        0x400000000404: (2138037, 13766457, 2097152),
+        0x400000000408: (2138037, 13766457, 2097152),
+        0x400000000410: (2138037, -1, 2097152),
+        0x400000000420: (2138037, -1, 2097152),
+        0x400000000440: (2138037, -1, 2097152),
+        0x400000000480: (2138037, -1, 2097152),
+        0x400000000500: (2138037, -1, 2097152),
+        0x400000000600: (2138037, -1, 2097152),
+        0x400000000800: (4235307, -1, 2097152),
+        0x400000000801: (4235307, 13422810, 2097152),
+        0x400000000802: (4235307, 13766457, 2097152),
+        0x400000000804: (4235307, 13766457, 2097152),
+        0x400000000808: (4235307, 13766457, 2097152),
+        0x400000000810: (4235307, -1, 2097152),
+        0x400000000820: (4235307, -1, 0),
+        0x400000000840: (4235307, -1, 2097152),
+        0x400000000880: (4235307, -1, 2097152),
+        0x400000000900: (4235307, -1, 2097152),
+        0x400000000a00: (15091027, -1, 2097152),
+        0x400000000c00: (2138037, -1, 2097152),
+        0x400000001000: (14650909, -1, 0),
+        0x400000001001: (14650909, 13422810, 0),
+        0x400000001002: (14650909, 13766457, 0),
+        0x400000001004: (14650909, 13766457, 0),
+        0x400000001008: (14650909, 13766457, 0),
+        0x400000001010: (14650909, -1, 0),
+        0x400000001020: (14650909, -1, 0),
+        0x400000001040: (14650909, -1, 0),
+        0x400000001080: (14650909, -1, 0),
+        0x400000001100: (14650909, -1, 0),
+        0x400000001200: (14650909, -1, 2097152),
+        0x400000001400: (14650909, -1, 2097152),
+        0x400000001800: (14650909, -1, 0),
+        0x400000002000: (15365835, -1, 2097152),
+        0x400000002001: (15365835, 13422810, 2097152),
+        0x400000002002: (15365835, 13766457, 2097152),
+        0x400000002004: (15365835, 13766457, 2097152),
+        0x400000002008: (15365835, 13766457, 2097152),
+        0x400000002010: (15365835, -1, 2097152),
+        0x400000002020: (15365835, -1, 2097152),
+        0x400000002040: (15365835, -1, 2097152),
+        0x400000002080: (15365835, -1, 2097152),
+        0x400000002100: (15365835, -1, 2097152),
+        0x400000002200: (15365835, -1, 2097152),
+        0x400000002400: (15365835, -1, 2097152),
+        0x400000002800: (15365835, -1, 2097152),
+        0x400000003000: (14650909, -1, 2097152),
+        0x400000004000: (14650909, -1, 2097152),
+        0x400000004001: (14650909, 13422810, 2097152),
+        0x400000004002: (14650909, 13766457, 2097152),
+        0x400000004004: (14650909, 13766457, 2097152),
+        0x400000004008: (14650909, 13766457, 2097152),
+        0x400000004010: (14650909, -1, 2097152),
+        0x400000004020: (14650909, -1, 2097152),
+        0x400000004040: (14650909, -1, 2097152),
+        0x400000004080: (14650909, -1, 2097152),
+        0x400000004100: (14650909, -1, 2097152),
+        0x400000004200: (14650909, -1, 2097152),
+        0x400000004400: (14650909, -1, 2097152),
+        0x400000004800: (14650909, -1, 2097152),
+        0x400000005000: (14650909, -1, 2097152),
+        0x400000006000: (14650909, -1, 2097152),
+        0x400000008000: (8927727, -1, 0),
+        0x400000008001: (8927727, 13422810, 0),
+        0x400000008002: (8927727, 13766457, 0),
+        0x400000008004: (8927727, 13766457, 0),
+        0x400000008008: (8927727, 13766457, 0),
+        0x400000008010: (8927727, -1, 0),
+        0x400000008020: (8927727, -1, 0),
+        0x400000008040: (8927727, -1, 0),
+        0x400000008080: (8927727, -1, 0),
+        0x400000008100: (8927727, -1, 0),
+        0x400000008200: (8927727, -1, 2097152),
+        0x400000008400: (8927727, -1, 2097152),
+        0x400000008800: (8927727, -1, 2097152),
+        0x400000009000: (8927727, -1, 0),
+        0x40000000a000: (8927727, -1, 2097152),
+        0x40000000c000: (8927727, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (15725045, 13422810, 0),
+        0x400000010002: (15725045, 13766457, 0),
+        0x400000010004: (15725045, 13766457, 0),
+        0x400000010008: (1992437, 13766457, 0),
+        0x400000010010: (8927727, -1, 0),
+        0x400000010020: (4235307, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (15091027, -1, 2097152),
+        0x400000010400: (2138037, -1, 2097152),
+        0x400000010800: (4235307, -1, 2097152),
+        0x400000011000: (14650909, -1, 0),
+        0x400000012000: (15365835, -1, 2097152),
+        0x400000014000: (14650909, -1, 2097152),
+        0x400000018000: (1544857, -1, 0),
+        0x400000020000: (13766457, -1, 2097152),
+        0x400000020001: (15725045, 13422810, 0),
+        0x400000020002: (13766457, 13766457, 2097152),
+        0x400000020004: (13766457, 13766457, 2097152),
+        0x400000020008: (13766457, 13766457, 2097152),
+        0x400000020010: (13766457, -1, 2097152),
+        0x400000020020: (13766457, -1, 2097152),
+        0x400000020040: (13766457, -1, 2097152),
+        0x400000020080: (13766457, -1, 2097152),
+        0x400000020100: (13766457, -1, 2097152),
+        0x400000020200: (16777215, -1, 2097152),
+        0x400000020400: (13766457, -1, 2097152),
+        0x400000020800: (13766457, -1, 2097152),
+        0x400000021000: (13766457, -1, 2097152),
+        0x400000022000: (16777215, -1, 2097152),
+        0x400000024000: (13766457, -1, 2097152),
+        0x400000028000: (13766457, -1, 2097152),
+        0x400000030000: (13766457, -1, 2097152),
+        0x400000040000: (9211809, -1, 2097152),
+        0x400000040001: (15725045, 13422810, 0),
+        0x400000040002: (9211809, 13766457, 2097152),
+        0x400000040004: (9211809, 13766457, 2097152),
+        0x400000040008: (9211809, 13766457, 2097152),
+        0x400000040010: (9211809, -1, 2097152),
+        0x400000040020: (9211809, -1, 2097152),
+        0x400000040040: (9211809, -1, 2097152),
+        0x400000040080: (9211809, -1, 2097152),
+        0x400000040100: (9211809, -1, 2097152),
+        0x400000040200: (9211809, -1, 2097152),
+        0x400000040400: (9211809, -1, 2097152),
+        0x400000040800: (9211809, -1, 2097152),
+        0x400000041000: (9211809, -1, 2097152),
+        0x400000042000: (9211809, -1, 2097152),
+        0x400000044000: (9211809, -1, 2097152),
+        0x400000048000: (9211809, -1, 2097152),
+        0x400000050000: (9211809, -1, 2097152),
+        0x400000060000: (9211809, -1, 2097152),
+        0x400000080000: (9211809, -1, 2097152),
+        0x400000080001: (15725045, 13422810, 0),
+        0x400000080002: (9211809, 13766457, 2097152),
+        0x400000080004: (9211809, 13766457, 2097152),
+        0x400000080008: (9211809, 13766457, 2097152),
+        0x400000080010: (9211809, -1, 2097152),
+        0x400000080020: (9211809, -1, 2097152),
+        0x400000080040: (9211809, -1, 2097152),
+        0x400000080080: (9211809, -1, 2097152),
+        0x400000080100: (9211809, -1, 2097152),
+        0x400000080200: (9211809, -1, 2097152),
+        0x400000080400: (9211809, -1, 2097152),
+        0x400000080800: (9211809, -1, 2097152),
+        0x400000081000: (9211809, -1, 2097152),
+        0x400000082000: (9211809, -1, 2097152),
+        0x400000084000: (9211809, -1, 2097152),
+        0x400000088000: (9211809, -1, 2097152),
+        0x400000090000: (9211809, -1, 2097152),
+        0x4000000a0000: (9211809, -1, 2097152),
+        0x4000000c0000: (9211809, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (15725045, 13422810, 2097152),
+        0x400000100002: (15725045, 13766457, 0),
+        0x400000100004: (15725045, 13766457, 0),
+        0x400000100008: (1992437, 13766457, 0),
+        0x400000100010: (8927727, -1, 0),
+        0x400000100020: (4235307, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (15091027, -1, 2097152),
+        0x400000100400: (2138037, -1, 2097152),
+        0x400000100800: (4235307, -1, 2097152),
+        0x400000101000: (14650909, -1, 0),
+        0x400000102000: (15365835, -1, 2097152),
+        0x400000104000: (14650909, -1, 2097152),
+        0x400000108000: (8927727, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (13766457, -1, 2097152),
+        0x400000140000: (9211809, -1, 2097152),
+        0x400000180000: (9211809, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (15725045, 13422810, 0),
+        0x400000200002: (15725045, 13766457, 0),
+        0x400000200004: (15725045, 13766457, 0),
+        0x400000200008: (1992437, 13766457, 0),
+        0x400000200010: (8927727, -1, 0),
+        0x400000200020: (4235307, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (15091027, -1, 2097152),
+        0x400000200400: (2138037, -1, 2097152),
+        0x400000200800: (4235307, -1, 2097152),
+        0x400000201000: (14650909, -1, 0),
+        0x400000202000: (15365835, -1, 2097152),
+        0x400000204000: (14650909, -1, 2097152),
+        0x400000208000: (8927727, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (13766457, -1, 2097152),
+        0x400000240000: (9211809, -1, 2097152),
+        0x400000280000: (9211809, -1, 2097152),
+        0x400000300000: (14650909, -1, 2097152),
+        0x400000400000: (15365835, -1, 0),
+        0x400000400001: (15365835, 13422810, 0),
+        0x400000400002: (15365835, 13766457, 0),
+        0x400000400004: (15365835, 13766457, 0),
+        0x400000400008: (15365835, 13766457, 0),
+        0x400000400010: (15365835, -1, 0),
+        0x400000400020: (15365835, -1, 0),
+        0x400000400040: (15365835, -1, 0),
+        0x400000400080: (15365835, -1, 0),
+        0x400000400100: (15365835, -1, 0),
+        0x400000400200: (15365835, -1, 2097152),
+        0x400000400400: (15365835, -1, 2097152),
+        0x400000400800: (15365835, -1, 2097152),
+        0x400000401000: (15365835, -1, 0),
+        0x400000402000: (15365835, -1, 2097152),
+        0x400000404000: (15365835, -1, 2097152),
+        0x400000408000: (15365835, -1, 0),
+        0x400000410000: (15365835, -1, 0),
+        0x400000420000: (15365835, -1, 2097152),
+        0x400000440000: (15365835, -1, 2097152),
+        0x400000480000: (15365835, -1, 2097152),
+        0x400000500000: (15365835, -1, 0),
+        0x400000600000: (15365835, -1, 0),
+        0x400000800000: (1544857, -1, 0),
+        0x400000800001: (1544857, 13422810, 0),
+        0x400000800002: (1544857, 13766457, 0),
+        0x400000800004: (1544857, 13766457, 0),
+        0x400000800008: (1544857, 13766457, 0),
+        0x400000800010: (1544857, -1, 0),
+        0x400000800020: (1544857, -1, 0),
+        0x400000800040: (1544857, -1, 0),
+        0x400000800080: (1544857, -1, 0),
+        0x400000800100: (1544857, -1, 0),
+        0x400000800200: (1544857, -1, 2097152),
+        0x400000800400: (1544857, -1, 2097152),
+        0x400000800800: (1544857, -1, 2097152),
+        0x400000801000: (1544857, -1, 0),
+        0x400000802000: (1544857, -1, 2097152),
+        0x400000804000: (1544857, -1, 2097152),
+        0x400000808000: (1544857, -1, 0),
+        0x400000810000: (1544857, -1, 0),
+        0x400000820000: (1544857, -1, 2097152),
+        0x400000840000: (1544857, -1, 2097152),
+        0x400000880000: (1544857, -1, 2097152),
+        0x400000900000: (1544857, -1, 0),
+        0x400000a00000: (1544857, -1, 0),
+        0x400000c00000: (1544857, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (1992437, -1, 2097152),
+        0x800000008000: (1544857, -1, 2097152),
+        0x800000008400: (1992437, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (1992437, -1, 2097152),
+        0x800000018000: (1544857, -1, 2097152),
+        0x800001000000: (4235307, -1, 2097152),
+        0x800001000400: (4235307, -1, 2097152),
+        0x800001008000: (4235307, -1, 2097152),
+        0x800001010000: (4235307, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (1992437, -1, 2097152),
+        0x800002008000: (1544857, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (13766457, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (1992437, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 4235307, 2097152),
+        0x800005000000: (4235307, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (14650909, -1, 2359296),
+        0x1000000210000: (14650909, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (14650909, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (4235307, -1, 0),
+        0x1000008200000: (14650909, -1, 2359296),
+        0x100000a000000: (9211809, 15365835, 0),
+        0x1000010000000: (1544857, -1, 2359296),
+        0x1000010010000: (1544857, -1, 2359296),
+        0x1000010200000: (1544857, -1, 2359296),
+        0x1000012000000: (1544857, -1, 2359296),
+        0x1000018000000: (1544857, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (14650909, -1, 2359296),
+        0x1000022000000: (13766457, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (1544857, -1, 2359296),
+        0x1000040000000: (-1, 1992437, 0),
+        0x1000040010000: (-1, 1992437, 0),
+        0x1000040200000: (14650909, 1992437, 2359296),
+        0x1000042000000: (-1, 1992437, 0),
+        0x1000048000000: (-1, 1992437, 0),
+        0x1000050000000: (1544857, 1992437, 2359296),
+        0x1000060000000: (-1, 1992437, 0),
+        0x1000080000000: (1992437, -1, 0),
+        0x1000080010000: (1992437, -1, 0),
+        0x1000080200000: (1992437, -1, 262144),
+        0x1000082000000: (1992437, -1, 0),
+        0x1000088000000: (1992437, -1, 0),
+        0x1000090000000: (1992437, -1, 262144),
+        0x10000a0000000: (1992437, -1, 0),
+        0x10000c0000000: (1992437, 1992437, 0),
+        0x1000100000000: (14650909, -1, 0),
+        0x1000100010000: (14650909, -1, 0),
+        0x1000100200000: (14650909, -1, 262144),
+        0x1000102000000: (14650909, -1, 0),
+        0x1000108000000: (14650909, -1, 0),
+        0x1000110000000: (14650909, -1, 262144),
+        0x1000120000000: (14650909, -1, 0),
+        0x1000140000000: (14650909, 1992437, 0),
+        0x1000180000000: (14650909, -1, 0),
+        0x1000200000000: (1544857, -1, 0),
+        0x1000200010000: (1544857, -1, 0),
+        0x1000200200000: (1544857, -1, 262144),
+        0x1000202000000: (1544857, -1, 0),
+        0x1000208000000: (1544857, -1, 0),
+        0x1000210000000: (1544857, -1, 262144),
+        0x1000220000000: (1544857, -1, 0),
+        0x1000240000000: (1544857, 1992437, 0),
+        0x1000280000000: (1544857, -1, 0),
+        0x1000300000000: (1544857, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 1992437, 0),
+        0x8000040000001: (1992437, -1, 262144),
+        0x8000400000000: (1992437, -1, 0),
+        0x8000400000001: (1992437, -1, 262144),
+        0x8000440000000: (1992437, 1992437, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (15365835, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (13766457, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (15365835, -1, 0),
+        0x10002000000000: (13766457, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (15365835, -1, 0),
+        0x10003000000000: (13766457, -1, 0),
+        0x10004000000000: (4235307, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (15365835, -1, 0),
+        0x10005000000000: (13766457, -1, 0),
+        0x10006000000000: (13766457, -1, 0),
+        0x10008000000000: (4235307, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (15365835, -1, 0),
+        0x10009000000000: (13766457, -1, 0),
+        0x1000a000000000: (13766457, -1, 0),
+        0x1000c000000000: (4235307, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (15365835, -1, 0),
+        0x10011000000000: (13766457, -1, 0),
+        0x10012000000000: (13766457, -1, 0),
+        0x10014000000000: (4235307, -1, 0),
+        0x10018000000000: (4235307, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (13766457, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (4235307, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (4235307, -1, 0),
+        0x20020000000000: (4235307, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (4235307, -1, 0),
+        0x20028000000000: (4235307, -1, 0),
+        0x20040000000000: (13766457, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (13766457, -1, 0),
+        0x20048000000000: (4235307, -1, 0),
+        0x20060000000000: (4235307, -1, 0),
+        0x20080000000000: (1544857, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (1544857, -1, 0),
+        0x20088000000000: (4235307, -1, 0),
+        0x200a0000000000: (4235307, -1, 0),
+        0x200c0000000000: (13766457, -1, 0),
+        0x20100000000000: (15365835, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (15365835, -1, 0),
+        0x20108000000000: (4235307, -1, 0),
+        0x20120000000000: (4235307, -1, 0),
+        0x20140000000000: (13766457, -1, 0),
+        0x20180000000000: (1544857, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_256():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (231, 188, 0),
+        0x400000000002: (231, 161, 0),
+        0x400000000003: (231, 161, 0),
+        0x400000000004: (231, 161, 0),
+        0x400000000005: (231, 161, 0),
+        0x400000000006: (231, 161, 0),
+        0x400000000008: (27, 161, 0),
+        0x400000000009: (27, 161, 0),
+        0x40000000000a: (27, 161, 0),
+        0x40000000000c: (27, 161, 0),
+        0x400000000010: (99, -1, 0),
+        0x400000000011: (99, 188, 0),
+        0x400000000012: (99, 161, 0),
+        0x400000000014: (99, 161, 0),
+        0x400000000018: (99, 161, 0),
+        0x400000000020: (70, -1, 0),
+        0x400000000021: (70, 188, 0),
+        0x400000000022: (70, 161, 0),
+        0x400000000024: (70, 161, 0),
+        0x400000000028: (70, 161, 0),
+        0x400000000030: (70, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (231, 188, 0),
+        0x400000000042: (231, 161, 0),
+        0x400000000044: (231, 161, 0),
+        0x400000000048: (27, 161, 0),
+        0x400000000050: (99, -1, 0),
+        0x400000000060: (172, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (231, 188, 0),
+        0x400000000082: (231, 161, 0),
+        0x400000000084: (231, 161, 0),
+        0x400000000088: (27, 161, 0),
+        0x400000000090: (99, -1, 0),
+        0x4000000000a0: (161, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (231, 188, 0),
+        0x400000000102: (231, 161, 0),
+        0x400000000104: (231, 161, 0),
+        0x400000000108: (27, 161, 0),
+        0x400000000110: (99, -1, 0),
+        0x400000000120: (30, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (167, -1, 2097152),
+        0x400000000201: (167, 188, 2097152),
+        0x400000000202: (167, 161, 2097152),
+        0x400000000204: (167, 161, 2097152),
+        0x400000000208: (167, 161, 2097152),
+        0x400000000210: (167, -1, 2097152),
+        0x400000000220: (167, -1, 2097152),
+        0x400000000240: (167, -1, 2097152),
+        0x400000000280: (167, -1, 2097152),
+        0x400000000300: (167, -1, 2097152),
+        0x400000000400: (37, -1, 2097152),
+        0x400000000401: (37, 188, 2097152),
+        0x400000000402: (37, 161, 2097152),
+        0x400000000404: (37, 161, 2097152),
+        0x400000000408: (37, 161, 2097152),
+        0x400000000410: (37, -1, 2097152),
+        0x400000000420: (37, -1, 2097152),
+        0x400000000440: (37, -1, 2097152),
+        0x400000000480: (37, -1, 2097152),
+        0x400000000500: (37, -1, 2097152),
+        0x400000000600: (37, -1, 2097152),
+        0x400000000800: (70, -1, 2097152),
+        0x400000000801: (70, 188, 2097152),
+        0x400000000802: (70, 161, 2097152),
+        0x400000000804: (70, 161, 2097152),
+        0x400000000808: (70, 161, 2097152),
+        0x400000000810: (70, -1, 2097152),
+        0x400000000820: (70, -1, 0),
+        0x400000000840: (70, -1, 2097152),
+        0x400000000880: (70, -1, 2097152),
+        0x400000000900: (70, -1, 2097152),
+        0x400000000a00: (167, -1, 2097152),
+        0x400000000c00: (37, -1, 2097152),
+        0x400000001000: (172, -1, 0),
+        0x400000001001: (172, 188, 0),
+        0x400000001002: (172, 161, 0),
+        0x400000001004: (172, 161, 0),
+        0x400000001008: (172, 161, 0),
+        0x400000001010: (172, -1, 0),
+        0x400000001020: (172, -1, 0),
+        0x400000001040: (172, -1, 0),
+        0x400000001080: (172, -1, 0),
+        0x400000001100: (172, -1, 0),
+        0x400000001200: (172, -1, 2097152),
+        0x400000001400: (172, -1, 2097152),
+        0x400000001800: (172, -1, 0),
+        0x400000002000: (176, -1, 2097152),
+        0x400000002001: (176, 188, 2097152),
+        0x400000002002: (176, 161, 2097152),
+        0x400000002004: (176, 161, 2097152),
+        0x400000002008: (176, 161, 2097152),
+        0x400000002010: (176, -1, 2097152),
+        0x400000002020: (176, -1, 2097152),
+        0x400000002040: (176, -1, 2097152),
+        0x400000002080: (176, -1, 2097152),
+        0x400000002100: (176, -1, 2097152),
+        0x400000002200: (176, -1, 2097152),
+        0x400000002400: (176, -1, 2097152),
+        0x400000002800: (176, -1, 2097152),
+        0x400000003000: (172, -1, 2097152),
+        0x400000004000: (172, -1, 2097152),
+        0x400000004001: (172, 188, 2097152),
+        0x400000004002: (172, 161, 2097152),
+        0x400000004004: (172, 161, 2097152),
+        0x400000004008: (172, 161, 2097152),
+        0x400000004010: (172, -1, 2097152),
+        0x400000004020: (172, -1, 2097152),
+        0x400000004040: (172, -1, 2097152),
+        0x400000004080: (172, -1, 2097152),
+        0x400000004100: (172, -1, 2097152),
+        0x400000004200: (172, -1, 2097152),
+        0x400000004400: (172, -1, 2097152),
+        0x400000004800: (172, -1, 2097152),
+        0x400000005000: (172, -1, 2097152),
+        0x400000006000: (172, -1, 2097152),
+        0x400000008000: (99, -1, 0),
+        0x400000008001: (99, 188, 0),
+        0x400000008002: (99, 161, 0),
+        0x400000008004: (99, 161, 0),
+        0x400000008008: (99, 161, 0),
+        0x400000008010: (99, -1, 0),
+        0x400000008020: (99, -1, 0),
+        0x400000008040: (99, -1, 0),
+        0x400000008080: (99, -1, 0),
+        0x400000008100: (99, -1, 0),
+        0x400000008200: (99, -1, 2097152),
+        0x400000008400: (99, -1, 2097152),
+        0x400000008800: (99, -1, 2097152),
+        0x400000009000: (99, -1, 0),
+        0x40000000a000: (99, -1, 2097152),
+        0x40000000c000: (99, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (231, 188, 0),
+        0x400000010002: (231, 161, 0),
+        0x400000010004: (231, 161, 0),
+        0x400000010008: (27, 161, 0),
+        0x400000010010: (99, -1, 0),
+        0x400000010020: (70, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (167, -1, 2097152),
+        0x400000010400: (37, -1, 2097152),
+        0x400000010800: (70, -1, 2097152),
+        0x400000011000: (172, -1, 0),
+        0x400000012000: (176, -1, 2097152),
+        0x400000014000: (172, -1, 2097152),
+        0x400000018000: (30, -1, 0),
+        0x400000020000: (161, -1, 2097152),
+        0x400000020001: (231, 188, 0),
+        0x400000020002: (161, 161, 2097152),
+        0x400000020004: (161, 161, 2097152),
+        0x400000020008: (161, 161, 2097152),
+        0x400000020010: (161, -1, 2097152),
+        0x400000020020: (161, -1, 2097152),
+        0x400000020040: (161, -1, 2097152),
+        0x400000020080: (161, -1, 2097152),
+        0x400000020100: (161, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (161, -1, 2097152),
+        0x400000020800: (161, -1, 2097152),
+        0x400000021000: (161, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (161, -1, 2097152),
+        0x400000028000: (161, -1, 2097152),
+        0x400000030000: (161, -1, 2097152),
+        0x400000040000: (103, -1, 2097152),
+        0x400000040001: (231, 188, 0),
+        0x400000040002: (103, 161, 2097152),
+        0x400000040004: (103, 161, 2097152),
+        0x400000040008: (103, 161, 2097152),
+        0x400000040010: (103, -1, 2097152),
+        0x400000040020: (103, -1, 2097152),
+        0x400000040040: (103, -1, 2097152),
+        0x400000040080: (103, -1, 2097152),
+        0x400000040100: (103, -1, 2097152),
+        0x400000040200: (103, -1, 2097152),
+        0x400000040400: (103, -1, 2097152),
+        0x400000040800: (103, -1, 2097152),
+        0x400000041000: (103, -1, 2097152),
+        0x400000042000: (103, -1, 2097152),
+        0x400000044000: (103, -1, 2097152),
+        0x400000048000: (103, -1, 2097152),
+        0x400000050000: (103, -1, 2097152),
+        0x400000060000: (103, -1, 2097152),
+        0x400000080000: (103, -1, 2097152),
+        0x400000080001: (231, 188, 0),
+        0x400000080002: (103, 161, 2097152),
+        0x400000080004: (103, 161, 2097152),
+        0x400000080008: (103, 161, 2097152),
+        0x400000080010: (103, -1, 2097152),
+        0x400000080020: (103, -1, 2097152),
+        0x400000080040: (103, -1, 2097152),
+        0x400000080080: (103, -1, 2097152),
+        0x400000080100: (103, -1, 2097152),
+        0x400000080200: (103, -1, 2097152),
+        0x400000080400: (103, -1, 2097152),
+        0x400000080800: (103, -1, 2097152),
+        0x400000081000: (103, -1, 2097152),
+        0x400000082000: (103, -1, 2097152),
+        0x400000084000: (103, -1, 2097152),
+        0x400000088000: (103, -1, 2097152),
+        0x400000090000: (103, -1, 2097152),
+        0x4000000a0000: (103, -1, 2097152),
+        0x4000000c0000: (103, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (231, 188, 2097152),
+        0x400000100002: (231, 161, 0),
+        0x400000100004: (231, 161, 0),
+        0x400000100008: (27, 161, 0),
+        0x400000100010: (99, -1, 0),
+        0x400000100020: (70, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (167, -1, 2097152),
+        0x400000100400: (37, -1, 2097152),
+        0x400000100800: (70, -1, 2097152),
+        0x400000101000: (172, -1, 0),
+        0x400000102000: (176, -1, 2097152),
+        0x400000104000: (172, -1, 2097152),
+        0x400000108000: (99, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (161, -1, 2097152),
+        0x400000140000: (103, -1, 2097152),
+        0x400000180000: (103, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (231, 188, 0),
+        0x400000200002: (231, 161, 0),
+        0x400000200004: (231, 161, 0),
+        0x400000200008: (27, 161, 0),
+        0x400000200010: (99, -1, 0),
+        0x400000200020: (70, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (167, -1, 2097152),
+        0x400000200400: (37, -1, 2097152),
+        0x400000200800: (70, -1, 2097152),
+        0x400000201000: (172, -1, 0),
+        0x400000202000: (176, -1, 2097152),
+        0x400000204000: (172, -1, 2097152),
+        0x400000208000: (99, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (161, -1, 2097152),
+        0x400000240000: (103, -1, 2097152),
+        0x400000280000: (103, -1, 2097152),
+        0x400000300000: (172, -1, 2097152),
+        0x400000400000: (176, -1, 0),
+        0x400000400001: (176, 188, 0),
+        0x400000400002: (176, 161, 0),
+        0x400000400004: (176, 161, 0),
+        0x400000400008: (176, 161, 0),
+        0x400000400010: (176, -1, 0),
+        0x400000400020: (176, -1, 0),
+        0x400000400040: (176, -1, 0),
+        0x400000400080: (176, -1, 0),
+        0x400000400100: (176, -1, 0),
+        0x400000400200: (176, -1, 2097152),
+        0x400000400400: (176, -1, 2097152),
+        0x400000400800: (176, -1, 2097152),
+        0x400000401000: (176, -1, 0),
+        0x400000402000: (176, -1, 2097152),
+        0x400000404000: (176, -1, 2097152),
+        0x400000408000: (176, -1, 0),
+        0x400000410000: (176, -1, 0),
+        0x400000420000: (176, -1, 2097152),
+        0x400000440000: (176, -1, 2097152),
+        0x400000480000: (176, -1, 2097152),
+        0x400000500000: (176, -1, 0),
+        0x400000600000: (176, -1, 0),
+        0x400000800000: (30, -1, 0),
+        0x400000800001: (30, 188, 0),
+        0x400000800002: (30, 161, 0),
+        0x400000800004: (30, 161, 0),
+        0x400000800008: (30, 161, 0),
+        0x400000800010: (30, -1, 0),
+        0x400000800020: (30, -1, 0),
+        0x400000800040: (30, -1, 0),
+        0x400000800080: (30, -1, 0),
+        0x400000800100: (30, -1, 0),
+        0x400000800200: (30, -1, 2097152),
+        0x400000800400: (30, -1, 2097152),
+        0x400000800800: (30, -1, 2097152),
+        0x400000801000: (30, -1, 0),
+        0x400000802000: (30, -1, 2097152),
+        0x400000804000: (30, -1, 2097152),
+        0x400000808000: (30, -1, 0),
+        0x400000810000: (30, -1, 0),
+        0x400000820000: (30, -1, 2097152),
+        0x400000840000: (30, -1, 2097152),
+        0x400000880000: (30, -1, 2097152),
+        0x400000900000: (30, -1, 0),
+        0x400000a00000: (30, -1, 0),
+        0x400000c00000: (30, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (27, -1, 2097152),
+        0x800000008000: (30, -1, 2097152),
+        0x800000008400: (27, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (27, -1, 2097152),
+        0x800000018000: (30, -1, 2097152),
+        0x800001000000: (70, -1, 2097152),
+        0x800001000400: (70, -1, 2097152),
+        0x800001008000: (70, -1, 2097152),
+        0x800001010000: (70, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (27, -1, 2097152),
+        0x800002008000: (30, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (161, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (27, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 70, 2097152),
+        0x800005000000: (70, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (172, -1, 2359296),
+        0x1000000210000: (172, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (172, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (70, -1, 0),
+        0x1000008200000: (172, -1, 2359296),
+        0x100000a000000: (103, 176, 0),
+        0x1000010000000: (30, -1, 2359296),
+        0x1000010010000: (30, -1, 2359296),
+        0x1000010200000: (30, -1, 2359296),
+        0x1000012000000: (30, -1, 2359296),
+        0x1000018000000: (30, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (172, -1, 2359296),
+        0x1000022000000: (161, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (30, -1, 2359296),
+        0x1000040000000: (-1, 27, 0),
+        0x1000040010000: (-1, 27, 0),
+        0x1000040200000: (172, 27, 2359296),
+        0x1000042000000: (-1, 27, 0),
+        0x1000048000000: (-1, 27, 0),
+        0x1000050000000: (30, 27, 2359296),
+        0x1000060000000: (-1, 27, 0),
+        0x1000080000000: (27, -1, 0),
+        0x1000080010000: (27, -1, 0),
+        0x1000080200000: (27, -1, 262144),
+        0x1000082000000: (27, -1, 0),
+        0x1000088000000: (27, -1, 0),
+        0x1000090000000: (27, -1, 262144),
+        0x10000a0000000: (27, -1, 0),
+        0x10000c0000000: (27, 27, 0),
+        0x1000100000000: (172, -1, 0),
+        0x1000100010000: (172, -1, 0),
+        0x1000100200000: (172, -1, 262144),
+        0x1000102000000: (172, -1, 0),
+        0x1000108000000: (172, -1, 0),
+        0x1000110000000: (172, -1, 262144),
+        0x1000120000000: (172, -1, 0),
+        0x1000140000000: (172, 27, 0),
+        0x1000180000000: (172, -1, 0),
+        0x1000200000000: (30, -1, 0),
+        0x1000200010000: (30, -1, 0),
+        0x1000200200000: (30, -1, 262144),
+        0x1000202000000: (30, -1, 0),
+        0x1000208000000: (30, -1, 0),
+        0x1000210000000: (30, -1, 262144),
+        0x1000220000000: (30, -1, 0),
+        0x1000240000000: (30, 27, 0),
+        0x1000280000000: (30, -1, 0),
+        0x1000300000000: (30, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 27, 0),
+        0x8000040000001: (27, -1, 262144),
+        0x8000400000000: (27, -1, 0),
+        0x8000400000001: (27, -1, 262144),
+        0x8000440000000: (27, 27, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (176, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (161, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (176, -1, 0),
+        0x10002000000000: (161, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (176, -1, 0),
+        0x10003000000000: (161, -1, 0),
+        0x10004000000000: (70, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (176, -1, 0),
+        0x10005000000000: (161, -1, 0),
+        0x10006000000000: (161, -1, 0),
+        0x10008000000000: (70, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (176, -1, 0),
+        0x10009000000000: (161, -1, 0),
+        0x1000a000000000: (161, -1, 0),
+        0x1000c000000000: (70, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (176, -1, 0),
+        0x10011000000000: (161, -1, 0),
+        0x10012000000000: (161, -1, 0),
+        0x10014000000000: (70, -1, 0),
+        0x10018000000000: (70, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (161, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (70, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (70, -1, 0),
+        0x20020000000000: (70, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (70, -1, 0),
+        0x20028000000000: (70, -1, 0),
+        0x20040000000000: (161, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (161, -1, 0),
+        0x20048000000000: (70, -1, 0),
+        0x20060000000000: (70, -1, 0),
+        0x20080000000000: (30, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (30, -1, 0),
+        0x20088000000000: (70, -1, 0),
+        0x200a0000000000: (70, -1, 0),
+        0x200c0000000000: (161, -1, 0),
+        0x20100000000000: (176, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (176, -1, 0),
+        0x20108000000000: (70, -1, 0),
+        0x20120000000000: (70, -1, 0),
+        0x20140000000000: (161, -1, 0),
+        0x20180000000000: (30, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_16():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (15, 7, 0),
+        0x400000000002: (15, 9, 0),
+        0x400000000003: (15, 9, 0),
+        0x400000000004: (15, 9, 0),
+        0x400000000005: (15, 9, 0),
+        0x400000000006: (15, 9, 0),
+        0x400000000008: (12, 9, 0),
+        0x400000000009: (12, 9, 0),
+        0x40000000000a: (12, 9, 0),
+        0x40000000000c: (12, 9, 0),
+        0x400000000010: (12, -1, 0),
+        0x400000000011: (12, 7, 0),
+        0x400000000012: (12, 9, 0),
+        0x400000000014: (12, 9, 0),
+        0x400000000018: (12, 9, 0),
+        0x400000000020: (2, -1, 0),
+        0x400000000021: (2, 7, 0),
+        0x400000000022: (2, 9, 0),
+        0x400000000024: (2, 9, 0),
+        0x400000000028: (2, 9, 0),
+        0x400000000030: (2, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (15, 7, 0),
+        0x400000000042: (15, 9, 0),
+        0x400000000044: (15, 9, 0),
+        0x400000000048: (12, 9, 0),
+        0x400000000050: (12, -1, 0),
+        0x400000000060: (3, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (15, 7, 0),
+        0x400000000082: (15, 9, 0),
+        0x400000000084: (15, 9, 0),
+        0x400000000088: (12, 9, 0),
+        0x400000000090: (12, -1, 0),
+        0x4000000000a0: (9, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (15, 7, 0),
+        0x400000000102: (15, 9, 0),
+        0x400000000104: (15, 9, 0),
+        0x400000000108: (12, 9, 0),
+        0x400000000110: (12, -1, 0),
+        0x400000000120: (6, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (9, -1, 2097152),
+        0x400000000201: (9, 7, 2097152),
+        0x400000000202: (9, 9, 2097152),
+        0x400000000204: (9, 9, 2097152),
+        0x400000000208: (9, 9, 2097152),
+        0x400000000210: (9, -1, 2097152),
+        0x400000000220: (9, -1, 2097152),
+        0x400000000240: (9, -1, 2097152),
+        0x400000000280: (9, -1, 2097152),
+        0x400000000300: (9, -1, 2097152),
+        0x400000000400: (6, -1, 2097152),
+        0x400000000401: (6, 7, 2097152),
+        0x400000000402: (6, 9, 2097152),
+        0x400000000404: (6, 9, 2097152),
+        0x400000000408: (6, 9, 2097152),
+        0x400000000410: (6, -1, 2097152),
+        0x400000000420: (6, -1, 2097152),
+        0x400000000440: (6, -1, 2097152),
+        0x400000000480: (6, -1, 2097152),
+        0x400000000500: (6, -1, 2097152),
+        0x400000000600: (6, -1, 2097152),
+        0x400000000800: (2, -1, 2097152),
+        0x400000000801: (2, 7, 2097152),
+        0x400000000802: (2, 9, 2097152),
+        0x400000000804: (2, 9, 2097152),
+        0x400000000808: (2, 9, 2097152),
+        0x400000000810: (2, -1, 2097152),
+        0x400000000820: (2, -1, 0),
+        0x400000000840: (2, -1, 2097152),
+        0x400000000880: (2, -1, 2097152),
+        0x400000000900: (2, -1, 2097152),
+        0x400000000a00: (9, -1, 2097152),
+        0x400000000c00: (6, -1, 2097152),
+        0x400000001000: (3, -1, 0),
+        0x400000001001: (3, 7, 0),
+        0x400000001002: (3, 9, 0),
+        0x400000001004: (3, 9, 0),
+        0x400000001008: (3, 9, 0),
+        0x400000001010: (3, -1, 0),
+        0x400000001020: (3, -1, 0),
+        0x400000001040: (3, -1, 0),
+        0x400000001080: (3, -1, 0),
+        0x400000001100: (3, -1, 0),
+        0x400000001200: (3, -1, 2097152),
+        0x400000001400: (3, -1, 2097152),
+        0x400000001800: (3, -1, 0),
+        0x400000002000: (13, -1, 2097152),
+        0x400000002001: (13, 7, 2097152),
+        0x400000002002: (13, 9, 2097152),
+        0x400000002004: (13, 9, 2097152),
+        0x400000002008: (13, 9, 2097152),
+        0x400000002010: (13, -1, 2097152),
+        0x400000002020: (13, -1, 2097152),
+        0x400000002040: (13, -1, 2097152),
+        0x400000002080: (13, -1, 2097152),
+        0x400000002100: (13, -1, 2097152),
+        0x400000002200: (13, -1, 2097152),
+        0x400000002400: (13, -1, 2097152),
+        0x400000002800: (13, -1, 2097152),
+        0x400000003000: (3, -1, 2097152),
+        0x400000004000: (3, -1, 2097152),
+        0x400000004001: (3, 7, 2097152),
+        0x400000004002: (3, 9, 2097152),
+        0x400000004004: (3, 9, 2097152),
+        0x400000004008: (3, 9, 2097152),
+        0x400000004010: (3, -1, 2097152),
+        0x400000004020: (3, -1, 2097152),
+        0x400000004040: (3, -1, 2097152),
+        0x400000004080: (3, -1, 2097152),
+        0x400000004100: (3, -1, 2097152),
+        0x400000004200: (3, -1, 2097152),
+        0x400000004400: (3, -1, 2097152),
+        0x400000004800: (3, -1, 2097152),
+        0x400000005000: (3, -1, 2097152),
+        0x400000006000: (3, -1, 2097152),
+        0x400000008000: (12, -1, 0),
+        0x400000008001: (12, 7, 0),
+        0x400000008002: (12, 9, 0),
+        0x400000008004: (12, 9, 0),
+        0x400000008008: (12, 9, 0),
+        0x400000008010: (12, -1, 0),
+        0x400000008020: (12, -1, 0),
+        0x400000008040: (12, -1, 0),
+        0x400000008080: (12, -1, 0),
+        0x400000008100: (12, -1, 0),
+        0x400000008200: (12, -1, 2097152),
+        0x400000008400: (12, -1, 2097152),
+        0x400000008800: (12, -1, 2097152),
+        0x400000009000: (12, -1, 0),
+        0x40000000a000: (12, -1, 2097152),
+        0x40000000c000: (12, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (15, 7, 0),
+        0x400000010002: (15, 9, 0),
+        0x400000010004: (15, 9, 0),
+        0x400000010008: (12, 9, 0),
+        0x400000010010: (12, -1, 0),
+        0x400000010020: (2, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (9, -1, 2097152),
+        0x400000010400: (6, -1, 2097152),
+        0x400000010800: (2, -1, 2097152),
+        0x400000011000: (3, -1, 0),
+        0x400000012000: (13, -1, 2097152),
+        0x400000014000: (3, -1, 2097152),
+        0x400000018000: (6, -1, 0),
+        0x400000020000: (9, -1, 2097152),
+        0x400000020001: (15, 7, 0),
+        0x400000020002: (9, 9, 2097152),
+        0x400000020004: (9, 9, 2097152),
+        0x400000020008: (9, 9, 2097152),
+        0x400000020010: (9, -1, 2097152),
+        0x400000020020: (9, -1, 2097152),
+        0x400000020040: (9, -1, 2097152),
+        0x400000020080: (9, -1, 2097152),
+        0x400000020100: (9, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (9, -1, 2097152),
+        0x400000020800: (9, -1, 2097152),
+        0x400000021000: (9, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (9, -1, 2097152),
+        0x400000028000: (9, -1, 2097152),
+        0x400000030000: (9, -1, 2097152),
+        0x400000040000: (8, -1, 2097152),
+        0x400000040001: (15, 7, 0),
+        0x400000040002: (8, 9, 2097152),
+        0x400000040004: (8, 9, 2097152),
+        0x400000040008: (8, 9, 2097152),
+        0x400000040010: (8, -1, 2097152),
+        0x400000040020: (8, -1, 2097152),
+        0x400000040040: (8, -1, 2097152),
+        0x400000040080: (8, -1, 2097152),
+        0x400000040100: (8, -1, 2097152),
+        0x400000040200: (8, -1, 2097152),
+        0x400000040400: (8, -1, 2097152),
+        0x400000040800: (8, -1, 2097152),
+        0x400000041000: (8, -1, 2097152),
+        0x400000042000: (8, -1, 2097152),
+        0x400000044000: (8, -1, 2097152),
+        0x400000048000: (8, -1, 2097152),
+        0x400000050000: (8, -1, 2097152),
+        0x400000060000: (8, -1, 2097152),
+        0x400000080000: (8, -1, 2097152),
+        0x400000080001: (15, 7, 0),
+        0x400000080002: (8, 9, 2097152),
+        0x400000080004: (8, 9, 2097152),
+        0x400000080008: (8, 9, 2097152),
+        0x400000080010: (8, -1, 2097152),
+        0x400000080020: (8, -1, 2097152),
+        0x400000080040: (8, -1, 2097152),
+        0x400000080080: (8, -1, 2097152),
+        0x400000080100: (8, -1, 2097152),
+        0x400000080200: (8, -1, 2097152),
+        0x400000080400: (8, -1, 2097152),
+        0x400000080800: (8, -1, 2097152),
+        0x400000081000: (8, -1, 2097152),
+        0x400000082000: (8, -1, 2097152),
+        0x400000084000: (8, -1, 2097152),
+        0x400000088000: (8, -1, 2097152),
+        0x400000090000: (8, -1, 2097152),
+        0x4000000a0000: (8, -1, 2097152),
+        0x4000000c0000: (8, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (15, 7, 2097152),
+        0x400000100002: (15, 9, 0),
+        0x400000100004: (15, 9, 0),
+        0x400000100008: (12, 9, 0),
+        0x400000100010: (12, -1, 0),
+        0x400000100020: (2, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (9, -1, 2097152),
+        0x400000100400: (6, -1, 2097152),
+        0x400000100800: (2, -1, 2097152),
+        0x400000101000: (3, -1, 0),
+        0x400000102000: (13, -1, 2097152),
+        0x400000104000: (3, -1, 2097152),
+        0x400000108000: (12, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (9, -1, 2097152),
+        0x400000140000: (8, -1, 2097152),
+        0x400000180000: (8, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (15, 7, 0),
+        0x400000200002: (15, 9, 0),
+        0x400000200004: (15, 9, 0),
+        0x400000200008: (12, 9, 0),
+        0x400000200010: (12, -1, 0),
+        0x400000200020: (2, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (9, -1, 2097152),
+        0x400000200400: (6, -1, 2097152),
+        0x400000200800: (2, -1, 2097152),
+        0x400000201000: (3, -1, 0),
+        0x400000202000: (13, -1, 2097152),
+        0x400000204000: (3, -1, 2097152),
+        0x400000208000: (12, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (9, -1, 2097152),
+        0x400000240000: (8, -1, 2097152),
+        0x400000280000: (8, -1, 2097152),
+        0x400000300000: (3, -1, 2097152),
+        0x400000400000: (13, -1, 0),
+        0x400000400001: (13, 7, 0),
+        0x400000400002: (13, 9, 0),
+        0x400000400004: (13, 9, 0),
+        0x400000400008: (13, 9, 0),
+        0x400000400010: (13, -1, 0),
+        0x400000400020: (13, -1, 0),
+        0x400000400040: (13, -1, 0),
+        0x400000400080: (13, -1, 0),
+        0x400000400100: (13, -1, 0),
+        0x400000400200: (13, -1, 2097152),
+        0x400000400400: (13, -1, 2097152),
+        0x400000400800: (13, -1, 2097152),
+        0x400000401000: (13, -1, 0),
+        0x400000402000: (13, -1, 2097152),
+        0x400000404000: (13, -1, 2097152),
+        0x400000408000: (13, -1, 0),
+        0x400000410000: (13, -1, 0),
+        0x400000420000: (13, -1, 2097152),
+        0x400000440000: (13, -1, 2097152),
+        0x400000480000: (13, -1, 2097152),
+        0x400000500000: (13, -1, 0),
+        0x400000600000: (13, -1, 0),
+        0x400000800000: (6, -1, 0),
+        0x400000800001: (6, 7, 0),
+        0x400000800002: (6, 9, 0),
+        0x400000800004: (6, 9, 0),
+        0x400000800008: (6, 9, 0),
+        0x400000800010: (6, -1, 0),
+        0x400000800020: (6, -1, 0),
+        0x400000800040: (6, -1, 0),
+        0x400000800080: (6, -1, 0),
+        0x400000800100: (6, -1, 0),
+        0x400000800200: (6, -1, 2097152),
+        0x400000800400: (6, -1, 2097152),
+        0x400000800800: (6, -1, 2097152),
+        0x400000801000: (6, -1, 0),
+        0x400000802000: (6, -1, 2097152),
+        0x400000804000: (6, -1, 2097152),
+        0x400000808000: (6, -1, 0),
+        0x400000810000: (6, -1, 0),
+        0x400000820000: (6, -1, 2097152),
+        0x400000840000: (6, -1, 2097152),
+        0x400000880000: (6, -1, 2097152),
+        0x400000900000: (6, -1, 0),
+        0x400000a00000: (6, -1, 0),
+        0x400000c00000: (6, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (12, -1, 2097152),
+        0x800000008000: (6, -1, 2097152),
+        0x800000008400: (12, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (12, -1, 2097152),
+        0x800000018000: (6, -1, 2097152),
+        0x800001000000: (2, -1, 2097152),
+        0x800001000400: (2, -1, 2097152),
+        0x800001008000: (2, -1, 2097152),
+        0x800001010000: (2, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (12, -1, 2097152),
+        0x800002008000: (6, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (9, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (12, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 2, 2097152),
+        0x800005000000: (2, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (3, -1, 2359296),
+        0x1000000210000: (3, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (3, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (2, -1, 0),
+        0x1000008200000: (3, -1, 2359296),
+        0x100000a000000: (8, 13, 0),
+        0x1000010000000: (6, -1, 2359296),
+        0x1000010010000: (6, -1, 2359296),
+        0x1000010200000: (6, -1, 2359296),
+        0x1000012000000: (6, -1, 2359296),
+        0x1000018000000: (6, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (3, -1, 2359296),
+        0x1000022000000: (9, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (6, -1, 2359296),
+        0x1000040000000: (-1, 12, 0),
+        0x1000040010000: (-1, 12, 0),
+        0x1000040200000: (3, 12, 2359296),
+        0x1000042000000: (-1, 12, 0),
+        0x1000048000000: (-1, 12, 0),
+        0x1000050000000: (6, 12, 2359296),
+        0x1000060000000: (-1, 12, 0),
+        0x1000080000000: (12, -1, 0),
+        0x1000080010000: (12, -1, 0),
+        0x1000080200000: (12, -1, 262144),
+        0x1000082000000: (12, -1, 0),
+        0x1000088000000: (12, -1, 0),
+        0x1000090000000: (12, -1, 262144),
+        0x10000a0000000: (12, -1, 0),
+        0x10000c0000000: (12, 12, 0),
+        0x1000100000000: (3, -1, 0),
+        0x1000100010000: (3, -1, 0),
+        0x1000100200000: (3, -1, 262144),
+        0x1000102000000: (3, -1, 0),
+        0x1000108000000: (3, -1, 0),
+        0x1000110000000: (3, -1, 262144),
+        0x1000120000000: (3, -1, 0),
+        0x1000140000000: (3, 12, 0),
+        0x1000180000000: (3, -1, 0),
+        0x1000200000000: (6, -1, 0),
+        0x1000200010000: (6, -1, 0),
+        0x1000200200000: (6, -1, 262144),
+        0x1000202000000: (6, -1, 0),
+        0x1000208000000: (6, -1, 0),
+        0x1000210000000: (6, -1, 262144),
+        0x1000220000000: (6, -1, 0),
+        0x1000240000000: (6, 12, 0),
+        0x1000280000000: (6, -1, 0),
+        0x1000300000000: (6, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 12, 0),
+        0x8000040000001: (12, -1, 262144),
+        0x8000400000000: (12, -1, 0),
+        0x8000400000001: (12, -1, 262144),
+        0x8000440000000: (12, 12, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (13, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (9, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (13, -1, 0),
+        0x10002000000000: (9, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (13, -1, 0),
+        0x10003000000000: (9, -1, 0),
+        0x10004000000000: (2, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (13, -1, 0),
+        0x10005000000000: (9, -1, 0),
+        0x10006000000000: (9, -1, 0),
+        0x10008000000000: (2, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (13, -1, 0),
+        0x10009000000000: (9, -1, 0),
+        0x1000a000000000: (9, -1, 0),
+        0x1000c000000000: (2, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (13, -1, 0),
+        0x10011000000000: (9, -1, 0),
+        0x10012000000000: (9, -1, 0),
+        0x10014000000000: (2, -1, 0),
+        0x10018000000000: (2, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (9, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (2, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (2, -1, 0),
+        0x20020000000000: (2, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (2, -1, 0),
+        0x20028000000000: (2, -1, 0),
+        0x20040000000000: (9, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (9, -1, 0),
+        0x20048000000000: (2, -1, 0),
+        0x20060000000000: (2, -1, 0),
+        0x20080000000000: (6, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (6, -1, 0),
+        0x20088000000000: (2, -1, 0),
+        0x200a0000000000: (2, -1, 0),
+        0x200c0000000000: (9, -1, 0),
+        0x20100000000000: (13, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (13, -1, 0),
+        0x20108000000000: (2, -1, 0),
+        0x20120000000000: (2, -1, 0),
+        0x20140000000000: (9, -1, 0),
+        0x20180000000000: (6, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+_TABLES = {
+    'truecolor': _colors_truecolor,
+    '256': _colors_256,
+    '16': _colors_16,
+}
+
+# Generated by build.py: the code at each color depth of the colors
+# _evaluate() returns.
+_DEPTH_CODES = {
+    'truecolor': {15: 16777215, 1000: 15725045, 1001: 1992437, 1002: 14475496, 1003: 14514296, 1004: 4235307, 1005: 7505917, 1006: 15133167, 1007: 15091027, 1008: 8927727, 1009: 10264752, 1010: 9211809, 1011: 8159123, 1012: 16671755, 1013: 15365835, 1014: 13766457, 1015: 14453368, 1016: 2138037, 1017: 304613, 1018: 7106437, 1019: 6053751, 1020: 13422810, 1021: 12370124, 1022: 11317438, 1023: 1544857, 1024: 5001065, 1025: 14650909},
+    '256': {1000: 231, 1001: 27, 1002: 188, 1003: 174, 1004: 70, 1005: 69, 1006: 189, 1007: 167, 1008: 99, 1009: 145, 1010: 103, 1011: 102, 1012: 202, 1013: 176, 1014: 161, 1015: 174, 1016: 37, 1017: 38, 1018: 60, 1019: 60, 1020: 188, 1021: 146, 1022: 145, 1023: 30, 1024: 59, 1025: 172},
+    '16': {1000: 15, 1001: 12, 1002: 15, 1003: 9, 1004: 2, 1005: 8, 1006: 15, 1007: 9, 1008: 12, 1009: 7, 1010: 8, 1011: 8, 1012: 9, 1013: 13, 1014: 9, 1015: 9, 1016: 6, 1017: 8, 1018: 8, 1019: 8, 1020: 7, 1021: 7, 1022: 7, 1023: 6, 1024: 8, 1025: 3},
+}
+
+# Generated by build.py: the value of each color constant at each color depth.
+_DEPTH_CONSTANTS = {
+    'truecolor': {'BASE': 15725045, 'BLUE': 1992437, 'CRUST': 14475496, 'FLAMINGO': 14514296, 'GREEN': 4235307, 'LAVENDER': 7505917, 'MANTLE': 15133167, 'MAROON': 15091027, 'MAUVE': 8927727, 'OVERLAY_0': 10264752, 'OVERLAY_1': 9211809, 'OVERLAY_2': 8159123, 'PEACH': 16671755, 'PINK': 15365835, 'RED': 13766457, 'ROSEWATER': 14453368, 'SAPPHIRE': 2138037, 'SKY': 304613, 'SUBTEXT_0': 7106437, 'SUBTEXT_1': 6053751, 'SURFACE_0': 13422810, 'SURFACE_1': 12370124, 'SURFACE_2': 11317438, 'TEAL': 1544857, 'TEXT': 5001065, 'YELLOW': 14650909},
+    '256': {'BASE': 231, 'BLUE': 27, 'CRUST': 188, 'FLAMINGO': 174, 'GREEN': 70, 'LAVENDER': 69, 'MANTLE': 189, 'MAROON': 167, 'MAUVE': 99, 'OVERLAY_0': 145, 'OVERLAY_1': 103, 'OVERLAY_2': 102, 'PEACH': 202, 'PINK': 176, 'RED': 161, 'ROSEWATER': 174, 'SAPPHIRE': 37, 'SKY': 38, 'SUBTEXT_0': 60, 'SUBTEXT_1': 60, 'SURFACE_0': 188, 'SURFACE_1': 146, 'SURFACE_2': 145, 'TEAL': 30, 'TEXT': 59, 'YELLOW': 172},
+    '16': {'BASE': 15, 'BLUE': 12, 'CRUST': 15, 'FLAMINGO': 9, 'GREEN': 2, 'LAVENDER': 8, 'MANTLE': 15, 'MAROON': 9, 'MAUVE': 12, 'OVERLAY_0': 7, 'OVERLAY_1': 8, 'OVERLAY_2': 8, 'PEACH': 9, 'PINK': 13, 'RED': 9, 'ROSEWATER': 9, 'SAPPHIRE': 6, 'SKY': 8, 'SUBTEXT_0': 8, 'SUBTEXT_1': 8, 'SURFACE_0': 7, 'SURFACE_1': 7, 'SURFACE_2': 7, 'TEAL': 6, 'TEXT': 8, 'YELLOW': 3},
+}
+
+# Generated by build.py: every (fg, bg) use() can return, most common first,
+# at each color depth.
+_DEPTH_PAIRS = {
+    'truecolor': (
+        (-1, -1),
+        (-1, 1992437),
+        (15725045, 13766457),
+        (15725045, 13422810),
+        (1992437, -1),
+        (4235307, -1),
+        (15091027, -1),
+        (15365835, -1),
+        (13766457, -1),
+        (2138037, -1),
+        (1544857, -1),
+        (14650909, -1),
+        (-1, 4235307),
+        (16777215, -1),
+        (1992437, 1992437),
+        (1992437, 13766457),
+        (4235307, 13766457),
+        (4235307, 13422810),
+        (15091027, 13766457),
+        (15091027, 13422810),
+        (8927727, -1),
+        (9211809, -1),
+        (9211809, 15365835),
+        (2138037, 13766457),
+        (2138037, 13422810),
+        (1544857, 1992437),
+        (14650909, 1992437),
+        (14650909, 13422810),
+        (16777215, 13766457),
+        (1992437, 15365835),
+        (4235307, 1992437),
+        (8927727, 13766457),
+        (8927727, 13422810),
+        (9211809, 1992437),
+        (9211809, 13766457),
+        (15365835, 1992437),
+        (15365835, 13422810),
+        (13766457, 1992437),
+        (13766457, 15365835),
+        (13766457, 13766457),
+        (13766457, 13422810),
+        (1544857, 15365835),
+        (1544857, 13422810),
+        (14650909, 15365835),
+        (-1, 15365835),
+        (4235307, 4235307),
+        (4235307, 15365835),
+        (15365835, 4235307),
+        (15365835, 15365835),
+        (15365835, 13766457),
+        (13766457, 4235307),
+        (1544857, 4235307),
+        (1544857, 13766457),
+        (-1, 13766457),
+        (14650909, 13766457),
+    ),
+    '256': (
+        (-1, -1),
+        (-1, 27),
+        (231, 161),
+        (231, 188),
+        (27, -1),
+        (70, -1),
+        (167, -1),
+        (176, -1),
+        (161, -1),
+        (37, -1),
+        (30, -1),
+        (172, -1),
+        (-1, 70),
+        (15, -1),
+        (27, 27),
+        (27, 161),
+        (70, 161),
+        (70, 188),
+        (167, 161),
+        (167, 188),
+        (99, -1),
+        (103, -1),
+        (103, 176),
+        (37, 161),
+        (37, 188),
+        (30, 27),
+        (172, 27),
+        (172, 188),
+        (15, 161),
+        (27, 176),
+        (70, 27),
+        (99, 161),
+        (99, 188),
+        (103, 27),
+        (103, 161),
+        (176, 27),
+        (176, 188),
+        (161, 27),
+        (161, 176),
+        (161, 161),
+        (161, 188),
+        (30, 176),
+        (30, 188),
+        (172, 176),
+        (-1, 176),
+        (70, 70),
+        (70, 176),
+        (176, 70),
+        (176, 176),
+        (176, 161),
+        (161, 70),
+        (30, 70),
+        (30, 161),
+        (-1, 161),
+        (172, 161),
+    ),
+    '16': (
+        (-1, -1),
+        (-1, 12),
+        (15, 9),
+        (15, 7),
+        (12, -1),
+        (2, -1),
+        (9, -1),
+        (13, -1),
+        (6, -1),
+        (3, -1),
+        (-1, 2),
+        (15, -1),
+        (12, 12),
+        (12, 9),
+        (2, 9),
+        (2, 7),
+        (9, 9),
+        (9, 7),
+        (8, -1),
+        (8, 13),
+        (6, 9),
+        (6, 7),
+        (6, 12),
+        (3, 12),
+        (3, 7),
+        (12, 13),
+        (2, 12),
+        (12, 7),
+        (8, 12),
+        (8, 9),
+        (13, 12),
+        (13, 7),
+        (9, 12),
+        (9, 13),
+        (6, 13),
+        (3, 13),
+        (-1, 13),
+        (2, 2),
+        (2, 13),
+        (13, 2),
+        (13, 13),
+        (13, 9),
+        (9, 2),
+        (6, 2),
+        (-1, 9),
+        (3, 9),
+    ),
+}
+
+# Generated by build.py: for terminals with fewer colors than any table, the
+# table they use and the code each of its codes 0-15 becomes.
+_FEWER_COLORS = {'8': ('16', (0, 1, 2, 3, 4, 5, 6, 7, 0, 1, 2, 3, 4, 5, 6, 7)), 'monochrome': ('16', (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1))}
+
+# Generated by build.py: the least number of colors of each depth's terminals.
+_DEPTH_COLORS = ((16777216, 'truecolor'), (256, '256'), (16, '16'), (8, '8'), (0, 'monochrome'))
+
+
+def _color_depth():
+    # The terminal's, from its terminfo entry, unless set in the environment.
+    import os
+
+    depth = os.environ.get("CATPPUCCIN_RANGER_DEPTH")
+    if depth in _TABLES or depth in _FEWER_COLORS:
+        return depth
+    try:
+        import curses
+
+        try:
+            colors = curses.COLORS  # Only once curses is started.
+        except AttributeError:
+            curses.setupterm()
+            colors = curses.tigetnum("colors")  # -1 if it has none.
+    except Exception:  # No curses, no terminal, unknown $TERM, ...
+        return "256"
+    for least, depth in _DEPTH_COLORS:
+        if colors >= least:
+            break
+    return depth
+
+
+def _use_depth(depth):
+    global _DEPTH, _CODES, _COLORS, _COLORS_LIMIT, _COLOR_PAIRS
+    _DEPTH = depth
+    depth, fewer = _FEWER_COLORS.get(depth, (depth, None))
+    _CODES = _DEPTH_CODES[depth]
+    _COLORS = _TABLES[depth]()
+    constants = _DEPTH_CONSTANTS[depth]
+    _COLOR_PAIRS = _DEPTH_PAIRS[depth]
+    if fewer:
+
+        def convert(code):
+            return fewer[code] if 0 <= code < 16 else code
+
+        _CODES = {code: convert(value) for code, value in _CODES.items()}
+        _CODES.update((code, convert(code)) for code in range(16))
+        _COLORS = {
+            key: (convert(fg), convert(bg), attr)
+            for key, (fg, bg, attr) in _COLORS.items()
+        }
+        constants = {name: convert(code) for name, code in constants.items()}
+        _COLOR_PAIRS = tuple(
+            dict.fromkeys((convert(fg), convert(bg)) for fg, bg in _COLOR_PAIRS)
+        )
+    if reverse != 262144 or bold != 2097152:
+        _COLORS = {}
+    _COLORS_LIMIT = len(_COLORS) + 1024
+    globals().update(constants)
+    CatppuccinLatte.progress_bar_color = BLUE
+
+
+# Chosen by the first use() or color pair allocation, which ranger only does
+# once curses is started, so that importing the scheme leaves the terminal
+# alone.
+_DEPTH = None
+_COLORS = {}
@@ -0,0 +1,2023 @@
+# This file is part of ranger, the console file manager.
+# Available at https://github.com/ranger/ranger
+# License: GNU GPL version 3, see the file "AUTHORS" for details.
+# This theme was greatly inspired by "Dracula" for ranger
+# It can be found in: `https://github.com/dracula/ranger`
+
+from ranger.gui.color import bold, reverse
+from ranger.gui.colorscheme import ColorScheme
+
+ROSEWATER = 224
+FLAMINGO = 224
+PINK = 218
+MAUVE = 183
+RED = 211
+MAROON = 217
+PEACH = 216
+YELLOW = 223
+GREEN = 151
+TEAL = 116
+SKY = 117
+SAPPHIRE = 117
+BLUE = 111
+LAVENDER = 147
+TEXT = 189
+SUBTEXT_1 = 146
+SUBTEXT_0 = 146
+OVERLAY_2 = 103
+OVERLAY_1 = 103
+OVERLAY_0 = 60
+SURFACE_2 = 59
+SURFACE_1 = 59
+SURFACE_0 = 59
+BASE = 16
+MANTLE = 16
+CRUST = 16
+
+
+class CatppuccinMocha(ColorScheme):
+    progress_bar_color = BLUE
+
+
+
+
+
+
+
+    def _evaluate(self, context):
+        fg, bg, attr = (-1, -1, 0)
+        if context.reset:
+            return (-1, -1, 0)
+        elif context.in_browser:
+            if context.selected:
+                bg = 1020
+                fg = 1000
+                attr &= ~bold
+            else:
+                attr = 0
+            if context.empty or context.error:
+                bg = 1014
+                fg = 1000
+            if context.border:
+                fg = 1001
+                bg = 1014
+            if context.document:
+                fg = 1008
+            if context.media:
+                if context.image:
+                    fg = 1025
+                elif context.video:
+                    fg = 1014
+                elif context.audio:
+                    fg = 1023
+                else:
+                    fg = 1004
+            if context.container:
+                attr |= bold
+                fg = 1007
+            if context.directory:
+                attr |= bold
+                fg = 1016
+            elif context.executable and (not any((context.media, context.container, context.fifo, context.socket))):
+                attr |= bold
+                fg = 1004
+            if context.socket:
+                fg = 1013
+                attr |= bold
+            if context.fifo or context.device:
+                fg = 1025
+                if context.device:
+                    attr |= bold
+            if context.link:
+                fg = 1023 if context.good else 1008
+            if context.tag_marker and (not context.selected):
+                attr |= bold
+                if fg in (1014, 1013, 1007):
+                    fg = 15
+                else:
+                    fg = 1014
+            if not context.selected and (context.cut or context.copied):
+                fg = 1010
+                attr |= bold
+            if context.main_column:
+                if context.selected:
+                    attr |= bold
+                if context.marked:
+                    attr |= bold
+                    fg = 1025
+            if context.badinfo:
+                if attr & reverse:
+                    bg = 1013
+                else:
+                    fg = 1013
+            if context.inactive_pane:
+                fg = 1023
+        elif context.in_titlebar:
+            attr |= bold
+            if context.hostname:
+                fg = 1014 if context.bad else 1004
+            elif context.directory:
+                fg = 1001
+            elif context.tab:
+                if context.good:
+                    bg = 1004
+            elif context.link:
+                fg = 1023
+        elif context.in_statusbar:
+            if context.permissions:
+                if context.good:
+                    fg = 1004
+                elif context.bad:
+                    bg = 1013
+                    fg = 1010
+            if context.marked:
+                attr |= bold | reverse
+                fg = 1025
+            if context.frozen:
+                attr |= bold | reverse
+                fg = 1023
+            if context.message:
+                if context.bad:
+                    attr |= bold
+                    fg = 1014
+            if context.loaded:
+                bg = 1001
+            if context.vcsinfo:
+                fg = 1001
+                attr &= ~bold
+            if context.vcscommit:
+                fg = 1025
+                attr &= ~bold
+            if context.vcsdate:
+                fg = 1023
+                attr &= ~bold
+        if context.text and context.highlight:
+            attr |= reverse
+        if context.in_taskview:
+            if context.title:
+                fg = 1001
+            if context.selected:
+                attr |= reverse
+            if context.loaded:
+                if context.selected:
+                    fg = 1001
+                else:
+                    bg = 1001
+        if context.vcsfile and (not context.selected):
+            attr &= ~bold
+            if context.vcsconflict:
+                fg = 1013
+            elif context.vcschanged:
+                fg = 1014
+            elif context.vcsunknown:
+                fg = 1014
+            elif context.vcsstaged:
+                fg = 1004
+            elif context.vcssync:
+                fg = 1004
+            elif context.vcsignored:
+                fg = -1
+        elif context.vcsremote and (not context.selected):
+            attr &= ~bold
+            if context.vcssync or context.vcsnone:
+                fg = 1004
+            elif context.vcsbehind:
+                fg = 1014
+            elif context.vcsahead:
+                fg = 1023
+            elif context.vcsdiverged:
+                fg = 1013
+            elif context.vcsunknown:
+                fg = 1014
+        return (fg, bg, attr)
+
+    def __init__(self):
+        super().__init__()
+        if not _allocate_color_pairs():
+            _allocate_when_ready()
+
+    def use(self, context):
+        flags = tuple(context.__dict__)
+        key = _KEYS.get(flags)
+        if key is None:
+            key = _intern_key(flags)
+        try:
+            return _COLORS[key]
+        except KeyError:
+            if _DEPTH is None:
+                _use_depth(_color_depth())
+                if key in _COLORS:
+                    return _COLORS[key]
+            fg, bg, attr = self._evaluate(context)
+            colors = (_CODES.get(fg, fg), _CODES.get(bg, bg), attr)
+            if len(_COLORS) < _COLORS_LIMIT:
+                _COLORS[key] = colors
+            return colors
+
+
+def _shared_keys(name, flag_bits):
+    # One table of context keys for every loaded scheme with the same flags.
+    import sys
+    import types
+
+    shared = sys.modules.get(name)
+    if shared is None:
+        shared = sys.modules[name] = types.ModuleType(name)
+        shared.FLAG_BITS = flag_bits
+        shared.KEYS = {}
+    return shared.FLAG_BITS, shared.KEYS
+
+
+def _intern_key(flags):
+    key = 0
+    for flag in flags:
+        key |= _FLAG_BITS.get(flag, 0)
+    if len(_KEYS) < 4096:
+        _KEYS[flags] = key
+    return key
+
+
+# Generated by build.py: bit of each context flag read by the scheme, and the
+# bitmask of each tuple of flags seen.
+_FLAG_BITS, _KEYS = _shared_keys(
+    "_catppuccin_ranger_keys_e734dcb2bc56d5f1",
+    {
+        'selected': 1 << 0,
+        'empty': 1 << 1,
+        'error': 1 << 2,
+        'border': 1 << 3,
+        'document': 1 << 4,
+        'media': 1 << 5,
+        'image': 1 << 6,
+        'video': 1 << 7,
+        'audio': 1 << 8,
+        'container': 1 << 9,
+        'directory': 1 << 10,
+        'executable': 1 << 11,
+        'fifo': 1 << 12,
+        'socket': 1 << 13,
+        'device': 1 << 14,
+        'link': 1 << 15,
+        'good': 1 << 16,
+        'tag_marker': 1 << 17,
+        'cut': 1 << 18,
+        'copied': 1 << 19,
+        'main_column': 1 << 20,
+        'marked': 1 << 21,
+        'badinfo': 1 << 22,
+        'inactive_pane': 1 << 23,
+        'hostname': 1 << 24,
+        'bad': 1 << 25,
+        'tab': 1 << 26,
+        'permissions': 1 << 27,
+        'frozen': 1 << 28,
+        'message': 1 << 29,
+        'loaded': 1 << 30,
+        'vcsinfo': 1 << 31,
+        'vcscommit': 1 << 32,
+        'vcsdate': 1 << 33,
+        'title': 1 << 34,
+        'vcsconflict': 1 << 35,
+        'vcschanged': 1 << 36,
+        'vcsunknown': 1 << 37,
+        'vcsstaged': 1 << 38,
+        'vcssync': 1 << 39,
+        'vcsignored': 1 << 40,
+        'vcsnone': 1 << 41,
+        'vcsbehind': 1 << 42,
+        'vcsahead': 1 << 43,
+        'vcsdiverged': 1 << 44,
+        'reset': 1 << 45,
+        'in_browser': 1 << 46,
+        'in_titlebar': 1 << 47,
+        'in_statusbar': 1 << 48,
+        'text': 1 << 49,
+        'highlight': 1 << 50,
+        'in_taskview': 1 << 51,
+        'vcsfile': 1 << 52,
+        'vcsremote': 1 << 53,
+    },
+)
+
+
+def _allocate_color_pairs():
+    try:
+        import curses
+        from ranger.gui.color import COLOR_PAIRS, get_color
+
+        limit = curses.COLOR_PAIRS
+    except (ImportError, AttributeError):
+        return False
+
+    if _DEPTH is None:
+        _use_depth(_color_depth())
+    for pair in _COLOR_PAIRS:
+        if pair not in COLOR_PAIRS:
+            if len(COLOR_PAIRS) >= limit:
+                break
+            get_color(*pair)
+    return True
+
+
+def _allocate_when_ready():
+    # ranger creates the scheme while reading rc.conf, before it starts curses.
+    try:
+        import ranger.api
+    except ImportError:
+        return
+    hook_ready = ranger.api.hook_ready
+
+    def allocate_then_hook_ready(fm):
+        _allocate_color_pairs()
+        return hook_ready(fm)
+
+    ranger.api.hook_ready = allocate_then_hook_ready
+
+
+# Generated by build.py: (fg, bg, attr) for each context-flag bitmask, at each
+# color depth; only the terminal's is built.
+
+def _colors_truecolor():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (1973806, 3224132, 0),
+        0x400000000002: (1973806, 15961000, 0),
+        0x400000000003: (1973806, 15961000, 0),
+        0x400000000004: (1973806, 15961000, 0),
+        0x400000000005: (1973806, 15961000, 0),
+        0x400000000006: (1973806, 15961000, 0),
+        0x400000000008: (9024762, 15961000, 0),
+        0x400000000009: (9024762, 15961000, 0),
+        0x40000000000a: (9024762, 15961000, 0),
+        0x40000000000c: (9024762, 15961000, 0),
+        0x400000000010: (13346551, -1, 0),
+        0x400000000011: (13346551, 3224132, 0),
+        0x400000000012: (13346551, 15961000, 0),
+        0x400000000014: (13346551, 15961000, 0),
+        0x400000000018: (13346551, 15961000, 0),
+        0x400000000020: (10937249, -1, 0),
+        0x400000000021: (10937249, 3224132, 0),
+        0x400000000022: (10937249, 15961000, 0),
+        0x400000000024: (10937249, 15961000, 0),
+        0x400000000028: (10937249, 15961000, 0),
+        0x400000000030: (10937249, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (1973806, 3224132, 0),
+        0x400000000042: (1973806, 15961000, 0),
+        0x400000000044: (1973806, 15961000, 0),
+        0x400000000048: (9024762, 15961000, 0),
+        0x400000000050: (13346551, -1, 0),
+        0x400000000060: (16376495, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (1973806, 3224132, 0),
+        0x400000000082: (1973806, 15961000, 0),
+        0x400000000084: (1973806, 15961000, 0),
+        0x400000000088: (9024762, 15961000, 0),
+        0x400000000090: (13346551, -1, 0),
+        0x4000000000a0: (15961000, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (1973806, 3224132, 0),
+        0x400000000102: (1973806, 15961000, 0),
+        0x400000000104: (1973806, 15961000, 0),
+        0x400000000108: (9024762, 15961000, 0),
+        0x400000000110: (13346551, -1, 0),
+        0x400000000120: (9757397, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (15442092, -1, 2097152),
+        0x400000000201: (15442092, 3224132, 2097152),
+        0x400000000202: (15442092, 15961000, 2097152),
+        0x400000000204: (15442092, 15961000, 2097152),
+        0x400000000208: (15442092, 15961000, 2097152),
+        0x400000000210: (15442092, -1, 2097152),
+        0x400000000220: (15442092, -1, 2097152),
+        0x400000000240: (15442092, -1, 2097152),
+        0x400000000280: (15442092, -1, 2097152),
+        0x400000000300: (15442092, -1, 2097152),
+        0x400000000400: (7653356, -1, 2097152),
+        0x400000000401: (7653356, 3224132, 2097152),
+        0x400000000402: (7653356, 15961000, 2097152),
+        0x400000000404: (7653356, 15961000, 2097152),
+        0x400000000408: (7653356, 15961000, 2097152),
+        0x400000000410: (7653356, -1, 2097152),
+        0x400000000420: (7653356, -1, 2097152),
+        0x400000000440: (7653356, -1, 2097152),
+        0x400000000480: (7653356, -1, 2097152),
+        0x400000000500: (7653356, -1, 2097152),
+        0x400000000600: (7653356, -1, 2097152),
+        0x400000000800: (10937249, -1, 2097152),
+        0x400000000801: (10937249, 3224132, 2097152),
+        0x400000000802: (10937249, 15961000, 2097152),
+        0x400000000804: (10937249, 15961000, 2097152),
+        0x400000000808: (10937249, 15961000, 2097152),
+        0x400000000810: (10937249, -1, 2097152),
+        0x400000000820: (10937249, -1, 0),
+        0x400000000840: (10937249, -1, 2097152),
+        0x400000000880: (10937249, -1, 2097152),
+        0x400000000900: (10937249, -1, 2097152),
+        0x400000000a00: (15442092, -1, 2097152),
+        0x400000000c00: (7653356, -1, 2097152),
+        0x400000001000: (16376495, -1, 0),
+        0x400000001001: (16376495, 3224132, 0),
+        0x400000001002: (16376495, 15961000, 0),
+        0x400000001004: (16376495, 15961000, 0),
+        0x400000001008: (16376495, 15961000, 0),
+        0x400000001010: (16376495, -1, 0),
+        0x400000001020: (16376495, -1, 0),
+        0x400000001040: (16376495, -1, 0),
+        0x400000001080: (16376495, -1, 0),
+        0x400000001100: (16376495, -1, 0),
+        0x400000001200: (16376495, -1, 2097152),
+        0x400000001400: (16376495, -1, 2097152),
+        0x400000001800: (16376495, -1, 0),
+        0x400000002000: (16106215, -1, 2097152),
+        0x400000002001: (16106215, 3224132, 2097152),
+        0x400000002002: (16106215, 15961000, 2097152),
+        0x400000002004: (16106215, 15961000, 2097152),
+        0x400000002008: (16106215, 15961000, 2097152),
+        0x400000002010: (16106215, -1, 2097152),
+        0x400000002020: (16106215, -1, 2097152),
+        0x400000002040: (16106215, -1, 2097152),
+        0x400000002080: (16106215, -1, 2097152),
+        0x400000002100: (16106215, -1, 2097152),
+        0x400000002200: (16106215, -1, 2097152),
+        0x400000002400: (16106215, -1, 2097152),
+        0x400000002800: (16106215, -1, 2097152),
+        0x400000003000: (16376495, -1, 2097152),
+        0x400000004000: (16376495, -1, 2097152),
+        0x400000004001: (16376495, 3224132, 2097152),
+        0x400000004002: (16376495, 15961000, 2097152),
+        0x400000004004: (16376495, 15961000, 2097152),
+        0x400000004008: (16376495, 15961000, 2097152),
+        0x400000004010: (16376495, -1, 2097152),
+        0x400000004020: (16376495, -1, 2097152),
+        0x400000004040: (16376495, -1, 2097152),
+        0x400000004080: (16376495, -1, 2097152),
+        0x400000004100: (16376495, -1, 2097152),
+        0x400000004200: (16376495, -1, 2097152),
+        0x400000004400: (16376495, -1, 2097152),
+        0x400000004800: (16376495, -1, 2097152),
+        0x400000005000: (16376495, -1, 2097152),
+        0x400000006000: (16376495, -1, 2097152),
+        0x400000008000: (13346551, -1, 0),
+        0x400000008001: (13346551, 3224132, 0),
+        0x400000008002: (13346551, 15961000, 0),
+        0x400000008004: (13346551, 15961000, 0),
+        0x400000008008: (13346551, 15961000, 0),
+        0x400000008010: (13346551, -1, 0),
+        0x400000008020: (13346551, -1, 0),
+        0x400000008040: (13346551, -1, 0),
+        0x400000008080: (13346551, -1, 0),
+        0x400000008100: (13346551, -1, 0),
+        0x400000008200: (13346551, -1, 2097152),
+        0x400000008400: (13346551, -1, 2097152),
+        0x400000008800: (13346551, -1, 2097152),
+        0x400000009000: (13346551, -1, 0),
+        0x40000000a000: (13346551, -1, 2097152),
+        0x40000000c000: (13346551, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (1973806, 3224132, 0),
+        0x400000010002: (1973806, 15961000, 0),
+        0x400000010004: (1973806, 15961000, 0),
+        0x400000010008: (9024762, 15961000, 0),
+        0x400000010010: (13346551, -1, 0),
+        0x400000010020: (10937249, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (15442092, -1, 2097152),
+        0x400000010400: (7653356, -1, 2097152),
+        0x400000010800: (10937249, -1, 2097152),
+        0x400000011000: (16376495, -1, 0),
+        0x400000012000: (16106215, -1, 2097152),
+        0x400000014000: (16376495, -1, 2097152),
+        0x400000018000: (9757397, -1, 0),
+        0x400000020000: (15961000, -1, 2097152),
+        0x400000020001: (1973806, 3224132, 0),
+        0x400000020002: (15961000, 15961000, 2097152),
+        0x400000020004: (15961000, 15961000, 2097152),
+        0x400000020008: (15961000, 15961000, 2097152),
+        0x400000020010: (15961000, -1, 2097152),
+        0x400000020020: (15961000, -1, 2097152),
+        0x400000020040: (15961000, -1, 2097152),
+        0x400000020080: (15961000, -1, 2097152),
+        0x400000020100: (15961000, -1, 2097152),
+        0x400000020200: (16777215, -1, 2097152),
+        0x400000020400: (15961000, -1, 2097152),
+        0x400000020800: (15961000, -1, 2097152),
+        0x400000021000: (15961000, -1, 2097152),
+        0x400000022000: (16777215, -1, 2097152),
+        0x400000024000: (15961000, -1, 2097152),
+        0x400000028000: (15961000, -1, 2097152),
+        0x400000030000: (15961000, -1, 2097152),
+        0x400000040000: (8357020, -1, 2097152),
+        0x400000040001: (1973806, 3224132, 0),
+        0x400000040002: (8357020, 15961000, 2097152),
+        0x400000040004: (8357020, 15961000, 2097152),
+        0x400000040008: (8357020, 15961000, 2097152),
+        0x400000040010: (8357020, -1, 2097152),
+        0x400000040020: (8357020, -1, 2097152),
+        0x400000040040: (8357020, -1, 2097152),
+        0x400000040080: (8357020, -1, 2097152),
+        0x400000040100: (8357020, -1, 2097152),
+        0x400000040200: (8357020, -1, 2097152),
+        0x400000040400: (8357020, -1, 2097152),
+        0x400000040800: (8357020, -1, 2097152),
+        0x400000041000: (8357020, -1, 2097152),
+        0x400000042000: (8357020, -1, 2097152),
+        0x400000044000: (8357020, -1, 2097152),
+        0x400000048000: (8357020, -1, 2097152),
+        0x400000050000: (8357020, -1, 2097152),
+        0x400000060000: (8357020, -1, 2097152),
+        0x400000080000: (8357020, -1, 2097152),
+        0x400000080001: (1973806, 3224132, 0),
+        0x400000080002: (8357020, 15961000, 2097152),
+        0x400000080004: (8357020, 15961000, 2097152),
+        0x400000080008: (8357020, 15961000, 2097152),
+        0x400000080010: (8357020, -1, 2097152),
+        0x400000080020: (8357020, -1, 2097152),
+        0x400000080040: (8357020, -1, 2097152),
+        0x400000080080: (8357020, -1, 2097152),
+        0x400000080100: (8357020, -1, 2097152),
+        0x400000080200: (8357020, -1, 2097152),
+        0x400000080400: (8357020, -1, 2097152),
+        0x400000080800: (8357020, -1, 2097152),
+        0x400000081000: (8357020, -1, 2097152),
+        0x400000082000: (8357020, -1, 2097152),
+        0x400000084000: (8357020, -1, 2097152),
+        0x400000088000: (8357020, -1, 2097152),
+        0x400000090000: (8357020, -1, 2097152),
+        0x4000000a0000: (8357020, -1, 2097152),
+        0x4000000c0000: (8357020, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (1973806, 3224132, 2097152),
+        0x400000100002: (1973806, 15961000, 0),
+        0x400000100004: (1973806, 15961000, 0),
+        0x400000100008: (9024762, 15961000, 0),
+        0x400000100010: (13346551, -1, 0),
+        0x400000100020: (10937249, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (15442092, -1, 2097152),
+        0x400000100400: (7653356, -1, 2097152),
+        0x400000100800: (10937249, -1, 2097152),
+        0x400000101000: (16376495, -1, 0),
+        0x400000102000: (16106215, -1, 2097152),
+        0x400000104000: (16376495, -1, 2097152),
+        0x400000108000: (13346551, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (15961000, -1, 2097152),
+        0x400000140000: (8357020, -1, 2097152),
+        0x400000180000: (8357020, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (1973806, 3224132, 0),
+        0x400000200002: (1973806, 15961000, 0),
+        0x400000200004: (1973806, 15961000, 0),
+        0x400000200008: (9024762, 15961000, 0),
+        0x400000200010: (13346551, -1, 0),
+        0x400000200020: (10937249, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (15442092, -1, 2097152),
+        0x400000200400: (7653356, -1, 2097152),
+        0x400000200800: (10937249, -1, 2097152),
+        0x400000201000: (16376495, -1, 0),
+        0x400000202000: (16106215, -1, 2097152),
+        0x400000204000: (16376495, -1, 2097152),
+        0x400000208000: (13346551, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (15961000, -1, 2097152),
+        0x400000240000: (8357020, -1, 2097152),
+        0x400000280000: (8357020, -1, 2097152),
+        0x400000300000: (16376495, -1, 2097152),
+        0x400000400000: (16106215, -1, 0),
+        0x400000400001: (16106215, 3224132, 0),
+        0x400000400002: (16106215, 15961000, 0),
+        0x400000400004: (16106215, 15961000, 0),
+        0x400000400008: (16106215, 15961000, 0),
+        0x400000400010: (16106215, -1, 0),
+        0x400000400020: (16106215, -1, 0),
+        0x400000400040: (16106215, -1, 0),
+        0x400000400080: (16106215, -1, 0),
+        0x400000400100: (16106215, -1, 0),
+        0x400000400200: (16106215, -1, 2097152),
+        0x400000400400: (16106215, -1, 2097152),
+        0x400000400800: (16106215, -1, 2097152),
+        0x400000401000: (16106215, -1, 0),
+        0x400000402000: (16106215, -1, 2097152),
+        0x400000404000: (16106215, -1, 2097152),
+        0x400000408000: (16106215, -1, 0),
+        0x400000410000: (16106215, -1, 0),
+        0x400000420000: (16106215, -1, 2097152),
+        0x400000440000: (16106215, -1, 2097152),
+        0x400000480000: (16106215, -1, 2097152),
+        0x400000500000: (16106215, -1, 0),
+        0x400000600000: (16106215, -1, 0),
+        0x400000800000: (9757397, -1, 0),
+        0x400000800001: (9757397, 3224132, 0),
+        0x400000800002: (9757397, 15961000, 0),
+        0x400000800004: (9757397, 15961000, 0),
+        0x400000800008: (9757397, 15961000, 0),
+        0x400000800010: (9757397, -1, 0),
+        0x400000800020: (9757397, -1, 0),
+        0x400000800040: (9757397, -1, 0),
+        0x400000800080: (9757397, -1, 0),
+        0x400000800100: (9757397, -1, 0),
+        0x400000800200: (9757397, -1, 2097152),
+        0x400000800400: (9757397, -1, 2097152),
+        0x400000800800: (9757397, -1, 2097152),
+        0x400000801000: (9757397, -1, 0),
+        0x400000802000: (9757397, -1, 2097152),
+        0x400000804000: (9757397, -1, 2097152),
+        0x400000808000: (9757397, -1, 0),
+        0x400000810000: (9757397, -1, 0),
+        0x400000820000: (9757397, -1, 2097152),
+        0x400000840000: (9757397, -1, 2097152),
+        0x400000880000: (9757397, -1, 2097152),
+        0x400000900000: (9757397, -1, 0),
+        0x400000a00000: (9757397, -1, 0),
+        0x400000c00000: (9757397, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (9024762, -1, 2097152),
+        0x800000008000: (9757397, -1, 2097152),
+        0x800000008400: (9024762, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (9024762, -1, 2097152),
+        0x800000018000: (9757397, -1, 2097152),
+        0x800001000000: (10937249, -1, 2097152),
+        0x800001000400: (10937249, -1, 2097152),
+        0x800001008000: (10937249, -1, 2097152),
+        0x800001010000: (10937249, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (9024762, -1, 2097152),
+        0x800002008000: (9757397, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (15961000, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (9024762, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 10937249, 2097152),
+        0x800005000000: (10937249, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (16376495, -1, 2359296),
+        0x1000000210000: (16376495, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (16376495, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (10937249, -1, 0),
+        0x1000008200000: (16376495, -1, 2359296),
+        0x100000a000000: (8357020, 16106215, 0),
+        0x1000010000000: (9757397, -1, 2359296),
+        0x1000010010000: (9757397, -1, 2359296),
+        0x1000010200000: (9757397, -1, 2359296),
+        0x1000012000000: (9757397, -1, 2359296),
+        0x1000018000000: (9757397, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (16376495, -1, 2359296),
+        0x1000022000000: (15961000, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (9757397, -1, 2359296),
+        0x1000040000000: (-1, 9024762, 0),
+        0x1000040010000: (-1, 9024762, 0),
+        0x1000040200000: (16376495, 9024762, 2359296),
+        0x1000042000000: (-1, 9024762, 0),
+        0x1000048000000: (-1, 9024762, 0),
+        0x1000050000000: (9757397, 9024762, 2359296),
+        0x1000060000000: (-1, 9024762, 0),
+        0x1000080000000: (9024762, -1, 0),
+        0x1000080010000: (9024762, -1, 0),
+        0x1000080200000: (9024762, -1, 262144),
+        0x1000082000000: (9024762, -1, 0),
+        0x1000088000000: (9024762, -1, 0),
+        0x1000090000000: (9024762, -1, 262144),
+        0x10000a0000000: (9024762, -1, 0),
+        0x10000c0000000: (9024762, 9024762, 0),
+        0x1000100000000: (16376495, -1, 0),
+        0x1000100010000: (16376495, -1, 0),
+        0x1000100200000: (16376495, -1, 262144),
+        0x1000102000000: (16376495, -1, 0),
+        0x1000108000000: (16376495, -1, 0),
+        0x1000110000000: (16376495, -1, 262144),
+        0x1000120000000: (16376495, -1, 0),
+        0x1000140000000: (16376495, 9024762, 0),
+        0x1000180000000: (16376495, -1, 0),
+        0x1000200000000: (9757397, -1, 0),
+        0x1000200010000: (9757397, -1, 0),
+        0x1000200200000: (9757397, -1, 262144),
+        0x1000202000000: (9757397, -1, 0),
+        0x1000208000000: (9757397, -1, 0),
+        0x1000210000000: (9757397, -1, 262144),
+        0x1000220000000: (9757397, -1, 0),
+        0x1000240000000: (9757397, 9024762, 0),
+        0x1000280000000: (9757397, -1, 0),
+        0x1000300000000: (9757397, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 9024762, 0),
+        0x8000040000001: (9024762, -1, 262144),
+        0x8000400000000: (9024762, -1, 0),
+        0x8000400000001: (9024762, -1, 262144),
+        0x8000440000000: (9024762, 9024762, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (16106215, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (15961000, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (16106215, -1, 0),
+        0x10002000000000: (15961000, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (16106215, -1, 0),
+        0x10003000000000: (15961000, -1, 0),
+        0x10004000000000: (10937249, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (16106215, -1, 0),
+        0x10005000000000: (15961000, -1, 0),
+        0x10006000000000: (15961000, -1, 0),
+        0x10008000000000: (10937249, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (16106215, -1, 0),
+        0x10009000000000: (15961000, -1, 0),
+        0x1000a000000000: (15961000, -1, 0),
+        0x1000c000000000: (10937249, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (16106215, -1, 0),
+        0x10011000000000: (15961000, -1, 0),
+        0x10012000000000: (15961000, -1, 0),
+        0x10014000000000: (10937249, -1, 0),
+        0x10018000000000: (10937249, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (15961000, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (10937249, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (10937249, -1, 0),
+        0x20020000000000: (10937249, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (10937249, -1, 0),
+        0x20028000000000: (10937249, -1, 0),
+        0x20040000000000: (15961000, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (15961000, -1, 0),
+        0x20048000000000: (10937249, -1, 0),
+        0x20060000000000: (10937249, -1, 0),
+        0x20080000000000: (9757397, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (9757397, -1, 0),
+        0x20088000000000: (10937249, -1, 0),
+        0x200a0000000000: (10937249, -1, 0),
+        0x200c0000000000: (15961000, -1, 0),
+        0x20100000000000: (16106215, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (16106215, -1, 0),
+        0x20108000000000: (10937249, -1, 0),
+        0x20120000000000: (10937249, -1, 0),
+        0x20140000000000: (15961000, -1, 0),
+        0x20180000000000: (9757397, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_256():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (16, 59, 0),
+        0x400000000002: (16, 211, 0),
+        0x400000000003: (16, 211, 0),
+        0x400000000004: (16, 211, 0),
+        0x400000000005: (16, 211, 0),
+        0x400000000006: (16, 211, 0),
+        0x400000000008: (111, 211, 0),
+        0x400000000009: (111, 211, 0),
+        0x40000000000a: (111, 211, 0),
+        0x40000000000c: (111, 211, 0),
+        0x400000000010: (183, -1, 0),
+        0x400000000011: (183, 59, 0),
+        0x400000000012: (183, 211, 0),
+        0x400000000014: (183, 211, 0),
+        0x400000000018: (183, 211, 0),
+        0x400000000020: (151, -1, 0),
+        0x400000000021: (151, 59, 0),
+        0x400000000022: (151, 211, 0),
+        0x400000000024: (151, 211, 0),
+        0x400000000028: (151, 211, 0),
+        0x400000000030: (151, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (16, 59, 0),
+        0x400000000042: (16, 211, 0),
+        0x400000000044: (16, 211, 0),
+        0x400000000048: (111, 211, 0),
+        0x400000000050: (183, -1, 0),
+        0x400000000060: (223, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (16, 59, 0),
+        0x400000000082: (16, 211, 0),
+        0x400000000084: (16, 211, 0),
+        0x400000000088: (111, 211, 0),
+        0x400000000090: (183, -1, 0),
+        0x4000000000a0: (211, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (16, 59, 0),
+        0x400000000102: (16, 211, 0),
+        0x400000000104: (16, 211, 0),
+        0x400000000108: (111, 211, 0),
+        0x400000000110: (183, -1, 0),
+        0x400000000120: (116, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (217, -1, 2097152),
+        0x400000000201: (217, 59, 2097152),
+        0x400000000202: (217, 211, 2097152),
+        0x400000000204: (217, 211, 2097152),
+        0x400000000208: (217, 211, 2097152),
+        0x400000000210: (217, -1, 2097152),
+        0x400000000220: (217, -1, 2097152),
+        0x400000000240: (217, -1, 2097152),
+        0x400000000280: (217, -1, 2097152),
+        0x400000000300: (217, -1, 2097152),
+        0x400000000400: (117, -1, 2097152),
+        0x400000000401: (117, 59, 2097152),
+        0x400000000402: (117, 211, 2097152),
+        0x400000000404: (117, 211, 2097152),
+        0x400000000408: (117, 211, 2097152),
+        0x400000000410: (117, -1, 2097152),
+        0x400000000420: (117, -1, 2097152),
+        0x400000000440: (117, -1, 2097152),
+        0x400000000480: (117, -1, 2097152),
+        0x400000000500: (117, -1, 2097152),
+        0x400000000600: (117, -1, 2097152),
+        0x400000000800: (151, -1, 2097152),
+        0x400000000801: (151, 59, 2097152),
+        0x400000000802: (151, 211, 2097152),
+        0x400000000804: (151, 211, 2097152),
+        0x400000000808: (151, 211, 2097152),
+        0x400000000810: (151, -1, 2097152),
+        0x400000000820: (151, -1, 0),
+        0x400000000840: (151, -1, 2097152),
+        0x400000000880: (151, -1, 2097152),
+        0x400000000900: (151, -1, 2097152),
+        0x400000000a00: (217, -1, 2097152),
+        0x400000000c00: (117, -1, 2097152),
+        0x400000001000: (223, -1, 0),
+        0x400000001001: (223, 59, 0),
+        0x400000001002: (223, 211, 0),
+        0x400000001004: (223, 211, 0),
+        0x400000001008: (223, 211, 0),
+        0x400000001010: (223, -1, 0),
+        0x400000001020: (223, -1, 0),
+        0x400000001040: (223, -1, 0),
+        0x400000001080: (223, -1, 0),
+        0x400000001100: (223, -1, 0),
+        0x400000001200: (223, -1, 2097152),
+        0x400000001400: (223, -1, 2097152),
+        0x400000001800: (223, -1, 0),
+        0x400000002000: (218, -1, 2097152),
+        0x400000002001: (218, 59, 2097152),
+        0x400000002002: (218, 211, 2097152),
+        0x400000002004: (218, 211, 2097152),
+        0x400000002008: (218, 211, 2097152),
+        0x400000002010: (218, -1, 2097152),
+        0x400000002020: (218, -1, 2097152),
+        0x400000002040: (218, -1, 2097152),
+        0x400000002080: (218, -1, 2097152),
+        0x400000002100: (218, -1, 2097152),
+        0x400000002200: (218, -1, 2097152),
+        0x400000002400: (218, -1, 2097152),
+        0x400000002800: (218, -1, 2097152),
+        0x400000003000: (223, -1, 2097152),
+        0x400000004000: (223, -1, 2097152),
+        0x400000004001: (223, 59, 2097152),
+        0x400000004002: (223, 211, 2097152),
+        0x400000004004: (223, 211, 2097152),
+        0x400000004008: (223, 211, 2097152),
+        0x400000004010: (223, -1, 2097152),
+        0x400000004020: (223, -1, 2097152),
+        0x400000004040: (223, -1, 2097152),
+        0x400000004080: (223, -1, 2097152),
+        0x400000004100: (223, -1, 2097152),
+        0x400000004200: (223, -1, 2097152),
+        0x400000004400: (223, -1, 2097152),
+        0x400000004800: (223, -1, 2097152),
+        0x400000005000: (223, -1, 2097152),
+        0x400000006000: (223, -1, 2097152),
+        0x400000008000: (183, -1, 0),
+        0x400000008001: (183, 59, 0),
+        0x400000008002: (183, 211, 0),
+        0x400000008004: (183, 211, 0),
+        0x400000008008: (183, 211, 0),
+        0x400000008010: (183, -1, 0),
+        0x400000008020: (183, -1, 0),
+        0x400000008040: (183, -1, 0),
+        0x400000008080: (183, -1, 0),
+        0x400000008100: (183, -1, 0),
+        0x400000008200: (183, -1, 2097152),
+        0x400000008400: (183, -1, 2097152),
+        0x400000008800: (183, -1, 2097152),
+        0x400000009000: (183, -1, 0),
+        0x40000000a000: (183, -1, 2097152),
+        0x40000000c000: (183, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (16, 59, 0),
+        0x400000010002: (16, 211, 0),
+        0x400000010004: (16, 211, 0),
+        0x400000010008: (111, 211, 0),
+        0x400000010010: (183, -1, 0),
+        0x400000010020: (151, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (217, -1, 2097152),
+        0x400000010400: (117, -1, 2097152),
+        0x400000010800: (151, -1, 2097152),
+        0x400000011000: (223, -1, 0),
+        0x400000012000: (218, -1, 2097152),
+        0x400000014000: (223, -1, 2097152),
+        0x400000018000: (116, -1, 0),
+        0x400000020000: (211, -1, 2097152),
+        0x400000020001: (16, 59, 0),
+        0x400000020002: (211, 211, 2097152),
+        0x400000020004: (211, 211, 2097152),
+        0x400000020008: (211, 211, 2097152),
+        0x400000020010: (211, -1, 2097152),
+        0x400000020020: (211, -1, 2097152),
+        0x400000020040: (211, -1, 2097152),
+        0x400000020080: (211, -1, 2097152),
+        0x400000020100: (211, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (211, -1, 2097152),
+        0x400000020800: (211, -1, 2097152),
+        0x400000021000: (211, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (211, -1, 2097152),
+        0x400000028000: (211, -1, 2097152),
+        0x400000030000: (211, -1, 2097152),
+        0x400000040000: (103, -1, 2097152),
+        0x400000040001: (16, 59, 0),
+        0x400000040002: (103, 211, 2097152),
+        0x400000040004: (103, 211, 2097152),
+        0x400000040008: (103, 211, 2097152),
+        0x400000040010: (103, -1, 2097152),
+        0x400000040020: (103, -1, 2097152),
+        0x400000040040: (103, -1, 2097152),
+        0x400000040080: (103, -1, 2097152),
+        0x400000040100: (103, -1, 2097152),
+        0x400000040200: (103, -1, 2097152),
+        0x400000040400: (103, -1, 2097152),
+        0x400000040800: (103, -1, 2097152),
+        0x400000041000: (103, -1, 2097152),
+        0x400000042000: (103, -1, 2097152),
+        0x400000044000: (103, -1, 2097152),
+        0x400000048000: (103, -1, 2097152),
+        0x400000050000: (103, -1, 2097152),
+        0x400000060000: (103, -1, 2097152),
+        0x400000080000: (103, -1, 2097152),
+        0x400000080001: (16, 59, 0),
+        0x400000080002: (103, 211, 2097152),
+        0x400000080004: (103, 211, 2097152),
+        0x400000080008: (103, 211, 2097152),
+        0x400000080010: (103, -1, 2097152),
+        0x400000080020: (103, -1, 2097152),
+        0x400000080040: (103, -1, 2097152),
+        0x400000080080: (103, -1, 2097152),
+        0x400000080100: (103, -1, 2097152),
+        0x400000080200: (103, -1, 2097152),
+        0x400000080400: (103, -1, 2097152),
+        0x400000080800: (103, -1, 2097152),
+        0x400000081000: (103, -1, 2097152),
+        0x400000082000: (103, -1, 2097152),
+        0x400000084000: (103, -1, 2097152),
+        0x400000088000: (103, -1, 2097152),
+        0x400000090000: (103, -1, 2097152),
+        0x4000000a0000: (103, -1, 2097152),
+        0x4000000c0000: (103, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (16, 59, 2097152),
+        0x400000100002: (16, 211, 0),
+        0x400000100004: (16, 211, 0),
+        0x400000100008: (111, 211, 0),
+        0x400000100010: (183, -1, 0),
+        0x400000100020: (151, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (217, -1, 2097152),
+        0x400000100400: (117, -1, 2097152),
+        0x400000100800: (151, -1, 2097152),
+        0x400000101000: (223, -1, 0),
+        0x400000102000: (218, -1, 2097152),
+        0x400000104000: (223, -1, 2097152),
+        0x400000108000: (183, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (211, -1, 2097152),
+        0x400000140000: (103, -1, 2097152),
+        0x400000180000: (103, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (16, 59, 0),
+        0x400000200002: (16, 211, 0),
+        0x400000200004: (16, 211, 0),
+        0x400000200008: (111, 211, 0),
+        0x400000200010: (183, -1, 0),
+        0x400000200020: (151, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (217, -1, 2097152),
+        0x400000200400: (117, -1, 2097152),
+        0x400000200800: (151, -1, 2097152),
+        0x400000201000: (223, -1, 0),
+        0x400000202000: (218, -1, 2097152),
+        0x400000204000: (223, -1, 2097152),
+        0x400000208000: (183, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (211, -1, 2097152),
+        0x400000240000: (103, -1, 2097152),
+        0x400000280000: (103, -1, 2097152),
+        0x400000300000: (223, -1, 2097152),
+        0x400000400000: (218, -1, 0),
+        0x400000400001: (218, 59, 0),
+        0x400000400002: (218, 211, 0),
+        0x400000400004: (218, 211, 0),
+        0x400000400008: (218, 211, 0),
+        0x400000400010: (218, -1, 0),
+        0x400000400020: (218, -1, 0),
+        0x400000400040: (218, -1, 0),
+        0x400000400080: (218, -1, 0),
+        0x400000400100: (218, -1, 0),
+        0x400000400200: (218, -1, 2097152),
+        0x400000400400: (218, -1, 2097152),
+        0x400000400800: (218, -1, 2097152),
+        0x400000401000: (218, -1, 0),
+        0x400000402000: (218, -1, 2097152),
+        0x400000404000: (218, -1, 2097152),
+        0x400000408000: (218, -1, 0),
+        0x400000410000: (218, -1, 0),
+        0x400000420000: (218, -1, 2097152),
+        0x400000440000: (218, -1, 2097152),
+        0x400000480000: (218, -1, 2097152),
+        0x400000500000: (218, -1, 0),
+        0x400000600000: (218, -1, 0),
+        0x400000800000: (116, -1, 0),
+        0x400000800001: (116, 59, 0),
+        0x400000800002: (116, 211, 0),
+        0x400000800004: (116, 211, 0),
+        0x400000800008: (116, 211, 0),
+        0x400000800010: (116, -1, 0),
+        0x400000800020: (116, -1, 0),
+        0x400000800040: (116, -1, 0),
+        0x400000800080: (116, -1, 0),
+        0x400000800100: (116, -1, 0),
+        0x400000800200: (116, -1, 2097152),
+        0x400000800400: (116, -1, 2097152),
+        0x400000800800: (116, -1, 2097152),
+        0x400000801000: (116, -1, 0),
+        0x400000802000: (116, -1, 2097152),
+        0x400000804000: (116, -1, 2097152),
+        0x400000808000: (116, -1, 0),
+        0x400000810000: (116, -1, 0),
+        0x400000820000: (116, -1, 2097152),
+        0x400000840000: (116, -1, 2097152),
+        0x400000880000: (116, -1, 2097152),
+        0x400000900000: (116, -1, 0),
+        0x400000a00000: (116, -1, 0),
+        0x400000c00000: (116, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (111, -1, 2097152),
+        0x800000008000: (116, -1, 2097152),
+        0x800000008400: (111, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (111, -1, 2097152),
+        0x800000018000: (116, -1, 2097152),
+        0x800001000000: (151, -1, 2097152),
+        0x800001000400: (151, -1, 2097152),
+        0x800001008000: (151, -1, 2097152),
+        0x800001010000: (151, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (111, -1, 2097152),
+        0x800002008000: (116, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (211, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (111, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 151, 2097152),
+        0x800005000000: (151, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (223, -1, 2359296),
+        0x1000000210000: (223, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (223, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (151, -1, 0),
+        0x1000008200000: (223, -1, 2359296),
+        0x100000a000000: (103, 218, 0),
+        0x1000010000000: (116, -1, 2359296),
+        0x1000010010000: (116, -1, 2359296),
+        0x1000010200000: (116, -1, 2359296),
+        0x1000012000000: (116, -1, 2359296),
+        0x1000018000000: (116, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (223, -1, 2359296),
+        0x1000022000000: (211, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (116, -1, 2359296),
+        0x1000040000000: (-1, 111, 0),
+        0x1000040010000: (-1, 111, 0),
+        0x1000040200000: (223, 111, 2359296),
+        0x1000042000000: (-1, 111, 0),
+        0x1000048000000: (-1, 111, 0),
+        0x1000050000000: (116, 111, 2359296),
+        0x1000060000000: (-1, 111, 0),
+        0x1000080000000: (111, -1, 0),
+        0x1000080010000: (111, -1, 0),
+        0x1000080200000: (111, -1, 262144),
+        0x1000082000000: (111, -1, 0),
+        0x1000088000000: (111, -1, 0),
+        0x1000090000000: (111, -1, 262144),
+        0x10000a0000000: (111, -1, 0),
+        0x10000c0000000: (111, 111, 0),
+        0x1000100000000: (223, -1, 0),
+        0x1000100010000: (223, -1, 0),
+        0x1000100200000: (223, -1, 262144),
+        0x1000102000000: (223, -1, 0),
+        0x1000108000000: (223, -1, 0),
+        0x1000110000000: (223, -1, 262144),
+        0x1000120000000: (223, -1, 0),
+        0x1000140000000: (223, 111, 0),
+        0x1000180000000: (223, -1, 0),
+        0x1000200000000: (116, -1, 0),
+        0x1000200010000: (116, -1, 0),
+        0x1000200200000: (116, -1, 262144),
+        0x1000202000000: (116, -1, 0),
+        0x1000208000000: (116, -1, 0),
+        0x1000210000000: (116, -1, 262144),
+        0x1000220000000: (116, -1, 0),
+        0x1000240000000: (116, 111, 0),
+        0x1000280000000: (116, -1, 0),
+        0x1000300000000: (116, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 111, 0),
+        0x8000040000001: (111, -1, 262144),
+        0x8000400000000: (111, -1, 0),
+        0x8000400000001: (111, -1, 262144),
+        0x8000440000000: (111, 111, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (218, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (211, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (218, -1, 0),
+        0x10002000000000: (211, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (218, -1, 0),
+        0x10003000000000: (211, -1, 0),
+        0x10004000000000: (151, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (218, -1, 0),
+        0x10005000000000: (211, -1, 0),
+        0x10006000000000: (211, -1, 0),
+        0x10008000000000: (151, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (218, -1, 0),
+        0x10009000000000: (211, -1, 0),
+        0x1000a000000000: (211, -1, 0),
+        0x1000c000000000: (151, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (218, -1, 0),
+        0x10011000000000: (211, -1, 0),
+        0x10012000000000: (211, -1, 0),
+        0x10014000000000: (151, -1, 0),
+        0x10018000000000: (151, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (211, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (151, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (151, -1, 0),
+        0x20020000000000: (151, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (151, -1, 0),
+        0x20028000000000: (151, -1, 0),
+        0x20040000000000: (211, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (211, -1, 0),
+        0x20048000000000: (151, -1, 0),
+        0x20060000000000: (151, -1, 0),
+        0x20080000000000: (116, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (116, -1, 0),
+        0x20088000000000: (151, -1, 0),
+        0x200a0000000000: (151, -1, 0),
+        0x200c0000000000: (211, -1, 0),
+        0x20100000000000: (218, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (218, -1, 0),
+        0x20108000000000: (151, -1, 0),
+        0x20120000000000: (151, -1, 0),
+        0x20140000000000: (211, -1, 0),
+        0x20180000000000: (116, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+def _colors_16():
+    return {
+        0x0: (-1, -1, 0),
+        0x200000000000: (-1, -1, 0),
+        0x400000000000: (-1, -1, 0),
+        0x400000000001: (0, 0, 0),
+        0x400000000002: (0, 13, 0),
+        0x400000000003: (0, 13, 0),
+        0x400000000004: (0, 13, 0),
+        0x400000000005: (0, 13, 0),
+        0x400000000006: (0, 13, 0),
+        0x400000000008: (7, 13, 0),
+        0x400000000009: (7, 13, 0),
+        0x40000000000a: (7, 13, 0),
+        0x40000000000c: (7, 13, 0),
+        0x400000000010: (13, -1, 0),
+        0x400000000011: (13, 0, 0),
+        0x400000000012: (13, 13, 0),
+        0x400000000014: (13, 13, 0),
+        0x400000000018: (13, 13, 0),
+        0x400000000020: (10, -1, 0),
+        0x400000000021: (10, 0, 0),
+        0x400000000022: (10, 13, 0),
+        0x400000000024: (10, 13, 0),
+        0x400000000028: (10, 13, 0),
+        0x400000000030: (10, -1, 0),
+        0x400000000040: (-1, -1, 0),
+        0x400000000041: (0, 0, 0),
+        0x400000000042: (0, 13, 0),
+        0x400000000044: (0, 13, 0),
+        0x400000000048: (7, 13, 0),
+        0x400000000050: (13, -1, 0),
+        0x400000000060: (15, -1, 0),
+        0x400000000080: (-1, -1, 0),
+        0x400000000081: (0, 0, 0),
+        0x400000000082: (0, 13, 0),
+        0x400000000084: (0, 13, 0),
+        0x400000000088: (7, 13, 0),
+        0x400000000090: (13, -1, 0),
+        0x4000000000a0: (13, -1, 0),
+        0x4000000000c0: (-1, -1, 0),
+        0x400000000100: (-1, -1, 0),
+        0x400000000101: (0, 0, 0),
+        0x400000000102: (0, 13, 0),
+        0x400000000104: (0, 13, 0),
+        0x400000000108: (7, 13, 0),
+        0x400000000110: (13, -1, 0),
+        0x400000000120: (14, -1, 0),
+        0x400000000140: (-1, -1, 0),
+        0x400000000180: (-1, -1, 0),
+        0x400000000200: (7, -1, 2097152),
+        0x400000000201: (7, 0, 2097152),
+        0x400000000202: (7, 13, 2097152),
+        0x400000000204: (7, 13, 2097152),
+        0x400000000208: (7, 13, 2097152),
+        0x400000000210: (7, -1, 2097152),
+        0x400000000220: (7, -1, 2097152),
+        0x400000000240: (7, -1, 2097152),
+        0x400000000280: (7, -1, 2097152),
+        0x400000000300: (7, -1, 2097152),
+        0x400000000400: (7, -1, 2097152),
+        0x400000000401: (7, 0, 2097152),
+        0x400000000402: (7, 13, 2097152),
+        0x400000000404: (7, 13, 2097152),
+        0x400000000408: (7, 13, 2097152),
+        0x400000000410: (7, -1, 2097152),
+        0x400000000420: (7, -1, 2097152),
+        0x400000000440: (7, -1, 2097152),
+        0x400000000480: (7, -1, 2097152),
+        0x400000000500: (7, -1, 2097152),
+        0x400000000600: (7, -1, 2097152),
+        0x400000000800: (10, -1, 2097152),
+        0x400000000801: (10, 0, 2097152),
+        0x400000000802: (10, 13, 2097152),
+        0x400000000804: (10, 13, 2097152),
+        0x400000000808: (10, 13, 2097152),
+        0x400000000810: (10, -1, 2097152),
+        0x400000000820: (10, -1, 0),
+        0x400000000840: (10, -1, 2097152),
+        0x400000000880: (10, -1, 2097152),
+        0x400000000900: (10, -1, 2097152),
+        0x400000000a00: (7, -1, 2097152),
+        0x400000000c00: (7, -1, 2097152),
+        0x400000001000: (15, -1, 0),
+        0x400000001001: (15, 0, 0),
+        0x400000001002: (15, 13, 0),
+        0x400000001004: (15, 13, 0),
+        0x400000001008: (15, 13, 0),
+        0x400000001010: (15, -1, 0),
+        0x400000001020: (15, -1, 0),
+        0x400000001040: (15, -1, 0),
+        0x400000001080: (15, -1, 0),
+        0x400000001100: (15, -1, 0),
+        0x400000001200: (15, -1, 2097152),
+        0x400000001400: (15, -1, 2097152),
+        0x400000001800: (15, -1, 0),
+        0x400000002000: (7, -1, 2097152),
+        0x400000002001: (7, 0, 2097152),
+        0x400000002002: (7, 13, 2097152),
+        0x400000002004: (7, 13, 2097152),
+        0x400000002008: (7, 13, 2097152),
+        0x400000002010: (7, -1, 2097152),
+        0x400000002020: (7, -1, 2097152),
+        0x400000002040: (7, -1, 2097152),
+        0x400000002080: (7, -1, 2097152),
+        0x400000002100: (7, -1, 2097152),
+        0x400000002200: (7, -1, 2097152),
+        0x400000002400: (7, -1, 2097152),
+        0x400000002800: (7, -1, 2097152),
+        0x400000003000: (15, -1, 2097152),
+        0x400000004000: (15, -1, 2097152),
+        0x400000004001: (15, 0, 2097152),
+        0x400000004002: (15, 13, 2097152),
+        0x400000004004: (15, 13, 2097152),
+        0x400000004008: (15, 13, 2097152),
+        0x400000004010: (15, -1, 2097152),
+        0x400000004020: (15, -1, 2097152),
+        0x400000004040: (15, -1, 2097152),
+        0x400000004080: (15, -1, 2097152),
+        0x400000004100: (15, -1, 2097152),
+        0x400000004200: (15, -1, 2097152),
+        0x400000004400: (15, -1, 2097152),
+        0x400000004800: (15, -1, 2097152),
+        0x400000005000: (15, -1, 2097152),
+        0x400000006000: (15, -1, 2097152),
+        0x400000008000: (13, -1, 0),
+        0x400000008001: (13, 0, 0),
+        0x400000008002: (13, 13, 0),
+        0x400000008004: (13, 13, 0),
+        0x400000008008: (13, 13, 0),
+        0x400000008010: (13, -1, 0),
+        0x400000008020: (13, -1, 0),
+        0x400000008040: (13, -1, 0),
+        0x400000008080: (13, -1, 0),
+        0x400000008100: (13, -1, 0),
+        0x400000008200: (13, -1, 2097152),
+        0x400000008400: (13, -1, 2097152),
+        0x400000008800: (13, -1, 2097152),
+        0x400000009000: (13, -1, 0),
+        0x40000000a000: (13, -1, 2097152),
+        0x40000000c000: (13, -1, 2097152),
+        0x400000010000: (-1, -1, 0),
+        0x400000010001: (0, 0, 0),
+        0x400000010002: (0, 13, 0),
+        0x400000010004: (0, 13, 0),
+        0x400000010008: (7, 13, 0),
+        0x400000010010: (13, -1, 0),
+        0x400000010020: (10, -1, 0),
+        0x400000010040: (-1, -1, 0),
+        0x400000010080: (-1, -1, 0),
+        0x400000010100: (-1, -1, 0),
+        0x400000010200: (7, -1, 2097152),
+        0x400000010400: (7, -1, 2097152),
+        0x400000010800: (10, -1, 2097152),
+        0x400000011000: (15, -1, 0),
+        0x400000012000: (7, -1, 2097152),
+        0x400000014000: (15, -1, 2097152),
+        0x400000018000: (14, -1, 0),
+        0x400000020000: (13, -1, 2097152),
+        0x400000020001: (0, 0, 0),
+        0x400000020002: (13, 13, 2097152),
+        0x400000020004: (13, 13, 2097152),
+        0x400000020008: (13, 13, 2097152),
+        0x400000020010: (13, -1, 2097152),
+        0x400000020020: (13, -1, 2097152),
+        0x400000020040: (13, -1, 2097152),
+        0x400000020080: (13, -1, 2097152),
+        0x400000020100: (13, -1, 2097152),
+        0x400000020200: (15, -1, 2097152),
+        0x400000020400: (13, -1, 2097152),
+        0x400000020800: (13, -1, 2097152),
+        0x400000021000: (13, -1, 2097152),
+        0x400000022000: (15, -1, 2097152),
+        0x400000024000: (13, -1, 2097152),
+        0x400000028000: (13, -1, 2097152),
+        0x400000030000: (13, -1, 2097152),
+        0x400000040000: (8, -1, 2097152),
+        0x400000040001: (0, 0, 0),
+        0x400000040002: (8, 13, 2097152),
+        0x400000040004: (8, 13, 2097152),
+        0x400000040008: (8, 13, 2097152),
+        0x400000040010: (8, -1, 2097152),
+        0x400000040020: (8, -1, 2097152),
+        0x400000040040: (8, -1, 2097152),
+        0x400000040080: (8, -1, 2097152),
+        0x400000040100: (8, -1, 2097152),
+        0x400000040200: (8, -1, 2097152),
+        0x400000040400: (8, -1, 2097152),
+        0x400000040800: (8, -1, 2097152),
+        0x400000041000: (8, -1, 2097152),
+        0x400000042000: (8, -1, 2097152),
+        0x400000044000: (8, -1, 2097152),
+        0x400000048000: (8, -1, 2097152),
+        0x400000050000: (8, -1, 2097152),
+        0x400000060000: (8, -1, 2097152),
+        0x400000080000: (8, -1, 2097152),
+        0x400000080001: (0, 0, 0),
+        0x400000080002: (8, 13, 2097152),
+        0x400000080004: (8, 13, 2097152),
+        0x400000080008: (8, 13, 2097152),
+        0x400000080010: (8, -1, 2097152),
+        0x400000080020: (8, -1, 2097152),
+        0x400000080040: (8, -1, 2097152),
+        0x400000080080: (8, -1, 2097152),
+        0x400000080100: (8, -1, 2097152),
+        0x400000080200: (8, -1, 2097152),
+        0x400000080400: (8, -1, 2097152),
+        0x400000080800: (8, -1, 2097152),
+        0x400000081000: (8, -1, 2097152),
+        0x400000082000: (8, -1, 2097152),
+        0x400000084000: (8, -1, 2097152),
+        0x400000088000: (8, -1, 2097152),
+        0x400000090000: (8, -1, 2097152),
+        0x4000000a0000: (8, -1, 2097152),
+        0x4000000c0000: (8, -1, 2097152),
+        0x400000100000: (-1, -1, 0),
+        0x400000100001: (0, 0, 2097152),
+        0x400000100002: (0, 13, 0),
+        0x400000100004: (0, 13, 0),
+        0x400000100008: (7, 13, 0),
+        0x400000100010: (13, -1, 0),
+        0x400000100020: (10, -1, 0),
+        0x400000100040: (-1, -1, 0),
+        0x400000100080: (-1, -1, 0),
+        0x400000100100: (-1, -1, 0),
+        0x400000100200: (7, -1, 2097152),
+        0x400000100400: (7, -1, 2097152),
+        0x400000100800: (10, -1, 2097152),
+        0x400000101000: (15, -1, 0),
+        0x400000102000: (7, -1, 2097152),
+        0x400000104000: (15, -1, 2097152),
+        0x400000108000: (13, -1, 0),
+        0x400000110000: (-1, -1, 0),
+        0x400000120000: (13, -1, 2097152),
+        0x400000140000: (8, -1, 2097152),
+        0x400000180000: (8, -1, 2097152),
+        0x400000200000: (-1, -1, 0),
+        0x400000200001: (0, 0, 0),
+        0x400000200002: (0, 13, 0),
+        0x400000200004: (0, 13, 0),
+        0x400000200008: (7, 13, 0),
+        0x400000200010: (13, -1, 0),
+        0x400000200020: (10, -1, 0),
+        0x400000200040: (-1, -1, 0),
+        0x400000200080: (-1, -1, 0),
+        0x400000200100: (-1, -1, 0),
+        0x400000200200: (7, -1, 2097152),
+        0x400000200400: (7, -1, 2097152),
+        0x400000200800: (10, -1, 2097152),
+        0x400000201000: (15, -1, 0),
+        0x400000202000: (7, -1, 2097152),
+        0x400000204000: (15, -1, 2097152),
+        0x400000208000: (13, -1, 0),
+        0x400000210000: (-1, -1, 0),
+        0x400000220000: (13, -1, 2097152),
+        0x400000240000: (8, -1, 2097152),
+        0x400000280000: (8, -1, 2097152),
+        0x400000300000: (15, -1, 2097152),
+        0x400000400000: (7, -1, 0),
+        0x400000400001: (7, 0, 0),
+        0x400000400002: (7, 13, 0),
+        0x400000400004: (7, 13, 0),
+        0x400000400008: (7, 13, 0),
+        0x400000400010: (7, -1, 0),
+        0x400000400020: (7, -1, 0),
+        0x400000400040: (7, -1, 0),
+        0x400000400080: (7, -1, 0),
+        0x400000400100: (7, -1, 0),
+        0x400000400200: (7, -1, 2097152),
+        0x400000400400: (7, -1, 2097152),
+        0x400000400800: (7, -1, 2097152),
+        0x400000401000: (7, -1, 0),
+        0x400000402000: (7, -1, 2097152),
+        0x400000404000: (7, -1, 2097152),
+        0x400000408000: (7, -1, 0),
+        0x400000410000: (7, -1, 0),
+        0x400000420000: (7, -1, 2097152),
+        0x400000440000: (7, -1, 2097152),
+        0x400000480000: (7, -1, 2097152),
+        0x400000500000: (7, -1, 0),
+        0x400000600000: (7, -1, 0),
+        0x400000800000: (14, -1, 0),
+        0x400000800001: (14, 0, 0),
+        0x400000800002: (14, 13, 0),
+        0x400000800004: (14, 13, 0),
+        0x400000800008: (14, 13, 0),
+        0x400000800010: (14, -1, 0),
+        0x400000800020: (14, -1, 0),
+        0x400000800040: (14, -1, 0),
+        0x400000800080: (14, -1, 0),
+        0x400000800100: (14, -1, 0),
+        0x400000800200: (14, -1, 2097152),
+        0x400000800400: (14, -1, 2097152),
+        0x400000800800: (14, -1, 2097152),
+        0x400000801000: (14, -1, 0),
+        0x400000802000: (14, -1, 2097152),
+        0x400000804000: (14, -1, 2097152),
+        0x400000808000: (14, -1, 0),
+        0x400000810000: (14, -1, 0),
+        0x400000820000: (14, -1, 2097152),
+        0x400000840000: (14, -1, 2097152),
+        0x400000880000: (14, -1, 2097152),
+        0x400000900000: (14, -1, 0),
+        0x400000a00000: (14, -1, 0),
+        0x400000c00000: (14, -1, 0),
+        0x600000000000: (-1, -1, 0),
+        0x800000000000: (-1, -1, 2097152),
+        0x800000000400: (7, -1, 2097152),
+        0x800000008000: (14, -1, 2097152),
+        0x800000008400: (7, -1, 2097152),
+        0x800000010000: (-1, -1, 2097152),
+        0x800000010400: (7, -1, 2097152),
+        0x800000018000: (14, -1, 2097152),
+        0x800001000000: (10, -1, 2097152),
+        0x800001000400: (10, -1, 2097152),
+        0x800001008000: (10, -1, 2097152),
+        0x800001010000: (10, -1, 2097152),
+        0x800002000000: (-1, -1, 2097152),
+        0x800002000400: (7, -1, 2097152),
+        0x800002008000: (14, -1, 2097152),
+        0x800002010000: (-1, -1, 2097152),
+        0x800003000000: (13, -1, 2097152),
+        0x800004000000: (-1, -1, 2097152),
+        0x800004000400: (7, -1, 2097152),
+        0x800004008000: (-1, -1, 2097152),
+        0x800004010000: (-1, 10, 2097152),
+        0x800005000000: (10, -1, 2097152),
+        0x800006000000: (-1, -1, 2097152),
+        0xa00000000000: (-1, -1, 0),
+        0xc00000000000: (-1, -1, 0),
+        0x1000000000000: (-1, -1, 0),
+        0x1000000010000: (-1, -1, 0),
+        0x1000000200000: (15, -1, 2359296),
+        0x1000000210000: (15, -1, 2359296),
+        0x1000002000000: (-1, -1, 0),
+        0x1000002010000: (-1, -1, 0),
+        0x1000002200000: (15, -1, 2359296),
+        0x1000008000000: (-1, -1, 0),
+        0x1000008010000: (10, -1, 0),
+        0x1000008200000: (15, -1, 2359296),
+        0x100000a000000: (8, 7, 0),
+        0x1000010000000: (14, -1, 2359296),
+        0x1000010010000: (14, -1, 2359296),
+        0x1000010200000: (14, -1, 2359296),
+        0x1000012000000: (14, -1, 2359296),
+        0x1000018000000: (14, -1, 2359296),
+        0x1000020000000: (-1, -1, 0),
+        0x1000020010000: (-1, -1, 0),
+        0x1000020200000: (15, -1, 2359296),
+        0x1000022000000: (13, -1, 2097152),
+        0x1000028000000: (-1, -1, 0),
+        0x1000030000000: (14, -1, 2359296),
+        0x1000040000000: (-1, 7, 0),
+        0x1000040010000: (-1, 7, 0),
+        0x1000040200000: (15, 7, 2359296),
+        0x1000042000000: (-1, 7, 0),
+        0x1000048000000: (-1, 7, 0),
+        0x1000050000000: (14, 7, 2359296),
+        0x1000060000000: (-1, 7, 0),
+        0x1000080000000: (7, -1, 0),
+        0x1000080010000: (7, -1, 0),
+        0x1000080200000: (7, -1, 262144),
+        0x1000082000000: (7, -1, 0),
+        0x1000088000000: (7, -1, 0),
+        0x1000090000000: (7, -1, 262144),
+        0x10000a0000000: (7, -1, 0),
+        0x10000c0000000: (7, 7, 0),
+        0x1000100000000: (15, -1, 0),
+        0x1000100010000: (15, -1, 0),
+        0x1000100200000: (15, -1, 262144),
+        0x1000102000000: (15, -1, 0),
+        0x1000108000000: (15, -1, 0),
+        0x1000110000000: (15, -1, 262144),
+        0x1000120000000: (15, -1, 0),
+        0x1000140000000: (15, 7, 0),
+        0x1000180000000: (15, -1, 0),
+        0x1000200000000: (14, -1, 0),
+        0x1000200010000: (14, -1, 0),
+        0x1000200200000: (14, -1, 262144),
+        0x1000202000000: (14, -1, 0),
+        0x1000208000000: (14, -1, 0),
+        0x1000210000000: (14, -1, 262144),
+        0x1000220000000: (14, -1, 0),
+        0x1000240000000: (14, 7, 0),
+        0x1000280000000: (14, -1, 0),
+        0x1000300000000: (14, -1, 0),
+        0x1200000000000: (-1, -1, 0),
+        0x1400000000000: (-1, -1, 0),
+        0x1800000000000: (-1, -1, 2097152),
+        0x2000000000000: (-1, -1, 0),
+        0x2200000000000: (-1, -1, 0),
+        0x2400000000000: (-1, -1, 0),
+        0x2800000000000: (-1, -1, 2097152),
+        0x3000000000000: (-1, -1, 0),
+        0x6000000000000: (-1, -1, 262144),
+        0x8000000000000: (-1, -1, 0),
+        0x8000000000001: (-1, -1, 262144),
+        0x8000040000000: (-1, 7, 0),
+        0x8000040000001: (7, -1, 262144),
+        0x8000400000000: (7, -1, 0),
+        0x8000400000001: (7, -1, 262144),
+        0x8000440000000: (7, 7, 0),
+        0x8200000000000: (-1, -1, 0),
+        0x8400000000000: (-1, -1, 0),
+        0x8800000000000: (-1, -1, 2097152),
+        0x9000000000000: (-1, -1, 0),
+        0xa000000000000: (-1, -1, 0),
+        0x10000000000000: (-1, -1, 0),
+        0x10000000000001: (-1, -1, 0),
+        0x10000800000000: (7, -1, 0),
+        0x10000800000001: (-1, -1, 0),
+        0x10001000000000: (13, -1, 0),
+        0x10001000000001: (-1, -1, 0),
+        0x10001800000000: (7, -1, 0),
+        0x10002000000000: (13, -1, 0),
+        0x10002000000001: (-1, -1, 0),
+        0x10002800000000: (7, -1, 0),
+        0x10003000000000: (13, -1, 0),
+        0x10004000000000: (10, -1, 0),
+        0x10004000000001: (-1, -1, 0),
+        0x10004800000000: (7, -1, 0),
+        0x10005000000000: (13, -1, 0),
+        0x10006000000000: (13, -1, 0),
+        0x10008000000000: (10, -1, 0),
+        0x10008000000001: (-1, -1, 0),
+        0x10008800000000: (7, -1, 0),
+        0x10009000000000: (13, -1, 0),
+        0x1000a000000000: (13, -1, 0),
+        0x1000c000000000: (10, -1, 0),
+        0x10010000000000: (-1, -1, 0),
+        0x10010000000001: (-1, -1, 0),
+        0x10010800000000: (7, -1, 0),
+        0x10011000000000: (13, -1, 0),
+        0x10012000000000: (13, -1, 0),
+        0x10014000000000: (10, -1, 0),
+        0x10018000000000: (10, -1, 0),
+        0x10200000000000: (-1, -1, 0),
+        0x10400000000000: (-1, -1, 0),
+        0x10800000000000: (-1, -1, 0),
+        0x11000000000000: (-1, -1, 0),
+        0x12000000000000: (-1, -1, 0),
+        0x18000000000000: (-1, -1, 0),
+        0x20000000000000: (-1, -1, 0),
+        0x20000000000001: (-1, -1, 0),
+        0x20002000000000: (13, -1, 0),
+        0x20002000000001: (-1, -1, 0),
+        0x20008000000000: (10, -1, 0),
+        0x20008000000001: (-1, -1, 0),
+        0x2000a000000000: (10, -1, 0),
+        0x20020000000000: (10, -1, 0),
+        0x20020000000001: (-1, -1, 0),
+        0x20022000000000: (10, -1, 0),
+        0x20028000000000: (10, -1, 0),
+        0x20040000000000: (13, -1, 0),
+        0x20040000000001: (-1, -1, 0),
+        0x20042000000000: (13, -1, 0),
+        0x20048000000000: (10, -1, 0),
+        0x20060000000000: (10, -1, 0),
+        0x20080000000000: (14, -1, 0),
+        0x20080000000001: (-1, -1, 0),
+        0x20082000000000: (14, -1, 0),
+        0x20088000000000: (10, -1, 0),
+        0x200a0000000000: (10, -1, 0),
+        0x200c0000000000: (13, -1, 0),
+        0x20100000000000: (7, -1, 0),
+        0x20100000000001: (-1, -1, 0),
+        0x20102000000000: (7, -1, 0),
+        0x20108000000000: (10, -1, 0),
+        0x20120000000000: (10, -1, 0),
+        0x20140000000000: (13, -1, 0),
+        0x20180000000000: (14, -1, 0),
+        0x20200000000000: (-1, -1, 0),
+        0x20400000000000: (-1, -1, 0),
+        0x20800000000000: (-1, -1, 0),
+        0x21000000000000: (-1, -1, 0),
+        0x22000000000000: (-1, -1, 0),
+        0x28000000000000: (-1, -1, 0),
+        0x30000000000000: (-1, -1, 0),
+    }
+
+
+_TABLES = {
+    'truecolor': _colors_truecolor,
+    '256': _colors_256,
+    '16': _colors_16,
+}
+
+# Generated by build.py: the code at each color depth of the colors
+# _evaluate() returns.
+_DEPTH_CODES = {
+    'truecolor': {15: 16777215, 1000: 1973806, 1001: 9024762, 1002: 1118491, 1003: 15912397, 1004: 10937249, 1005: 11845374, 1006: 1579045, 1007: 15442092, 1008: 13346551, 1009: 7106694, 1010: 8357020, 1011: 9673138, 1012: 16429959, 1013: 16106215, 1014: 15961000, 1015: 16113884, 1016: 7653356, 1017: 9034987, 1018: 10923464, 1019: 12239582, 1020: 3224132, 1021: 4540250, 1022: 5790576, 1023: 9757397, 1024: 13489908, 1025: 16376495},
+    '256': {1000: 16, 1001: 111, 1002: 16, 1003: 224, 1004: 151, 1005: 147, 1006: 16, 1007: 217, 1008: 183, 1009: 60, 1010: 103, 1011: 103, 1012: 216, 1013: 218, 1014: 211, 1015: 224, 1016: 117, 1017: 117, 1018: 146, 1019: 146, 1020: 59, 1021: 59, 1022: 59, 1023: 116, 1024: 189, 1025: 223},
+    '16': {1000: 0, 1001: 7, 1002: 0, 1003: 7, 1004: 10, 1005: 7, 1006: 0, 1007: 7, 1008: 13, 1009: 8, 1010: 8, 1011: 8, 1012: 7, 1013: 7, 1014: 13, 1015: 15, 1016: 7, 1017: 14, 1018: 7, 1019: 7, 1020: 0, 1021: 0, 1022: 8, 1023: 14, 1024: 7, 1025: 15},
+}
+
+# Generated by build.py: the value of each color constant at each color depth.
+_DEPTH_CONSTANTS = {
+    'truecolor': {'BASE': 1973806, 'BLUE': 9024762, 'CRUST': 1118491, 'FLAMINGO': 15912397, 'GREEN': 10937249, 'LAVENDER': 11845374, 'MANTLE': 1579045, 'MAROON': 15442092, 'MAUVE': 13346551, 'OVERLAY_0': 7106694, 'OVERLAY_1': 8357020, 'OVERLAY_2': 9673138, 'PEACH': 16429959, 'PINK': 16106215, 'RED': 15961000, 'ROSEWATER': 16113884, 'SAPPHIRE': 7653356, 'SKY': 9034987, 'SUBTEXT_0': 10923464, 'SUBTEXT_1': 12239582, 'SURFACE_0': 3224132, 'SURFACE_1': 4540250, 'SURFACE_2': 5790576, 'TEAL': 9757397, 'TEXT': 13489908, 'YELLOW': 16376495},
+    '256': {'BASE': 16, 'BLUE': 111, 'CRUST': 16, 'FLAMINGO': 224, 'GREEN': 151, 'LAVENDER': 147, 'MANTLE': 16, 'MAROON': 217, 'MAUVE': 183, 'OVERLAY_0': 60, 'OVERLAY_1': 103, 'OVERLAY_2': 103, 'PEACH': 216, 'PINK': 218, 'RED': 211, 'ROSEWATER': 224, 'SAPPHIRE': 117, 'SKY': 117, 'SUBTEXT_0': 146, 'SUBTEXT_1': 146, 'SURFACE_0': 59, 'SURFACE_1': 59, 'SURFACE_2': 59, 'TEAL': 116, 'TEXT': 189, 'YELLOW': 223},
+    '16': {'BASE': 0, 'BLUE': 7, 'CRUST': 0, 'FLAMINGO': 7, 'GREEN': 10, 'LAVENDER': 7, 'MANTLE': 0, 'MAROON': 7, 'MAUVE': 13, 'OVERLAY_0': 8, 'OVERLAY_1': 8, 'OVERLAY_2': 8, 'PEACH': 7, 'PINK': 7, 'RED': 13, 'ROSEWATER': 15, 'SAPPHIRE': 7, 'SKY': 14, 'SUBTEXT_0': 7, 'SUBTEXT_1': 7, 'SURFACE_0': 0, 'SURFACE_1': 0, 'SURFACE_2': 8, 'TEAL': 14, 'TEXT': 7, 'YELLOW': 15},
+}
+
+# Generated by build.py: every (fg, bg) use() can return, most common first,
+# at each color depth.
+_DEPTH_PAIRS = {
+    'truecolor': (
+        (-1, -1),
+        (-1, 9024762),
+        (1973806, 15961000),
+        (1973806, 3224132),
+        (9024762, -1),
+        (10937249, -1),
+        (15442092, -1),
+        (16106215, -1),
+        (15961000, -1),
+        (7653356, -1),
+        (9757397, -1),
+        (16376495, -1),
+        (-1, 10937249),
+        (16777215, -1),
+        (9024762, 9024762),
+        (9024762, 15961000),
+        (10937249, 15961000),
+        (10937249, 3224132),
+        (15442092, 15961000),
+        (15442092, 3224132),
+        (13346551, -1),
+        (8357020, -1),
+        (8357020, 16106215),
+        (7653356, 15961000),
+        (7653356, 3224132),
+        (9757397, 9024762),
+        (16376495, 9024762),
+        (16376495, 3224132),
+        (16777215, 15961000),
+        (9024762, 16106215),
+        (10937249, 9024762),
+        (13346551, 15961000),
+        (13346551, 3224132),
+        (8357020, 9024762),
+        (8357020, 15961000),
+        (16106215, 9024762),
+        (16106215, 3224132),
+        (15961000, 9024762),
+        (15961000, 16106215),
+        (15961000, 15961000),
+        (15961000, 3224132),
+        (9757397, 16106215),
+        (9757397, 3224132),
+        (16376495, 16106215),
+        (-1, 16106215),
+        (10937249, 10937249),
+        (10937249, 16106215),
+        (16106215, 10937249),
+        (16106215, 16106215),
+        (16106215, 15961000),
+        (15961000, 10937249),
+        (9757397, 10937249),
+        (9757397, 15961000),
+        (-1, 15961000),
+        (16376495, 15961000),
+    ),
+    '256': (
+        (-1, -1),
+        (-1, 111),
+        (16, 211),
+        (16, 59),
+        (111, -1),
+        (151, -1),
+        (217, -1),
+        (218, -1),
+        (211, -1),
+        (117, -1),
+        (116, -1),
+        (223, -1),
+        (-1, 151),
+        (15, -1),
+        (111, 111),
+        (111, 211),
+        (151, 211),
+        (151, 59),
+        (217, 211),
+        (217, 59),
+        (183, -1),
+        (103, -1),
+        (103, 218),
+        (117, 211),
+        (117, 59),
+        (116, 111),
+        (223, 111),
+        (223, 59),
+        (15, 211),
+        (111, 218),
+        (151, 111),
+        (183, 211),
+        (183, 59),
+        (103, 111),
+        (103, 211),
+        (218, 111),
+        (218, 59),
+        (211, 111),
+        (211, 218),
+        (211, 211),
+        (211, 59),
+        (116, 218),
+        (116, 59),
+        (223, 218),
+        (-1, 218),
+        (151, 151),
+        (151, 218),
+        (218, 151),
+        (218, 218),
+        (218, 211),
+        (211, 151),
+        (116, 151),
+        (116, 211),
+        (-1, 211),
+        (223, 211),
+    ),
+    '16': (
+        (-1, -1),
+        (-1, 7),
+        (0, 13),
+        (0, 0),
+        (7, -1),
+        (10, -1),
+        (13, -1),
+        (14, -1),
+        (15, -1),
+        (-1, 10),
+        (7, 7),
+        (7, 13),
+        (10, 13),
+        (10, 0),
+        (7, 0),
+        (8, -1),
+        (8, 7),
+        (14, 7),
+        (15, 7),
+        (15, 0),
+        (15, 13),
+        (10, 7),
+        (13, 13),
+        (13, 0),
+        (8, 13),
+        (13, 7),
+        (14, 0),
+        (10, 10),
+        (7, 10),
+        (13, 10),
+        (14, 10),
+        (14, 13),
+        (-1, 13),
+    ),
+}
+
+# Generated by build.py: for terminals with fewer colors than any table, the
+# table they use and the code each of its codes 0-15 becomes.
+_FEWER_COLORS = {'8': ('16', (0, 1, 2, 3, 4, 5, 6, 7, 0, 1, 2, 3, 4, 5, 6, 7)), 'monochrome': ('16', (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1))}
+
+# Generated by build.py: the least number of colors of each depth's terminals.
+_DEPTH_COLORS = ((16777216, 'truecolor'), (256, '256'), (16, '16'), (8, '8'), (0, 'monochrome'))
+
+
+def _color_depth():
+    # The terminal's, from its terminfo entry, unless set in the environment.
+    import os
+
+    depth = os.environ.get("CATPPUCCIN_RANGER_DEPTH")
+    if depth in _TABLES or depth in _FEWER_COLORS:
+        return depth
+    try:
+        import curses
+
+        try:
+            colors = curses.COLORS  # Only once curses is started.
+        except AttributeError:
+            curses.setupterm()
+            colors = curses.tigetnum("colors")  # -1 if it has none.
+    except Exception:  # No curses, no terminal, unknown $TERM, ...
+        return "256"
+    for least, depth in _DEPTH_COLORS:
+        if colors >= least:
+            break
+    return depth
+
+
+def _use_depth(depth):
+    global _DEPTH, _CODES, _COLORS, _COLORS_LIMIT, _COLOR_PAIRS
+    _DEPTH = depth
+    depth, fewer = _FEWER_COLORS.get(depth, (depth, None))
+    _CODES = _DEPTH_CODES[depth]
+    _COLORS = _TABLES[depth]()
+    constants = _DEPTH_CONSTANTS[depth]
+    _COLOR_PAIRS = _DEPTH_PAIRS[depth]
+    if fewer:
+
+        def convert(code):
+            return fewer[code] if 0 <= code < 16 else code
+
+        _CODES = {code: convert(value) for code, value in _CODES.items()}
+        _CODES.update((code, convert(code)) for code in range(16))
+        _COLORS = {
+            key: (convert(fg), convert(bg), attr)
+            for key, (fg, bg, attr) in _COLORS.items()
+        }
+        constants = {name: convert(code) for name, code in constants.items()}
+        _COLOR_PAIRS = tuple(
+            dict.fromkeys((convert(fg), convert(bg)) for fg, bg in _COLOR_PAIRS)
+        )
+    if reverse != 262144 or bold != 2097152:
+        _COLORS = {}
+    _COLORS_LIMIT = len(_COLORS) + 1024
+    globals().update(constants)
+    CatppuccinMocha.progress_bar_color = BLUE
+
+
+# Chosen by the first use() or color pair allocation, which ranger only does
+# once curses is started, so that importing the scheme leaves the terminal
+# alone.
+_DEPTH = None
+_COLORS = {}
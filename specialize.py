@@ -0,0 +1,290 @@
+"""Specializes a flavor's colorscheme code for its palette.
+
+Once a flavor's colors are substituted into the template, every color is a
+module-level integer. `specialize_method` rewrites one method of the scheme
+class so that:
+
+- calls of the form `fg, bg, attr = self.verify_*(context, fg, bg, attr)`
+  are replaced by the body of the helper;
+- colors, and the ranger values that are the same on every terminal
+  (`default`, `normal` and `default_colors`), become literals;
+- expressions over literals are evaluated, `if`s whose test is then fixed
+  lose their dead branch, repeated members of `in (...)` tuples are
+  dropped, and no-op updates such as `attr |= normal` are removed.
+
+Attributes of `self` (like `progress_bar_color`) and the curses attributes
+(`bold`, `reverse`, ...) stay dynamic. `drop_inlined_helpers` then removes the
+helpers nothing calls any more.
+"""
+
+import ast
+import copy
+
+# Values defined by ranger.gui.color that do not depend on curses.
+RANGER_CONSTANTS = {"default": -1, "normal": 0, "default_colors": (-1, -1, 0)}
+HELPER_ARGS = ["self", "context", "fg", "bg", "attr"]
+
+
+def _module_constants(tree: ast.Module) -> dict[str, object]:
+    constants = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, int)
+        ):
+            constants[node.targets[0].id] = node.value.value
+        elif isinstance(node, ast.ImportFrom) and node.module == "ranger.gui.color":
+            for alias in node.names:
+                if alias.name in RANGER_CONSTANTS:
+                    name = alias.asname or alias.name
+                    constants[name] = RANGER_CONSTANTS[alias.name]
+    return constants
+
+
+def _inlinable_body(method: ast.FunctionDef) -> list[ast.stmt] | None:
+    # A helper can be inlined when it takes and returns (fg, bg, attr) and
+    # has no other exit than its final return.
+    if [arg.arg for arg in method.args.args] != HELPER_ARGS:
+        return None
+
+    *body, last = method.body
+    if not (
+        isinstance(last, ast.Return)
+        and isinstance(last.value, ast.Tuple)
+        and [getattr(e, "id", None) for e in last.value.elts] == HELPER_ARGS[2:]
+    ):
+        return None
+
+    for statement in body:
+        if any(isinstance(node, ast.Return) for node in ast.walk(statement)):
+            return None
+
+    return body
+
+
+class _Inliner(ast.NodeTransformer):
+    def __init__(self, helpers: dict[str, list[ast.stmt]]) -> None:
+        self.helpers = helpers
+        self.inlined: set[str] = set()
+
+    def visit_Assign(self, node: ast.Assign) -> ast.AST | list[ast.stmt]:
+        call = node.value
+        if (
+            len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Tuple)
+            and [getattr(e, "id", None) for e in node.targets[0].elts]
+            == HELPER_ARGS[2:]
+            and isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == "self"
+            and call.func.attr in self.helpers
+            and [getattr(a, "id", None) for a in call.args] == HELPER_ARGS[1:]
+            and not call.keywords
+        ):
+            # The helper's own nodes are only copied if it is inlined twice.
+            helper = self.helpers[call.func.attr]
+            if call.func.attr in self.inlined:
+                helper = copy.deepcopy(helper)
+            self.inlined.add(call.func.attr)
+            body = []
+            for statement in helper:
+                result = self.visit(statement)
+                body.extend(result if isinstance(result, list) else [result])
+            return body
+        return node
+
+
+class _Folder(ast.NodeTransformer):
+    def __init__(self, constants: dict[str, object]) -> None:
+        self.constants = constants
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if isinstance(node.ctx, ast.Load) and node.id in self.constants:
+            return ast.copy_location(ast.Constant(self.constants[node.id]), node)
+        return node
+
+    def _fold(self, node: ast.expr) -> ast.expr:
+        if all(
+            isinstance(child, ast.Constant)
+            for child in ast.iter_child_nodes(node)
+            if isinstance(child, ast.expr)
+        ):
+            expression = ast.fix_missing_locations(ast.Expression(node))
+            value = eval(compile(expression, "<fold>", "eval"), {"__builtins__": {}})
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        return self._fold(self.generic_visit(node))
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        return self._fold(self.generic_visit(node))
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        return self._fold(self.generic_visit(node))
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        node = self.generic_visit(node)
+        for i, comparator in enumerate(node.comparators):
+            if isinstance(node.ops[i], (ast.In, ast.NotIn)) and isinstance(
+                comparator, (ast.Tuple, ast.Constant)
+            ):
+                node.comparators[i] = _dedupe(comparator)
+        if len(node.ops) == 1 and isinstance(node.comparators[0], ast.Tuple):
+            members = node.comparators[0].elts
+            if len(members) == 1:
+                op = ast.Eq() if isinstance(node.ops[0], ast.In) else ast.NotEq()
+                node = ast.Compare(node.left, [op], members)
+        return self._fold(node)
+
+    def visit_Tuple(self, node: ast.Tuple) -> ast.AST:
+        node = self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load):
+            return self._fold(node)
+        return node
+
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        node = self.generic_visit(node)
+        if isinstance(node.test, ast.Constant):
+            return node.body if node.test.value else node.orelse
+        return node
+
+    def visit_If(self, node: ast.If) -> ast.AST | list[ast.stmt]:
+        node = self.generic_visit(node)
+        if isinstance(node.test, ast.Constant):
+            return node.body if node.test.value else node.orelse
+        node.body = node.body or [ast.Pass()]
+        return node
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST | None:
+        node = self.generic_visit(node)
+        if (
+            isinstance(node.target, ast.Name)
+            and isinstance(node.op, (ast.BitOr, ast.BitXor, ast.Add, ast.Sub))
+            and isinstance(node.value, ast.Constant)
+            and node.value.value == 0
+        ):
+            return None
+        return node
+
+
+def _dedupe(node: ast.expr) -> ast.expr:
+    if isinstance(node, ast.Constant) and isinstance(node.value, tuple):
+        elts = [ast.Constant(value) for value in node.value]
+    elif isinstance(node, ast.Tuple):
+        elts = node.elts
+    else:
+        return node
+
+    unique = {}
+    for elt in elts:
+        key = ast.dump(elt) if not isinstance(elt, ast.Constant) else elt.value
+        unique.setdefault(key, elt)
+    return ast.copy_location(ast.Tuple(list(unique.values()), ast.Load()), node)
+
+
+def _assigned_names(function: ast.FunctionDef) -> set[str]:
+    names = {arg.arg for arg in function.args.args}
+    for node in ast.walk(function):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+    return names
+
+
+def specialize_method(config: str, class_name: str, method_name: str) -> str:
+    """Replaces a method of a flavor's scheme with its specialized version.
+
+    Args:
+        config: The colorscheme source, with all colors substituted.
+        class_name: The name of the colorscheme class.
+        method_name: The method to specialize (e.g. '_evaluate').
+
+    Returns:
+        The colorscheme source with the method rewritten.
+
+    Raises:
+        ValueError: If the class or the method cannot be found.
+    """
+    tree = ast.parse(config)
+    classes = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == class_name
+    ]
+    if not classes:
+        raise ValueError(f"Class {class_name} not found")
+
+    methods = {
+        node.name: node for node in classes[0].body if isinstance(node, ast.FunctionDef)
+    }
+    if method_name not in methods:
+        raise ValueError(f"Method {class_name}.{method_name} not found")
+
+    helpers = {}
+    for name, method in methods.items():
+        body = _inlinable_body(method)
+        if name != method_name and body is not None:
+            helpers[name] = body
+
+    method = methods[method_name]
+    start = (method.decorator_list[0] if method.decorator_list else method).lineno
+    end = method.end_lineno
+    # `tree` is not reused, so the method is rewritten in place.
+    function = _Inliner(helpers).visit(method)
+
+    local = _assigned_names(function)
+    constants = {
+        name: value
+        for name, value in _module_constants(tree).items()
+        if name not in local
+    }
+    function = _Folder(constants).visit(function)
+    function.body = function.body or [ast.Pass()]
+    ast.fix_missing_locations(function)
+
+    source = "\n".join(
+        f"    {line}" if line else line for line in ast.unparse(function).splitlines()
+    )
+    lines = config.splitlines(keepends=True)
+    before, after = lines[: start - 1], lines[end:]
+    return "".join(before) + source + "\n" + "".join(after)
+
+
+def drop_inlined_helpers(config: str, class_name: str) -> str:
+    """Removes the helpers `specialize_method` inlines that nothing calls.
+
+    Args:
+        config: The colorscheme source, with its methods specialized.
+        class_name: The name of the colorscheme class.
+
+    Returns:
+        The colorscheme source without the helpers no longer read as an
+        attribute anywhere in it.
+
+    Raises:
+        ValueError: If the class cannot be found.
+    """
+    tree = ast.parse(config)
+    classes = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == class_name
+    ]
+    if not classes:
+        raise ValueError(f"Class {class_name} not found")
+
+    called = {node.attr for node in ast.walk(tree) if isinstance(node, ast.Attribute)}
+    lines = config.splitlines(keepends=True)
+    for node in reversed(classes[0].body):
+        if (
+            isinstance(node, ast.FunctionDef)
+            and node.name not in called
+            and _inlinable_body(node) is not None
+        ):
+            start = (node.decorator_list[0] if node.decorator_list else node).lineno
+            del lines[start - 1 : node.end_lineno]
+    return "".join(lines)